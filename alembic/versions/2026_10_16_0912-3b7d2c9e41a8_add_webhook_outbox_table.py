@@ -0,0 +1,60 @@
+"""add webhook_outbox table
+
+Revision ID: 3b7d2c9e41a8
+Revises: 613e4f756671
+Create Date: 2026-10-16T09:12:41.517203+00:00
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3b7d2c9e41a8"
+down_revision: Union[str, None] = "613e4f756671"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("SET lock_timeout = '5s';")
+    op.create_table(
+        "webhook_outbox",
+        sa.Column("webhook_outbox_id", sa.String(), nullable=False),
+        sa.Column("organization_id", sa.String(), nullable=False),
+        sa.Column("run_id", sa.String(), nullable=False),
+        sa.Column("run_type", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("payload", sa.UnicodeText(), nullable=False),
+        sa.Column("headers", sa.JSON(), nullable=False),
+        sa.Column("success_marker", sa.String(), nullable=True),
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("attempts", sa.Integer(), nullable=False),
+        sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+        sa.Column("locked_until", sa.DateTime(), nullable=True),
+        sa.Column("last_status_code", sa.Integer(), nullable=True),
+        sa.Column("last_error", sa.UnicodeText(), nullable=True),
+        sa.Column("delivered_at", sa.DateTime(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organizations.organization_id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("webhook_outbox_id"),
+    )
+    op.create_index("ix_webhook_outbox_run_id", "webhook_outbox", ["run_id"], unique=False)
+    op.create_index(
+        "ix_webhook_outbox_pending_next_attempt_at",
+        "webhook_outbox",
+        ["next_attempt_at"],
+        unique=False,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.execute("SET lock_timeout = '5s';")
+    op.drop_index("ix_webhook_outbox_pending_next_attempt_at", table_name="webhook_outbox")
+    op.drop_index("ix_webhook_outbox_run_id", table_name="webhook_outbox")
+    op.drop_table("webhook_outbox")
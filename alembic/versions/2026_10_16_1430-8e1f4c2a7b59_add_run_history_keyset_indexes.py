@@ -0,0 +1,38 @@
+"""add run history keyset indexes
+
+Revision ID: 8e1f4c2a7b59
+Revises: 3b7d2c9e41a8
+Create Date: 2026-10-16T14:30:12.408215+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e1f4c2a7b59"
+down_revision: Union[str, None] = "3b7d2c9e41a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("SET statement_timeout = '3h';")
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_workflow_runs_org_created_run_id
+            ON workflow_runs (organization_id, created_at, workflow_run_id)
+            WHERE parent_workflow_run_id IS NULL;
+        """)
+        op.execute("""
+            CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_tasks_org_created_task_id
+            ON tasks (organization_id, created_at, task_id);
+        """)
+        op.execute("RESET statement_timeout;")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_tasks_org_created_task_id;")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_workflow_runs_org_created_run_id;")
@@ -8,6 +8,13 @@ import typer
 from skyvern.forge import app
 from skyvern.forge.forge_app_initializer import start_streaming_worker_app
 from skyvern.forge.sdk.api.files import get_skyvern_temp_dir
+from skyvern.forge.sdk.db.status_notifications import (
+    StatusEntity,
+    StatusSubscription,
+    start_status_notification_listener,
+    status_notifications,
+    stop_status_notification_listener,
+)
 from skyvern.forge.sdk.workflow.models.workflow import WorkflowRunStatus
 from skyvern.utils.files import get_json_from_file, get_skyvern_state_file_path, initialize_skyvern_state_file
 
@@ -18,6 +25,13 @@ LOG = structlog.get_logger()
 async def run() -> None:
     start_streaming_worker_app()
     await initialize_skyvern_state_file(task_id=None, workflow_run_id=None, organization_id=None)
+    start_status_notification_listener(app.DATABASE.engine)
+
+    # The run being streamed and whether it was still active when its row was last read. The row is
+    # re-read when its status changes rather than on every screenshot.
+    watched_run: tuple[str | None, str | None] | None = None
+    watched_run_active = False
+    subscription: StatusSubscription | None = None
 
     try:
         while True:
@@ -33,25 +47,35 @@ async def run() -> None:
             if not organization_id or (not task_id and not workflow_run_id):
                 continue
 
+            if watched_run != (task_id, workflow_run_id) or subscription is None:
+                if subscription is not None:
+                    subscription.close()
+                watched_run = (task_id, workflow_run_id)
+                subscription = (
+                    status_notifications.subscribe(StatusEntity.workflow_run, workflow_run_id)
+                    if workflow_run_id
+                    else status_notifications.subscribe(StatusEntity.task, task_id)
+                )
+            file_name = f"{workflow_run_id or task_id}.png"
             try:
-                if workflow_run_id:
-                    workflow_run = await app.DATABASE.workflow_runs.get_workflow_run(workflow_run_id=workflow_run_id)
-                    if not workflow_run or workflow_run.status in [
-                        WorkflowRunStatus.completed,
-                        WorkflowRunStatus.failed,
-                        WorkflowRunStatus.terminated,
-                    ]:
-                        continue
-                    file_name = f"{workflow_run_id}.png"
-
-                elif task_id:
-                    task = await app.DATABASE.tasks.get_task(task_id=task_id, organization_id=organization_id)
-                    if not task or task.status.is_final():
-                        continue
-                    file_name = f"{task_id}.png"
-                else:
+                if subscription.should_refresh(INTERVAL):
+                    if workflow_run_id:
+                        workflow_run = await app.DATABASE.workflow_runs.get_workflow_run(
+                            workflow_run_id=workflow_run_id
+                        )
+                        watched_run_active = workflow_run is not None and workflow_run.status not in [
+                            WorkflowRunStatus.completed,
+                            WorkflowRunStatus.failed,
+                            WorkflowRunStatus.terminated,
+                        ]
+                    else:
+                        task = await app.DATABASE.tasks.get_task(task_id=task_id, organization_id=organization_id)
+                        watched_run_active = task is not None and not task.status.is_final()
+                if not watched_run_active:
                     continue
             except Exception:
+                # Read the row again on the next tick.
+                watched_run = None
                 LOG.exception(
                     "Failed to get task or workflow run while taking streaming screenshot in worker",
                     task_id=task_id,
@@ -74,6 +98,9 @@ async def run() -> None:
             except Exception:
                 LOG.debug("Failed to upload screenshot", organization_id=organization_id, file_name=file_name)
     finally:
+        if subscription is not None:
+            subscription.close()
+        await stop_status_notification_listener()
         # Dispose the DB engine/pool this worker owns. The minimal streaming-worker
         # runtime makes this worker the sole owner of app.DATABASE, so releasing it
         # when the loop is cancelled or exits (task cancellation / SIGINT / an
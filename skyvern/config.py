@@ -107,7 +107,25 @@ class Settings(BaseSettings):
     CDP_CONNECT_RETRY_ATTEMPTS: int = 6
     CDP_CONNECT_RETRY_BACKOFF_SECONDS: list[float] = [1, 2, 3, 4, 5]
     CHROME_EXECUTABLE_PATH: str | None = None
+    # Keep launched-but-unused local Chromium contexts ready so a run whose launch settings match
+    # (engine, proxy location, browser-internal headers) skips the cold launch. Each pooled browser
+    # serves exactly one run; idle ones are recycled after BROWSER_POOL_MAX_IDLE_SECONDS, when their
+    # resident memory has grown by BROWSER_POOL_MAX_RSS_GROWTH_MB (0 disables), or on a failed probe.
+    BROWSER_POOL_ENABLED: bool = False
+    BROWSER_POOL_MIN_SIZE: int = Field(default=1, ge=0)  # idle browsers kept per launch key
+    BROWSER_POOL_MAX_SIZE: int = Field(default=4, ge=0)  # idle browsers across all launch keys
+    BROWSER_POOL_MAX_IDLE_SECONDS: float = 600.0
+    BROWSER_POOL_MAX_RSS_GROWTH_MB: int = 256
     MAX_SCRAPING_RETRIES: int = 0
+    # Reuse trimmed subtrees and rendered HTML from the previous scrape of the same page, and record
+    # the element-level delta between the two scrapes on the ScrapedPage.
+    ENABLE_INCREMENTAL_SCRAPE: bool = False
+    # Pages with at least this many interactable elements are hashed in a worker thread so the event
+    # loop keeps serving other runs. 0 always hashes inline.
+    ELEMENT_HASHING_THREAD_THRESHOLD: int = 5000
+    # Overlap the read-only scrape stages (page text, HTML) with cleanup, hashing and, when the
+    # screenshots do not scroll, with the screenshots themselves.
+    ENABLE_PIPELINED_SCRAPE: bool = False
     VIDEO_PATH: str | None = "./video"
     VIDEO_COMPRESSION_ENABLED: bool = True
     VIDEO_COMPRESSION_CRF: int = 28
@@ -147,6 +165,22 @@ class Settings(BaseSettings):
     # degrades fast instead of burning the full loading-timeout budget.
     BROWSER_SCREENSHOT_LOAD_STATE_TIMEOUT_MS: int = 5000
     BROWSER_SCRAPING_BUILDING_ELEMENT_TREE_TIMEOUT_MS: int = 60 * 1000  # 1 minute
+    # In-page wall-time budget for one buildTreeFromBody walk. Past it the walk stops and returns
+    # the tree built so far, instead of running into the timeout above and returning nothing.
+    # Keep it under that timeout. 0 disables.
+    BROWSER_SCRAPING_TREE_BUILD_BUDGET_MS: int = 0
+    # How buildTreeFromBody's result crosses the evaluate boundary: "nested" element dicts, or the
+    # "compact" columnar JSON string (skyvern/webeye/scraper/compact_tree.py). "compare" scrapes
+    # with compact and also re-sends each tree both ways, logging payload sizes and transfer times.
+    BROWSER_SCRAPING_ELEMENT_TREE_WIRE_FORMAT: Literal["nested", "compact", "compare"] = "nested"
+    # Cap wait_for_page_ready's loading-indicator, network-idle and DOM-stability timeouts by how
+    # long each has recently taken on the same host (PageReadyTimeouts in
+    # skyvern/webeye/utils/page.py). The caller's timeouts stay the ceiling.
+    BROWSER_PAGE_READY_LEARNED_TIMEOUTS: bool = False
+    # Turn the fixed post_click_delay and inter_action_delay sleeps into upper bounds: return as
+    # soon as the page goes quiet after the action (settle_wait in
+    # skyvern/experimentation/wait_utils.py), logging the time saved.
+    BROWSER_ACTION_SETTLE_DETECTION: bool = False
     CODE_BLOCK_EXECUTION_TIMEOUT_SECONDS: int = 300
     # In-block OTP email/SMS poll budget; bounded under CODE_BLOCK_EXECUTION_TIMEOUT_SECONDS
     # so one fetch can't consume the whole block. TOTP re-mint is instant and unaffected.
@@ -179,6 +213,12 @@ class Settings(BaseSettings):
     # Emit per-call image_tokens/image_cost/image_count on the LLM duration log so
     # screenshot spend can be monitored independently of the provider's blended tokens.
     LLM_IMAGE_COST_TRACKING_ENABLED: bool = True
+    # Downscale and re-encode screenshots before inlining them into element-based prompts. The long edge is
+    # capped at LLM_SCREENSHOT_MAX_DIMENSION (0 disables resizing); format is webp, jpeg or png.
+    LLM_SCREENSHOT_ENCODING_ENABLED: bool = False
+    LLM_SCREENSHOT_MAX_DIMENSION: int = 1568
+    LLM_SCREENSHOT_FORMAT: str = "webp"
+    LLM_SCREENSHOT_QUALITY: int = 85
     # Ratio should be between 0 and 1.
     # If the task has been running for more steps than this ratio of the max steps per run, then we'll log a warning.
     LONG_RUNNING_TASK_WARNING_RATIO: float = 0.95
@@ -205,6 +245,10 @@ class Settings(BaseSettings):
     # and can exhaust pgbouncer client connections.
     DATABASE_POOL_TIMEOUT: int = 30
     DATABASE_POOL_RECYCLE: int = -1
+    # Hold the agent loop's action inserts and per-LLM-call step usage updates in a per-run buffer and
+    # write them in batched transactions at step/task status changes instead of one round-trip each
+    # (skyvern/services/write_behind.py). Cuts pooled-connection checkouts per step under load.
+    DATABASE_WRITE_BEHIND_ENABLED: bool = False
     PROMPT_ACTION_HISTORY_WINDOW: int = 1
     TASK_RESPONSE_ACTION_SCREENSHOT_COUNT: int = 3
 
@@ -300,6 +344,14 @@ class Settings(BaseSettings):
 
     # Artifact storage settings
     ARTIFACT_STORAGE_PATH: str = f"{SKYVERN_DIR}/artifacts"
+    # Step/task archives whose members total at least this many bytes are zipped into a temp file and
+    # uploaded from disk (chunked multipart on S3/GCS/Azure) instead of being built in memory.
+    ARTIFACT_ARCHIVE_SPOOL_THRESHOLD_BYTES: int = 8 * 1024 * 1024
+    # Concurrent storage PUTs when a step archive is flushed without bundling (one object per member).
+    ARTIFACT_UNBUNDLED_UPLOAD_CONCURRENCY: int = 8
+    # Store screenshots once per organization under their sha256 digest and point every artifact row with
+    # the same bytes at that object. Applies to unbundled uploads; bundled step archives are unaffected.
+    ARTIFACT_SCREENSHOT_DEDUP: bool = False
 
     # Supported storage types: local, s3cloud, azureblob
     SKYVERN_STORAGE_TYPE: str = "local"
@@ -307,6 +359,19 @@ class Settings(BaseSettings):
     # Shared Redis URL (used by any service that needs Redis)
     REDIS_URL: str = "redis://localhost:6379/0"
 
+    # In-process LocalCache budget (used when no shared cache is configured). Values larger than
+    # the budget are not cached; otherwise the least recently used keys are evicted to fit.
+    LOCAL_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
+    # Shared keep-alive client for aiohttp_request (HTTP request blocks, credential/auth callbacks).
+    # Unproxied requests reuse connections per origin, and validated DNS answers are reused for
+    # HTTP_CLIENT_DNS_CACHE_TTL_SECONDS. Off by default: every call opens its own session.
+    HTTP_CLIENT_POOL_ENABLED: bool = False
+    HTTP_CLIENT_POOL_MAX_CONNECTIONS: int = Field(default=100, ge=1)
+    HTTP_CLIENT_POOL_MAX_PER_HOST: int = Field(default=10, ge=0)  # 0 = no per-host cap
+    HTTP_CLIENT_KEEPALIVE_SECONDS: float = 30.0
+    HTTP_CLIENT_DNS_CACHE_TTL_SECONDS: float = Field(default=60.0, gt=0)
+
     # S3/AWS settings
     AWS_REGION: str = "us-east-1"
     MAX_UPLOAD_FILE_SIZE: int = 10 * 1024 * 1024  # 10 MB
@@ -406,6 +471,23 @@ class Settings(BaseSettings):
 
     # Saved browser session settings
     BROWSER_SESSION_BASE_PATH: str = f"{constants.REPO_ROOT_DIR}/browser_sessions"
+    # Chromium user-data directories (matched by name at any depth) that are never persisted with a
+    # saved session or profile. Everything here is rebuilt by the browser on demand.
+    BROWSER_PROFILE_EXCLUDED_DIRS: list[str] = [
+        "Cache",
+        "Code Cache",
+        "GPUCache",
+        "GrShaderCache",
+        "GraphiteDawnCache",
+        "ShaderCache",
+        "DawnCache",
+        "DawnGraphiteCache",
+        "DawnWebGPUCache",
+        "component_crx_cache",
+        "extensions_crx_cache",
+        "Crashpad",
+        "BrowserMetrics",
+    ]
 
     #####################
     # Bitwarden Configs #
@@ -417,6 +499,26 @@ class Settings(BaseSettings):
     # task generation settings
     PROMPT_CACHE_WINDOW_HOURS: int = 24
 
+    # cross-run extract-information cache for self-hosted installs; unset keeps the OSS hooks no-ops
+    EXTRACTION_CACHE_SQLITE_PATH: str | None = None
+    EXTRACTION_CACHE_SQLITE_MAX_BYTES: int = 256 * 1024 * 1024
+    EXTRACTION_CACHE_SQLITE_MAX_ENTRY_BYTES: int = 1024 * 1024
+    EXTRACTION_CACHE_SQLITE_TTL_SECONDS: int = 7 * 24 * 60 * 60
+
+    # per-organization limits for self-hosted API workers, shared by every process on the host through
+    # one SQLite file (":memory:" for a single process); unset keeps the OSS no-op rate limiter
+    RATE_LIMITER_SQLITE_PATH: str | None = None
+    # token bucket for run submissions: refills at this many per minute, holds at most BURST; 0 disables
+    SUBMIT_RUN_RATE_LIMIT_PER_MINUTE: int = Field(default=60, ge=0)
+    SUBMIT_RUN_RATE_LIMIT_BURST: int = Field(default=20, ge=0)
+    # SDK actions an organization may have in flight at once across the host; 0 disables
+    SDK_ACTION_CONCURRENCY_LIMIT: int = Field(default=8, ge=0)
+    # a slot held longer than this is presumed leaked by a killed worker and reclaimed
+    SDK_ACTION_SLOT_LEASE_SECONDS: int = Field(default=3600, gt=0)
+    # per-organization overrides of the three limits above, e.g.
+    # {"o_123": {"submit_run_per_minute": 600, "submit_run_burst": 100, "sdk_action_concurrency": 32}}
+    RATE_LIMIT_ORGANIZATION_OVERRIDES: dict[str, dict[str, int]] = {}
+
     #####################
     # LLM Configuration #
     #####################
@@ -858,6 +960,55 @@ class Settings(BaseSettings):
     WORKFLOW_SCHEDULE_MAX_CONCURRENT_RUNS: int = 1
     """Maximum number of scheduled workflow runs dispatched concurrently by one OSS server process."""
 
+    # Webhook Outbox Settings
+    WEBHOOK_OUTBOX_ENABLED: bool = False
+    """Persist run-completion webhooks to the webhook_outbox table and deliver them from a background
+    worker in the API process, instead of delivering inline while the run finalizes."""
+    WEBHOOK_OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    """How often the outbox worker looks for due webhooks when the previous batch was not full."""
+    WEBHOOK_OUTBOX_BATCH_SIZE: int = Field(default=50, ge=1)
+    """Maximum number of due webhooks one worker claims per poll."""
+    WEBHOOK_OUTBOX_CONCURRENCY: int = Field(default=16, ge=1)
+    """Maximum number of webhook requests one worker has in flight."""
+    WEBHOOK_OUTBOX_MAX_CONNECTIONS_PER_DESTINATION: int = Field(default=4, ge=1)
+    """Keep-alive connections the worker holds open per webhook origin (scheme, host and port)."""
+    WEBHOOK_OUTBOX_LEASE_SECONDS: int = Field(default=300, ge=1)
+    """How long a claimed webhook stays invisible to other workers; a crashed worker's claim expires after it."""
+    WEBHOOK_OUTBOX_MAX_ATTEMPTS: int = Field(default=12, ge=1)
+    """Attempts before a webhook that keeps failing with a retryable error is dead-lettered."""
+    WEBHOOK_OUTBOX_RETRY_BASE_DELAY_SECONDS: float = Field(default=30.0, gt=0)
+    """First retry delay; later retries double it, up to WEBHOOK_OUTBOX_RETRY_MAX_DELAY_SECONDS."""
+    WEBHOOK_OUTBOX_RETRY_MAX_DELAY_SECONDS: float = Field(default=3600.0, gt=0)
+    """Ceiling for a single retry delay, including one requested by a Retry-After header."""
+    WEBHOOK_OUTBOX_MAX_AGE_HOURS: float = Field(default=24.0, gt=0)
+    """Webhooks still undelivered this long after they were enqueued are dead-lettered."""
+
+    # Run Status Notification Settings
+    RUN_STATUS_LISTEN_NOTIFY_ENABLED: bool = False
+    """Send task, workflow run and browser session state changes with Postgres NOTIFY and receive them
+    over LISTEN (skyvern/forge/sdk/db/status_notifications.py), so streaming and browser-session waiters
+    in other processes wake on the change instead of re-reading the row on a fixed sleep. Needs a direct
+    Postgres connection; behind a transaction pooler changes are only broadcast within the process."""
+    RUN_STATUS_FALLBACK_POLL_SECONDS: float = Field(default=30.0, gt=0)
+    """How often a waiter re-reads its row anyway while the LISTEN connection is up."""
+
+    # File Parser Settings
+    FILE_PARSER_STREAMING_ENABLED: bool = False
+    """Parse the FileParserBlock's CSV and Excel inputs in row batches and spill large ones to a JSON
+    Lines file that ForLoopBlocks iterate lazily (skyvern/forge/sdk/workflow/tabular_rows.py), instead
+    of holding every row in the workflow context."""
+    FILE_PARSER_BATCH_ROWS: int = Field(default=5000, ge=1)
+    """Rows read and type-converted per batch by the streaming parse."""
+    FILE_PARSER_SPILL_ROW_THRESHOLD: int = Field(default=50000, ge=0)
+    """Files with more rows than this are spilled to disk; the persisted block output is then the row
+    count and a preview of the first rows."""
+
+    # Live View Settings
+    CDP_FRAME_PUBLISHER_FROM_SCREENCAST: bool = False
+    """Have the worker's CDP frame publisher read the latest frame of the page's shared screencast
+    (skyvern/webeye/page_screencast.py) instead of taking a PNG screenshot every second. Published
+    frames are then JPEG, and the page is encoded once for the publisher and any in-process viewers."""
+
     # OpenTelemetry Settings
     OTEL_ENABLED: bool = False
     OTEL_SERVICE_NAME: str = "skyvern"
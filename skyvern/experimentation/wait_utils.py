@@ -5,12 +5,18 @@ These functions wrap asyncio.sleep with experiment-aware wait times and metrics
 """
 
 import asyncio
+import time
+from typing import TYPE_CHECKING
 
 import structlog
 from cachetools import TTLCache
 
 from skyvern.experimentation.wait_config import WaitConfig, get_wait_config_from_experiment
 from skyvern.forge import app
+from skyvern.forge.sdk.settings_manager import SettingsManager
+
+if TYPE_CHECKING:
+    from playwright.async_api import Frame, Page
 
 LOG = structlog.get_logger()
 
@@ -90,6 +96,55 @@ def get_wait_time(
     return default
 
 
+async def settle_wait(
+    page: "Page | Frame | None",
+    wait_seconds: float,
+    wait_type: str,
+    action_type: str | None = None,
+) -> None:
+    """
+    Wait up to wait_seconds after an action.
+
+    With BROWSER_ACTION_SETTLE_DETECTION on, this returns as soon as the page goes quiet (no DOM
+    mutations, no requests completing, document loaded), so wait_seconds is only the upper bound.
+    The time saved against it is logged per wait and action type. If the page can't be observed,
+    e.g. because the action started a navigation, the rest of the fixed wait is slept as before.
+
+    Args:
+        page: Page the action ran on; None always sleeps the fixed wait
+        wait_seconds: Fixed wait, from get_wait_time
+        wait_type: Type of wait (e.g., "post_click_delay"), for logging
+        action_type: Type of the action just run, for logging
+    """
+    if wait_seconds <= 0 or page is None or not SettingsManager.get_settings().BROWSER_ACTION_SETTLE_DETECTION:
+        await asyncio.sleep(max(wait_seconds, 0.0))
+        return
+
+    from skyvern.webeye.utils.page import SkyvernFrame  # noqa: PLC0415
+
+    started_at = time.monotonic()
+    try:
+        settled = await SkyvernFrame(frame=page).wait_for_action_settle(max_ms=wait_seconds * 1000)
+        outcome = "settled" if settled else "upper_bound"
+    except Exception:
+        outcome = "unobservable"
+        LOG.debug("Could not observe the page settling, sleeping the fixed wait", wait_type=wait_type, exc_info=True)
+        remaining = wait_seconds - (time.monotonic() - started_at)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+    waited = time.monotonic() - started_at
+    LOG.info(
+        "Post-action settle wait",
+        wait_type=wait_type,
+        action_type=action_type,
+        outcome=outcome,
+        upper_bound_ms=round(wait_seconds * 1000),
+        waited_ms=round(waited * 1000),
+        saved_ms=round((wait_seconds - waited) * 1000),
+        sampling=True,
+    )
+
+
 # Convenience functions for common wait patterns
 
 
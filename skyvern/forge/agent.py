@@ -72,7 +72,7 @@ from skyvern.exceptions import (
     UnsupportedTaskType,
     get_user_facing_exception_message,
 )
-from skyvern.experimentation.wait_utils import get_or_create_wait_config, get_wait_time
+from skyvern.experimentation.wait_utils import get_or_create_wait_config, get_wait_time, settle_wait
 from skyvern.forge import app
 from skyvern.forge.async_operations import AgentPhase, AsyncOperationPool
 from skyvern.forge.failure_classifier import classify_from_failure_reason
@@ -158,7 +158,7 @@ from skyvern.forge.validation_evidence_router import (
     ValidationRouterResult,
     route_validation_evidence,
 )
-from skyvern.schemas.runs import CUA_ENGINES, RunEngine
+from skyvern.schemas.runs import CUA_ENGINES, RunEngine, RunType
 from skyvern.schemas.steps import AgentStepOutput
 from skyvern.services import run_service, service_utils
 from skyvern.services.action_service import get_action_history
@@ -174,6 +174,15 @@ from skyvern.services.webhook_delivery import (
     deliver_webhook_with_retries,
     describe_delivery_error,
 )
+from skyvern.services.webhook_outbox import enqueue_run_webhook
+from skyvern.services.write_behind import (
+    RunWriteBuffer,
+    begin_step_write_behind,
+    current_write_buffer,
+    flush_write_buffer,
+    persist_action,
+    record_step_llm_usage,
+)
 from skyvern.utils.image_resizer import Resolution
 from skyvern.utils.prompt_engine import (
     PROMPT_HARD_CEILING_TOKENS,
@@ -2567,6 +2576,7 @@ class ForgeAgent:
         )
         prefetched_summary_task: asyncio.Task[dict[str, Any]] | None = None
         artifact_tracker = _BackgroundArtifactTaskTracker()
+        write_buffer: RunWriteBuffer | None = None
 
         try:
             LOG.info(
@@ -2590,6 +2600,7 @@ class ForgeAgent:
                         log_context={"task_id": task.task_id},
                     )
 
+            write_buffer = begin_step_write_behind(step)
             step = await self.update_step(step=step, status=StepStatus.running)
             injected_actions = await app.AGENT_FUNCTION.prepare_step_execution(
                 organization=organization, task=task, step=step, browser_state=browser_state
@@ -2752,6 +2763,8 @@ class ForgeAgent:
         finally:
             await _cancel_pending_prefetch_task(prefetched_summary_task)
             await artifact_tracker.drain()
+            if write_buffer is not None:
+                await write_buffer.end_step(step.step_id)
 
     async def _execute_step_actions(
         self,
@@ -2860,7 +2873,7 @@ class ForgeAgent:
                 detailed_agent_step_output.actions_and_results[action_idx] = (action, [action_result])
                 action.started_at = reload_started_at
                 action.finished_at = naive_utc_now()
-                action.action_id = (await app.DATABASE.workflow_params.create_action(action=action)).action_id
+                action.action_id = (await persist_action(action)).action_id
                 artifact_tracker.task = asyncio.create_task(
                     self.record_artifacts_after_action(task, step, browser_state, engine, action)
                 )
@@ -2978,7 +2991,7 @@ class ForgeAgent:
                 "action.post_wait",
                 attributes={"wait_time_ms": int(wait_time * 1000), "action_idx": action_idx},
             )
-            await asyncio.sleep(wait_time)
+            await settle_wait(current_page, wait_time, "inter_action_delay", action.action_type)
             if not is_page_level_scroll:
                 artifact_tracker.task = asyncio.create_task(
                     self.record_artifacts_after_action(task, step, browser_state, engine, action)
@@ -3521,10 +3534,8 @@ class ForgeAgent:
             cached_tokens = first_response.usage.input_tokens_details.cached_tokens or 0
             reasoning_tokens = first_response.usage.output_tokens_details.reasoning_tokens or 0
             llm_cost = (3.0 / 1000000) * input_tokens + (12.0 / 1000000) * output_tokens
-            await app.DATABASE.tasks.update_step(
-                task_id=task.task_id,
-                step_id=step.step_id,
-                organization_id=task.organization_id,
+            await record_step_llm_usage(
+                step,
                 incremental_cost=llm_cost,
                 incremental_input_tokens=input_tokens if input_tokens > 0 else None,
                 incremental_output_tokens=output_tokens if output_tokens > 0 else None,
@@ -3660,10 +3671,8 @@ class ForgeAgent:
         cached_tokens = current_response.usage.input_tokens_details.cached_tokens or 0
         reasoning_tokens = current_response.usage.output_tokens_details.reasoning_tokens or 0
         llm_cost = (3.0 / 1000000) * input_tokens + (12.0 / 1000000) * output_tokens
-        await app.DATABASE.tasks.update_step(
-            task_id=task.task_id,
-            step_id=step.step_id,
-            organization_id=task.organization_id,
+        await record_step_llm_usage(
+            step,
             incremental_cost=llm_cost,
             incremental_input_tokens=input_tokens if input_tokens > 0 else None,
             incremental_output_tokens=output_tokens if output_tokens > 0 else None,
@@ -4099,10 +4108,8 @@ class ForgeAgent:
             or incremental_reasoning_tokens is not None
             or incremental_cached_tokens is not None
         ):
-            await app.DATABASE.tasks.update_step(
-                task_id=step.task_id,
-                step_id=step.step_id,
-                organization_id=step.organization_id,
+            await record_step_llm_usage(
+                step,
                 incremental_cost=incremental_cost,
                 incremental_input_tokens=incremental_input_tokens,
                 incremental_output_tokens=incremental_output_tokens,
@@ -5165,10 +5172,7 @@ class ForgeAgent:
                 model_name = match.group(1).lower()
 
             # Create cache for this task
-            # Use asyncio.to_thread to offload blocking HTTP request (requests.post)
-            # This prevents freezing the event loop during cache creation
-            cache_data = await asyncio.to_thread(
-                cache_manager.create_cache,
+            cache_data = await cache_manager.create_cache(
                 model_name=model_name,
                 static_content=static_prompt,
                 cache_key=cache_key,
@@ -5451,7 +5455,8 @@ class ForgeAgent:
                     enable_new_planner_actions=enable_new_planner_actions,
                     planner_mini_goal_improvements=planner_mini_goal_improvements,
                 )
-                static_prompt = prompt_engine.load_prompt(f"{template}-static", **prompt_kwargs)
+                # Constant for the task's variant flags, so later steps reuse the first render.
+                static_prompt = prompt_engine.load_prompt_memoized(f"{template}-static", **prompt_kwargs)
                 dynamic_prompt = prompt_engine.load_prompt(
                     f"{template}-dynamic",
                     elements=elements_for_prompt,
@@ -6194,6 +6199,17 @@ class ForgeAgent:
                 headers=signed_data.headers,
             )
 
+            # A manual replay (enable_retries=False) is delivered inline so the caller sees its outcome.
+            if enable_retries and await enqueue_run_webhook(
+                organization_id=task.organization_id,
+                run_id=task.task_id,
+                run_type=RunType.task_v1,
+                url=task.webhook_callback_url,
+                payload=signed_data.signed_payload,
+                headers=signed_data.headers,
+            ):
+                return
+
             try:
                 resp = await deliver_webhook_with_retries(
                     url=task.webhook_callback_url,
@@ -6561,12 +6577,24 @@ class ForgeAgent:
 
         await save_step_logs(step.step_id)
 
-        return await app.DATABASE.tasks.update_step(
-            task_id=step.task_id,
-            step_id=step.step_id,
-            organization_id=step.organization_id,
-            **updates,
-        )
+        # A step update is a write-behind consistency point: commit the buffered actions first, and
+        # fold the step's buffered LLM usage into this UPDATE instead of writing it separately.
+        write_buffer = current_write_buffer()
+        usage = write_buffer.take_step_usage(step.step_id) if write_buffer else {}
+        try:
+            if write_buffer:
+                await write_buffer.flush("step_update")
+            return await app.DATABASE.tasks.update_step(
+                task_id=step.task_id,
+                step_id=step.step_id,
+                organization_id=step.organization_id,
+                **updates,
+                **usage,
+            )
+        except BaseException:
+            if write_buffer and usage:
+                write_buffer.restore_step_usage(step.step_id, step.task_id, step.organization_id, usage)
+            raise
 
     async def update_task(
         self,
@@ -6578,6 +6606,7 @@ class ForgeAgent:
         errors: list[dict[str, Any]] | None = None,
         failure_category: list[dict[str, Any]] | None = None,
     ) -> Task:
+        await flush_write_buffer("task_update")
         # refresh task from db to get the latest status
         task_from_db = await app.DATABASE.tasks.get_task(task_id=task.task_id, organization_id=task.organization_id)
         if task_from_db:
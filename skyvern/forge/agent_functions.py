@@ -38,6 +38,7 @@ from skyvern.forge.sdk.api.llm.api_handler import LLMAPIHandler
 from skyvern.forge.sdk.api.llm.api_handler_factory import get_org_aware_secondary_llm_api_handler
 from skyvern.forge.sdk.api.llm.exceptions import LLMProviderError
 from skyvern.forge.sdk.cache.base import CACHE_EXPIRE_TIME
+from skyvern.forge.sdk.cache.extraction_cache_sqlite import get_local_cross_run_cache
 from skyvern.forge.sdk.copilot.code_block_preflight import CodeBlockScanFinding
 from skyvern.forge.sdk.copilot.config import CopilotConfig, block_authoring_policy_from_code_only_mode
 from skyvern.forge.sdk.core import skyvern_context
@@ -1636,8 +1637,26 @@ class AgentFunction:
         workflow_permanent_id: str | None,
         cache_key: str,
     ) -> Any | None:
-        """Cross-run (wpid-scoped) extraction-cache read. OSS no-op."""
-        return None
+        """Cross-run (wpid-scoped) extraction-cache read. OSS reads the SQLite tier when
+        EXTRACTION_CACHE_SQLITE_PATH is set and is a no-op otherwise."""
+        cache = get_local_cross_run_cache()
+        if cache is None:
+            return None
+        result = await cache.lookup(workflow_permanent_id, cache_key)
+        if result is None:
+            return None
+        if not result.hit:
+            # The callers only see None and log every cross-run miss as ``cross_run_miss``; record
+            # the tier's own reason (key_not_found, ttl_expired or lookup_error) here.
+            LOG.info(
+                "extraction_cache.cross_run_miss",
+                workflow_permanent_id=workflow_permanent_id,
+                cache_key=cache_key,
+                cache_scope=result.scope,
+                fallback_reason=result.fallback_reason,
+            )
+            return None
+        return result.value
 
     async def store_cross_run_extraction_cache(
         self,
@@ -1645,7 +1664,12 @@ class AgentFunction:
         cache_key: str,
         value: Any,
     ) -> None:
-        """Cross-run (wpid-scoped) extraction-cache write. OSS no-op."""
+        """Cross-run (wpid-scoped) extraction-cache write. OSS writes the SQLite tier when
+        EXTRACTION_CACHE_SQLITE_PATH is set and is a no-op otherwise."""
+        cache = get_local_cross_run_cache()
+        if cache is None:
+            return None
+        await cache.store(workflow_permanent_id, cache_key, value)
         return None
 
     async def collect_virtualized_grid_rows(self, *, task: Task, page: Page) -> str | None:
@@ -2241,6 +2265,7 @@ class AgentFunction:
         organization_id: str | None = None,
         run_id: str | None = None,
         resolved_ips: tuple[str, ...] | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> httpx.Response:
         """Deliver a webhook POST request to *url*.
 
@@ -2249,14 +2274,24 @@ class AgentFunction:
 
         ``resolved_ips`` pins the connection to addresses the caller already validated,
         closing the DNS-rebinding window between validation and connect.
+
+        ``client`` is a caller-owned keep-alive client for the destination (the webhook
+        outbox worker keeps one per origin); it is used only when no IPs are pinned.
         """
-        async with pinned_ip_client(resolved_ips) as client:
+        if client is not None and not resolved_ips:
             return await client.post(
                 url,
                 content=payload,
                 headers=headers,
                 timeout=httpx.Timeout(timeout_seconds),
             )
+        async with pinned_ip_client(resolved_ips) as pinned_client:
+            return await pinned_client.post(
+                url,
+                content=payload,
+                headers=headers,
+                timeout=httpx.Timeout(timeout_seconds),
+            )
 
     async def post_totp_verification_request(
         self,
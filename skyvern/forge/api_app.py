@@ -3,6 +3,7 @@
 # The server-extra guard must run before FastAPI/Starlette imports.
 # ruff: noqa: E402
 
+import asyncio
 import os
 import uuid
 from contextlib import asynccontextmanager
@@ -35,13 +36,20 @@ from skyvern.cors import credentialed_cors_allow_origin_regex, credentialed_cors
 from skyvern.exceptions import SkyvernHTTPException
 from skyvern.forge import app as forge_app
 from skyvern.forge.forge_app_initializer import start_forge_app
+from skyvern.forge.prompts import prompt_engine
 from skyvern.forge.request_logging import RequestLoggingMiddleware, log_raw_request_exception
 from skyvern.forge.sdk.api.llm.custom_llm_registry import load_custom_llm_configs_from_database
+from skyvern.forge.sdk.api.llm.vertex_cache_manager import close_cache_manager as close_vertex_cache_manager
 from skyvern.forge.sdk.copilot.tracing_setup import ensure_tracing_initialized
 from skyvern.forge.sdk.core import skyvern_context
+from skyvern.forge.sdk.core.aiohttp_helper import close_pooled_http_client
 from skyvern.forge.sdk.core.skyvern_context import SkyvernContext
 from skyvern.forge.sdk.db.exceptions import NotFoundError
 from skyvern.forge.sdk.db.models import Base
+from skyvern.forge.sdk.db.status_notifications import (
+    start_status_notification_listener,
+    stop_status_notification_listener,
+)
 from skyvern.forge.sdk.routes import internal_auth, internal_llms
 from skyvern.forge.sdk.routes.google_oauth import google_oauth_router
 from skyvern.forge.sdk.routes.google_sheets import google_sheets_router
@@ -60,6 +68,7 @@ from skyvern.services.cleanup_service import (
     stop_cleanup_scheduler,
     stop_temp_artifact_sweep,
 )
+from skyvern.services.webhook_outbox import start_webhook_outbox_worker, stop_webhook_outbox_worker
 from skyvern.services.workflow_schedule_service import (
     start_workflow_schedule_scheduler,
     stop_workflow_schedule_scheduler,
@@ -303,6 +312,13 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, Any]:
     # the lazy path also fails after every code change in dev.
     ensure_tracing_initialized()
 
+    # Compile the prompt templates now so the first steps don't pay for parsing them.
+    try:
+        compiled_templates = await asyncio.to_thread(prompt_engine.precompile)
+        LOG.info("Precompiled prompt templates", template_count=compiled_templates)
+    except Exception:
+        LOG.exception("Failed to precompile prompt templates")
+
     # Auto-bootstrap SQLite database on first server start.
     # Re-raise on failure — a server with no tables/org/API key is
     # useless and would produce confusing 401s on every request.
@@ -345,6 +361,16 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, Any]:
     if workflow_schedule_task:
         LOG.info("Workflow schedule scheduler started")
 
+    start_webhook_outbox_worker()
+
+    start_status_notification_listener(forge_app.DATABASE.engine)
+
+    # Launch the warm browser pool now, so the first runs after a deploy don't start cold.
+    try:
+        await forge_app.BROWSER_MANAGER.prewarm_browser_pool()
+    except Exception:
+        LOG.exception("Failed to prewarm the browser pool")
+
     # Start MCP sub-application lifespan if mounted. Starlette Mount does NOT
     # forward lifespan events to sub-apps, so we must enter the MCP app's
     # lifespan here. This initializes the streamable-http session manager's
@@ -360,9 +386,14 @@ async def lifespan(fastapi_app: FastAPI) -> AsyncGenerator[None, Any]:
 
     # Stop cleanup scheduler
     await stop_workflow_schedule_scheduler()
+    await stop_webhook_outbox_worker()
+    await stop_status_notification_listener()
     await stop_cleanup_scheduler()
     await stop_temp_artifact_sweep()
     await interpretation_registry.stop_all()
+    await forge_app.BROWSER_MANAGER.close_browser_pool()
+    await close_pooled_http_client()
+    await close_vertex_cache_manager()
 
     if forge_app.api_app_shutdown_event:
         LOG.info("Calling api app shutdown event")
@@ -29,6 +29,7 @@ from skyvern.forge.sdk.artifact.storage.gcs import GcsStorage
 from skyvern.forge.sdk.artifact.storage.s3 import S3Storage
 from skyvern.forge.sdk.cache.base import BaseCache
 from skyvern.forge.sdk.cache.factory import CacheFactory
+from skyvern.forge.sdk.core.local_rate_limiter import LocalRateLimiter
 from skyvern.forge.sdk.core.rate_limiter import NoopRateLimiter, RateLimiter
 from skyvern.forge.sdk.db.agent_db import AgentDB
 from skyvern.forge.sdk.encrypt.bootstrap import register_aes_encryptor
@@ -154,7 +155,9 @@ def create_forge_app() -> ForgeApp:
     app.ARTIFACT_MANAGER = ArtifactManager()
     app.BROWSER_MANAGER = RealBrowserManager()
     app.EXPERIMENTATION_PROVIDER = NoOpExperimentationProvider()
-    app.RATE_LIMITER = NoopRateLimiter()
+    app.RATE_LIMITER = (
+        LocalRateLimiter(settings.RATE_LIMITER_SQLITE_PATH) if settings.RATE_LIMITER_SQLITE_PATH else NoopRateLimiter()
+    )
 
     app.LLM_API_HANDLER = LLMAPIHandlerFactory.get_llm_api_handler(settings.LLM_KEY)
     app.OPENAI_CUA_MODEL = settings.OPENAI_CUA_MODEL
@@ -74,6 +74,7 @@ from skyvern.schemas.llm import (
     LLMConfig,
     LLMRouterConfig,
 )
+from skyvern.services.write_behind import record_step_llm_usage
 from skyvern.utils.image_resizer import Resolution, get_resize_target_dimension, resize_screenshots
 from skyvern.utils.image_token_estimator import estimate_image_cost, estimate_image_tokens, provider_image_tokens
 from skyvern.utils.secret_redaction import redact_secrets_from_text
@@ -2211,10 +2212,8 @@ class LLMAPIHandlerFactory:
                 # per-call tracking table.
                 actual_model = _normalize_llm_model(getattr(response, "model", None) or model_used)
                 if step and not is_speculative_step:
-                    await app.DATABASE.tasks.update_step(
-                        task_id=step.task_id,
-                        step_id=step.step_id,
-                        organization_id=step.organization_id,
+                    await record_step_llm_usage(
+                        step,
                         incremental_cost=llm_cost,
                         incremental_input_tokens=prompt_tokens if prompt_tokens > 0 else None,
                         incremental_output_tokens=completion_tokens if completion_tokens > 0 else None,
@@ -2826,10 +2825,8 @@ class LLMAPIHandlerFactory:
 
                 actual_model = _normalize_llm_model(getattr(response, "model", None) or model_name)
                 if step and not is_speculative_step:
-                    await app.DATABASE.tasks.update_step(
-                        task_id=step.task_id,
-                        step_id=step.step_id,
-                        organization_id=step.organization_id,
+                    await record_step_llm_usage(
+                        step,
                         incremental_cost=llm_cost,
                         incremental_input_tokens=prompt_tokens if prompt_tokens > 0 else None,
                         incremental_output_tokens=completion_tokens if completion_tokens > 0 else None,
@@ -3554,10 +3551,8 @@ class LLMCaller:
 
             actual_model = _normalize_llm_model(getattr(response, "model", None) or self.llm_config.model_name)
             if step and not is_speculative_step:
-                await app.DATABASE.tasks.update_step(
-                    task_id=step.task_id,
-                    step_id=step.step_id,
-                    organization_id=step.organization_id,
+                await record_step_llm_usage(
+                    step,
                     incremental_cost=call_stats.llm_cost,
                     incremental_input_tokens=call_stats.input_tokens,
                     incremental_output_tokens=call_stats.output_tokens,
@@ -0,0 +1,117 @@
+"""Downscale and re-encode screenshots before they are inlined into LLM prompts.
+
+Raw full-resolution PNGs dominate request payloads. With LLM_SCREENSHOT_ENCODING_ENABLED on,
+each screenshot is resized so its long edge fits LLM_SCREENSHOT_MAX_DIMENSION and re-encoded
+as LLM_SCREENSHOT_FORMAT at LLM_SCREENSHOT_QUALITY. Encoding runs in a worker thread, and
+results are cached per screenshot digest because the same capture is often sent again
+(retries, check-user-goal, speculative steps).
+"""
+
+import asyncio
+import hashlib
+import io
+from dataclasses import dataclass
+
+import structlog
+from cachetools import LRUCache
+from opentelemetry import trace as otel_trace
+from PIL import Image
+
+from skyvern.config import settings
+
+LOG = structlog.get_logger()
+
+PNG_MEDIA_TYPE = "image/png"
+
+_FORMATS: dict[str, tuple[str, str]] = {
+    # setting value -> (Pillow format, media type)
+    "webp": ("WEBP", "image/webp"),
+    "jpeg": ("JPEG", "image/jpeg"),
+    "png": ("PNG", PNG_MEDIA_TYPE),
+}
+
+_ENCODED_CACHE_SIZE = 128
+
+
+@dataclass(frozen=True)
+class EncodedScreenshot:
+    data: bytes
+    media_type: str
+
+
+_encoded_cache: LRUCache[tuple[str, int, str, int], EncodedScreenshot] = LRUCache(maxsize=_ENCODED_CACHE_SIZE)
+
+
+def _encode(screenshot: bytes, max_dimension: int, image_format: str, quality: int) -> EncodedScreenshot:
+    pil_format, media_type = _FORMATS[image_format]
+    with Image.open(io.BytesIO(screenshot)) as image:
+        image.load()
+        resized = image
+        if max_dimension > 0 and max(image.size) > max_dimension:
+            scale = max_dimension / max(image.size)
+            size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            resized = image.resize(size, Image.Resampling.LANCZOS)
+        if pil_format == "JPEG" and resized.mode not in ("RGB", "L"):
+            resized = resized.convert("RGB")
+        buf = io.BytesIO()
+        if pil_format == "PNG":
+            resized.save(buf, format=pil_format, optimize=True)
+        else:
+            resized.save(buf, format=pil_format, quality=quality)
+        if resized is not image:
+            resized.close()
+    return EncodedScreenshot(data=buf.getvalue(), media_type=media_type)
+
+
+async def encode_screenshot_for_llm(screenshot: bytes) -> EncodedScreenshot:
+    """Return the bytes and media type to inline for ``screenshot``.
+
+    Falls back to the original PNG when encoding is disabled, fails, or would not make the
+    image smaller.
+    """
+    if not settings.LLM_SCREENSHOT_ENCODING_ENABLED:
+        return EncodedScreenshot(data=screenshot, media_type=PNG_MEDIA_TYPE)
+
+    image_format = settings.LLM_SCREENSHOT_FORMAT.lower()
+    if image_format not in _FORMATS:
+        LOG.warning("Unknown LLM screenshot format; sending the original PNG", image_format=image_format)
+        return EncodedScreenshot(data=screenshot, media_type=PNG_MEDIA_TYPE)
+
+    key = (
+        hashlib.sha256(screenshot).hexdigest(),
+        settings.LLM_SCREENSHOT_MAX_DIMENSION,
+        image_format,
+        settings.LLM_SCREENSHOT_QUALITY,
+    )
+    cached = _encoded_cache.get(key)
+    if cached is not None:
+        return cached
+
+    try:
+        encoded = await asyncio.to_thread(_encode, screenshot, *key[1:])
+    except Exception:
+        LOG.warning("Failed to encode screenshot for the LLM; sending the original PNG", exc_info=True)
+        return EncodedScreenshot(data=screenshot, media_type=PNG_MEDIA_TYPE)
+
+    if len(encoded.data) >= len(screenshot):
+        encoded = EncodedScreenshot(data=screenshot, media_type=PNG_MEDIA_TYPE)
+    _encoded_cache[key] = encoded
+    return encoded
+
+
+async def encode_screenshots_for_llm(screenshots: list[bytes]) -> list[EncodedScreenshot]:
+    """Encode a batch of screenshots concurrently and record the byte savings on the current span."""
+    encoded = list(await asyncio.gather(*(encode_screenshot_for_llm(screenshot) for screenshot in screenshots)))
+    if settings.LLM_SCREENSHOT_ENCODING_ENABLED and screenshots:
+        raw_bytes = sum(len(screenshot) for screenshot in screenshots)
+        encoded_bytes = sum(len(image.data) for image in encoded)
+        span = otel_trace.get_current_span()
+        span.set_attribute("screenshot_bytes_raw", raw_bytes)
+        span.set_attribute("screenshot_bytes_encoded", encoded_bytes)
+        LOG.debug(
+            "Encoded screenshots for LLM",
+            screenshot_count=len(screenshots),
+            raw_bytes=raw_bytes,
+            encoded_bytes=encoded_bytes,
+        )
+    return encoded
@@ -16,6 +16,7 @@ from skyvern.forge.sdk.api.llm.exceptions import (
     InvalidLLMResponseType,
     LLMOutputTruncatedError,
 )
+from skyvern.forge.sdk.api.llm.screenshot_encoding import encode_screenshots_for_llm
 
 LOG = structlog.get_logger()
 
@@ -43,14 +44,14 @@ async def llm_messages_builder(
     ]
 
     if screenshots:
-        for screenshot in screenshots:
-            encoded_image = base64.b64encode(screenshot).decode("utf-8")
+        for screenshot in await encode_screenshots_for_llm(screenshots):
+            encoded_image = base64.b64encode(screenshot.data).decode("utf-8")
             if message_pattern == "anthropic":
                 message = {
                     "type": "image",
                     "source": {
                         "type": "base64",
-                        "media_type": "image/png",
+                        "media_type": screenshot.media_type,
                         "data": encoded_image,
                     },
                 }
@@ -58,7 +59,7 @@ async def llm_messages_builder(
                 message = {
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/png;base64,{encoded_image}",
+                        "url": f"data:{screenshot.media_type};base64,{encoded_image}",
                     },
                 }
             messages.append(message)
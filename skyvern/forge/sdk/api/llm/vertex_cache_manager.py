@@ -8,12 +8,13 @@ Unlike the Anthropic-style cache_control markers, Vertex AI requires:
 3. Referencing that cache name in subsequent requests
 """
 
+import asyncio
 import json
-from datetime import datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import google.auth
-import requests
+import httpx
 import structlog
 from google.auth.credentials import Credentials
 from google.auth.transport.requests import Request
@@ -23,6 +24,17 @@ from skyvern.config import settings
 
 LOG = structlog.get_logger()
 
+# Refresh the access token this long before it expires so no request goes out with a token that lapses
+# in flight.
+TOKEN_REFRESH_MARGIN = timedelta(minutes=5)
+# A registered cache is only reused while it has at least this long left, so the LLM call that references
+# it cannot race its expiry.
+CACHE_REUSE_MARGIN = timedelta(minutes=2)
+
+
+def _parse_expire_time(expire_time: str) -> datetime:
+    return datetime.fromisoformat(expire_time.replace("Z", "+00:00"))
+
 
 class VertexCacheManager:
     """
@@ -30,9 +42,20 @@ class VertexCacheManager:
 
     This provides guaranteed cache hits for static content across requests,
     unlike implicit caching which requires exact prompt matches.
+
+    All calls are asyncio-native and share one pooled HTTP client. Access tokens are cached and
+    refreshed ahead of expiry, concurrent creates for the same cache_key share one request, and
+    the local registry drops caches once their TTL has passed (Vertex deletes them server-side).
     """
 
-    def __init__(self, project_id: str, location: str = "global", credentials_json: str | None = None):
+    def __init__(
+        self,
+        project_id: str,
+        location: str = "global",
+        credentials_json: str | None = None,
+        base_url: str | None = None,
+        credentials: Credentials | None = None,
+    ):
         self.project_id = project_id
         self.location = location
         # Use regional endpoint for non-global locations, global endpoint for global
@@ -40,11 +63,15 @@ class VertexCacheManager:
             self.api_endpoint = "aiplatform.googleapis.com"
         else:
             self.api_endpoint = f"{location}-aiplatform.googleapis.com"
+        # base_url lets tests point the manager at a local HTTP stand-in
+        self.base_url = base_url or f"https://{self.api_endpoint}"
         self._cache_registry: dict[str, dict[str, Any]] = {}  # Maps cache_key -> cache_data
+        self._inflight_creates: dict[str, asyncio.Task[dict[str, Any]]] = {}
         self._scopes = ["https://www.googleapis.com/auth/cloud-platform"]
-        self._default_credentials = None
-        self._service_account_credentials = None
+        self._credentials: Credentials | None = credentials
         self._service_account_info: dict[str, Any] | None = None
+        self._token_lock = asyncio.Lock()
+        self._client: httpx.AsyncClient | None = None
 
         if credentials_json:
             try:
@@ -52,34 +79,83 @@ class VertexCacheManager:
             except Exception as exc:  # noqa: BLE001
                 LOG.warning("Failed to parse Vertex credentials JSON, falling back to ADC", error=str(exc))
 
-    def _get_access_token(self) -> str:
-        """Get Google Cloud access token for API calls."""
-        try:
-            credentials: Credentials | None = None
-            if self._service_account_info:
-                if not self._service_account_credentials:
-                    self._service_account_credentials = service_account.Credentials.from_service_account_info(
-                        self._service_account_info,
-                        scopes=self._scopes,
-                    )
-                credentials = self._service_account_credentials
-            else:
-                if not self._default_credentials:
-                    self._default_credentials, _ = google.auth.default(scopes=self._scopes)
-                credentials = self._default_credentials
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                timeout=httpx.Timeout(30.0, connect=10.0),
+                limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _load_credentials(self) -> Credentials:
+        if self._service_account_info:
+            return service_account.Credentials.from_service_account_info(
+                self._service_account_info,
+                scopes=self._scopes,
+            )
+        credentials, _ = google.auth.default(scopes=self._scopes)
+        return credentials
 
-            if credentials is None:
-                raise RuntimeError("Unable to initialize Google credentials for Vertex cache manager")
+    def _token_is_fresh(self) -> bool:
+        credentials = self._credentials
+        if credentials is None or not credentials.token or not credentials.valid:
+            return False
+        if credentials.expiry is None:
+            return True
+        # google-auth stores expiry as a naive UTC datetime
+        expiry = credentials.expiry.replace(tzinfo=UTC)
+        return expiry - datetime.now(UTC) > TOKEN_REFRESH_MARGIN
 
-            if not credentials.valid or credentials.expired:
-                credentials.refresh(Request())
+    async def _get_access_token(self) -> str:
+        """Get Google Cloud access token for API calls.
 
-            return credentials.token
-        except Exception as e:
-            LOG.error("Failed to get access token", error=str(e))
-            raise
+        google-auth is synchronous, so loading and refreshing credentials run in a worker thread;
+        the lock keeps concurrent callers from refreshing the same token twice.
+        """
+        if self._token_is_fresh():
+            return self._credentials.token  # type: ignore[union-attr]
+        async with self._token_lock:
+            if self._token_is_fresh():
+                return self._credentials.token  # type: ignore[union-attr]
+            try:
+                if self._credentials is None:
+                    self._credentials = await asyncio.to_thread(self._load_credentials)
+                if self._credentials is None:
+                    raise RuntimeError("Unable to initialize Google credentials for Vertex cache manager")
+                await asyncio.to_thread(self._credentials.refresh, Request())
+                return self._credentials.token
+            except Exception as e:
+                LOG.error("Failed to get access token", error=str(e))
+                raise
+
+    def purge_expired(self) -> None:
+        """Drop registry entries whose TTL has passed."""
+        now = datetime.now(UTC)
+        expired = [
+            cache_key
+            for cache_key, cache_data in self._cache_registry.items()
+            if _parse_expire_time(cache_data["expireTime"]) <= now
+        ]
+        for cache_key in expired:
+            del self._cache_registry[cache_key]
+        if expired:
+            LOG.debug("Purged expired Vertex caches from registry", cache_keys=expired)
+
+    def _get_live_cache(self, cache_key: str) -> dict[str, Any] | None:
+        cache_data = self._cache_registry.get(cache_key)
+        if cache_data is None:
+            return None
+        if _parse_expire_time(cache_data["expireTime"]) - datetime.now(UTC) > CACHE_REUSE_MARGIN:
+            return cache_data
+        return None
 
-    def create_cache(
+    async def create_cache(
         self,
         model_name: str,
         static_content: str,
@@ -100,21 +176,36 @@ class VertexCacheManager:
         Returns:
             Cache data with 'name', 'expireTime', etc.
         """
-        # Check if cache already exists for this key
-        if cache_key in self._cache_registry:
-            cache_data = self._cache_registry[cache_key]
-            # Check if still valid
-            expire_time = datetime.fromisoformat(cache_data["expireTime"].replace("Z", "+00:00"))
-            if expire_time > datetime.now(expire_time.tzinfo):
-                return cache_data
-            else:
-                # Clean up expired cache
-                try:
-                    self.delete_cache(cache_key)
-                except Exception:
-                    pass  # Best effort cleanup
+        self.purge_expired()
+        cache_data = self._get_live_cache(cache_key)
+        if cache_data is not None:
+            return cache_data
+
+        # Concurrent callers for the same key share one create request.
+        create = self._inflight_creates.get(cache_key)
+        if create is None:
+            create = asyncio.create_task(
+                self._create_cache(
+                    model_name=model_name,
+                    static_content=static_content,
+                    cache_key=cache_key,
+                    ttl_seconds=ttl_seconds,
+                    system_instruction=system_instruction,
+                )
+            )
+            self._inflight_creates[cache_key] = create
+            create.add_done_callback(lambda _: self._inflight_creates.pop(cache_key, None))
+        return await asyncio.shield(create)
 
-        url = f"https://{self.api_endpoint}/v1/projects/{self.project_id}/locations/{self.location}/cachedContents"
+    async def _create_cache(
+        self,
+        model_name: str,
+        static_content: str,
+        cache_key: str,
+        ttl_seconds: int,
+        system_instruction: str | None,
+    ) -> dict[str, Any]:
+        url = f"/v1/projects/{self.project_id}/locations/{self.location}/cachedContents"
 
         # Build the model path
         full_model_path = f"projects/{self.project_id}/locations/{self.location}/publishers/google/models/{model_name}"
@@ -130,7 +221,7 @@ class VertexCacheManager:
         if system_instruction:
             payload["systemInstruction"] = {"parts": [{"text": system_instruction}]}
 
-        headers = {"Authorization": f"Bearer {self._get_access_token()}", "Content-Type": "application/json"}
+        headers = {"Authorization": f"Bearer {await self._get_access_token()}"}
 
         LOG.info(
             "Creating Vertex AI cache object",
@@ -141,7 +232,7 @@ class VertexCacheManager:
         )
 
         try:
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = await self._get_client().post(url, headers=headers, json=payload)
 
             if response.status_code != 200:
                 LOG.error(
@@ -167,14 +258,14 @@ class VertexCacheManager:
 
             return cache_data
 
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             LOG.error("Cache creation timed out", cache_key=cache_key)
             raise
         except Exception as e:
             LOG.error("Cache creation failed", cache_key=cache_key, error=str(e))
             raise
 
-    def delete_cache(self, cache_key: str) -> bool:
+    async def delete_cache(self, cache_key: str) -> bool:
         """Delete a cache object."""
         cache_data = self._cache_registry.get(cache_key)
         if not cache_data:
@@ -182,20 +273,20 @@ class VertexCacheManager:
             return False
 
         cache_name = cache_data["name"]
-        url = f"https://{self.api_endpoint}/v1/{cache_name}"
+        url = f"/v1/{cache_name}"
 
         headers = {
-            "Authorization": f"Bearer {self._get_access_token()}",
+            "Authorization": f"Bearer {await self._get_access_token()}",
         }
 
         LOG.info("Deleting cache", cache_key=cache_key, cache_name=cache_name)
 
         try:
-            response = requests.delete(url, headers=headers, timeout=10)
+            response = await self._get_client().delete(url, headers=headers, timeout=10)
 
             if response.status_code in (200, 204):
                 # Remove from registry
-                del self._cache_registry[cache_key]
+                self._cache_registry.pop(cache_key, None)
                 LOG.info("Cache deleted successfully", cache_key=cache_key)
                 return True
             else:
@@ -232,3 +323,9 @@ def get_cache_manager() -> VertexCacheManager:
         LOG.info("Created global cache manager", project_id=project_id, location=location)
 
     return _global_cache_manager
+
+
+async def close_cache_manager() -> None:
+    """Close the global cache manager's pooled HTTP client, if one was created."""
+    if _global_cache_manager is not None:
+        await _global_cache_manager.aclose()
@@ -1,4 +1,5 @@
 import asyncio
+import hashlib
 import io
 import os
 import time
@@ -6,10 +7,11 @@ import zipfile
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 from urllib.parse import urlencode
 
 import structlog
+from cachetools import LRUCache
 
 from skyvern.config import settings
 from skyvern.forge import app
@@ -32,6 +34,7 @@ from skyvern.forge.sdk.models import Step
 from skyvern.forge.sdk.schemas.ai_suggestions import AISuggestion
 from skyvern.forge.sdk.schemas.task_v2 import TaskV2, Thought
 from skyvern.forge.sdk.schemas.workflow_runs import WorkflowRunBlock
+from skyvern.services.write_behind import flush_write_buffer
 from skyvern.utils.secret_redaction import redact_har_bytes, redact_secrets_from_bytes
 
 if TYPE_CHECKING:
@@ -75,6 +78,12 @@ _SCREENSHOT_PREFIX_MAP: dict[ArtifactType, str] = {
     ArtifactType.SCREENSHOT_FINAL: "screenshot_final",
 }
 
+# Screenshots repeat byte-for-byte across steps on unchanged pages and loop iterations, so with
+# ARTIFACT_SCREENSHOT_DEDUP on they are stored once per org under their sha256 digest.
+_CONTENT_ADDRESSED_ARTIFACT_TYPES: frozenset[ArtifactType] = frozenset(_SCREENSHOT_PREFIX_MAP)
+# Content-addressed URIs this process has uploaded (or is uploading), so repeats skip the existence check.
+_CONTENT_UPLOAD_CACHE_SIZE = 10_000
+
 _REDACTABLE_TEXT_ARTIFACT_TYPES: frozenset[ArtifactType] = frozenset(
     {
         ArtifactType.HTML,
@@ -213,6 +222,8 @@ class ArtifactManager:
         self.upload_aiotasks_map: dict[str, list[asyncio.Task[None]]] = defaultdict(list)
         # step_id -> accumulator for step archive artifacts
         self._step_archives: dict[str, StepArchiveAccumulator] = {}
+        # content-addressed uri -> upload of its bytes, shared by every artifact with that content
+        self._content_uploads: LRUCache[str, asyncio.Future[bool]] = LRUCache(maxsize=_CONTENT_UPLOAD_CACHE_SIZE)
 
     def _track_upload_aiotask(
         self,
@@ -259,6 +270,7 @@ class ArtifactManager:
         organization_id: str,
         bundle_key: str | None = None,
         file_size: int | None = None,
+        checksum: str | None = None,
         step_id: str | None = None,
         task_id: str | None = None,
         workflow_run_id: str | None = None,
@@ -276,6 +288,7 @@ class ArtifactManager:
             artifact_type: Type of the artifact
             uri: Storage URI for the artifact
             organization_id: Organization ID
+            checksum: Optional sha256 hex digest of the stored bytes
             step_id: Optional step ID
             task_id: Optional task ID
             workflow_run_id: Optional workflow run ID
@@ -294,6 +307,7 @@ class ArtifactManager:
             uri=uri,
             bundle_key=bundle_key,
             file_size=file_size,
+            checksum=checksum,
             organization_id=organization_id,
             task_id=task_id,
             step_id=step_id,
@@ -305,6 +319,38 @@ class ArtifactManager:
             ai_suggestion_id=ai_suggestion_id,
         )
 
+    @staticmethod
+    def _content_addressed_uri(
+        organization_id: str, artifact_type: ArtifactType, data: bytes
+    ) -> tuple[str, str] | None:
+        """Return (uri, sha256 digest) when ``data`` should be stored content-addressed, else None."""
+        if not settings.ARTIFACT_SCREENSHOT_DEDUP or artifact_type not in _CONTENT_ADDRESSED_ARTIFACT_TYPES:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        uri = app.STORAGE.build_content_addressed_uri(
+            organization_id=organization_id, digest=digest, artifact_type=artifact_type
+        )
+        if uri is None:
+            return None
+        return uri, digest
+
+    async def _store_content_addressed(self, artifact: Artifact, data: bytes) -> None:
+        """Store a content-addressed artifact, uploading each distinct blob at most once per process.
+
+        Concurrent callers with the same content await one shared upload; a failed upload is
+        forgotten so the next caller retries it.
+        """
+        upload = self._content_uploads.get(artifact.uri)
+        if upload is None:
+            upload = asyncio.ensure_future(app.STORAGE.store_content_addressed_artifact(artifact, data))
+            self._content_uploads[artifact.uri] = upload
+        try:
+            await asyncio.shield(upload)
+        except Exception:
+            if self._content_uploads.get(artifact.uri) is upload:
+                self._content_uploads.pop(artifact.uri, None)
+            raise
+
     async def _create_artifact(
         self,
         aio_task_primary_key: str,
@@ -341,9 +387,14 @@ class ArtifactManager:
         if not workflow_run_block_id and context:
             workflow_run_block_id = context.parent_workflow_run_block_id
 
+        checksum = None
+        content_addressed = False
         if data is not None:
             data = _maybe_redact_artifact_data(artifact_type, data, workflow_run_id=workflow_run_id)
             file_size = len(data)
+            if content := self._content_addressed_uri(organization_id, artifact_type, data):
+                uri, checksum = content
+                content_addressed = True
 
         if file_size is None:
             file_size = _safe_file_size_from_path(path)
@@ -361,9 +412,14 @@ class ArtifactManager:
             run_id=run_id,
             organization_id=organization_id,
             ai_suggestion_id=ai_suggestion_id,
+            checksum=checksum,
             file_size=file_size,
         )
-        if data:
+        if data and content_addressed:
+            # Fire and forget
+            aio_task = asyncio.create_task(self._store_content_addressed(artifact, data))
+            self._track_upload_aiotask(aio_task_primary_key, aio_task)
+        elif data:
             # Fire and forget
             aio_task = asyncio.create_task(app.STORAGE.store_artifact(artifact, data))
             self._track_upload_aiotask(aio_task_primary_key, aio_task)
@@ -961,15 +1017,22 @@ class ArtifactManager:
         if not request.artifacts:
             return []
 
+        content_addressed: set[str] = set()
         for artifact_data in request.artifacts:
             if artifact_data.data is not None:
-                artifact_type = ArtifactType(artifact_data.artifact_model.artifact_type)
+                artifact_model = artifact_data.artifact_model
+                artifact_type = ArtifactType(artifact_model.artifact_type)
                 artifact_data.data = _maybe_redact_artifact_data(
                     artifact_type,
                     artifact_data.data,
-                    workflow_run_id=artifact_data.artifact_model.workflow_run_id,
+                    workflow_run_id=artifact_model.workflow_run_id,
                 )
-                artifact_data.artifact_model.file_size = len(artifact_data.data)
+                artifact_model.file_size = len(artifact_data.data)
+                if content := self._content_addressed_uri(
+                    artifact_model.organization_id, artifact_type, artifact_data.data
+                ):
+                    artifact_model.uri, artifact_model.checksum = content
+                    content_addressed.add(artifact_model.artifact_id)
 
         # Extract models for bulk insert
         artifact_models = [artifact_data.artifact_model for artifact_data in request.artifacts]
@@ -979,7 +1042,10 @@ class ArtifactManager:
 
         # Fire and forget upload tasks
         for artifact, artifact_data in zip(artifacts, request.artifacts):
-            if artifact_data.data is not None:
+            if artifact_data.data is not None and artifact.artifact_id in content_addressed:
+                aio_task = asyncio.create_task(self._store_content_addressed(artifact, artifact_data.data))
+                self._track_upload_aiotask(request.primary_key, aio_task)
+            elif artifact_data.data is not None:
                 aio_task = asyncio.create_task(app.STORAGE.store_artifact(artifact, artifact_data.data))
                 self._track_upload_aiotask(request.primary_key, aio_task)
             elif artifact_data.path is not None:
@@ -1752,19 +1818,55 @@ class ArtifactManager:
         acc.pending_action_screenshot_updates.append((organization_id, action_id, artifact_id))
 
     @staticmethod
-    def _build_zip(entries: dict[str, bytes]) -> bytes:
-        """Build an in-memory ZIP from a filename → bytes mapping.
+    def _write_zip(entries: dict[str, bytes], fileobj: IO[bytes]) -> None:
+        """Write a ZIP of a filename → bytes mapping to ``fileobj``.
 
         Text files (html, json, txt) are deflate-compressed; binary files (png, zip) are stored as-is.
         """
-        buf = io.BytesIO()
-        with zipfile.ZipFile(buf, "w") as zf:
+        with zipfile.ZipFile(fileobj, "w") as zf:
             for filename, data in entries.items():
                 ext = filename.rsplit(".", 1)[-1].lower() if "." in filename else ""
                 compress = zipfile.ZIP_STORED if ext in ("png", "zip", "webm") else zipfile.ZIP_DEFLATED
                 zf.writestr(zipfile.ZipInfo(filename), data, compress_type=compress)
+
+    @staticmethod
+    def _build_zip(entries: dict[str, bytes]) -> bytes:
+        """Build an in-memory ZIP from a filename → bytes mapping."""
+        buf = io.BytesIO()
+        ArtifactManager._write_zip(entries, buf)
         return buf.getvalue()
 
+    @staticmethod
+    def _write_zip_to_path(entries: dict[str, bytes], path: str) -> None:
+        with open(path, "wb") as f:
+            ArtifactManager._write_zip(entries, f)
+
+    async def _store_archive(self, artifact: Artifact, entries: dict[str, bytes]) -> None:
+        """Zip ``entries`` in a worker thread and upload the archive.
+
+        Compression never runs on the event loop. Small archives are built in memory and stored
+        with one PUT; archives whose members total ARTIFACT_ARCHIVE_SPOOL_THRESHOLD_BYTES or more
+        are spooled to a temp file and uploaded from disk, so the compressed copy is never held in
+        memory and the S3/GCS/Azure clients switch to their chunked multipart uploads.
+        """
+        total_bytes = sum(len(data) for data in entries.values())
+        if total_bytes < settings.ARTIFACT_ARCHIVE_SPOOL_THRESHOLD_BYTES:
+            zip_bytes = await asyncio.to_thread(self._build_zip, entries)
+            await app.STORAGE.store_artifact(artifact, zip_bytes)
+            return
+
+        temp_file = create_named_temporary_file(delete=False)
+        temp_file.close()
+        try:
+            await asyncio.to_thread(self._write_zip_to_path, entries, temp_file.name)
+            await app.STORAGE.store_artifact_from_path(artifact, temp_file.name)
+        finally:
+            # Local storage moves the file into place, so it may already be gone.
+            try:
+                os.remove(temp_file.name)
+            except FileNotFoundError:
+                pass
+
     async def flush_step_archive(self, step_id: str) -> None:
         """Persist the step's accumulated artifacts.
 
@@ -1794,6 +1896,11 @@ class ArtifactManager:
         else:
             await self._flush_step_archive_unbundled(accumulator)
 
+        if not accumulator.pending_action_screenshot_updates:
+            return
+        if settings.DATABASE_WRITE_BEHIND_ENABLED:
+            await self._link_action_screenshots_batched(accumulator.pending_action_screenshot_updates)
+            return
         for organization_id, action_id, artifact_id in accumulator.pending_action_screenshot_updates:
             try:
                 await app.DATABASE.artifacts.update_action_screenshot_artifact_id(
@@ -1809,6 +1916,25 @@ class ArtifactManager:
                     exc_info=True,
                 )
 
+    @staticmethod
+    async def _link_action_screenshots_batched(updates: list[tuple[str, str, str]]) -> None:
+        """Write-behind mode: flush the buffered action inserts, then link every screenshot in one
+        transaction."""
+        try:
+            # The actions these updates point at may still sit in the write-behind buffer.
+            await flush_write_buffer("step_archive")
+        except Exception:
+            # A failed flush keeps its actions buffered; links to actions already written still apply.
+            LOG.warning("Failed to flush write-behind buffer before linking action screenshots", exc_info=True)
+        try:
+            await app.DATABASE.artifacts.update_action_screenshot_artifact_ids(updates)
+        except Exception:
+            LOG.warning(
+                "Failed to update actions with screenshot artifact ids after archive flush",
+                action_ids=[action_id for _, action_id, _ in updates],
+                exc_info=True,
+            )
+
     async def _flush_step_archive_bundled(self, accumulator: StepArchiveAccumulator) -> None:
         """Bundle all accumulated entries into a single ZIP, one storage PUT, parent + member rows."""
         step = accumulator.step
@@ -1835,8 +1961,7 @@ class ArtifactManager:
             modified_at=now,
         )
 
-        zip_bytes = self._build_zip(accumulator.entries)
-        await app.STORAGE.store_artifact(archive_artifact, zip_bytes)
+        await self._store_archive(archive_artifact, accumulator.entries)
 
         # Parent archive row (no bundle_key — represents the ZIP object itself)
         parent_model = self._build_artifact_model(
@@ -1872,23 +1997,31 @@ class ArtifactManager:
         """Persist each accumulated entry as its own storage object + ArtifactModel row.
 
         No STEP_ARCHIVE parent — the ZIP doesn't exist in this mode. Storage
-        PUTs are sequenced; the member count per step is small (typically < 20).
+        PUTs run concurrently, at most ARTIFACT_UNBUNDLED_UPLOAD_CONCURRENCY at a
+        time; rows are only written once every PUT has succeeded. Screenshots
+        are stored content-addressed when ARTIFACT_SCREENSHOT_DEDUP is on.
         """
         step = accumulator.step
         now = datetime.now(UTC)
         member_models: list[ArtifactModel] = []
+        uploads: list[tuple[Artifact, bytes, bool]] = []
         for artifact_type, filename, artifact_id in accumulator.member_types:
             data = accumulator.entries[filename]
-            uri = app.STORAGE.build_uri(
-                organization_id=step.organization_id,
-                artifact_id=artifact_id,
-                step=step,
-                artifact_type=artifact_type,
-            )
+            checksum = None
+            if content := self._content_addressed_uri(step.organization_id, artifact_type, data):
+                uri, checksum = content
+            else:
+                uri = app.STORAGE.build_uri(
+                    organization_id=step.organization_id,
+                    artifact_id=artifact_id,
+                    step=step,
+                    artifact_type=artifact_type,
+                )
             artifact = Artifact(
                 artifact_id=artifact_id,
                 artifact_type=artifact_type,
                 uri=uri,
+                checksum=checksum,
                 organization_id=step.organization_id,
                 step_id=step.step_id,
                 task_id=step.task_id,
@@ -1898,13 +2031,14 @@ class ArtifactManager:
                 created_at=now,
                 modified_at=now,
             )
-            await app.STORAGE.store_artifact(artifact, data)
+            uploads.append((artifact, data, checksum is not None))
             member_models.append(
                 self._build_artifact_model(
                     artifact_id=artifact_id,
                     artifact_type=artifact_type,
                     uri=uri,
                     file_size=len(data),
+                    checksum=checksum,
                     organization_id=step.organization_id,
                     step_id=step.step_id,
                     task_id=step.task_id,
@@ -1913,6 +2047,20 @@ class ArtifactManager:
                     run_id=accumulator.run_id,
                 )
             )
+
+        semaphore = asyncio.Semaphore(max(1, settings.ARTIFACT_UNBUNDLED_UPLOAD_CONCURRENCY))
+
+        async def _store(artifact: Artifact, data: bytes, content_addressed: bool) -> None:
+            async with semaphore:
+                if content_addressed:
+                    await self._store_content_addressed(artifact, data)
+                else:
+                    await app.STORAGE.store_artifact(artifact, data)
+
+        results = await asyncio.gather(*(_store(*upload) for upload in uploads), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
         await app.DATABASE.artifacts.bulk_create_artifacts(member_models)
 
     async def create_task_archive(
@@ -1991,8 +2139,7 @@ class ArtifactManager:
             filename: _maybe_redact_artifact_data(artifact_type, data, workflow_run_id=archive_artifact.workflow_run_id)
             for filename, (artifact_type, data) in entries.items()
         }
-        zip_bytes = self._build_zip(zip_entries)
-        await app.STORAGE.store_artifact(archive_artifact, zip_bytes)
+        await self._store_archive(archive_artifact, zip_entries)
 
         # Parent archive row (no bundle_key — represents the ZIP object itself)
         parent_model = self._build_artifact_model(
@@ -1,5 +1,5 @@
+import asyncio
 import os
-import shutil
 import uuid
 from datetime import datetime, timezone
 from typing import BinaryIO
@@ -30,6 +30,7 @@ from skyvern.forge.sdk.artifact.storage.base import (
     key_is_org_scoped,
     presign_with_sensitive_cap,
 )
+from skyvern.forge.sdk.artifact.storage.profile_sync import zip_profile_directory
 from skyvern.forge.sdk.artifact.storage.run_recording_clips import RUN_RECORDING_PATH_SEGMENT, sync_run_recording_clips
 from skyvern.forge.sdk.artifact.utils import replace_file_extension
 from skyvern.forge.sdk.models import Step
@@ -202,22 +203,26 @@ class AzureStorage(BaseStorage):
         return await self.async_client.download_file(path, log_exception=False)
 
     async def store_browser_session(self, organization_id: str, workflow_permanent_id: str, directory: str) -> None:
-        # Zip the directory to a temp file
         temp_zip_file = create_named_temporary_file()
-        zip_file_path = shutil.make_archive(temp_zip_file.name, "zip", directory)
+        zip_file_path = f"{temp_zip_file.name}.zip"
         browser_session_uri = f"azure://{settings.AZURE_STORAGE_CONTAINER_BROWSER_SESSIONS}/{settings.ENV}/{organization_id}/{workflow_permanent_id}.zip"
         tier = await self._get_storage_tier_for_org(organization_id)
         tags = await self._get_tags_for_org(organization_id)
-        LOG.debug(
-            "Storing browser session",
-            organization_id=organization_id,
-            workflow_permanent_id=workflow_permanent_id,
-            zip_file_path=zip_file_path,
-            browser_session_uri=browser_session_uri,
-            storage_tier=tier,
-            tags=tags,
-        )
-        await self.async_client.upload_file_from_path(browser_session_uri, zip_file_path, tier=tier, tags=tags)
+        try:
+            await asyncio.to_thread(zip_profile_directory, directory, zip_file_path)
+            LOG.debug(
+                "Storing browser session",
+                organization_id=organization_id,
+                workflow_permanent_id=workflow_permanent_id,
+                zip_file_path=zip_file_path,
+                browser_session_uri=browser_session_uri,
+                storage_tier=tier,
+                tags=tags,
+            )
+            await self.async_client.upload_file_from_path(browser_session_uri, zip_file_path, tier=tier, tags=tags)
+        finally:
+            if os.path.exists(zip_file_path):
+                os.remove(zip_file_path)
 
     async def retrieve_browser_session(self, organization_id: str, workflow_permanent_id: str) -> str | None:
         browser_session_uri = f"azure://{settings.AZURE_STORAGE_CONTAINER_BROWSER_SESSIONS}/{settings.ENV}/{organization_id}/{workflow_permanent_id}.zip"
@@ -239,24 +244,25 @@ class AzureStorage(BaseStorage):
     async def store_browser_profile(self, organization_id: str, profile_id: str, directory: str) -> None:
         """Store browser profile to Azure."""
         temp_zip_file = create_named_temporary_file()
-        zip_file_path = shutil.make_archive(temp_zip_file.name, "zip", directory)
+        zip_file_path = f"{temp_zip_file.name}.zip"
         profile_uri = f"azure://{settings.AZURE_STORAGE_CONTAINER_BROWSER_SESSIONS}/{settings.ENV}/{organization_id}/profiles/{profile_id}.zip"
         tier = await self._get_storage_tier_for_org(organization_id)
         tags = await self._get_tags_for_org(organization_id)
-        LOG.debug(
-            "Storing browser profile",
-            organization_id=organization_id,
-            profile_id=profile_id,
-            zip_file_path=zip_file_path,
-            profile_uri=profile_uri,
-            storage_tier=tier,
-            tags=tags,
-        )
         try:
+            await asyncio.to_thread(zip_profile_directory, directory, zip_file_path)
+            LOG.debug(
+                "Storing browser profile",
+                organization_id=organization_id,
+                profile_id=profile_id,
+                zip_file_path=zip_file_path,
+                profile_uri=profile_uri,
+                storage_tier=tier,
+                tags=tags,
+            )
             await self.async_client.upload_file_from_path(profile_uri, zip_file_path, tier=tier, tags=tags)
         finally:
-            # make_archive writes temp_zip_file.name + ".zip", a separate file the NamedTemporaryFile
-            # cleanup never removes; drop it so successful profile banks don't leak zips into TEMP_PATH.
+            # The archive is a separate file the NamedTemporaryFile cleanup never removes; drop it so
+            # profile banks don't leak zips into TEMP_PATH.
             if os.path.exists(zip_file_path):
                 os.remove(zip_file_path)
 
@@ -217,6 +217,27 @@ class BaseStorage(ABC):
     async def store_artifact_from_path(self, artifact: Artifact, path: str) -> None:
         pass
 
+    def build_content_addressed_uri(
+        self, *, organization_id: str, digest: str, artifact_type: ArtifactType
+    ) -> str | None:
+        """URI of the org-scoped object that holds the bytes whose sha256 hex digest is ``digest``.
+
+        Every artifact row with the same content points at this one object. None means the backend
+        does not support content-addressed storage and callers keep the per-artifact URI.
+        """
+        return None
+
+    async def store_content_addressed_artifact(self, artifact: Artifact, data: bytes) -> bool:
+        """Upload ``data`` to its content-addressed ``artifact.uri`` unless an object is already there.
+
+        Returns True when the bytes were uploaded. Concurrent writers of the same digest may both
+        upload; the bytes are identical, so the last PUT winning is harmless.
+        """
+        if await self.file_exists(artifact.uri):
+            return False
+        await self.store_artifact(artifact, data)
+        return True
+
     @abstractmethod
     async def save_streaming_file(self, organization_id: str, file_name: str) -> bool | None:
         """None/True means the frame was uploaded; False means a gate intentionally skipped it,
@@ -1,5 +1,7 @@
+import asyncio
 import os
 import shutil
+import tempfile
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import BinaryIO
@@ -17,6 +19,7 @@ from skyvern.forge.sdk.api.files import (
 )
 from skyvern.forge.sdk.artifact.models import Artifact, ArtifactType, LogEntityType
 from skyvern.forge.sdk.artifact.storage.base import FILE_EXTENTSION_MAP, BaseStorage
+from skyvern.forge.sdk.artifact.storage.profile_sync import sync_profile_directory
 from skyvern.forge.sdk.models import Step
 from skyvern.forge.sdk.schemas.ai_suggestions import AISuggestion
 from skyvern.forge.sdk.schemas.files import FileInfo
@@ -28,11 +31,6 @@ from skyvern.webeye.session_cookies import SESSION_COOKIES_FILENAME
 LOG = structlog.get_logger()
 WINDOWS = os.name == "nt"
 
-# Live Chromium profiles carry runtime files that exist but can't be copied as regular files
-# (Singleton sockets/locks). These are skipped during a store; a copy failure on any other file
-# means an incomplete profile and is re-raised.
-_TRANSIENT_PROFILE_FILES = {"RunningChromeVersion", "SingletonLock", "SingletonSocket", "SingletonCookie"}
-
 
 def _safe_timestamp() -> str:
     ts = datetime.utcnow().isoformat()
@@ -47,6 +45,17 @@ def _windows_safe_filename(name: str) -> str:
     return name.rstrip(" .")
 
 
+def _write_file_atomically(file_path: Path, data: bytes) -> None:
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
 class LocalStorage(BaseStorage):
     def __init__(self, artifact_path: str = settings.ARTIFACT_STORAGE_PATH) -> None:
         self.artifact_path = artifact_path
@@ -58,6 +67,26 @@ class LocalStorage(BaseStorage):
             return f"file://{self.artifact_path}/{organization_id}/{step.task_id}/{step.order:02d}_{step.retry_index}_{step.step_id}/{ts}_{artifact_id}_{artifact_type}.{file_ext}"
         return f"file://{self.artifact_path}/{organization_id}/{step.task_id}/{step.order:02d}_{step.retry_index}_{step.step_id}/{datetime.utcnow().isoformat()}_{artifact_id}_{artifact_type}.{file_ext}"
 
+    def build_content_addressed_uri(
+        self, *, organization_id: str, digest: str, artifact_type: ArtifactType
+    ) -> str | None:
+        file_ext = FILE_EXTENTSION_MAP[artifact_type]
+        return f"file://{self.artifact_path}/{organization_id}/content/{digest[:2]}/{digest}.{file_ext}"
+
+    async def store_content_addressed_artifact(self, artifact: Artifact, data: bytes) -> bool:
+        """Write ``data`` to its content-addressed path unless a blob is already there.
+
+        A blob that exists is never written again, so unlike ``store_artifact`` the bytes go to a
+        temporary file that is renamed into place, and a failed write raises instead of leaving a
+        partial file that every later artifact with the same digest would point at.
+        """
+        file_path = Path(parse_uri_to_path(artifact.uri))
+        if file_path.exists():
+            return False
+        self._create_directories_if_not_exists(file_path)
+        await asyncio.to_thread(_write_file_atomically, file_path, data)
+        return True
+
     async def retrieve_global_workflows(self) -> list[str]:
         file_path = Path(f"{self.artifact_path}/{settings.ENV}/global_workflows.txt")
         self._create_directories_if_not_exists(file_path)
@@ -201,25 +230,23 @@ class LocalStorage(BaseStorage):
             return
         (stored_folder_path / SESSION_COOKIES_FILENAME).unlink(missing_ok=True)
 
-    def _copy_directory_best_effort(self, source_directory: Path, stored_folder_path: Path) -> None:
+    def _copy_directory_best_effort(
+        self, source_directory: Path, stored_folder_path: Path, *, prune: bool = False
+    ) -> None:
         # Source may be a live browser profile. Skip only transient runtime files: ones that vanish
         # mid-walk (FileNotFoundError) or Chrome's Singleton sockets/locks that can't be copied as
         # regular files. Re-raise anything else (e.g. ENOSPC/permission on Cookies or localStorage) so
-        # a partial profile isn't silently stored and later reused as if it were valid.
-        for root, _, files in os.walk(source_directory):
-            for file in files:
-                source_file_path = Path(root) / file
-                target_file_path = stored_folder_path / source_file_path.relative_to(source_directory)
-                try:
-                    self._create_directories_if_not_exists(target_file_path)
-                    shutil.copy2(source_file_path, target_file_path)
-                except OSError as e:
-                    if isinstance(e, FileNotFoundError) or file in _TRANSIENT_PROFILE_FILES:
-                        LOG.debug(
-                            "Skipped transient profile file while storing browser dir", path=str(source_file_path)
-                        )
-                    else:
-                        raise
+        # a partial profile isn't silently stored and later reused as if it were valid. Only files that
+        # changed since the previous store are copied, and browser caches are never stored.
+        result = sync_profile_directory(source_directory, stored_folder_path, prune=prune)
+        LOG.info(
+            "Synced browser dir to local storage",
+            path=str(stored_folder_path),
+            copied=result.copied,
+            unchanged=result.unchanged,
+            removed=result.removed,
+            bytes_copied=result.bytes_copied,
+        )
 
     async def store_browser_session(self, organization_id: str, workflow_permanent_id: str, directory: str) -> None:
         stored_folder_path = self._resolve_browser_storage_path(organization_id, workflow_permanent_id)
@@ -244,7 +271,7 @@ class LocalStorage(BaseStorage):
         )
 
         self._drop_stale_session_sidecar(source_directory, stored_folder_path)
-        self._copy_directory_best_effort(source_directory, stored_folder_path)
+        await asyncio.to_thread(self._copy_directory_best_effort, source_directory, stored_folder_path)
 
     async def retrieve_browser_session(self, organization_id: str, workflow_permanent_id: str) -> str | None:
         stored_folder_path = self._resolve_browser_storage_path(organization_id, workflow_permanent_id)
@@ -297,11 +324,6 @@ class LocalStorage(BaseStorage):
         source_directory = Path(directory).resolve()
         if source_directory == stored_folder_path:
             return
-        # True overwrite: drop any prior contents so a re-save can't leave stale cookies or
-        # localStorage from the old session mixed into the refreshed profile. Let errors surface
-        # rather than silently merging onto a half-deleted directory.
-        if stored_folder_path.exists():
-            shutil.rmtree(stored_folder_path)
         self._create_directories_if_not_exists(stored_folder_path)
         LOG.info(
             "Storing browser profile locally",
@@ -311,8 +333,10 @@ class LocalStorage(BaseStorage):
             browser_profile_path=str(stored_folder_path),
         )
 
-        self._drop_stale_session_sidecar(source_directory, stored_folder_path)
-        self._copy_directory_best_effort(source_directory, stored_folder_path)
+        # True overwrite: prune stored files the source no longer has so a re-save can't leave stale
+        # cookies or localStorage from the old session mixed into the refreshed profile. Unchanged
+        # files are kept in place instead of being deleted and copied again.
+        await asyncio.to_thread(self._copy_directory_best_effort, source_directory, stored_folder_path, prune=True)
 
     async def retrieve_browser_profile(self, organization_id: str, profile_id: str) -> str | None:
         """Retrieve browser profile from local storage."""
@@ -0,0 +1,174 @@
+"""Incremental persistence of Chromium user-data directories (saved sessions and browser profiles).
+
+Every store used to copy or archive the whole user-data dir, caches included. Here a store:
+- never persists the directories named in BROWSER_PROFILE_EXCLUDED_DIRS;
+- for local storage, copies only the files whose content changed since the previous store, tracked by
+  a manifest of (path, size, mtime, sha256) written next to the stored copy.
+
+All functions are blocking and are meant to be called through ``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import zipfile
+from collections.abc import Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import structlog
+
+from skyvern.config import settings
+
+LOG = structlog.get_logger()
+
+PROFILE_MANIFEST_FILENAME = ".skyvern_profile_manifest.json"
+_MANIFEST_VERSION = 1
+
+# Live Chromium profiles carry runtime files that exist but can't be copied as regular files
+# (Singleton sockets/locks). These are skipped during a store; a copy failure on any other file
+# means an incomplete profile and is re-raised.
+TRANSIENT_PROFILE_FILES = frozenset({"RunningChromeVersion", "SingletonLock", "SingletonSocket", "SingletonCookie"})
+
+
+@dataclass(frozen=True)
+class ProfileFileEntry:
+    size: int
+    mtime_ns: int
+    sha256: str
+
+    def matches(self, stat: os.stat_result) -> bool:
+        return self.size == stat.st_size and self.mtime_ns == stat.st_mtime_ns
+
+
+@dataclass
+class ProfileSyncResult:
+    copied: int = 0
+    unchanged: int = 0
+    removed: int = 0
+    bytes_copied: int = 0
+
+
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def iter_profile_files(source: Path) -> Iterator[tuple[str, Path]]:
+    """Yield ``(relative posix path, absolute path)`` for every file worth persisting under ``source``."""
+    excluded_dirs = set(settings.BROWSER_PROFILE_EXCLUDED_DIRS)
+    for root, dirs, files in os.walk(source):
+        dirs[:] = [d for d in dirs if d not in excluded_dirs]
+        for file in files:
+            if file == PROFILE_MANIFEST_FILENAME:
+                continue
+            path = Path(root) / file
+            yield path.relative_to(source).as_posix(), path
+
+
+def load_manifest(destination: Path) -> dict[str, ProfileFileEntry]:
+    try:
+        raw = json.loads((destination / PROFILE_MANIFEST_FILENAME).read_text())
+        if raw.get("version") != _MANIFEST_VERSION:
+            return {}
+        return {path: ProfileFileEntry(**entry) for path, entry in raw["files"].items()}
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError, TypeError, KeyError):
+        LOG.warning("Ignoring unreadable browser profile manifest", destination=str(destination), exc_info=True)
+        return {}
+
+
+def _write_manifest(destination: Path, manifest: dict[str, ProfileFileEntry]) -> None:
+    payload = {"version": _MANIFEST_VERSION, "files": {path: asdict(entry) for path, entry in manifest.items()}}
+    tmp_path = destination / f"{PROFILE_MANIFEST_FILENAME}.tmp"
+    tmp_path.write_text(json.dumps(payload, separators=(",", ":")))
+    os.replace(tmp_path, destination / PROFILE_MANIFEST_FILENAME)
+
+
+def _stat_or_none(path: Path) -> os.stat_result | None:
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        return None
+
+
+def _is_transient_copy_error(error: OSError, file_name: str) -> bool:
+    return isinstance(error, FileNotFoundError) or file_name in TRANSIENT_PROFILE_FILES
+
+
+def sync_profile_directory(source: Path, destination: Path, *, prune: bool) -> ProfileSyncResult:
+    """Bring ``destination`` up to date with ``source``, copying only what changed.
+
+    A file is skipped without reading it when the source and the stored copy both still carry the
+    size and mtime recorded in the manifest. Otherwise it is hashed, and copied only if the content
+    differs. With ``prune``, stored files that no longer exist in the source (or are now excluded)
+    are removed, so the destination ends up an exact overwrite rather than an overlay.
+    """
+    manifest = load_manifest(destination)
+    updated: dict[str, ProfileFileEntry] = {}
+    result = ProfileSyncResult()
+    destination.mkdir(parents=True, exist_ok=True)
+
+    for relative_path, source_path in iter_profile_files(source):
+        target_path = destination / relative_path
+        try:
+            source_stat = source_path.stat()
+            previous = manifest.get(relative_path)
+            target_stat = _stat_or_none(target_path)
+            if previous and target_stat and previous.matches(source_stat) and previous.matches(target_stat):
+                updated[relative_path] = previous
+                result.unchanged += 1
+                continue
+            sha256 = _sha256(source_path)
+            if previous and target_stat and previous.matches(target_stat) and previous.sha256 == sha256:
+                # Rewritten with identical bytes (Chromium does this to Preferences and friends).
+                os.utime(target_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
+                result.unchanged += 1
+            else:
+                target_path.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy2(source_path, target_path)
+                result.copied += 1
+                result.bytes_copied += source_stat.st_size
+            updated[relative_path] = ProfileFileEntry(
+                size=source_stat.st_size, mtime_ns=source_stat.st_mtime_ns, sha256=sha256
+            )
+        except OSError as e:
+            if _is_transient_copy_error(e, source_path.name):
+                LOG.debug("Skipped transient profile file while storing browser dir", path=str(source_path))
+            else:
+                raise
+
+    if prune:
+        for root, _, files in os.walk(destination, topdown=False):
+            for file in files:
+                path = Path(root) / file
+                relative_path = path.relative_to(destination).as_posix()
+                if relative_path != PROFILE_MANIFEST_FILENAME and relative_path not in updated:
+                    path.unlink(missing_ok=True)
+                    result.removed += 1
+            if Path(root) != destination and not os.listdir(root):
+                os.rmdir(root)
+
+    _write_manifest(destination, updated)
+    return result
+
+
+def zip_profile_directory(source: str, zip_file_path: str) -> str:
+    """Archive ``source`` for upload, leaving out excluded directories and transient runtime files."""
+    with zipfile.ZipFile(zip_file_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+        for relative_path, path in iter_profile_files(Path(source)):
+            try:
+                zipf.write(path, relative_path)
+            except OSError as e:
+                if _is_transient_copy_error(e, path.name):
+                    LOG.debug("Skipped transient profile file while archiving browser dir", path=str(path))
+                else:
+                    raise
+    return zip_file_path
@@ -1,7 +1,6 @@
 import asyncio
 import io
 import os
-import shutil
 import uuid
 import zipfile
 from datetime import datetime, timezone
@@ -34,6 +33,7 @@ from skyvern.forge.sdk.artifact.storage.base import (
     key_is_org_scoped,
     presign_with_sensitive_cap,
 )
+from skyvern.forge.sdk.artifact.storage.profile_sync import zip_profile_directory
 from skyvern.forge.sdk.artifact.storage.run_recording_clips import (
     RUN_RECORDING_CLIPS_SYNC_TIMEOUT_SECONDS,
     RUN_RECORDING_PATH_SEGMENT,
@@ -97,6 +97,12 @@ class S3Storage(BaseStorage):
     def _build_base_uri(self, organization_id: str) -> str:
         return f"s3://{self.bucket}/{self._PATH_VERSION}/{settings.ENV}/{organization_id}"
 
+    def build_content_addressed_uri(
+        self, *, organization_id: str, digest: str, artifact_type: ArtifactType
+    ) -> str | None:
+        file_ext = FILE_EXTENTSION_MAP[artifact_type]
+        return f"{self._build_base_uri(organization_id)}/content/{digest[:2]}/{digest}.{file_ext}"
+
     def build_log_uri(
         self, *, organization_id: str, log_entity_type: LogEntityType, log_entity_id: str, artifact_type: ArtifactType
     ) -> str:
@@ -266,20 +272,24 @@ class S3Storage(BaseStorage):
         return await self.async_client.download_file(path, log_exception=False)
 
     async def store_browser_session(self, organization_id: str, workflow_permanent_id: str, directory: str) -> None:
-        # Zip the directory to a temp file
         temp_zip_file = create_named_temporary_file()
-        zip_file_path = shutil.make_archive(temp_zip_file.name, "zip", directory)
+        zip_file_path = f"{temp_zip_file.name}.zip"
         browser_session_uri = f"s3://{settings.AWS_S3_BUCKET_BROWSER_SESSIONS}/{settings.ENV}/{organization_id}/{workflow_permanent_id}.zip"
         sc = await self._get_storage_class_for_org(organization_id, settings.AWS_S3_BUCKET_BROWSER_SESSIONS)
-        LOG.debug(
-            "Storing browser session",
-            organization_id=organization_id,
-            workflow_permanent_id=workflow_permanent_id,
-            zip_file_path=zip_file_path,
-            browser_session_uri=browser_session_uri,
-            storage_class=sc,
-        )
-        await self.async_client.upload_file_from_path(browser_session_uri, zip_file_path, storage_class=sc)
+        try:
+            await asyncio.to_thread(zip_profile_directory, directory, zip_file_path)
+            LOG.debug(
+                "Storing browser session",
+                organization_id=organization_id,
+                workflow_permanent_id=workflow_permanent_id,
+                zip_file_path=zip_file_path,
+                browser_session_uri=browser_session_uri,
+                storage_class=sc,
+            )
+            await self.async_client.upload_file_from_path(browser_session_uri, zip_file_path, storage_class=sc)
+        finally:
+            if os.path.exists(zip_file_path):
+                os.remove(zip_file_path)
 
     async def retrieve_browser_session(self, organization_id: str, workflow_permanent_id: str) -> str | None:
         browser_session_uri = f"s3://{settings.AWS_S3_BUCKET_BROWSER_SESSIONS}/{settings.ENV}/{organization_id}/{workflow_permanent_id}.zip"
@@ -303,9 +313,9 @@ class S3Storage(BaseStorage):
     async def store_browser_profile(self, organization_id: str, profile_id: str, directory: str) -> None:
         """Store browser profile to S3."""
         temp_zip_file = create_named_temporary_file()
-        # make_archive writes base_name + ".zip", a separate file the NamedTemporaryFile cleanup never
-        # removes. Name it up front and clean it in a finally that also covers the archive step, so a
-        # partial .zip from an archive that fails partway can't leak into TEMP_PATH.
+        # The archive is a separate file the NamedTemporaryFile cleanup never removes. Name it up front
+        # and clean it in a finally that also covers the archive step, so a partial .zip from an archive
+        # that fails partway can't leak into TEMP_PATH.
         zip_file_path = f"{temp_zip_file.name}.zip"
         profile_uri = (
             f"s3://{settings.AWS_S3_BUCKET_BROWSER_SESSIONS}/{settings.ENV}/{organization_id}/profiles/{profile_id}.zip"
@@ -314,7 +324,7 @@ class S3Storage(BaseStorage):
         try:
             # Off the event loop: the credential living-profile engine calls this mid-run, where a
             # sync archive of a large profile dir would stall every other coroutine on the worker.
-            await asyncio.to_thread(shutil.make_archive, temp_zip_file.name, "zip", directory)
+            await asyncio.to_thread(zip_profile_directory, directory, zip_file_path)
             LOG.debug(
                 "Storing browser profile",
                 organization_id=organization_id,
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from datetime import timedelta
 from types import TracebackType
 from typing import Any, Protocol, Self, Union, runtime_checkable
@@ -60,10 +61,19 @@ class BaseCache(ABC):
     async def get(self, key: str) -> Any:
         pass
 
+    async def mget(self, keys: Sequence[str]) -> list[Any]:
+        """Values for ``keys`` in order, None for missing keys. Backends with a batch read override this."""
+        return [await self.get(key) for key in keys]
+
+    async def mset(self, mapping: Mapping[str, Any], ex: Union[int, timedelta, None] = CACHE_EXPIRE_TIME) -> None:
+        """Set every key in ``mapping`` with the same expiry. Backends with a batch write override this."""
+        for key, value in mapping.items():
+            await self.set(key, value, ex=ex)
+
     def get_lock(self, lock_name: str, blocking_timeout: int = 5, timeout: int = 10) -> AsyncLock:
         """
         Get a distributed lock for the given name.
-        Default implementation returns a no-op lock for OSS deployments.
+        Default implementation returns a no-op lock; LocalCache returns an in-process lock.
         Cloud implementations should override this to use Redis locks.
         """
         return NoopLock(lock_name, blocking_timeout, timeout)
@@ -11,13 +11,16 @@ extraction output and skips the LLM call on a hit.
 This module is the v2 in-process tier. A cross-run Redis tier (SKY-8873) sits
 behind the `lookup_cross_run_extraction_cache` / `store_cross_run_extraction_cache`
 hooks on `AgentFunction` — this module stays OSS-safe and scope-neutral.
+Self-hosted deployments can back those hooks with the SQLite tier in
+`extraction_cache_sqlite` by setting `EXTRACTION_CACHE_SQLITE_PATH`.
 
 Scope and lifetime:
 - In-process tier scoped by `workflow_run_id`. Cache entries for a different
   run are isolated, and a run's entries can be cleared via `clear_workflow_run`
   (e.g. at run end).
 - Purely in-memory, per-process. Cross-run / cross-worker persistence is
-  handled by the cloud-side Redis tier behind the AgentFunction hooks.
+  handled by the tier behind the AgentFunction hooks (Redis in cloud, the
+  optional SQLite file in OSS).
 - Two-tier eviction:
     - **Outer** (workflow runs): LRU with a cap of `_MAX_WORKFLOW_RUNS`.
       Reads and writes refresh the run's position via `move_to_end`.
@@ -84,7 +87,7 @@ SCOPE_WPID = "wpid"
 # normalization opportunity) from lookup_error (bug or infra issue).
 FALLBACK_FIRST_CALL_IN_RUN = "first_call_in_run"
 FALLBACK_KEY_NOT_FOUND = "key_not_found"
-# Reserved for the TTL-backed Redis cache in v4 (SKY-8874). Never emitted in v1.
+# Emitted only by the TTL-backed cross-run tiers; the in-run tier has no TTL.
 FALLBACK_TTL_EXPIRED = "ttl_expired"
 FALLBACK_LOOKUP_ERROR = "lookup_error"
 
@@ -0,0 +1,298 @@
+"""
+SQLite-backed cross-run (wpid-scoped) tier of the extract-information cache.
+
+Self-hosted installs without Redis get no cross-run tier from the cloud hooks
+on `AgentFunction`, so scheduled runs re-pay the LLM call for every
+extraction on a page that has not changed since the last run. This tier keeps
+those results in a single SQLite file that every API/worker process on the
+host opens, keyed on `(workflow_permanent_id, cache_key)` where `cache_key`
+comes from `extraction_cache.compute_cache_key`.
+
+Bounds:
+- **TTL** per entry. An expired entry is deleted on read and reported with
+  `FALLBACK_TTL_EXPIRED`; expired rows are also swept on every write.
+- **Per-entry byte cap.** Oversized results are not stored at all.
+- **Total byte cap** with LRU eviction. Reads refresh `last_access_at`, and
+  the least recently used rows are deleted until the file's payload fits.
+
+SQLite calls are blocking, so every public coroutine runs them in a worker
+thread. WAL mode plus a busy timeout lets readers in other processes proceed
+while one process writes. Every error is swallowed and logged: a locked or
+corrupt cache file must only cost a cache miss, never a failed extraction.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import structlog
+
+from skyvern.config import settings
+from skyvern.forge.sdk.cache.extraction_cache import (
+    FALLBACK_KEY_NOT_FOUND,
+    FALLBACK_LOOKUP_ERROR,
+    FALLBACK_TTL_EXPIRED,
+    SCOPE_WPID,
+    LookupResult,
+)
+
+LOG = structlog.get_logger()
+
+_HIT_RATE_LOG_INTERVAL = 50  # log hit rate every N lookups
+_EVICTION_BATCH_SIZE = 256
+_BUSY_TIMEOUT_MS = 5000
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS extraction_cache (
+        workflow_permanent_id TEXT NOT NULL,
+        cache_key TEXT NOT NULL,
+        value TEXT NOT NULL,
+        size_bytes INTEGER NOT NULL,
+        stored_at REAL NOT NULL,
+        expires_at REAL NOT NULL,
+        last_access_at REAL NOT NULL,
+        PRIMARY KEY (workflow_permanent_id, cache_key)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS extraction_cache_last_access_at_idx ON extraction_cache (last_access_at)",
+    "CREATE INDEX IF NOT EXISTS extraction_cache_expires_at_idx ON extraction_cache (expires_at)",
+)
+
+
+@dataclass
+class CacheStats:
+    """In-process counters for this worker's use of the shared file."""
+
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    rejected_oversize: int = 0
+    errors: int = 0
+
+    @property
+    def hit_rate(self) -> float | None:
+        total = self.hits + self.misses
+        return round(self.hits / total, 3) if total else None
+
+
+class SqliteExtractionCache:
+    def __init__(
+        self,
+        path: str,
+        *,
+        max_bytes: int,
+        max_entry_bytes: int,
+        ttl_seconds: float,
+    ) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.ttl_seconds = ttl_seconds
+        self.stats = CacheStats()
+        # One connection per process, serialized by a lock: the to_thread pool may run calls on
+        # different threads, and sqlite3 connections must not be used concurrently.
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(Path(self.path).expanduser()) if self.path != ":memory:" else self.path,
+                timeout=_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def lookup(self, workflow_permanent_id: str | None, cache_key: str) -> LookupResult | None:
+        """Read a cached result. ``None`` means the tier does not apply (no workflow_permanent_id)."""
+        if not workflow_permanent_id:
+            return None
+        return await asyncio.to_thread(self.lookup_sync, workflow_permanent_id, cache_key)
+
+    async def store(self, workflow_permanent_id: str | None, cache_key: str, value: Any) -> bool:
+        """Write a result. Returns True when it was stored."""
+        if not workflow_permanent_id:
+            return False
+        return await asyncio.to_thread(self.store_sync, workflow_permanent_id, cache_key, value)
+
+    def lookup_sync(self, workflow_permanent_id: str, cache_key: str) -> LookupResult:
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT value, stored_at, expires_at FROM extraction_cache "
+                    "WHERE workflow_permanent_id = ? AND cache_key = ?",
+                    (workflow_permanent_id, cache_key),
+                ).fetchone()
+                if row is None:
+                    return self._miss(FALLBACK_KEY_NOT_FOUND)
+                raw_value, stored_at, expires_at = row
+                if expires_at <= now:
+                    conn.execute(
+                        "DELETE FROM extraction_cache WHERE workflow_permanent_id = ? AND cache_key = ?",
+                        (workflow_permanent_id, cache_key),
+                    )
+                    self.stats.expired += 1
+                    return self._miss(FALLBACK_TTL_EXPIRED)
+                conn.execute(
+                    "UPDATE extraction_cache SET last_access_at = ? WHERE workflow_permanent_id = ? AND cache_key = ?",
+                    (now, workflow_permanent_id, cache_key),
+                )
+            value = json.loads(raw_value)
+        except (sqlite3.Error, ValueError):
+            LOG.warning(
+                "extraction_cache.sqlite_lookup_failed",
+                workflow_permanent_id=workflow_permanent_id,
+                cache_key=cache_key,
+                exc_info=True,
+            )
+            self.stats.errors += 1
+            return self._miss(FALLBACK_LOOKUP_ERROR)
+
+        self.stats.hits += 1
+        self._maybe_log_hit_rate()
+        return LookupResult(
+            hit=True,
+            value=value,
+            age_seconds=max(0.0, now - stored_at),
+            fallback_reason=None,
+            scope=SCOPE_WPID,
+        )
+
+    def store_sync(self, workflow_permanent_id: str, cache_key: str, value: Any) -> bool:
+        try:
+            payload = json.dumps(value)
+        except (TypeError, ValueError):
+            LOG.warning("extraction_cache.sqlite_unserializable_value", value_type=type(value).__name__)
+            return False
+        size_bytes = len(payload.encode("utf-8"))
+        if size_bytes > self.max_entry_bytes or size_bytes > self.max_bytes:
+            self.stats.rejected_oversize += 1
+            LOG.debug(
+                "extraction_cache.sqlite_entry_too_large",
+                workflow_permanent_id=workflow_permanent_id,
+                cache_key=cache_key,
+                size_bytes=size_bytes,
+                max_entry_bytes=self.max_entry_bytes,
+            )
+            return False
+
+        now = time.time()
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute("DELETE FROM extraction_cache WHERE expires_at <= ?", (now,))
+                    conn.execute(
+                        "INSERT OR REPLACE INTO extraction_cache "
+                        "(workflow_permanent_id, cache_key, value, size_bytes, stored_at, expires_at, last_access_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        (workflow_permanent_id, cache_key, payload, size_bytes, now, now + self.ttl_seconds, now),
+                    )
+                    self.stats.evictions += self._evict_over_budget(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            LOG.warning(
+                "extraction_cache.sqlite_store_failed",
+                workflow_permanent_id=workflow_permanent_id,
+                cache_key=cache_key,
+                exc_info=True,
+            )
+            self.stats.errors += 1
+            return False
+        return True
+
+    def _evict_over_budget(self, conn: sqlite3.Connection) -> int:
+        (total_bytes,) = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM extraction_cache").fetchone()
+        evicted = 0
+        while total_bytes > self.max_bytes:
+            oldest = conn.execute(
+                "SELECT workflow_permanent_id, cache_key, size_bytes FROM extraction_cache "
+                "ORDER BY last_access_at LIMIT ?",
+                (_EVICTION_BATCH_SIZE,),
+            ).fetchall()
+            if not oldest:
+                break
+            for workflow_permanent_id, cache_key, size_bytes in oldest:
+                if total_bytes <= self.max_bytes:
+                    break
+                conn.execute(
+                    "DELETE FROM extraction_cache WHERE workflow_permanent_id = ? AND cache_key = ?",
+                    (workflow_permanent_id, cache_key),
+                )
+                total_bytes -= size_bytes
+                evicted += 1
+        if evicted:
+            LOG.debug("extraction_cache.sqlite_evicted", evicted=evicted, total_bytes=total_bytes)
+        return evicted
+
+    def _miss(self, fallback_reason: str) -> LookupResult:
+        self.stats.misses += 1
+        self._maybe_log_hit_rate()
+        return LookupResult(
+            hit=False,
+            value=None,
+            age_seconds=None,
+            fallback_reason=fallback_reason,
+            scope=SCOPE_WPID,
+        )
+
+    def _maybe_log_hit_rate(self) -> None:
+        total = self.stats.hits + self.stats.misses
+        if total > 0 and total % _HIT_RATE_LOG_INTERVAL == 0:
+            LOG.info(
+                "extraction_cache.hit_rate",
+                scope=SCOPE_WPID,
+                hits=self.stats.hits,
+                misses=self.stats.misses,
+                expired=self.stats.expired,
+                evictions=self.stats.evictions,
+                total=total,
+                hit_rate=self.stats.hit_rate,
+            )
+
+
+_local_cache: SqliteExtractionCache | None = None
+
+
+def get_local_cross_run_cache() -> SqliteExtractionCache | None:
+    """The process-wide SQLite tier, or None when EXTRACTION_CACHE_SQLITE_PATH is unset."""
+    global _local_cache  # noqa: PLW0603
+    if not settings.EXTRACTION_CACHE_SQLITE_PATH:
+        return None
+    if _local_cache is None or _local_cache.path != settings.EXTRACTION_CACHE_SQLITE_PATH:
+        _local_cache = SqliteExtractionCache(
+            settings.EXTRACTION_CACHE_SQLITE_PATH,
+            max_bytes=settings.EXTRACTION_CACHE_SQLITE_MAX_BYTES,
+            max_entry_bytes=settings.EXTRACTION_CACHE_SQLITE_MAX_ENTRY_BYTES,
+            ttl_seconds=settings.EXTRACTION_CACHE_SQLITE_TTL_SECONDS,
+        )
+    return _local_cache
@@ -1,20 +1,243 @@
+import asyncio
+import sys
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import timedelta
+from types import TracebackType
 from typing import Any, Union
 
-from cachetools import TTLCache
+import structlog
 
+from skyvern.config import settings
 from skyvern.forge.sdk.cache.base import CACHE_EXPIRE_TIME, MAX_CACHE_ITEM, BaseCache
 
+# Raise the same error type the Redis lock raises so callers' `except LockError` handling applies
+try:
+    from redis.exceptions import LockError
+except ImportError:
+
+    class LockError(Exception):  # type: ignore[no-redef]
+        pass
+
+
+LOG = structlog.get_logger()
+
+# Stop walking a value's object graph after this many nodes; the size is an estimate anyway.
+_MAX_SIZE_WALK_NODES = 10_000
+
+
+def _ttl_seconds(ex: Union[int, timedelta, None]) -> float | None:
+    if ex is None:
+        return None
+    if isinstance(ex, timedelta):
+        return ex.total_seconds()
+    return float(ex)
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate retained size of ``value`` in bytes, following containers and object attributes."""
+    if isinstance(value, (bytes, bytearray, str)):
+        return sys.getsizeof(value)
+    total = 0
+    seen: set[int] = set()
+    stack = [value]
+    while stack and len(seen) < _MAX_SIZE_WALK_NODES:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, (str, bytes, bytearray, int, float, bool)) or obj is None:
+            continue
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+        elif hasattr(obj, "__dict__"):
+            stack.append(vars(obj))
+    return total
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    expires_at: float | None
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and self.expires_at <= now
+
+
+@dataclass
+class LocalCacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    rejected_oversize: int = 0
+
+
+@dataclass
+class _LockState:
+    owner: str | None = None
+    expires_at: float | None = None
+    waiters: int = 0
+    released: asyncio.Event = field(default_factory=asyncio.Event)
+
+
+class LocalLock:
+    """
+    In-process asyncio lock with the semantics of the Redis lock the cloud cache hands out:
+    acquisition gives up with LockError after ``blocking_timeout`` seconds (0 tries exactly once),
+    and a holder that outlives ``timeout`` seconds loses the lock to the next waiter.
+    """
+
+    def __init__(self, cache: "LocalCache", lock_name: str, blocking_timeout: float | None, timeout: float | None):
+        self.cache = cache
+        self.lock_name = lock_name
+        self.blocking_timeout = blocking_timeout
+        self.timeout = timeout
+        self._token: str | None = None
+        self._key: tuple[asyncio.AbstractEventLoop, str] | None = None
+
+    async def __aenter__(self) -> "LocalLock":
+        # asyncio primitives are bound to one loop, so lock state is too (tests run several loops)
+        self._key = (asyncio.get_running_loop(), self.lock_name)
+        state = self.cache._locks.setdefault(self._key, _LockState())
+        token = uuid.uuid4().hex
+        deadline = None if self.blocking_timeout is None else time.monotonic() + self.blocking_timeout
+        state.waiters += 1
+        try:
+            while True:
+                now = time.monotonic()
+                if state.owner is None or (state.expires_at is not None and state.expires_at <= now):
+                    state.owner = token
+                    state.expires_at = None if self.timeout is None else now + self.timeout
+                    self._token = token
+                    return self
+                wait_for = None if state.expires_at is None else state.expires_at - now
+                if deadline is not None:
+                    remaining = deadline - now
+                    if remaining <= 0:
+                        raise LockError("Unable to acquire lock within the time specified")
+                    wait_for = remaining if wait_for is None else min(wait_for, remaining)
+                try:
+                    await asyncio.wait_for(state.released.wait(), wait_for)
+                except TimeoutError:
+                    pass
+        finally:
+            state.waiters -= 1
+            self._discard_if_idle(state)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        if self._key is None:
+            return
+        state = self.cache._locks.get(self._key)
+        if state is None or state.owner != self._token:
+            # Redis raises LockNotOwnedError here; the work already ran, so only surface it in logs.
+            LOG.warning("Local cache lock expired before release", lock_name=self.lock_name, timeout=self.timeout)
+            return
+        state.owner = None
+        state.expires_at = None
+        released, state.released = state.released, asyncio.Event()
+        released.set()
+        self._discard_if_idle(state)
+
+    def _discard_if_idle(self, state: _LockState) -> None:
+        if state.owner is None and state.waiters == 0 and self._key is not None:
+            if self.cache._locks.get(self._key) is state:
+                del self.cache._locks[self._key]
+
 
 class LocalCache(BaseCache):
-    def __init__(self) -> None:
-        self.cache: TTLCache = TTLCache(maxsize=MAX_CACHE_ITEM, ttl=CACHE_EXPIRE_TIME.total_seconds())
+    """
+    Per-process cache used when no shared cache is configured.
 
-    async def get(self, key: str) -> Any:
-        if key not in self.cache:
+    LRU over both an item cap and a byte budget (sizes are estimated at write time), with per-key
+    expiry from ``ex``. Expired keys are dropped when read and before anything live is evicted.
+    """
+
+    def __init__(self, max_items: int = MAX_CACHE_ITEM, max_bytes: int | None = None) -> None:
+        self.max_items = max_items
+        self.max_bytes = settings.LOCAL_CACHE_MAX_BYTES if max_bytes is None else max_bytes
+        self.current_bytes = 0
+        self.stats = LocalCacheStats()
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._locks: dict[tuple[asyncio.AbstractEventLoop, str], _LockState] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str, now: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            self.stats.misses += 1
+            return None
+        if entry.expired(now):
+            self._remove(key)
+            self.stats.expirations += 1
+            self.stats.misses += 1
             return None
-        value = self.cache[key]
-        return value
+        self._entries.move_to_end(key)
+        self.stats.hits += 1
+        return entry.value
+
+    def _set(self, key: str, value: Any, ttl: float | None, now: float) -> None:
+        self._remove(key)
+        if ttl is not None and ttl <= 0:
+            return
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            self.stats.rejected_oversize += 1
+            LOG.debug("Value too large for local cache; not cached", key=key, size=size, max_bytes=self.max_bytes)
+            return
+        self._entries[key] = _Entry(value=value, size=size, expires_at=None if ttl is None else now + ttl)
+        self.current_bytes += size
+        self._evict(now)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.current_bytes -= entry.size
+
+    def _over_budget(self) -> bool:
+        return len(self._entries) > self.max_items or self.current_bytes > self.max_bytes
+
+    def _evict(self, now: float) -> None:
+        if not self._over_budget():
+            return
+        for key in [key for key, entry in self._entries.items() if entry.expired(now)]:
+            self._remove(key)
+            self.stats.expirations += 1
+        while self._over_budget():
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
+
+    async def get(self, key: str) -> Any:
+        return self._get(key, time.monotonic())
 
     async def set(self, key: str, value: Any, ex: Union[int, timedelta, None] = CACHE_EXPIRE_TIME) -> None:
-        self.cache[key] = value
+        self._set(key, value, _ttl_seconds(ex), time.monotonic())
+
+    async def mget(self, keys: Sequence[str]) -> list[Any]:
+        now = time.monotonic()
+        return [self._get(key, now) for key in keys]
+
+    async def mset(self, mapping: Mapping[str, Any], ex: Union[int, timedelta, None] = CACHE_EXPIRE_TIME) -> None:
+        ttl = _ttl_seconds(ex)
+        now = time.monotonic()
+        for key, value in mapping.items():
+            self._set(key, value, ttl, now)
+
+    def get_lock(self, lock_name: str, blocking_timeout: int = 5, timeout: int = 10) -> LocalLock:
+        return LocalLock(self, lock_name, blocking_timeout, timeout)
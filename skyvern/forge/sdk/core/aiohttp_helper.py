@@ -2,6 +2,10 @@ import asyncio
 import ipaddress
 import os
 import socket
+import threading
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass
 from typing import Any
 from urllib.parse import urlparse
 
@@ -10,7 +14,10 @@ import aiohttp
 import structlog
 from aiohttp.abc import AbstractResolver, ResolveResult
 from aiohttp.resolver import DefaultResolver
+from cachetools import TTLCache
+from opentelemetry import trace as otel_trace
 
+from skyvern.config import settings
 from skyvern.exceptions import HttpException, InvalidUrl
 from skyvern.utils.url_validators import (
     MAX_SAFE_REDIRECTS,
@@ -60,6 +67,13 @@ class SSRFGuardedResolver(AbstractResolver):
             raise OSError(f"No safe addresses resolved for host: {host}")
         self._pinned_host_ips[self._host_key(host)] = ips
 
+    def _pinned_ips(self, host_key: str) -> tuple[str, ...] | None:
+        return self._pinned_host_ips.get(host_key)
+
+    def cached_host_ips(self, host: str) -> tuple[str, ...] | None:
+        # A per-request resolver validates every URL it is given afresh.
+        return None
+
     def pin_url_ips(self, url: str, ips: tuple[str, ...]) -> None:
         host = urlparse(url).hostname
         if not host:
@@ -79,7 +93,7 @@ class SSRFGuardedResolver(AbstractResolver):
         if host_key in self._trusted_proxy_hosts:
             return await self._default_resolver.resolve(host, port, family)
 
-        ips = self._pinned_host_ips.get(host_key)
+        ips = self._pinned_ips(host_key)
         resolved_ips = await asyncio.to_thread(resolve_fetch_host_ips, host) if ips is None else ips
         for ip in resolved_ips:
             ip_family = (
@@ -105,14 +119,56 @@ class SSRFGuardedResolver(AbstractResolver):
         await self._default_resolver.close()
 
 
+class CachingSSRFGuardedResolver(SSRFGuardedResolver):
+    """Resolver behind the shared pooled connector, where pins double as a validated-DNS cache.
+
+    Every cached answer came out of ``resolve_fetch_host_ips`` less than ``ttl_seconds`` ago, so a
+    connection the shared connector opens still only ever reaches a validated address. Proxy hosts
+    are never trusted here: one trusted proxy host would be trusted for every later request.
+    """
+
+    def __init__(self, ttl_seconds: float, maxsize: int = 4096) -> None:
+        super().__init__()
+        self._validated_host_ips: TTLCache[str, tuple[str, ...]] = TTLCache(maxsize=maxsize, ttl=ttl_seconds)
+        # Validation looks up the cache from a worker thread while connects read it on the loop.
+        self._lock = threading.Lock()
+        self.cache_hits = 0
+
+    def pin_host_ips(self, host: str, ips: tuple[str, ...]) -> None:
+        if not ips:
+            raise OSError(f"No safe addresses resolved for host: {host}")
+        host_key = self._host_key(host)
+        with self._lock:
+            # Validation hands back the cached answer and its caller pins it again; rewriting it
+            # would restart the TTL, and a busy host would then never be resolved and checked again.
+            if self._validated_host_ips.get(host_key) != ips:
+                self._validated_host_ips[host_key] = ips
+
+    def _pinned_ips(self, host_key: str) -> tuple[str, ...] | None:
+        with self._lock:
+            return self._validated_host_ips.get(host_key)
+
+    def cached_host_ips(self, host: str) -> tuple[str, ...] | None:
+        with self._lock:
+            ips = self._validated_host_ips.get(self._host_key(host))
+            if ips is not None:
+                self.cache_hits += 1
+            return ips
+
+    def trust_proxy_url(self, proxy: str) -> None:
+        raise ValueError("Proxied requests must not use the shared SSRF-guarded resolver")
+
+
 async def validate_and_pin_fetch_url(url: str, resolver: SSRFGuardedResolver) -> str:
-    validated_url, ips = await asyncio.to_thread(validate_fetch_url_with_resolved_ips, url)
+    validated_url, ips = await asyncio.to_thread(validate_fetch_url_with_resolved_ips, url, resolver.cached_host_ips)
     resolver.pin_url_ips(validated_url, ips)
     return validated_url
 
 
 async def validate_and_pin_redirect_url(url: str, location: str, resolver: SSRFGuardedResolver) -> str:
-    validated_url, ips = await asyncio.to_thread(validate_redirect_url_with_resolved_ips, url, location)
+    validated_url, ips = await asyncio.to_thread(
+        validate_redirect_url_with_resolved_ips, url, location, resolver.cached_host_ips
+    )
     resolver.pin_url_ips(validated_url, ips)
     return validated_url
 
@@ -121,6 +177,93 @@ def ssrf_guarded_tcp_connector(resolver: SSRFGuardedResolver | None = None) -> a
     return aiohttp.TCPConnector(resolver=resolver or SSRFGuardedResolver(), use_dns_cache=False)
 
 
+@dataclass
+class HttpClientPoolStats:
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        total = self.connections_created + self.connections_reused
+        return self.connections_reused / total if total else 0.0
+
+
+class PooledHttpClient:
+    """Process-wide keep-alive session for unproxied ``aiohttp_request`` calls.
+
+    Connections are pooled per origin (bounded overall and per host) and validated DNS answers are
+    reused for HTTP_CLIENT_DNS_CACHE_TTL_SECONDS. The session keeps no cookie jar, so cookies never
+    carry over between callers. It is bound to the loop it was created on and rebuilt if used from
+    another one.
+    """
+
+    def __init__(self) -> None:
+        self.stats = HttpClientPoolStats()
+        self._session: aiohttp.ClientSession | None = None
+        self._resolver: CachingSSRFGuardedResolver | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    @property
+    def resolver(self) -> CachingSSRFGuardedResolver:
+        if self._resolver is None:
+            raise RuntimeError("PooledHttpClient.session() must be called before using its resolver")
+        return self._resolver
+
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            trace_config = aiohttp.TraceConfig()
+            trace_config.on_connection_create_end.append(self._on_connection_created)
+            trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+            self._resolver = CachingSSRFGuardedResolver(ttl_seconds=settings.HTTP_CLIENT_DNS_CACHE_TTL_SECONDS)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    resolver=self._resolver,
+                    use_dns_cache=False,
+                    limit=settings.HTTP_CLIENT_POOL_MAX_CONNECTIONS,
+                    limit_per_host=settings.HTTP_CLIENT_POOL_MAX_PER_HOST,
+                    keepalive_timeout=settings.HTTP_CLIENT_KEEPALIVE_SECONDS,
+                ),
+                cookie_jar=aiohttp.DummyCookieJar(),
+                trace_configs=[trace_config],
+            )
+            self._loop = loop
+        self.stats.requests += 1
+        return self._session
+
+    async def _on_connection_created(self, *_: Any) -> None:
+        self.stats.connections_created += 1
+        otel_trace.get_current_span().set_attribute("http_connection_reused", False)
+
+    async def _on_connection_reused(self, *_: Any) -> None:
+        self.stats.connections_reused += 1
+        otel_trace.get_current_span().set_attribute("http_connection_reused", True)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._resolver = None
+        self._loop = None
+
+
+_pooled_http_client: PooledHttpClient | None = None
+
+
+def pooled_http_client() -> PooledHttpClient:
+    global _pooled_http_client
+    if _pooled_http_client is None:
+        _pooled_http_client = PooledHttpClient()
+    return _pooled_http_client
+
+
+async def close_pooled_http_client() -> None:
+    if _pooled_http_client is not None:
+        LOG.info("Closing pooled HTTP client", **vars(_pooled_http_client.stats))
+        await _pooled_http_client.close()
+
+
 async def aiohttp_request(
     method: str,
     url: str,
@@ -153,17 +296,27 @@ async def aiohttp_request(
         Tuple of (status_code, response_headers, response_body)
         where response_body can be dict (for JSON) or str (for text)
     """
-    resolver = SSRFGuardedResolver()
-    if proxy:
-        resolver.trust_proxy_url(proxy)
+    pooled_session: aiohttp.ClientSession | None = None
+    if settings.HTTP_CLIENT_POOL_ENABLED and not proxy:
+        pooled = pooled_http_client()
+        pooled_session = pooled.session()
+        resolver: SSRFGuardedResolver = pooled.resolver
+    else:
+        resolver = SSRFGuardedResolver()
+        if proxy:
+            resolver.trust_proxy_url(proxy)
     current_url = await validate_and_pin_fetch_url(url, resolver)
     request_method = method.upper()
     request_headers = dict(headers or {})
     request_cookies = cookies
     strip_body_headers = False
 
-    async with aiohttp.ClientSession(
-        timeout=aiohttp.ClientTimeout(total=timeout), connector=ssrf_guarded_tcp_connector(resolver)
+    async with (
+        nullcontext(pooled_session)
+        if pooled_session is not None
+        else aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=timeout), connector=ssrf_guarded_tcp_connector(resolver)
+        )
     ) as session:
 
         async def build_request_kwargs() -> dict[str, Any]:
@@ -177,6 +330,11 @@ async def aiohttp_request(
                 "proxy": proxy,
                 "allow_redirects": False,
             }
+            # ``timeout`` bounds the whole redirect chain, not each hop, on either session.
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(f"HTTP request to {url} timed out after {timeout}s")
+            request_kwargs["timeout"] = aiohttp.ClientTimeout(total=remaining)
 
             if request_method == "GET":
                 return request_kwargs
@@ -205,6 +363,7 @@ async def aiohttp_request(
                 request_kwargs["json" if "application/json" in content_type.lower() else "data"] = data
             return request_kwargs
 
+        deadline = time.monotonic() + timeout
         for _ in range(MAX_SAFE_REDIRECTS + 1):
             request_kwargs = await build_request_kwargs()
             request_kwargs["url"] = current_url
@@ -0,0 +1,287 @@
+"""
+SQLite-backed per-organization rate limiter for self-hosted API workers.
+
+The OSS build otherwise ships only `NoopRateLimiter`, so one organization's burst of run
+submissions or SDK actions can saturate a worker's event loop and browser capacity for every
+other organization. This limiter keeps its state in a single SQLite file that every API worker
+process on the host opens, so the limits hold across processes rather than per worker:
+
+- **Run submissions** use a token bucket per organization: it refills at
+  SUBMIT_RUN_RATE_LIMIT_PER_MINUTE and holds at most SUBMIT_RUN_RATE_LIMIT_BURST tokens. A
+  submission with no token left raises `RateLimitExceeded`.
+- **SDK actions** hold one of SDK_ACTION_CONCURRENCY_LIMIT slots for the organization while they
+  run. Entering at the cap raises `ConcurrencyLimitExceeded`. Slots record their holder's pid and
+  a lease, so a worker killed mid-action cannot leak them forever.
+
+Limits can be overridden per organization with RATE_LIMIT_ORGANIZATION_OVERRIDES.
+
+SQLite calls are blocking, so every check runs in a worker thread. A locked or unreadable limiter
+file fails open: it is logged and the request proceeds, because the limiter must never be the
+reason the API is down.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+import psutil
+import structlog
+
+from skyvern.config import settings
+from skyvern.exceptions import ConcurrencyLimitExceeded, RateLimitExceeded
+from skyvern.forge.sdk.core.rate_limiter import RateLimiter
+
+LOG = structlog.get_logger()
+
+_BUSY_TIMEOUT_MS = 5000
+_STATS_LOG_INTERVAL = 100  # log counters every N decisions
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS submit_run_buckets (
+        organization_id TEXT PRIMARY KEY,
+        tokens REAL NOT NULL,
+        updated_at REAL NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS sdk_action_slots (
+        slot_id TEXT PRIMARY KEY,
+        organization_id TEXT NOT NULL,
+        pid INTEGER NOT NULL,
+        acquired_at REAL NOT NULL,
+        expires_at REAL NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS sdk_action_slots_organization_id_idx ON sdk_action_slots (organization_id)",
+)
+
+
+@dataclass(frozen=True)
+class OrganizationLimits:
+    submit_run_per_minute: int
+    submit_run_burst: int
+    sdk_action_concurrency: int
+
+    @classmethod
+    def for_organization(cls, organization_id: str) -> OrganizationLimits:
+        overrides = settings.RATE_LIMIT_ORGANIZATION_OVERRIDES.get(organization_id, {})
+        return cls(
+            submit_run_per_minute=overrides.get("submit_run_per_minute", settings.SUBMIT_RUN_RATE_LIMIT_PER_MINUTE),
+            submit_run_burst=overrides.get("submit_run_burst", settings.SUBMIT_RUN_RATE_LIMIT_BURST),
+            sdk_action_concurrency=overrides.get("sdk_action_concurrency", settings.SDK_ACTION_CONCURRENCY_LIMIT),
+        )
+
+
+@dataclass
+class RateLimiterStats:
+    """In-process counters for this worker's decisions against the shared file."""
+
+    submit_runs_allowed: int = 0
+    submit_runs_rejected: int = 0
+    sdk_action_slots_acquired: int = 0
+    sdk_action_slots_rejected: int = 0
+    stale_slots_reclaimed: int = 0
+    errors: int = 0
+
+    @property
+    def decisions(self) -> int:
+        return (
+            self.submit_runs_allowed
+            + self.submit_runs_rejected
+            + self.sdk_action_slots_acquired
+            + self.sdk_action_slots_rejected
+        )
+
+
+class LocalRateLimiter(RateLimiter):
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.stats = RateLimiterStats()
+        # One connection per process, serialized by a lock: the to_thread pool may run calls on
+        # different threads, and sqlite3 connections must not be used concurrently.
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(Path(self.path).expanduser()) if self.path != ":memory:" else self.path,
+                timeout=_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+            self._conn = conn
+        return self._conn
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def rate_limit_submit_run(self, organization_id: str) -> None:
+        limits = OrganizationLimits.for_organization(organization_id)
+        if limits.submit_run_per_minute <= 0 or limits.submit_run_burst <= 0:
+            return
+        if not await asyncio.to_thread(self.take_submit_run_token_sync, organization_id, limits):
+            raise RateLimitExceeded(organization_id, max_requests=limits.submit_run_per_minute, window_seconds=60)
+
+    def limit_sdk_action_concurrency(self, organization_id: str) -> AbstractAsyncContextManager[None]:
+        return self._sdk_action_slot(organization_id)
+
+    @asynccontextmanager
+    async def _sdk_action_slot(self, organization_id: str) -> AsyncIterator[None]:
+        limit = OrganizationLimits.for_organization(organization_id).sdk_action_concurrency
+        if limit <= 0:
+            yield
+            return
+        slot_id = await asyncio.to_thread(self.acquire_sdk_action_slot_sync, organization_id, limit)
+        if slot_id is None:
+            raise ConcurrencyLimitExceeded(organization_id=organization_id, operation="SDK action", limit=limit)
+        try:
+            yield
+        finally:
+            # Runs to completion in its thread even if this task is cancelled while awaiting it.
+            await asyncio.to_thread(self.release_sdk_action_slot_sync, slot_id)
+
+    def take_submit_run_token_sync(self, organization_id: str, limits: OrganizationLimits) -> bool:
+        now = time.time()
+        refill_per_second = limits.submit_run_per_minute / 60
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    row = conn.execute(
+                        "SELECT tokens, updated_at FROM submit_run_buckets WHERE organization_id = ?",
+                        (organization_id,),
+                    ).fetchone()
+                    tokens = float(limits.submit_run_burst)
+                    if row is not None:
+                        tokens = min(tokens, row[0] + max(0.0, now - row[1]) * refill_per_second)
+                    allowed = tokens >= 1
+                    if allowed:
+                        tokens -= 1
+                    conn.execute(
+                        "INSERT OR REPLACE INTO submit_run_buckets (organization_id, tokens, updated_at) "
+                        "VALUES (?, ?, ?)",
+                        (organization_id, tokens, now),
+                    )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            LOG.warning("rate_limiter.submit_run_check_failed", organization_id=organization_id, exc_info=True)
+            self.stats.errors += 1
+            return True
+
+        if allowed:
+            self.stats.submit_runs_allowed += 1
+        else:
+            self.stats.submit_runs_rejected += 1
+            LOG.info(
+                "rate_limiter.submit_run_rejected",
+                organization_id=organization_id,
+                submit_run_per_minute=limits.submit_run_per_minute,
+                submit_run_burst=limits.submit_run_burst,
+                rejected_total=self.stats.submit_runs_rejected,
+            )
+        self._maybe_log_stats()
+        return allowed
+
+    def acquire_sdk_action_slot_sync(self, organization_id: str, limit: int) -> str | None:
+        """Claim a slot and return its id, or None when the organization is at ``limit``.
+
+        A limiter file that cannot be used returns a slot id that matches no row, so the action
+        proceeds unbounded and its release is a no-op.
+        """
+        now = time.time()
+        slot_id = uuid.uuid4().hex
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    in_flight = self._count_live_slots(conn, organization_id, now)
+                    acquired = in_flight < limit
+                    if acquired:
+                        conn.execute(
+                            "INSERT INTO sdk_action_slots (slot_id, organization_id, pid, acquired_at, expires_at) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            (slot_id, organization_id, os.getpid(), now, now + settings.SDK_ACTION_SLOT_LEASE_SECONDS),
+                        )
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error:
+            LOG.warning("rate_limiter.sdk_action_slot_acquire_failed", organization_id=organization_id, exc_info=True)
+            self.stats.errors += 1
+            return slot_id
+
+        if acquired:
+            self.stats.sdk_action_slots_acquired += 1
+        else:
+            self.stats.sdk_action_slots_rejected += 1
+            LOG.info(
+                "rate_limiter.sdk_action_rejected",
+                organization_id=organization_id,
+                in_flight=in_flight,
+                limit=limit,
+                rejected_total=self.stats.sdk_action_slots_rejected,
+            )
+        self._maybe_log_stats()
+        return slot_id if acquired else None
+
+    def _count_live_slots(self, conn: sqlite3.Connection, organization_id: str, now: float) -> int:
+        rows = conn.execute(
+            "SELECT slot_id, pid, expires_at FROM sdk_action_slots WHERE organization_id = ?",
+            (organization_id,),
+        ).fetchall()
+        stale = [slot_id for slot_id, pid, expires_at in rows if expires_at <= now or not psutil.pid_exists(pid)]
+        if stale:
+            conn.executemany("DELETE FROM sdk_action_slots WHERE slot_id = ?", [(slot_id,) for slot_id in stale])
+            self.stats.stale_slots_reclaimed += len(stale)
+            LOG.warning(
+                "rate_limiter.stale_sdk_action_slots_reclaimed", organization_id=organization_id, count=len(stale)
+            )
+        return len(rows) - len(stale)
+
+    def release_sdk_action_slot_sync(self, slot_id: str) -> None:
+        try:
+            with self._lock:
+                self._connect().execute("DELETE FROM sdk_action_slots WHERE slot_id = ?", (slot_id,))
+        except sqlite3.Error:
+            # The lease reclaims the slot if this delete never lands.
+            LOG.warning("rate_limiter.sdk_action_slot_release_failed", slot_id=slot_id, exc_info=True)
+            self.stats.errors += 1
+
+    def _maybe_log_stats(self) -> None:
+        decisions = self.stats.decisions
+        if decisions > 0 and decisions % _STATS_LOG_INTERVAL == 0:
+            LOG.info(
+                "rate_limiter.stats",
+                submit_runs_allowed=self.stats.submit_runs_allowed,
+                submit_runs_rejected=self.stats.submit_runs_rejected,
+                sdk_action_slots_acquired=self.stats.sdk_action_slots_acquired,
+                sdk_action_slots_rejected=self.stats.sdk_action_slots_rejected,
+                stale_slots_reclaimed=self.stats.stale_slots_reclaimed,
+                errors=self.stats.errors,
+            )
@@ -25,6 +25,7 @@ if TYPE_CHECKING:
     # Deferred import: skyvern_context.py sits below the service layer and
     # must not pull a service module at import time. String annotation below.
     from skyvern.services.script_reviewer_v3.budget import RunBudget
+    from skyvern.services.write_behind import RunWriteBuffer
 
 LOG = structlog.get_logger()
 
@@ -244,6 +245,10 @@ class SkyvernContext:
     # run start for v3-cohort workflows; None for v2-cohort runs. SKY-7676.
     v3_run_budget: RunBudget | None = None
 
+    # Write-behind buffer for the agent loop's action and step usage writes, created on the first
+    # buffered step when DATABASE_WRITE_BEHIND_ENABLED (see skyvern/services/write_behind.py).
+    write_buffer: RunWriteBuffer | None = None
+
     # magic link handling
     # task_id is the key, page is the value
     # we only consider the page is a magic link page in the same task scope
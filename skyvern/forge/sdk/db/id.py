@@ -86,6 +86,7 @@ RUN_TAG_EVENT_PREFIX = "rtge"
 TAG_KEY_PREFIX = "tkey"
 TAG_VALUE_PREFIX = "tval"
 UPLOADED_FILE_PREFIX = "file"
+WEBHOOK_OUTBOX_PREFIX = "who"
 
 
 def generate_workflow_id() -> str:
@@ -368,6 +369,11 @@ def generate_workflow_schedule_id() -> str:
     return f"{WORKFLOW_SCHEDULE_PREFIX}_{int_id}"
 
 
+def generate_webhook_outbox_id() -> str:
+    int_id = generate_id()
+    return f"{WEBHOOK_OUTBOX_PREFIX}_{int_id}"
+
+
 ############# Helper functions below ##############
 def generate_id() -> int:
     """
@@ -66,6 +66,7 @@ from skyvern.forge.sdk.db.id import (
     generate_thought_id,
     generate_totp_code_id,
     generate_uploaded_file_id,
+    generate_webhook_outbox_id,
     generate_workflow_copilot_chat_id,
     generate_workflow_copilot_chat_message_id,
     generate_workflow_copilot_completion_criteria_set_id,
@@ -91,6 +92,8 @@ class TaskModel(Base):
     __tablename__ = "tasks"
     __table_args__ = (
         Index("idx_tasks_org_created", "organization_id", "created_at"),
+        # Keyset paging of run history / task lists on (created_at, task_id).
+        Index("ix_tasks_org_created_task_id", "organization_id", "created_at", "task_id"),
         Index(
             "ix_tasks_nonterminal_status",
             "status",
@@ -701,6 +704,14 @@ class WorkflowRunModel(Base):
     __tablename__ = "workflow_runs"
     __table_args__ = (
         Index("idx_workflow_runs_org_created", "organization_id", "created_at"),
+        # Keyset paging of run history on (created_at, workflow_run_id); history lists top-level runs only.
+        Index(
+            "ix_workflow_runs_org_created_run_id",
+            "organization_id",
+            "created_at",
+            "workflow_run_id",
+            postgresql_where=text("parent_workflow_run_id IS NULL"),
+        ),
         Index("idx_workflow_runs_wpid_created", "workflow_permanent_id", "created_at"),
         Index(
             "ix_workflow_runs_nonterminal_status",
@@ -2083,3 +2094,41 @@ class UploadedFileModel(Base):
         onupdate=datetime.datetime.utcnow,
         nullable=False,
     )
+
+
+class WebhookOutboxModel(Base):
+    __tablename__ = "webhook_outbox"
+    __table_args__ = (
+        # The worker's claim query: pending rows ordered by when they are next due.
+        Index(
+            "ix_webhook_outbox_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        Index("ix_webhook_outbox_run_id", "run_id"),
+    )
+
+    webhook_outbox_id = Column(String, primary_key=True, default=generate_webhook_outbox_id)
+    organization_id = Column(String, ForeignKey("organizations.organization_id", ondelete="CASCADE"), nullable=False)
+    run_id = Column(String, nullable=False)
+    run_type = Column(String, nullable=False)
+    url = Column(String, nullable=False)
+    # Signed at enqueue time; the signature headers travel with it unchanged on every attempt.
+    payload = Column(UnicodeText, nullable=False)
+    headers = Column(JSON, nullable=False)
+    success_marker = Column(String, nullable=True)
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=datetime.datetime.utcnow)
+    locked_until = Column(DateTime, nullable=True)
+    last_status_code = Column(Integer, nullable=True)
+    last_error = Column(UnicodeText, nullable=True)
+    delivered_at = Column(DateTime, nullable=True)
+
+    created_at = Column(DateTime, default=datetime.datetime.utcnow, nullable=False)
+    modified_at = Column(
+        DateTime,
+        default=datetime.datetime.utcnow,
+        onupdate=datetime.datetime.utcnow,
+        nullable=False,
+    )
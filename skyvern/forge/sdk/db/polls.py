@@ -3,6 +3,7 @@ import asyncio
 from structlog import get_logger
 
 from skyvern.forge.sdk.db.agent_db import AgentDB
+from skyvern.forge.sdk.db.status_notifications import StatusEntity, status_notifications
 from skyvern.forge.sdk.schemas.persistent_browser_sessions import PersistentBrowserSession
 
 LOG = get_logger(__name__)
@@ -27,24 +28,25 @@ async def await_browser_session(
     poll_interval: float = 2,
 ) -> PersistentBrowserSession | None:
     try:
-        async with asyncio.timeout(timeout):
-            while True:
-                persistent_browser_session = await db.browser_sessions.get_persistent_browser_session(
-                    session_id, organization_id
-                )
-                if persistent_browser_session is None:
-                    raise Exception(f"Persistent browser session not found for {session_id}")
-
-                LOG.debug(
-                    "Checking browser readiness",
-                    session_id=session_id,
-                    is_browser_ready=persistent_browser_session.is_browser_ready,
-                )
-
-                if persistent_browser_session.is_browser_ready:
-                    return persistent_browser_session
-
-                await asyncio.sleep(poll_interval)
+        with status_notifications.subscribe(StatusEntity.browser_session, session_id) as subscription:
+            async with asyncio.timeout(timeout):
+                while True:
+                    persistent_browser_session = await db.browser_sessions.get_persistent_browser_session(
+                        session_id, organization_id
+                    )
+                    if persistent_browser_session is None:
+                        raise Exception(f"Persistent browser session not found for {session_id}")
+
+                    LOG.debug(
+                        "Checking browser readiness",
+                        session_id=session_id,
+                        is_browser_ready=persistent_browser_session.is_browser_ready,
+                    )
+
+                    if persistent_browser_session.is_browser_ready:
+                        return persistent_browser_session
+
+                    await subscription.wait(poll_interval)
     except asyncio.TimeoutError:
         LOG.warning(f"Browser address not found for persistent browser session {session_id}")
 
@@ -831,3 +831,17 @@ class ArtifactsRepository(BaseRepository):
                 .values(screenshot_artifact_id=screenshot_artifact_id)
             )
             await session.commit()
+
+    @db_operation("update_action_screenshot_artifact_ids")
+    async def update_action_screenshot_artifact_ids(self, updates: list[tuple[str, str, str]]) -> None:
+        """Apply (organization_id, action_id, screenshot_artifact_id) updates in one transaction."""
+        if not updates:
+            return
+        async with self.Session() as session:
+            for organization_id, action_id, screenshot_artifact_id in updates:
+                await session.execute(
+                    update(ActionModel)
+                    .where(ActionModel.action_id == action_id, ActionModel.organization_id == organization_id)
+                    .values(screenshot_artifact_id=screenshot_artifact_id)
+                )
+            await session.commit()
@@ -24,6 +24,7 @@ from skyvern.forge.sdk.db.models import (
     WorkflowRunModel,
 )
 from skyvern.forge.sdk.db.repositories.proxy_pin_update import apply_proxy_pin_to_model, normalize_proxy_pin_for_create
+from skyvern.forge.sdk.db.status_notifications import StatusEntity, commit_with_status_notification
 from skyvern.forge.sdk.db.utils import serialize_proxy_location
 from skyvern.forge.sdk.schemas.browser_profiles import (
     BrowserProfile,
@@ -978,7 +979,10 @@ class BrowserSessionsRepository(BaseRepository):
             if browser_profile_loaded is not None:
                 persistent_browser_session.browser_profile_loaded = browser_profile_loaded
 
-            await session.commit()
+            if status:
+                await commit_with_status_notification(session, StatusEntity.browser_session, [browser_session_id])
+            else:
+                await session.commit()
             await session.refresh(persistent_browser_session)
             return PersistentBrowserSession.model_validate(persistent_browser_session)
 
@@ -1028,7 +1032,13 @@ class BrowserSessionsRepository(BaseRepository):
                 if browser_vendor:
                     persistent_browser_session.browser_vendor = browser_vendor
                 try:
-                    await session.commit()
+                    if upstream_cdp_url:
+                        # Readiness (``is_browser_ready``) is what ``await_browser_session`` waits for.
+                        await commit_with_status_notification(
+                            session, StatusEntity.browser_session, [browser_session_id]
+                        )
+                    else:
+                        await session.commit()
                 except StatementError as exc:
                     # A failed statement renders its bound parameters — including upstream_cdp_url —
                     # into the text that callers log. The type and statement still identify the fault.
@@ -1083,7 +1093,7 @@ class BrowserSessionsRepository(BaseRepository):
             ).first()
             if persistent_browser_session:
                 persistent_browser_session.deleted_at = naive_utc_now()
-                await session.commit()
+                await commit_with_status_notification(session, StatusEntity.browser_session, [session_id])
                 await session.refresh(persistent_browser_session)
             else:
                 raise NotFoundError(f"PersistentBrowserSession {session_id} not found")
@@ -1233,7 +1243,7 @@ class BrowserSessionsRepository(BaseRepository):
                 persistent_browser_session.completed_at = naive_utc_now()
                 persistent_browser_session.status = "completed"
                 persistent_browser_session.download_run_id = None
-                await session.commit()
+                await commit_with_status_notification(session, StatusEntity.browser_session, [session_id])
                 await session.refresh(persistent_browser_session)
                 return PersistentBrowserSession.model_validate(persistent_browser_session)
             raise NotFoundError(f"PersistentBrowserSession {session_id} not found")
@@ -6,7 +6,7 @@ from decimal import Decimal
 from typing import Any, Sequence
 
 import structlog
-from sqlalchemy import and_, delete, func, select, update
+from sqlalchemy import and_, delete, func, literal, select, tuple_, update
 
 from skyvern.forge.sdk.db._error_handling import db_operation
 from skyvern.forge.sdk.db.base_alchemy_db import read_retry
@@ -22,6 +22,7 @@ from skyvern.forge.sdk.db.models import (
     WorkflowRunBlockModel,
     WorkflowRunModel,
 )
+from skyvern.forge.sdk.db.status_notifications import StatusEntity, commit_with_status_notification
 from skyvern.forge.sdk.db.utils import convert_to_step, convert_to_task, hydrate_action, serialize_proxy_location
 from skyvern.forge.sdk.models import Step, StepStatus
 from skyvern.forge.sdk.schemas.runs import Run
@@ -695,7 +696,10 @@ class TasksRepository(BaseRepository):
                     task.webhook_failure_reason = webhook_failure_reason
                 if failure_category is not None:
                     task.failure_category = failure_category
-                await session.commit()
+                if status is not None:
+                    await commit_with_status_notification(session, StatusEntity.task, [task_id])
+                else:
+                    await session.commit()
                 updated_task = await self.get_task(task_id, organization_id=organization_id)
                 if not updated_task:
                     raise NotFoundError("Task not found")
@@ -742,7 +746,7 @@ class TasksRepository(BaseRepository):
                 task.queued_at = None
                 task.started_at = None
                 task.finished_at = None
-                await session.commit()
+                await commit_with_status_notification(session, StatusEntity.task, [task_id])
                 await session.refresh(task)
                 reset_task = convert_to_task(task, debug_enabled=self.debug_enabled)
             else:
@@ -831,7 +835,10 @@ class TasksRepository(BaseRepository):
                 )
             result = await session.execute(update_stmt.values(**update_values).returning(TaskModel.task_id))
             updated_task_ids = list(result.scalars().all())
-            await session.commit()
+            if status:
+                await commit_with_status_notification(session, StatusEntity.task, updated_task_ids)
+            else:
+                await session.commit()
             return updated_task_ids
 
     @db_operation("bulk_update_tasks_by_workflow_run_ids")
@@ -863,10 +870,12 @@ class TasksRepository(BaseRepository):
                 .where(TaskModel.workflow_run_id.in_(workflow_run_ids))
                 .where(TaskModel.status.in_([s.value for s in only_if_status_in]))
                 .values(**update_values)
+                .returning(TaskModel.task_id)
             )
             result = await session.execute(update_stmt)
-            await session.commit()
-            return result.rowcount or 0
+            updated_task_ids = list(result.scalars().all())
+            await commit_with_status_notification(session, StatusEntity.task, updated_task_ids)
+            return len(updated_task_ids)
 
     @db_operation("bulk_update_steps_by_workflow_run_ids")
     async def bulk_update_steps_by_workflow_run_ids(
@@ -908,16 +917,20 @@ class TasksRepository(BaseRepository):
         application: str | None = None,
         order_by_column: OrderBy = OrderBy.created_at,
         order: SortDirection = SortDirection.desc,
+        cursor_value: datetime | None = None,
+        cursor_task_id: str | None = None,
     ) -> list[Task]:
         """
         Get all tasks.
-        :param page: Starts at 1
+        :param page: Starts at 1. Ignored when a cursor is given.
         :param page_size:
         :param task_status:
         :param workflow_run_id:
         :param only_standalone_tasks:
         :param order_by_column:
         :param order:
+        :param cursor_value: order_by_column value of the last task on the previous page
+        :param cursor_task_id: task_id of the last task on the previous page
         :return:
         """
         if page < 1:
@@ -939,11 +952,17 @@ class TasksRepository(BaseRepository):
             if application:
                 query = query.filter(TaskModel.application == application)
             order_by_col = getattr(TaskModel, order_by_column)
-            query = (
-                query.order_by(order_by_col.desc() if order == SortDirection.desc else order_by_col.asc())
-                .limit(page_size)
-                .offset(db_page * page_size)
-            )
+            if cursor_value is not None and cursor_task_id is not None:
+                # Keyset page: seek past the previous page's last row instead of scanning the offset.
+                row = tuple_(order_by_col, TaskModel.task_id)
+                cursor = tuple_(literal(to_naive_utc(cursor_value)), literal(cursor_task_id))
+                query = query.filter(row < cursor if order == SortDirection.desc else row > cursor)
+                db_page = 0
+            if order == SortDirection.desc:
+                query = query.order_by(order_by_col.desc(), TaskModel.task_id.desc())
+            else:
+                query = query.order_by(order_by_col.asc(), TaskModel.task_id.asc())
+            query = query.limit(page_size).offset(db_page * page_size)
 
             results = (await session.execute(query)).all()
 
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_, select, update
+
+from skyvern.forge.sdk.db._error_handling import db_operation
+from skyvern.forge.sdk.db.base_repository import BaseRepository
+from skyvern.forge.sdk.db.datetime_utils import naive_utc_now, to_naive_utc
+from skyvern.forge.sdk.db.models import WebhookOutboxModel
+from skyvern.forge.sdk.schemas.webhook_outbox import WebhookOutboxEntry, WebhookOutboxStatus
+
+
+class WebhookOutboxRepository(BaseRepository):
+    """Database operations for the durable run-completion webhook outbox."""
+
+    @db_operation("enqueue_webhook")
+    async def enqueue_webhook(
+        self,
+        organization_id: str,
+        run_id: str,
+        run_type: str,
+        url: str,
+        payload: str,
+        headers: dict[str, str],
+        success_marker: str | None = None,
+    ) -> WebhookOutboxEntry:
+        now = naive_utc_now()
+        async with self.Session() as session:
+            entry = WebhookOutboxModel(
+                organization_id=organization_id,
+                run_id=run_id,
+                run_type=run_type,
+                url=url,
+                payload=payload,
+                headers=headers,
+                success_marker=success_marker,
+                status=WebhookOutboxStatus.pending,
+                attempts=0,
+                next_attempt_at=now,
+            )
+            session.add(entry)
+            await session.commit()
+            await session.refresh(entry)
+            return WebhookOutboxEntry.model_validate(entry)
+
+    @db_operation("claim_due_webhooks")
+    async def claim_due_webhooks(self, limit: int, lease_seconds: int) -> list[WebhookOutboxEntry]:
+        """Lease up to ``limit`` due webhooks to the caller and count the attempt it is about to make.
+
+        The SELECT skips rows another worker holds locked (Postgres), and the UPDATE re-checks the
+        lease, so two workers polling at once never claim the same row. The attempt is counted at
+        claim time so a webhook that crashes its worker still runs out of attempts.
+        """
+        now = naive_utc_now()
+        not_leased = or_(WebhookOutboxModel.locked_until.is_(None), WebhookOutboxModel.locked_until <= now)
+        async with self.Session() as session:
+            due_ids = (
+                (
+                    await session.execute(
+                        select(WebhookOutboxModel.webhook_outbox_id)
+                        .where(WebhookOutboxModel.status == WebhookOutboxStatus.pending)
+                        .where(WebhookOutboxModel.next_attempt_at <= now)
+                        .where(not_leased)
+                        .order_by(WebhookOutboxModel.next_attempt_at)
+                        .limit(limit)
+                        .with_for_update(skip_locked=True)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            if not due_ids:
+                return []
+            result = await session.execute(
+                update(WebhookOutboxModel)
+                .where(WebhookOutboxModel.webhook_outbox_id.in_(due_ids))
+                .where(WebhookOutboxModel.status == WebhookOutboxStatus.pending)
+                .where(not_leased)
+                .values(
+                    locked_until=now + timedelta(seconds=lease_seconds),
+                    attempts=WebhookOutboxModel.attempts + 1,
+                    modified_at=now,
+                )
+                .returning(WebhookOutboxModel)
+            )
+            # Read the rows out before committing: commit expires the ORM instances.
+            claimed = [WebhookOutboxEntry.model_validate(row) for row in result.scalars().all()]
+            await session.commit()
+            return sorted(claimed, key=lambda entry: entry.next_attempt_at)
+
+    @db_operation("mark_webhook_delivered")
+    async def mark_webhook_delivered(self, webhook_outbox_id: str, status_code: int) -> None:
+        now = naive_utc_now()
+        await self._update(
+            webhook_outbox_id,
+            status=WebhookOutboxStatus.delivered,
+            last_status_code=status_code,
+            last_error=None,
+            delivered_at=now,
+            modified_at=now,
+        )
+
+    @db_operation("reschedule_webhook")
+    async def reschedule_webhook(
+        self,
+        webhook_outbox_id: str,
+        next_attempt_at: datetime,
+        status_code: int | None,
+        error: str | None,
+    ) -> None:
+        await self._update(
+            webhook_outbox_id,
+            next_attempt_at=to_naive_utc(next_attempt_at),
+            last_status_code=status_code,
+            last_error=error,
+            modified_at=naive_utc_now(),
+        )
+
+    @db_operation("mark_webhook_dead")
+    async def mark_webhook_dead(self, webhook_outbox_id: str, status_code: int | None, error: str | None) -> None:
+        await self._update(
+            webhook_outbox_id,
+            status=WebhookOutboxStatus.dead,
+            last_status_code=status_code,
+            last_error=error,
+            modified_at=naive_utc_now(),
+        )
+
+    async def _update(self, webhook_outbox_id: str, **values: object) -> None:
+        async with self.Session() as session:
+            await session.execute(
+                update(WebhookOutboxModel)
+                .where(WebhookOutboxModel.webhook_outbox_id == webhook_outbox_id)
+                .values(locked_until=None, **values)
+            )
+            await session.commit()
@@ -1164,40 +1164,65 @@ class WorkflowParametersRepository(BaseRepository):
                 return None
             return TaskGeneration.model_validate(task_generation)
 
+    @staticmethod
+    def _build_action_model(action: Action, **columns: Any) -> ActionModel:
+        raw_action_payload = action.model_dump()
+        action_log_payload = redact_action_for_log(action)
+        return ActionModel(
+            action_type=action.action_type,
+            source_action_id=action.source_action_id,
+            organization_id=action.organization_id,
+            workflow_run_id=action.workflow_run_id,
+            task_id=action.task_id,
+            step_id=action.step_id,
+            step_order=action.step_order,
+            action_order=action.action_order,
+            status=action.status,
+            reasoning=action.reasoning,
+            intention=action.intention,
+            response=action_log_payload.get("response"),
+            element_id=action.element_id,
+            skyvern_element_hash=action.skyvern_element_hash,
+            skyvern_element_data=action.skyvern_element_data,
+            screenshot_artifact_id=action.screenshot_artifact_id,
+            action_json=raw_action_payload,
+            confidence_float=action.confidence_float,
+            started_at=action.started_at,
+            finished_at=action.finished_at,
+            created_by=action.created_by,
+            **columns,
+        )
+
     @traced(name="skyvern.db.create_action")
     @db_operation("create_action")
     async def create_action(self, action: Action) -> Action:
         async with self.Session() as session:
-            raw_action_payload = action.model_dump()
-            action_log_payload = redact_action_for_log(action)
-            new_action = ActionModel(
-                action_type=action.action_type,
-                source_action_id=action.source_action_id,
-                organization_id=action.organization_id,
-                workflow_run_id=action.workflow_run_id,
-                task_id=action.task_id,
-                step_id=action.step_id,
-                step_order=action.step_order,
-                action_order=action.action_order,
-                status=action.status,
-                reasoning=action.reasoning,
-                intention=action.intention,
-                response=action_log_payload.get("response"),
-                element_id=action.element_id,
-                skyvern_element_hash=action.skyvern_element_hash,
-                skyvern_element_data=action.skyvern_element_data,
-                screenshot_artifact_id=action.screenshot_artifact_id,
-                action_json=raw_action_payload,
-                confidence_float=action.confidence_float,
-                started_at=action.started_at,
-                finished_at=action.finished_at,
-                created_by=action.created_by,
-            )
+            new_action = self._build_action_model(action)
             session.add(new_action)
             await session.commit()
             await session.refresh(new_action)
             return hydrate_action(new_action)
 
+    @traced(name="skyvern.db.create_actions")
+    @db_operation("create_actions")
+    async def create_actions(self, actions: list[tuple[Action, datetime]]) -> None:
+        """Insert already-identified actions in one transaction.
+
+        Each action must carry its pre-generated ``action_id``; its paired timestamp becomes
+        ``created_at`` so history queries ordered by it see the actions in the order they ran,
+        not the order they were written.
+        """
+        if not actions:
+            return
+        async with self.Session() as session:
+            session.add_all(
+                [
+                    self._build_action_model(action, action_id=action.action_id, created_at=created_at)
+                    for action, created_at in actions
+                ]
+            )
+            await session.commit()
+
     @traced(name="skyvern.db.upsert_recorded_action")
     @db_operation("upsert_recorded_action")
     async def upsert_recorded_action(self, action: Action) -> None:
@@ -19,6 +19,8 @@ from sqlalchemy import (
     literal_column,
     or_,
     select,
+    tuple_,
+    union_all,
     update,
 )
 from sqlalchemy.dialects.postgresql import JSONB
@@ -49,6 +51,7 @@ from skyvern.forge.sdk.db.models import (
     WorkflowRunParameterModel,
 )
 from skyvern.forge.sdk.db.protocols import WorkflowParameterReader
+from skyvern.forge.sdk.db.status_notifications import StatusEntity, commit_with_status_notification
 from skyvern.forge.sdk.db.utils import (
     convert_to_task,
     convert_to_workflow_run,
@@ -469,7 +472,10 @@ class WorkflowRunsRepository(BaseRepository):
                     workflow_run.queued_at = to_naive_utc(typing_cast(datetime | None, queued_at))
                 if finished_at is not _UNSET:
                     workflow_run.finished_at = to_naive_utc(typing_cast(datetime | None, finished_at))
-                await session.commit()
+                if status:
+                    await commit_with_status_notification(session, StatusEntity.workflow_run, [workflow_run_id])
+                else:
+                    await session.commit()
                 await save_workflow_run_logs(workflow_run_id)
                 await session.refresh(workflow_run)
                 return convert_to_workflow_run(workflow_run)
@@ -591,9 +597,10 @@ class WorkflowRunsRepository(BaseRepository):
                 .returning(WorkflowRunModel.workflow_run_id)
             )
             affected = result.scalar_one_or_none()
-            await session.commit()
             if affected is None:
+                await session.commit()
                 return None
+            await commit_with_status_notification(session, StatusEntity.workflow_run, [workflow_run_id])
             refreshed = (
                 await session.scalars(select(WorkflowRunModel).filter_by(workflow_run_id=workflow_run_id))
             ).one()
@@ -706,7 +713,10 @@ class WorkflowRunsRepository(BaseRepository):
                 update_stmt.values(**update_values).returning(WorkflowRunModel.workflow_run_id)
             )
             updated_workflow_run_ids = list(result.scalars().all())
-            await session.commit()
+            if status:
+                await commit_with_status_notification(session, StatusEntity.workflow_run, updated_workflow_run_ids)
+            else:
+                await session.commit()
             return updated_workflow_run_ids
 
     @db_operation("clear_workflow_run_failure_reason")
@@ -727,6 +737,70 @@ class WorkflowRunsRepository(BaseRepository):
             else:
                 raise NotFoundError("Workflow run not found")
 
+    def _filter_all_runs_workflow_runs(
+        self,
+        query: Select,
+        organization_id: str,
+        status: list[WorkflowRunStatus] | None,
+        include_debugger_runs: bool,
+        search_key: str | None,
+    ) -> Select:
+        query = (
+            query.join(WorkflowModel, WorkflowModel.workflow_id == WorkflowRunModel.workflow_id)
+            .filter(WorkflowRunModel.organization_id == organization_id)
+            .filter(WorkflowRunModel.parent_workflow_run_id.is_(None))
+            .filter(WorkflowRunModel.copilot_session_id.is_(None))
+        )
+
+        if not include_debugger_runs:
+            query = query.filter(WorkflowRunModel.debug_session_id.is_(None))
+
+        if search_key:
+            key_like = f"%{search_key}%"
+            # Match workflow_run_id directly
+            id_matches = WorkflowRunModel.workflow_run_id.ilike(key_like)
+            # Match parameter key or description (only for non-deleted parameter definitions)
+            param_key_desc_exists = exists(
+                select(1)
+                .select_from(WorkflowRunParameterModel)
+                .join(
+                    WorkflowParameterModel,
+                    WorkflowParameterModel.workflow_parameter_id == WorkflowRunParameterModel.workflow_parameter_id,
+                )
+                .where(WorkflowRunParameterModel.workflow_run_id == WorkflowRunModel.workflow_run_id)
+                .where(WorkflowParameterModel.deleted_at.is_(None))
+                .where(
+                    or_(
+                        WorkflowParameterModel.key.ilike(key_like),
+                        WorkflowParameterModel.description.ilike(key_like),
+                    )
+                )
+            )
+            # Match run parameter value directly (searches all values regardless of parameter definition status)
+            param_value_exists = exists(
+                select(1)
+                .select_from(WorkflowRunParameterModel)
+                .where(WorkflowRunParameterModel.workflow_run_id == WorkflowRunModel.workflow_run_id)
+                .where(WorkflowRunParameterModel.value.ilike(key_like))
+            )
+            # Match extra HTTP headers (cast JSON to text for search, skip NULLs)
+            extra_headers_match = and_(
+                WorkflowRunModel.extra_http_headers.isnot(None),
+                func.cast(WorkflowRunModel.extra_http_headers, Text()).ilike(key_like),
+            )
+            query = query.where(or_(id_matches, param_key_desc_exists, param_value_exists, extra_headers_match))
+
+        if status:
+            query = query.filter(WorkflowRunModel.status.in_(status))
+        return query
+
+    @staticmethod
+    def _filter_all_runs_tasks(query: Select, organization_id: str, status: list[WorkflowRunStatus] | None) -> Select:
+        query = query.filter(TaskModel.organization_id == organization_id).filter(TaskModel.workflow_run_id.is_(None))
+        if status:
+            query = query.filter(TaskModel.status.in_(status))
+        return query
+
     @db_operation("get_all_runs")
     async def get_all_runs(
         self,
@@ -738,62 +812,19 @@ class WorkflowRunsRepository(BaseRepository):
         search_key: str | None = None,
     ) -> list[WorkflowRun | Task]:
         async with self.Session() as session:
-            # temporary limit to 10 pages
+            # temporary limit to 10 pages; get_all_runs_before pages without a depth limit
             if page > 10:
                 return []
 
             limit = page * page_size
 
-            workflow_run_query = (
-                select(WorkflowRunModel, WorkflowModel.title)
-                .join(WorkflowModel, WorkflowModel.workflow_id == WorkflowRunModel.workflow_id)
-                .filter(WorkflowRunModel.organization_id == organization_id)
-                .filter(WorkflowRunModel.parent_workflow_run_id.is_(None))
-                .filter(WorkflowRunModel.copilot_session_id.is_(None))
+            workflow_run_query = self._filter_all_runs_workflow_runs(
+                select(WorkflowRunModel, WorkflowModel.title),
+                organization_id,
+                status,
+                include_debugger_runs,
+                search_key,
             )
-
-            if not include_debugger_runs:
-                workflow_run_query = workflow_run_query.filter(WorkflowRunModel.debug_session_id.is_(None))
-
-            if search_key:
-                key_like = f"%{search_key}%"
-                # Match workflow_run_id directly
-                id_matches = WorkflowRunModel.workflow_run_id.ilike(key_like)
-                # Match parameter key or description (only for non-deleted parameter definitions)
-                param_key_desc_exists = exists(
-                    select(1)
-                    .select_from(WorkflowRunParameterModel)
-                    .join(
-                        WorkflowParameterModel,
-                        WorkflowParameterModel.workflow_parameter_id == WorkflowRunParameterModel.workflow_parameter_id,
-                    )
-                    .where(WorkflowRunParameterModel.workflow_run_id == WorkflowRunModel.workflow_run_id)
-                    .where(WorkflowParameterModel.deleted_at.is_(None))
-                    .where(
-                        or_(
-                            WorkflowParameterModel.key.ilike(key_like),
-                            WorkflowParameterModel.description.ilike(key_like),
-                        )
-                    )
-                )
-                # Match run parameter value directly (searches all values regardless of parameter definition status)
-                param_value_exists = exists(
-                    select(1)
-                    .select_from(WorkflowRunParameterModel)
-                    .where(WorkflowRunParameterModel.workflow_run_id == WorkflowRunModel.workflow_run_id)
-                    .where(WorkflowRunParameterModel.value.ilike(key_like))
-                )
-                # Match extra HTTP headers (cast JSON to text for search, skip NULLs)
-                extra_headers_match = and_(
-                    WorkflowRunModel.extra_http_headers.isnot(None),
-                    func.cast(WorkflowRunModel.extra_http_headers, Text()).ilike(key_like),
-                )
-                workflow_run_query = workflow_run_query.where(
-                    or_(id_matches, param_key_desc_exists, param_value_exists, extra_headers_match)
-                )
-
-            if status:
-                workflow_run_query = workflow_run_query.filter(WorkflowRunModel.status.in_(status))
             workflow_run_query = workflow_run_query.order_by(WorkflowRunModel.created_at.desc()).limit(limit)
             workflow_run_query_result = (await session.execute(workflow_run_query)).all()
             workflow_runs = [
@@ -801,13 +832,7 @@ class WorkflowRunsRepository(BaseRepository):
                 for run, title in workflow_run_query_result
             ]
 
-            task_query = (
-                select(TaskModel)
-                .filter(TaskModel.organization_id == organization_id)
-                .filter(TaskModel.workflow_run_id.is_(None))
-            )
-            if status:
-                task_query = task_query.filter(TaskModel.status.in_(status))
+            task_query = self._filter_all_runs_tasks(select(TaskModel), organization_id, status)
             task_query = task_query.order_by(TaskModel.created_at.desc()).limit(limit)
             task_query_result = (await session.scalars(task_query)).all()
             tasks = [convert_to_task(task, debug_enabled=self.debug_enabled) for task in task_query_result]
@@ -821,6 +846,91 @@ class WorkflowRunsRepository(BaseRepository):
 
             return runs[lower:upper]
 
+    @db_operation("get_all_runs_before")
+    async def get_all_runs_before(
+        self,
+        organization_id: str,
+        page_size: int = 10,
+        status: list[WorkflowRunStatus] | None = None,
+        include_debugger_runs: bool = False,
+        search_key: str | None = None,
+        created_before: datetime | None = None,
+        run_id_before: str | None = None,
+    ) -> list[WorkflowRun | Task]:
+        """Keyset page of the same runs as ``get_all_runs``, newest first.
+
+        Returns the ``page_size`` runs ordered before the ``(created_at, run id)`` cursor, or the
+        newest runs when no cursor is given. Workflow runs and standalone tasks are merged by one
+        UNION ALL on ``(created_at, id)``; each branch applies the cursor and its own LIMIT so it
+        seeks its (organization_id, created_at, id) index. A page costs the same at any depth.
+        """
+        async with self.Session() as session:
+            workflow_run_keys = self._filter_all_runs_workflow_runs(
+                select(
+                    literal(RunType.workflow_run.value).label("run_type"),
+                    WorkflowRunModel.workflow_run_id.label("run_id"),
+                    WorkflowRunModel.created_at.label("created_at"),
+                ),
+                organization_id,
+                status,
+                include_debugger_runs,
+                search_key,
+            )
+            task_keys = self._filter_all_runs_tasks(
+                select(
+                    literal(RunType.task_v1.value).label("run_type"),
+                    TaskModel.task_id.label("run_id"),
+                    TaskModel.created_at.label("created_at"),
+                ),
+                organization_id,
+                status,
+            )
+            if created_before is not None and run_id_before is not None:
+                cursor = tuple_(literal(to_naive_utc(created_before)), literal(run_id_before))
+                # Row-value comparison, so the planner can turn it into a single index range.
+                workflow_run_keys = workflow_run_keys.where(
+                    tuple_(WorkflowRunModel.created_at, WorkflowRunModel.workflow_run_id) < cursor
+                )
+                task_keys = task_keys.where(tuple_(TaskModel.created_at, TaskModel.task_id) < cursor)
+            workflow_run_keys = workflow_run_keys.order_by(
+                WorkflowRunModel.created_at.desc(), WorkflowRunModel.workflow_run_id.desc()
+            ).limit(page_size)
+            task_keys = task_keys.order_by(TaskModel.created_at.desc(), TaskModel.task_id.desc()).limit(page_size)
+
+            # Each branch is wrapped so its ORDER BY/LIMIT stays inside it (SQLite rejects them on
+            # bare compound members).
+            run_keys = union_all(
+                select(workflow_run_keys.subquery()),
+                select(task_keys.subquery()),
+            ).subquery()
+            keys = (
+                await session.execute(
+                    select(run_keys.c.run_type, run_keys.c.run_id)
+                    .order_by(run_keys.c.created_at.desc(), run_keys.c.run_id.desc())
+                    .limit(page_size)
+                )
+            ).all()
+
+            workflow_run_ids = [run_id for run_type, run_id in keys if run_type == RunType.workflow_run.value]
+            task_ids = [run_id for run_type, run_id in keys if run_type == RunType.task_v1.value]
+            runs_by_id: dict[str, WorkflowRun | Task] = {}
+            if workflow_run_ids:
+                rows = (
+                    await session.execute(
+                        select(WorkflowRunModel, WorkflowModel.title)
+                        .join(WorkflowModel, WorkflowModel.workflow_id == WorkflowRunModel.workflow_id)
+                        .filter(WorkflowRunModel.workflow_run_id.in_(workflow_run_ids))
+                    )
+                ).all()
+                for run, title in rows:
+                    runs_by_id[run.workflow_run_id] = convert_to_workflow_run(
+                        run, workflow_title=title, debug_enabled=self.debug_enabled
+                    )
+            if task_ids:
+                for task in (await session.scalars(select(TaskModel).filter(TaskModel.task_id.in_(task_ids)))).all():
+                    runs_by_id[task.task_id] = convert_to_task(task, debug_enabled=self.debug_enabled)
+            return [runs_by_id[run_id] for _, run_id in keys if run_id in runs_by_id]
+
     @read_retry()
     async def get_all_runs_v2(
         self,
@@ -0,0 +1,299 @@
+"""Notifications of task, workflow run and browser session state changes.
+
+Waiters that used to re-read a row on a fixed sleep (the streaming routes, ``await_browser_session``
+and the screenshot streaming worker) subscribe to the entity here and re-read it when woken.
+Repositories commit status changes with ``commit_with_status_notification``, which wakes the
+subscribers in this process once the transaction has committed.
+
+With RUN_STATUS_LISTEN_NOTIFY_ENABLED on Postgres the change is also sent with NOTIFY inside the
+writing transaction, and every process running a ``StatusNotificationListener`` receives it over
+LISTEN. While that listener is connected, waiters fall back to re-reading the row only every
+RUN_STATUS_FALLBACK_POLL_SECONDS. Otherwise, including while the listener reconnects, they keep
+their own poll interval and only wake early for changes written by this process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import defaultdict
+from collections.abc import Sequence
+from enum import StrEnum
+from types import TracebackType
+from typing import Any
+from uuid import uuid4
+
+import structlog
+from opentelemetry import metrics
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession
+
+from skyvern.config import settings
+
+LOG = structlog.get_logger(__name__)
+
+STATUS_NOTIFICATION_CHANNEL = "skyvern_status_changes"
+# NOTIFY payloads are capped at 8000 bytes; 100 ids stay well below it.
+_MAX_IDS_PER_NOTIFICATION = 100
+# Lets the listener drop its own process's notifications, which were already delivered locally.
+_ORIGIN = uuid4().hex
+
+_meter = metrics.get_meter("skyvern.status_notifications")
+_notifications_received = _meter.create_counter(
+    "skyvern.status_notifications.received",
+    unit="{notification}",
+    description="Status change notifications delivered to this process, by source",
+)
+
+
+class StatusEntity(StrEnum):
+    task = "task"
+    workflow_run = "workflow_run"
+    browser_session = "browser_session"
+
+
+class StatusSubscription:
+    """One waiter's interest in one entity. Use as a context manager so it is always unsubscribed."""
+
+    def __init__(self, hub: StatusNotificationHub, entity: StatusEntity, entity_id: str) -> None:
+        self._hub = hub
+        self._key = (entity, entity_id)
+        self._changed = asyncio.Event()
+        self._last_refresh: float | None = None
+
+    def __enter__(self) -> StatusSubscription:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._hub._unsubscribe(self._key, self)
+
+    def notify(self) -> None:
+        self._changed.set()
+
+    async def wait(self, poll_interval: float, deadline: float | None = None) -> bool:
+        """Sleep until the entity changes or the poll interval passes. True when woken by a change.
+
+        ``deadline`` (a ``time.monotonic()`` value) caps the sleep for waiters with their own timeout.
+        """
+        timeout = self._hub.poll_interval(poll_interval)
+        if deadline is not None:
+            timeout = max(0.0, min(timeout, deadline - time.monotonic()))
+        try:
+            async with asyncio.timeout(timeout):
+                await self._changed.wait()
+        except TimeoutError:
+            return False
+        self._changed.clear()
+        return True
+
+    def should_refresh(self, poll_interval: float) -> bool:
+        """For loops with their own cadence: whether the entity changed or the poll interval passed."""
+        now = time.monotonic()
+        if (
+            self._changed.is_set()
+            or self._last_refresh is None
+            or now - self._last_refresh >= self._hub.poll_interval(poll_interval)
+        ):
+            self._changed.clear()
+            self._last_refresh = now
+            return True
+        return False
+
+
+class StatusNotificationHub:
+    """In-process broadcaster of status changes to the subscriptions of this event loop."""
+
+    def __init__(self) -> None:
+        self._subscriptions: defaultdict[tuple[StatusEntity, str], set[StatusSubscription]] = defaultdict(set)
+        self._listening = False
+
+    @property
+    def listening(self) -> bool:
+        """Whether changes written by other processes are being received."""
+        return self._listening
+
+    def set_listening(self, listening: bool) -> None:
+        if listening and not self._listening:
+            # Changes made while nothing was listening were never delivered.
+            self.wake_all()
+        self._listening = listening
+
+    def poll_interval(self, poll_interval: float) -> float:
+        if self._listening:
+            return max(poll_interval, settings.RUN_STATUS_FALLBACK_POLL_SECONDS)
+        return poll_interval
+
+    def subscribe(self, entity: StatusEntity, entity_id: str) -> StatusSubscription:
+        subscription = StatusSubscription(self, entity, entity_id)
+        self._subscriptions[(entity, entity_id)].add(subscription)
+        return subscription
+
+    def _unsubscribe(self, key: tuple[StatusEntity, str], subscription: StatusSubscription) -> None:
+        subscriptions = self._subscriptions.get(key)
+        if subscriptions is None:
+            return
+        subscriptions.discard(subscription)
+        if not subscriptions:
+            del self._subscriptions[key]
+
+    def publish(self, entity: StatusEntity, entity_ids: Sequence[str], source: str = "local") -> None:
+        for entity_id in entity_ids:
+            for subscription in self._subscriptions.get((entity, entity_id), ()):
+                subscription.notify()
+        _notifications_received.add(len(entity_ids), {"source": source, "entity": entity.value})
+
+    def wake_all(self) -> None:
+        for subscriptions in self._subscriptions.values():
+            for subscription in subscriptions:
+                subscription.notify()
+
+
+status_notifications = StatusNotificationHub()
+
+
+def _notification_payloads(entity: StatusEntity, entity_ids: Sequence[str]) -> list[str]:
+    return [
+        json.dumps(
+            {"origin": _ORIGIN, "entity": entity.value, "ids": list(entity_ids[i : i + _MAX_IDS_PER_NOTIFICATION])}
+        )
+        for i in range(0, len(entity_ids), _MAX_IDS_PER_NOTIFICATION)
+    ]
+
+
+async def commit_with_status_notification(
+    session: AsyncSession,
+    entity: StatusEntity,
+    entity_ids: Sequence[str],
+) -> None:
+    """Commit ``session`` and notify the subscribers of ``entity_ids`` that their state changed."""
+    if entity_ids and settings.RUN_STATUS_LISTEN_NOTIFY_ENABLED and session.get_bind().dialect.name == "postgresql":
+        # Sent by the commit itself, so no process hears about a change that was rolled back.
+        for payload in _notification_payloads(entity, entity_ids):
+            await session.execute(select(func.pg_notify(STATUS_NOTIFICATION_CHANNEL, payload)))
+    await session.commit()
+    if entity_ids:
+        status_notifications.publish(entity, entity_ids)
+
+
+def _dispatch_remote_notification(payload: str) -> None:
+    try:
+        message = json.loads(payload)
+        if message.get("origin") == _ORIGIN:
+            return
+        entity = StatusEntity(message["entity"])
+        entity_ids = [str(entity_id) for entity_id in message["ids"]]
+    except (ValueError, KeyError, TypeError):
+        LOG.warning("Ignoring malformed status notification", payload=payload[:200])
+        return
+    status_notifications.publish(entity, entity_ids, source="remote")
+
+
+class StatusNotificationListener:
+    """Holds one connection in LISTEN and feeds what it receives to ``status_notifications``."""
+
+    def __init__(self, engine: AsyncEngine, reconnect_delay_seconds: float = 5.0, keepalive_seconds: float = 60.0):
+        self._engine = engine
+        self._reconnect_delay_seconds = reconnect_delay_seconds
+        self._keepalive_seconds = keepalive_seconds
+
+    async def run_forever(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                LOG.warning("Status notification listener disconnected; reconnecting", exc_info=True)
+            finally:
+                status_notifications.set_listening(False)
+            await asyncio.sleep(self._reconnect_delay_seconds)
+
+    async def _listen(self) -> None:
+        async with self._engine.connect() as connection:
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            try:
+                raw_connection = await connection.get_raw_connection()
+                driver_connection: Any = raw_connection.driver_connection
+                if self._engine.dialect.driver == "asyncpg":
+                    await self._listen_asyncpg(driver_connection)
+                else:
+                    await self._listen_psycopg(connection, driver_connection)
+            finally:
+                # A connection left in LISTEN must not go back to the pool.
+                await connection.invalidate()
+
+    async def _listen_asyncpg(self, driver_connection: Any) -> None:
+        closed = asyncio.Event()
+        driver_connection.add_termination_listener(lambda _connection: closed.set())
+        await driver_connection.add_listener(
+            STATUS_NOTIFICATION_CHANNEL,
+            lambda _connection, _pid, _channel, payload: _dispatch_remote_notification(payload),
+        )
+        LOG.info("Listening for status notifications", channel=STATUS_NOTIFICATION_CHANNEL)
+        status_notifications.set_listening(True)
+        while not closed.is_set():
+            try:
+                async with asyncio.timeout(self._keepalive_seconds):
+                    await closed.wait()
+            except TimeoutError:
+                # asyncpg delivers notifications passively, so a peer that vanished is found by a query.
+                await driver_connection.execute("SELECT 1")
+        raise ConnectionError("Status notification connection closed")
+
+    async def _listen_psycopg(self, connection: AsyncConnection, driver_connection: Any) -> None:
+        await connection.exec_driver_sql(f"LISTEN {STATUS_NOTIFICATION_CHANNEL}")
+        LOG.info("Listening for status notifications", channel=STATUS_NOTIFICATION_CHANNEL)
+        status_notifications.set_listening(True)
+        while True:
+            async for notification in driver_connection.notifies(timeout=self._keepalive_seconds):
+                _dispatch_remote_notification(notification.payload)
+            await connection.exec_driver_sql("SELECT 1")
+
+
+_listener_task: asyncio.Task[None] | None = None
+
+
+def start_status_notification_listener(engine: AsyncEngine) -> asyncio.Task[None] | None:
+    global _listener_task
+
+    if not settings.RUN_STATUS_LISTEN_NOTIFY_ENABLED:
+        LOG.debug("Status notification LISTEN/NOTIFY is disabled")
+        return None
+    if engine.dialect.name != "postgresql":
+        LOG.info("Status notifications stay in-process: LISTEN/NOTIFY needs Postgres", dialect=engine.dialect.name)
+        return None
+
+    from skyvern.forge.sdk.db.agent_db import _is_transaction_pooler
+
+    if _is_transaction_pooler(engine.url.render_as_string(hide_password=False)):
+        # A transaction pooler hands each statement to any server connection, so LISTEN does not stick.
+        LOG.info("Status notifications stay in-process: LISTEN does not work through a transaction pooler")
+        return None
+
+    if _listener_task is not None and not _listener_task.done():
+        LOG.warning("Status notification listener is already running")
+        return _listener_task
+
+    _listener_task = asyncio.create_task(StatusNotificationListener(engine).run_forever())
+    return _listener_task
+
+
+async def stop_status_notification_listener() -> None:
+    global _listener_task
+
+    if _listener_task is not None and not _listener_task.done():
+        _listener_task.cancel()
+        try:
+            await _listener_task
+        except asyncio.CancelledError:
+            pass
+    _listener_task = None
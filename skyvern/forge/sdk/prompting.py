@@ -19,19 +19,27 @@ class PromptEngine:
 """
 
 import glob
+import json
 import os
+import time
+from dataclasses import dataclass
 from difflib import get_close_matches
 from pathlib import Path
 from typing import Any, List
 
 import structlog
-from jinja2 import Environment, FileSystemLoader
+from cachetools import LRUCache
+from jinja2 import Environment, FileSystemLoader, meta
+from opentelemetry import trace as otel_trace
 
 from skyvern.constants import SKYVERN_DIR
 from skyvern.utils.strings import escape_code_fences, neutralize_untrusted_web_page_data_sentinels
 
 LOG = structlog.get_logger()
 
+# Rendered outputs kept by load_prompt_memoized; static prompt sections are a few tens of KB each.
+_MEMOIZED_RENDER_CACHE_SIZE = 256
+
 
 def _untrusted_filter(value: Any, escape_quotes: bool = False) -> str:
     # Coerce to a plain str so dict/list values do not crash NFKC and so
@@ -42,6 +50,13 @@ def _untrusted_filter(value: Any, escape_quotes: bool = False) -> str:
     return neutralize_untrusted_web_page_data_sentinels(filtered)
 
 
+@dataclass
+class PromptRenderStats:
+    hits: int = 0
+    misses: int = 0
+    render_ms: float = 0.0
+
+
 class PromptEngine:
     """
     Class to handle loading and populating Jinja2 templates for prompts.
@@ -67,8 +82,13 @@ class PromptEngine:
 
             self.model = self.get_closest_match(self.model, model_names)
 
-            self.env = Environment(loader=FileSystemLoader(models_dir))
+            # cache_size=-1 keeps every compiled template; the set is small and fixed.
+            self.env = Environment(loader=FileSystemLoader(models_dir), cache_size=-1)
             self.env.filters["untrusted"] = _untrusted_filter
+            self._memoized_renders: LRUCache[tuple[str, str], str] = LRUCache(maxsize=_MEMOIZED_RENDER_CACHE_SIZE)
+            # template path -> variables it (and anything it includes) reads; None when not statically known
+            self._template_variables: dict[str, frozenset[str] | None] = {}
+            self.render_stats = PromptRenderStats()
         except Exception:
             LOG.error("Error initializing PromptEngine.", model=model, exc_info=True)
             raise
@@ -121,6 +141,76 @@ class PromptEngine:
             )
             raise
 
+    def precompile(self) -> int:
+        """Compile every template of this model up front so the first render of each skips parsing.
+
+        Returns the number of templates compiled.
+        """
+        names = self.env.list_templates(
+            filter_func=lambda name: name.startswith(f"{self.model}/") and name.endswith(".j2")
+        )
+        for name in names:
+            self.env.get_template(name)
+        return len(names)
+
+    def _referenced_variables(self, template_path: str) -> frozenset[str] | None:
+        if template_path in self._template_variables:
+            return self._template_variables[template_path]
+        variables: set[str] | None = set()
+        pending = [template_path]
+        seen: set[str] = set()
+        while pending and variables is not None:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            source, _, _ = self.env.loader.get_source(self.env, name)  # type: ignore[union-attr]
+            ast = self.env.parse(source)
+            variables |= meta.find_undeclared_variables(ast)
+            for referenced in meta.find_referenced_templates(ast):
+                if referenced is None:
+                    # dynamic include: can't tell what it reads, so never memoize this template
+                    variables = None
+                    break
+                pending.append(referenced)
+        result = frozenset(variables) if variables is not None else None
+        self._template_variables[template_path] = result
+        return result
+
+    def load_prompt_memoized(self, template: str, **kwargs: Any) -> str:
+        """
+        Like load_prompt, but reuse the rendered output when every variable the template reads is unchanged.
+
+        Meant for sections that are constant within a task (e.g. extract-action-static): the cache key
+        only covers the kwargs the template references, so per-step values passed alongside (element
+        tree, action history) don't defeat it. Records prompt_render_cache_hit and prompt_render_ms on
+        the current span.
+        """
+        template_path = f"{self.model}/{template}.j2"
+        variables = self._referenced_variables(template_path)
+        if variables is None:
+            return self.load_prompt(template, **kwargs)
+        key = (
+            template_path,
+            json.dumps({name: kwargs[name] for name in variables if name in kwargs}, sort_keys=True, default=repr),
+        )
+        span = otel_trace.get_current_span()
+        rendered = self._memoized_renders.get(key)
+        if rendered is not None:
+            self.render_stats.hits += 1
+            span.set_attribute("prompt_render_cache_hit", True)
+            return rendered
+
+        started_at = time.perf_counter()
+        rendered = self.load_prompt(template, **kwargs)
+        render_ms = (time.perf_counter() - started_at) * 1000
+        self.render_stats.misses += 1
+        self.render_stats.render_ms += render_ms
+        span.set_attribute("prompt_render_cache_hit", False)
+        span.set_attribute("prompt_render_ms", int(render_ms))
+        self._memoized_renders[key] = rendered
+        return rendered
+
     def load_prompt_from_string(self, template: str, **kwargs: Any) -> str:
         """
         Load and populate the specified template from a string.
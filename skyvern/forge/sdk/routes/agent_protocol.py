@@ -1,11 +1,13 @@
 import asyncio
+import base64
+import binascii
 import json
 import os
 import random
 import time
 import unicodedata
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Annotated, Any
 from urllib.parse import parse_qs, quote, urlparse
@@ -4058,6 +4060,33 @@ async def retry_webhook(
     return await app.agent.build_task_response(task=task_obj, last_step=latest_step)
 
 
+_NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def _encode_keyset_cursor(sort_value: datetime, row_id: str) -> str:
+    if sort_value.tzinfo is not None:
+        sort_value = sort_value.astimezone(timezone.utc).replace(tzinfo=None)
+    value = json.dumps([sort_value.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(value).decode().rstrip("=")
+
+
+def _decode_keyset_cursor(cursor: str | None) -> tuple[datetime | None, str | None]:
+    """Decode an opaque ``X-Next-Cursor`` value back into the (sort value, id) of the last row served."""
+    if cursor is None:
+        return None, None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value_raw, row_id = json.loads(base64.urlsafe_b64decode(padded).decode())
+        if not isinstance(sort_value_raw, str) or not isinstance(row_id, str) or not row_id:
+            raise ValueError
+        sort_value = datetime.fromisoformat(sort_value_raw)
+        if sort_value.tzinfo is not None:
+            sort_value = sort_value.astimezone(timezone.utc).replace(tzinfo=None)
+        return sort_value, row_id
+    except (binascii.Error, json.JSONDecodeError, UnicodeDecodeError, ValueError, TypeError) as exc:
+        raise HTTPException(status_code=422, detail={"code": "invalid_cursor"}) from exc
+
+
 @legacy_base_router.get(
     "/tasks",
     tags=["agent"],
@@ -4081,10 +4110,16 @@ async def get_tasks(
     application: Annotated[str | None, Query()] = None,
     sort: OrderBy = Query(OrderBy.created_at),
     order: SortDirection = Query(SortDirection.desc),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page. Takes precedence over page.",
+    ),
 ) -> Response:
     """
     Get all tasks.
     :param page: Starting page, defaults to 1
+    :param cursor: Keyset cursor returned in the X-Next-Cursor header; pages deep history at constant cost
     :param page_size: Page size, defaults to 10
     :param task_status: Task status filter
     :param workflow_run_id: Workflow run id filter
@@ -4100,6 +4135,7 @@ async def get_tasks(
             status_code=http_status.HTTP_400_BAD_REQUEST,
             detail="only_standalone_tasks and workflow_run_id cannot be used together",
         )
+    cursor_value, cursor_task_id = _decode_keyset_cursor(cursor)
     tasks = await app.DATABASE.tasks.get_tasks(
         page,
         page_size,
@@ -4110,8 +4146,15 @@ async def get_tasks(
         order=order,
         order_by_column=sort,
         application=application,
+        cursor_value=cursor_value,
+        cursor_task_id=cursor_task_id,
+    )
+    headers = {}
+    if len(tasks) == page_size:
+        headers[_NEXT_CURSOR_HEADER] = _encode_keyset_cursor(getattr(tasks[-1], sort), tasks[-1].task_id)
+    return ORJSONResponse(
+        [(await app.agent.build_task_response(task=task)).model_dump() for task in tasks], headers=headers
     )
-    return ORJSONResponse([(await app.agent.build_task_response(task=task)).model_dump() for task in tasks])
 
 
 @legacy_base_router.get(
@@ -4142,17 +4185,39 @@ async def get_runs(
         ),
         examples=["login_url", "credential_value", "wr_abc123"],
     ),
+    cursor: str | None = Query(
+        None,
+        max_length=512,
+        description="Opaque cursor from the X-Next-Cursor header of the previous page. Takes precedence over page.",
+    ),
 ) -> Response:
     analytics.capture("skyvern-oss-agent-runs-get")
 
-    # temporary limit to 100 runs
-    if page > 10:
-        return []
+    if cursor is None and page > 1:
+        # temporary limit to 100 runs for offset paging; cursor paging has no depth limit
+        if page > 10:
+            return []
+
+        runs = await app.DATABASE.workflow_runs.get_all_runs(
+            current_org.organization_id, page=page, page_size=page_size, status=status, search_key=search_key
+        )
+        return ORJSONResponse([run.model_dump() for run in runs])
 
-    runs = await app.DATABASE.workflow_runs.get_all_runs(
-        current_org.organization_id, page=page, page_size=page_size, status=status, search_key=search_key
+    created_before, run_id_before = _decode_keyset_cursor(cursor)
+    runs = await app.DATABASE.workflow_runs.get_all_runs_before(
+        current_org.organization_id,
+        page_size=page_size,
+        status=status,
+        search_key=search_key,
+        created_before=created_before,
+        run_id_before=run_id_before,
     )
-    return ORJSONResponse([run.model_dump() for run in runs])
+    headers = {}
+    if len(runs) == page_size:
+        last_run = runs[-1]
+        last_run_id = last_run.workflow_run_id if isinstance(last_run, WorkflowRun) else last_run.task_id
+        headers[_NEXT_CURSOR_HEADER] = _encode_keyset_cursor(last_run.created_at, last_run_id)
+    return ORJSONResponse([run.model_dump() for run in runs], headers=headers)
 
 
 _MAX_TAG_FILTER_TERMS = 20
@@ -1,8 +1,8 @@
 """
 CDP screencast loop for local-mode browser streaming.
 
-Uses Chrome's Page.startScreencast() to stream JPEG frames from the browser
-over a WebSocket connection.
+Streams the JPEG frames of the page's shared screencast (skyvern/webeye/page_screencast.py) over a
+WebSocket connection, so any number of viewers of one page cost Chrome a single Page.startScreencast.
 """
 
 import asyncio
@@ -12,11 +12,12 @@ from collections.abc import Awaitable, Callable
 import structlog
 from fastapi import WebSocket, WebSocketDisconnect
 from opentelemetry import metrics
-from playwright.async_api import CDPSession
 
 from skyvern.forge import app
+from skyvern.forge.sdk.db.status_notifications import StatusEntity, status_notifications
 from skyvern.forge.sdk.routes.streaming.client_disconnect import watch_for_client_disconnect
 from skyvern.webeye.browser_state import BrowserState
+from skyvern.webeye.page_screencast import ScreencastFrame, ScreencastSubscription, page_screencasts
 
 LOG = structlog.get_logger()
 
@@ -196,28 +197,10 @@ async def start_screencast_loop(
         degraded_context["organization_id"] = organization_id
     if workflow_run_id:
         degraded_context["workflow_run_id"] = workflow_run_id
-    cdp_session: CDPSession | None = None
+    subscription: ScreencastSubscription | None = None
     attached_page: object | None = None
-    frame_queue: asyncio.Queue[tuple[str, float]] = asyncio.Queue(maxsize=2)
     viewport_info: dict[str, int] = {"width": DEFAULT_WIDTH, "height": DEFAULT_HEIGHT}
 
-    async def _ack_frame(session: CDPSession, session_id: int) -> None:
-        try:
-            await session.send("Page.screencastFrameAck", {"sessionId": session_id})
-        except Exception:
-            pass
-
-    def _update_viewport_from_page(page: object) -> None:
-        viewport_size = getattr(page, "viewport_size", None)
-        if not isinstance(viewport_size, dict):
-            return
-        width = viewport_size.get("width")
-        height = viewport_size.get("height")
-        if isinstance(width, (int, float)) and width > 0:
-            viewport_info["width"] = int(width)
-        if isinstance(height, (int, float)) and height > 0:
-            viewport_info["height"] = int(height)
-
     def _update_viewport_from_metadata(metadata: dict) -> None:
         device_width = metadata.get("deviceWidth")
         device_height = metadata.get("deviceHeight")
@@ -226,117 +209,36 @@ async def start_screencast_loop(
         if isinstance(device_height, (int, float)) and device_height > 0:
             viewport_info["height"] = int(device_height)
 
-    def _queue_frame(data: str, received_at: float) -> None:
-        if not data:
-            return
-        if frame_queue.full():
-            try:
-                _, evicted_received_at = frame_queue.get_nowait()
-                _frame_queue_seconds.record(time.monotonic() - evicted_received_at, metric_attributes)
-                _frames_evicted.add(1, metric_attributes)
-            except asyncio.QueueEmpty:
-                pass
-        try:
-            frame_queue.put_nowait((data, received_at))
-        except asyncio.QueueFull:
-            pass
-
-    def _drain_frame_queue() -> None:
-        while True:
-            try:
-                frame_queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-    async def _on_frame(session: CDPSession, params: dict, received_at: float) -> None:
-        # Acked before the session check because Chrome withholds further frames until the last one
-        # is acked: a frame that lands while a swap is in flight is not displayed, but dropping it
-        # unacked would stall the session it came from.
-        asyncio.create_task(_ack_frame(session, params.get("sessionId", 0)))
-        if session is not cdp_session:
-            return
-        metadata = params.get("metadata", {})
-        if metadata:
-            _update_viewport_from_metadata(metadata)
-        _queue_frame(params.get("data", ""), received_at)
-
-    async def _discard_session(session: CDPSession) -> None:
-        try:
-            await session.send("Page.stopScreencast", {})
-        except Exception:
-            pass
-        try:
-            await session.detach()
-        except Exception:
-            pass
+    def _record_evicted(frame: ScreencastFrame) -> None:
+        _frame_queue_seconds.record(time.monotonic() - frame.received_at, metric_attributes)
+        _frames_evicted.add(1, metric_attributes)
 
     async def _stop_current_screencast() -> None:
-        nonlocal cdp_session, attached_page
-        session = cdp_session
-        cdp_session = None
+        nonlocal subscription, attached_page
+        current = subscription
+        subscription = None
         attached_page = None
-        if session is None:
+        if current is None:
             return
-        await _discard_session(session)
-
-    async def _prime_current_frame(session: CDPSession, page: object) -> None:
-        try:
-            result = await session.send(
-                "Page.captureScreenshot",
-                {
-                    "format": "jpeg",
-                    "quality": 60,
-                    "captureBeyondViewport": False,
-                },
-            )
-            data = result.get("data", "") if isinstance(result, dict) else ""
-            _update_viewport_from_page(page)
-            _queue_frame(data, time.monotonic())
-        except Exception:
-            LOG.debug(
-                "Could not prime CDP screencast frame",
-                entity_id=entity_id,
-                entity_type=entity_type,
-                exc_info=True,
-            )
+        await current.close()
 
     async def _attach_to_page(page: object) -> None:
-        nonlocal cdp_session, attached_page
-        if page is attached_page and cdp_session is not None:
+        nonlocal subscription, attached_page
+        if page is attached_page and subscription is not None:
             return
 
-        # The replacement is built and confirmed before anything tears down what the viewer is
-        # watching, so a page that cannot be attached leaves the running stream alone.
-        next_session = await page.context.new_cdp_session(page)  # type: ignore[attr-defined]
-        next_session.on(
-            "Page.screencastFrame",
-            lambda params: asyncio.create_task(_on_frame(next_session, params, time.monotonic())),
-        )
-        try:
-            await next_session.send(
-                "Page.startScreencast",
-                {
-                    "format": "jpeg",
-                    "quality": 60,
-                    "maxWidth": DEFAULT_WIDTH,
-                    "maxHeight": DEFAULT_HEIGHT,
-                },
-            )
-        except (asyncio.CancelledError, Exception):
-            await _discard_session(next_session)
-            raise
-        # Adopting and draining without an await in between is what keeps the swap clean: frames the
-        # replacement already emitted are still queued (and acked) afterwards, while frames from the
-        # page being left behind are rejected by _on_frame instead of surviving the drain.
-        previous_session = cdp_session
-        cdp_session = next_session
+        # The replacement is subscribed before the viewer leaves what it is watching, so a page that
+        # cannot be attached leaves the running stream alone. The page's screencast is shared with
+        # every other viewer of it, and the new subscription starts from its latest frame.
+        next_subscription = await page_screencasts.subscribe(page, on_evicted=_record_evicted)
+        previous_subscription = subscription
+        subscription = next_subscription
         attached_page = page
-        _drain_frame_queue()
-        if previous_session is not None:
-            await _discard_session(previous_session)
-        await _prime_current_frame(next_session, page)
+        if previous_subscription is not None:
+            # Closing drops the frames still queued from the page being left behind.
+            await previous_subscription.close()
         LOG.info(
-            "CDP screencast started",
+            "Live view attached to page screencast",
             entity_id=entity_id,
             entity_type=entity_type,
             url=getattr(page, "url", ""),
@@ -344,9 +246,20 @@ async def start_screencast_loop(
 
     async def _frame_forwarding_loop() -> None:
         while True:
-            data, received_at = await frame_queue.get()
+            current = subscription
+            if current is None:
+                return
+            frame = await current.get()
+            if frame is None:
+                if current is subscription:
+                    # Closed underneath the viewer rather than swapped for another page.
+                    return
+                continue
+            data, received_at = frame.data, frame.received_at
             dequeued_at = time.monotonic()
             _frame_queue_seconds.record(dequeued_at - received_at, metric_attributes)
+            if frame.metadata:
+                _update_viewport_from_metadata(frame.metadata)
             current_url = ""
             if attached_page is not None:
                 try:
@@ -372,18 +285,19 @@ async def start_screencast_loop(
             _frame_forward_seconds.record(sent_at - received_at, metric_attributes)
 
     async def _completion_polling_loop() -> None:
-        while True:
-            await asyncio.sleep(2)
-            try:
-                if await check_finalized():
-                    return
-            except Exception:
-                LOG.warning(
-                    "Error checking finalization status",
-                    entity_id=entity_id,
-                    entity_type=entity_type,
-                    exc_info=True,
-                )
+        with status_notifications.subscribe(StatusEntity(entity_type), entity_id) as subscription:
+            while True:
+                await subscription.wait(2)
+                try:
+                    if await check_finalized():
+                        return
+                except Exception:
+                    LOG.warning(
+                        "Error checking finalization status",
+                        entity_id=entity_id,
+                        entity_type=entity_type,
+                        exc_info=True,
+                    )
 
     async def _active_page_monitor_loop() -> None:
         interval = ACTIVE_PAGE_POLL_INTERVAL
@@ -23,6 +23,7 @@ from websockets.exceptions import ConnectionClosedError, ConnectionClosedOK
 
 from skyvern.config import settings
 from skyvern.forge import app
+from skyvern.forge.sdk.db.status_notifications import StatusEntity, status_notifications
 from skyvern.forge.sdk.routes.routers import base_router, legacy_base_router
 from skyvern.forge.sdk.routes.streaming.client_disconnect import watch_for_client_disconnect
 from skyvern.forge.sdk.routes.streaming.screencast import (
@@ -32,9 +33,9 @@ from skyvern.forge.sdk.routes.streaming.screencast import (
 )
 from skyvern.forge.sdk.routes.streaming.verify import stream_transport
 from skyvern.forge.sdk.schemas.persistent_browser_sessions import PersistentBrowserSessionStatus, is_final_status
-from skyvern.forge.sdk.schemas.tasks import TaskStatus
+from skyvern.forge.sdk.schemas.tasks import Task, TaskStatus
 from skyvern.forge.sdk.services.org_auth_service import get_current_org
-from skyvern.forge.sdk.workflow.models.workflow import WorkflowRunStatus
+from skyvern.forge.sdk.workflow.models.workflow import WorkflowRun, WorkflowRunStatus
 from skyvern.webeye.cdp_frame_publisher import stream_key_for_task, stream_key_for_workflow_run
 
 LOG = structlog.get_logger()
@@ -42,6 +43,11 @@ STREAMING_TIMEOUT = 300
 WAIT_FOR_RUNNING_TIMEOUT = 120
 
 
+def _stream_image_format(image: bytes) -> str:
+    # The stream key is PNG unless the worker publishes from the page's JPEG screencast.
+    return "jpeg" if image.startswith(b"\xff\xd8") else "png"
+
+
 @legacy_base_router.websocket("/stream/tasks/{task_id}")
 async def task_stream(
     websocket: WebSocket,
@@ -82,6 +88,9 @@ async def task_stream(
     last_activity_timestamp = datetime.utcnow()
 
     disconnected = watch_for_client_disconnect(websocket)
+    # Screenshots go out every 2s; the task row is re-read only when its status changes.
+    status_subscription = status_notifications.subscribe(StatusEntity.task, task_id)
+    task: Task | None = None
     try:
         while True:
             if disconnected.done():
@@ -100,7 +109,8 @@ async def task_stream(
                 )
                 return
 
-            task = await app.DATABASE.tasks.get_task(task_id=task_id, organization_id=organization_id)
+            if status_subscription.should_refresh(2):
+                task = await app.DATABASE.tasks.get_task(task_id=task_id, organization_id=organization_id)
             if not task:
                 LOG.info("Task not found. Closing connection", task_id=task_id, organization_id=organization_id)
                 await websocket.send_json(
@@ -138,6 +148,7 @@ async def task_stream(
                             "task_id": task_id,
                             "status": task.status,
                             "screenshot": encoded_screenshot,
+                            "format": _stream_image_format(screenshot),
                         }
                     )
                     last_activity_timestamp = datetime.utcnow()
@@ -162,6 +173,7 @@ async def task_stream(
         return
     finally:
         disconnected.cancel()
+        status_subscription.close()
     LOG.info("WebSocket connection closed successfully", task_id=task_id, organization_id=organization_id)
     return
 
@@ -211,6 +223,9 @@ async def workflow_run_streaming(
     last_activity_timestamp = datetime.utcnow()
 
     disconnected = watch_for_client_disconnect(websocket)
+    # Screenshots go out every 2s; the run row is re-read only when its status changes.
+    status_subscription = status_notifications.subscribe(StatusEntity.workflow_run, workflow_run_id)
+    workflow_run: WorkflowRun | None = None
     try:
         while True:
             if disconnected.done():
@@ -235,10 +250,11 @@ async def workflow_run_streaming(
                 )
                 return
 
-            workflow_run = await app.DATABASE.workflow_runs.get_workflow_run(
-                workflow_run_id=workflow_run_id,
-                organization_id=organization_id,
-            )
+            if status_subscription.should_refresh(2):
+                workflow_run = await app.DATABASE.workflow_runs.get_workflow_run(
+                    workflow_run_id=workflow_run_id,
+                    organization_id=organization_id,
+                )
             if not workflow_run or workflow_run.organization_id != organization_id:
                 LOG.info(
                     "WofklowRun Streaming: Workflow not found",
@@ -282,6 +298,7 @@ async def workflow_run_streaming(
                             "workflow_run_id": workflow_run_id,
                             "status": workflow_run.status,
                             "screenshot": encoded_screenshot,
+                            "format": _stream_image_format(screenshot),
                         }
                     )
                     last_activity_timestamp = datetime.utcnow()
@@ -319,6 +336,7 @@ async def workflow_run_streaming(
         return
     finally:
         disconnected.cancel()
+        status_subscription.close()
     LOG.info(
         "WofklowRun Streaming: WebSocket connection closed successfully",
         workflow_run_id=workflow_run_id,
@@ -455,25 +473,26 @@ async def _local_screencast_for_workflow_run(
 ) -> None:
     async def wait_for_running() -> str | None:
         deadline = time.monotonic() + WAIT_FOR_RUNNING_TIMEOUT
-        while True:
-            workflow_run = await app.DATABASE.workflow_runs.get_workflow_run(
-                workflow_run_id=workflow_run_id,
-                organization_id=organization_id,
-            )
-            if not workflow_run or workflow_run.organization_id != organization_id:
-                return "not_found"
-            if workflow_run.status.is_final():
-                return workflow_run.status
-            if workflow_run.status in (WorkflowRunStatus.running, WorkflowRunStatus.paused):
-                return None
-            if time.monotonic() >= deadline:
-                LOG.warning(
-                    "Timed out waiting for running status",
+        with status_notifications.subscribe(StatusEntity.workflow_run, workflow_run_id) as subscription:
+            while True:
+                workflow_run = await app.DATABASE.workflow_runs.get_workflow_run(
                     workflow_run_id=workflow_run_id,
                     organization_id=organization_id,
                 )
-                return "timeout"
-            await asyncio.sleep(1)
+                if not workflow_run or workflow_run.organization_id != organization_id:
+                    return "not_found"
+                if workflow_run.status.is_final():
+                    return workflow_run.status
+                if workflow_run.status in (WorkflowRunStatus.running, WorkflowRunStatus.paused):
+                    return None
+                if time.monotonic() >= deadline:
+                    LOG.warning(
+                        "Timed out waiting for running status",
+                        workflow_run_id=workflow_run_id,
+                        organization_id=organization_id,
+                    )
+                    return "timeout"
+                await subscription.wait(1, deadline=deadline)
 
     async def check_finalized() -> bool:
         wr = await app.DATABASE.workflow_runs.get_workflow_run(
@@ -510,23 +529,24 @@ async def _local_screencast_for_task(
     async def wait_for_running() -> str | None:
         nonlocal task_workflow_run_id
         deadline = time.monotonic() + WAIT_FOR_RUNNING_TIMEOUT
-        while True:
-            task = await app.DATABASE.tasks.get_task(task_id=task_id, organization_id=organization_id)
-            if not task:
-                return "not_found"
-            if task.status.is_final():
-                return task.status
-            if task.status == TaskStatus.running:
-                task_workflow_run_id = task.workflow_run_id
-                return None
-            if time.monotonic() >= deadline:
-                LOG.warning(
-                    "Timed out waiting for running status",
-                    task_id=task_id,
-                    organization_id=organization_id,
-                )
-                return "timeout"
-            await asyncio.sleep(1)
+        with status_notifications.subscribe(StatusEntity.task, task_id) as subscription:
+            while True:
+                task = await app.DATABASE.tasks.get_task(task_id=task_id, organization_id=organization_id)
+                if not task:
+                    return "not_found"
+                if task.status.is_final():
+                    return task.status
+                if task.status == TaskStatus.running:
+                    task_workflow_run_id = task.workflow_run_id
+                    return None
+                if time.monotonic() >= deadline:
+                    LOG.warning(
+                        "Timed out waiting for running status",
+                        task_id=task_id,
+                        organization_id=organization_id,
+                    )
+                    return "timeout"
+                await subscription.wait(1, deadline=deadline)
 
     async def check_finalized() -> bool:
         task = await app.DATABASE.tasks.get_task(task_id=task_id, organization_id=organization_id)
@@ -0,0 +1,39 @@
+from datetime import datetime
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class WebhookOutboxStatus(StrEnum):
+    pending = "pending"
+    delivered = "delivered"
+    dead = "dead"
+
+
+class WebhookOutboxEntry(BaseModel):
+    """A signed run-completion webhook waiting for (or done with) delivery by the outbox worker.
+
+    A pending entry with ``locked_until`` in the future is claimed by a worker; once the lease
+    lapses it is due again, so a worker that dies mid-delivery cannot strand it.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    webhook_outbox_id: str
+    organization_id: str
+    run_id: str
+    run_type: str
+    url: str
+    payload: str
+    headers: dict[str, str]
+    # Written to the run's webhook_failure_reason on success ("" when unset).
+    success_marker: str | None = None
+    status: WebhookOutboxStatus
+    attempts: int
+    next_attempt_at: datetime
+    locked_until: datetime | None = None
+    last_status_code: int | None = None
+    last_error: str | None = None
+    delivered_at: datetime | None = None
+    created_at: datetime
+    modified_at: datetime
@@ -24,9 +24,9 @@ import unicodedata
 import uuid
 import zipfile
 from collections import defaultdict, deque
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
 from dataclasses import replace
-from datetime import UTC, date, datetime, time
+from datetime import UTC, datetime
 from email.message import EmailMessage
 from functools import partial
 from pathlib import Path, PurePosixPath
@@ -102,7 +102,9 @@ from skyvern.forge.sdk.api.files import (
     download_file,
     get_download_dir,
     get_path_for_workflow_download_directory,
+    get_run_temp_dir,
     is_remote_url,
+    make_temp_directory,
     parse_uri_to_path,
     resolve_local_or_download_file,
     resolve_run_download_id,
@@ -220,6 +222,13 @@ from skyvern.forge.sdk.workflow.secret_encryption import (
     is_encrypted_secret,
     is_full_template_reference,
 )
+from skyvern.forge.sdk.workflow.tabular_rows import (
+    SpilledRows,
+    clean_dataframe_records,
+    collect_rows,
+    iter_csv_row_batches,
+    iter_excel_row_batches,
+)
 from skyvern.schemas.runs import RunEngine
 from skyvern.schemas.self_heal import HealClassification, HealSkipReason, HealStatus, OutputObligation
 from skyvern.schemas.workflows import (
@@ -2305,7 +2314,7 @@ class ForLoopBlock(Block):
         workflow_run_id: str,
         workflow_run_block_id: str,
         organization_id: str | None = None,
-    ) -> list[Any]:
+    ) -> list[Any] | SpilledRows:
         propagated_error: BaseException
         try:
             return await self._get_values_from_loop_variable_reference(
@@ -2328,11 +2337,16 @@ class ForLoopBlock(Block):
         workflow_run_id: str,
         workflow_run_block_id: str,
         organization_id: str | None = None,
-    ) -> list[Any]:
+    ) -> list[Any] | SpilledRows:
         parameter_value = None
         if self.loop_variable_reference:
             LOG.debug("Processing loop variable reference")
 
+            # Rows a FileParserBlock spilled to disk are iterated from there, not rendered through tojson.
+            spilled_rows = self._referenced_spilled_rows(workflow_run_context)
+            if spilled_rows is not None:
+                return spilled_rows
+
             # Check if this looks like a parameter path (contains dots and/or _output)
             is_likely_parameter_path = "extracted_information." in self.loop_variable_reference
 
@@ -2430,13 +2444,22 @@ class ForLoopBlock(Block):
         else:
             return [parameter_value]
 
+    def _referenced_spilled_rows(self, workflow_run_context: WorkflowRunContext) -> SpilledRows | None:
+        if self.loop_variable_reference is None:
+            return None
+        key = self.loop_variable_reference.strip(" {}")
+        if not workflow_run_context.has_value(key):
+            return None
+        value = workflow_run_context.get_value(key)
+        return value if isinstance(value, SpilledRows) else None
+
     async def get_loop_over_parameter_values(
         self,
         workflow_run_context: WorkflowRunContext,
         workflow_run_id: str,
         workflow_run_block_id: str,
         organization_id: str | None = None,
-    ) -> list[Any]:
+    ) -> list[Any] | SpilledRows:
         # parse the value from self.loop_variable_reference and then from self.loop_over
         if self.loop_variable_reference:
             return await self.get_values_from_loop_variable_reference(
@@ -2476,7 +2499,7 @@ class ForLoopBlock(Block):
             else:
                 raise NoIterableValueFound()
 
-        if isinstance(parameter_value, list):
+        if isinstance(parameter_value, (list, SpilledRows)):
             return parameter_value
         else:
             # TODO (kerem): Should we raise an error here?
@@ -2813,7 +2836,7 @@ class ForLoopBlock(Block):
         workflow_run_id: str,
         workflow_run_block_id: str,
         workflow_run_context: WorkflowRunContext,
-        loop_over_values: list[Any],
+        loop_over_values: list[Any] | SpilledRows,
         organization_id: str | None = None,
         browser_session_id: str | None = None,
     ) -> LoopBlockExecutedResult:
@@ -3189,7 +3212,8 @@ class ForLoopBlock(Block):
         await app.DATABASE.observer.update_workflow_run_block(
             workflow_run_block_id=workflow_run_block_id,
             organization_id=organization_id,
-            loop_values=loop_over_values,
+            # Spilled rows are recorded by their preview; the loop reads them from disk.
+            loop_values=loop_over_values.head() if isinstance(loop_over_values, SpilledRows) else loop_over_values,
         )
 
         LOG.info(
@@ -10050,44 +10074,46 @@ class FileParserBlock(Block):
                     file_url=file_url_used, file_type=self.file_type, error="File is not a valid ZIP archive"
                 )
 
-    async def _parse_csv_file(self, file_path: str) -> list[dict[str, Any]]:
+    async def _parse_csv_file(self, file_path: str) -> list[dict[str, Any]] | SpilledRows:
         """Parse CSV/TSV file and return list of dictionaries."""
         return await _run_blocking_parse_step("CSV parsing", self.file_url, self._parse_csv_file_sync, file_path)
 
-    def _parse_csv_file_sync(self, file_path: str) -> list[dict[str, Any]]:
+    def _parse_csv_file_sync(self, file_path: str) -> list[dict[str, Any]] | SpilledRows:
         delimiter, encoding = self._sniff_csv_delimiter(file_path)
+        if settings.FILE_PARSER_STREAMING_ENABLED:
+            return self._collect_rows(
+                iter_csv_row_batches(file_path, delimiter, encoding, settings.FILE_PARSER_BATCH_ROWS)
+            )
         with open(file_path, encoding=encoding, errors="replace", newline="") as file:
             reader = csv.DictReader(file, delimiter=delimiter)
             return list(reader)
 
+    def _collect_rows(self, batches: Iterator[list[dict[str, Any]]]) -> list[dict[str, Any]] | SpilledRows:
+        rows = collect_rows(batches, settings.FILE_PARSER_SPILL_ROW_THRESHOLD, self._spill_directory())
+        if isinstance(rows, SpilledRows):
+            LOG.info("FileParserBlock spilled parsed rows to disk", file_url=self.file_url, row_count=len(rows))
+        return rows
+
+    @staticmethod
+    def _spill_directory() -> str:
+        # The run's scratch directory is removed with the run, which is when the rows stop being needed.
+        context = skyvern_context.current()
+        if context and context.organization_id and context.run_id:
+            return get_run_temp_dir(context.organization_id, context.run_id)
+        return make_temp_directory(prefix="file_parser_")
+
     def _clean_dataframe_for_json(self, df: pd.DataFrame) -> list[dict[str, Any]]:
         """Clean DataFrame to ensure it can be serialized to JSON."""
-        # Replace NaN and NaT values with "nan" string
-        df_cleaned = df.replace({pd.NA: "nan", pd.NaT: "nan"})
-        df_cleaned = df_cleaned.where(pd.notna(df_cleaned), "nan")
-
-        # Convert to list of dictionaries
-        records = df_cleaned.to_dict("records")
-
-        # Additional cleaning for any remaining problematic values
-        for record in records:
-            for key, value in record.items():
-                if pd.isna(value) or value == "NaN" or value == "NaT":
-                    record[key] = "nan"
-                elif isinstance(value, (pd.Timestamp, datetime, date, time)):
-                    # NaT timestamps are already caught by pd.isna() above, so this is always valid
-                    record[key] = value.isoformat()
-                elif isinstance(value, pd.Timedelta):
-                    record[key] = str(value)
-
-        return records
-
-    async def _parse_excel_file(self, file_path: str) -> list[dict[str, Any]]:
+        return clean_dataframe_records(df)
+
+    async def _parse_excel_file(self, file_path: str) -> list[dict[str, Any]] | SpilledRows:
         """Parse Excel file and return list of dictionaries."""
         return await _run_blocking_parse_step("Excel parsing", self.file_url, self._parse_excel_file_sync, file_path)
 
-    def _parse_excel_file_sync(self, file_path: str) -> list[dict[str, Any]]:
+    def _parse_excel_file_sync(self, file_path: str) -> list[dict[str, Any]] | SpilledRows:
         try:
+            if settings.FILE_PARSER_STREAMING_ENABLED:
+                return self._collect_rows(iter_excel_row_batches(file_path, settings.FILE_PARSER_BATCH_ROWS))
             # Read Excel file with pandas, specifying engine explicitly
             df = pd.read_excel(file_path, engine="calamine")
             # Clean and convert DataFrame to list of dictionaries
@@ -10587,7 +10613,7 @@ class FileParserBlock(Block):
         file_path: str,
         workflow_run_block_id: str | None = None,
         organization_id: str | None = None,
-    ) -> str | list[dict[str, Any]] | None:
+    ) -> str | list[dict[str, Any]] | SpilledRows | None:
         """Parse a file with the parser for its type; returns None for unsupported types."""
         if file_type == FileType.CSV:
             return await self._parse_csv_file(file_path)
@@ -10619,7 +10645,7 @@ class FileParserBlock(Block):
 
     async def _extract_with_ai(
         self,
-        content: str | list[dict[str, Any]],
+        content: str | list[dict[str, Any]] | SpilledRows,
         workflow_run_context: WorkflowRunContext,
         workflow_run_block_id: str | None = None,
         organization_id: str | None = None,
@@ -10631,7 +10657,10 @@ class FileParserBlock(Block):
             raise ValueError("File parser JSON schema is invalid.")
 
         # Convert content to string for AI processing
-        if isinstance(content, list):
+        if isinstance(content, SpilledRows):
+            # Only a prefix survives the token bound below; a token spans well under this many characters.
+            content_str = await asyncio.to_thread(content.json_prefix, MAX_FILE_PARSE_INPUT_TOKENS * 16)
+        elif isinstance(content, list):
             content_str = json.dumps(content, separators=(",", ":"))
         else:
             content_str = content
@@ -10855,7 +10884,7 @@ class FileParserBlock(Block):
         )
 
         # Parse the file based on type
-        parsed_data: str | list[dict[str, Any]]
+        parsed_data: str | list[dict[str, Any]] | SpilledRows
         try:
             if self.file_type == FileType.ZIP:
                 extracted_zip_files = await asyncio.to_thread(
@@ -10919,6 +10948,27 @@ class FileParserBlock(Block):
                     organization_id,
                     f"Failed to extract data with AI: {str(e)}",
                 )
+        elif isinstance(parsed_data, SpilledRows):
+            # The workflow iterates the rows from disk; only their summary is persisted.
+            await workflow_run_context.register_output_parameter_value_post_execution(
+                parameter=self.output_parameter,
+                value=parsed_data,  # type: ignore[arg-type]
+            )
+            summary = parsed_data.summary()
+            self._output_recorded_this_execution = True
+            await app.DATABASE.workflow_runs.create_or_update_workflow_run_output_parameter(
+                workflow_run_id=workflow_run_id,
+                output_parameter_id=self.output_parameter.output_parameter_id,
+                value=summary,
+            )
+            return await self.build_block_result(
+                success=True,
+                failure_reason=None,
+                output_parameter_value=summary,
+                status=BlockStatus.completed,
+                workflow_run_block_id=workflow_run_block_id,
+                organization_id=organization_id,
+            )
         else:
             # Return raw parsed data
             final_data = parsed_data
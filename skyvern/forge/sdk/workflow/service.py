@@ -245,6 +245,7 @@ from skyvern.services.webhook_delivery import (
     deliver_webhook_with_retries,
     describe_delivery_error,
 )
+from skyvern.services.webhook_outbox import enqueue_run_webhook
 from skyvern.services.workflow_script_service import BLOCK_TYPES_THAT_SHOULD_BE_CACHED
 from skyvern.utils.css_selector import build_action_summaries_with_timing  # shared with script_service
 from skyvern.utils.secret_headers import merge_masked_headers
@@ -11426,6 +11427,15 @@ class WorkflowService:
             webhook_callback_url=webhook.webhook_callback_url,
             headers=webhook.headers,
         )
+        if await enqueue_run_webhook(
+            organization_id=webhook.organization_id,
+            run_id=webhook.workflow_run_id,
+            run_type=RunType.workflow_run,
+            url=webhook.webhook_callback_url,
+            payload=webhook.signed_payload,
+            headers=webhook.headers,
+        ):
+            return
         try:
             resp = await deliver_webhook_with_retries(
                 url=webhook.webhook_callback_url,
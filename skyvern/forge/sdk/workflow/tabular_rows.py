@@ -0,0 +1,255 @@
+"""Streaming parse of the FileParserBlock's CSV and Excel inputs.
+
+With FILE_PARSER_STREAMING_ENABLED the block reads these files in batches of FILE_PARSER_BATCH_ROWS
+rows instead of materialising the whole file: CSV through ``csv.DictReader``, Excel straight from
+python-calamine's row iterator rather than a whole-sheet DataFrame. Each Excel batch is cleaned
+column by column (``clean_dataframe_records``), as the non-streaming parse cleans its DataFrame.
+
+A file with more than FILE_PARSER_SPILL_ROW_THRESHOLD rows is spilled to a JSON Lines file in the
+run's temp directory, and the block hands the workflow a ``SpilledRows`` sequence over it. A
+ForLoopBlock iterates that sequence lazily, one row in memory at a time. The block output persisted
+to the database is ``SpilledRows.summary()``: the row count and a preview of the first rows.
+"""
+
+from __future__ import annotations
+
+import csv
+import itertools
+import json
+import os
+import tempfile
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import date, datetime, time, timedelta
+from typing import Any, overload
+
+import pandas as pd
+from pandas.api.types import infer_dtype, is_datetime64_any_dtype, is_string_dtype, is_timedelta64_dtype
+
+MISSING_VALUE = "nan"
+SPILLED_ROWS_PREVIEW_SIZE = 20
+
+
+# pandas.api.types.infer_dtype results of object columns that hold nothing needing conversion.
+_PLAIN_INFERRED_DTYPES = frozenset({"string", "integer", "floating", "mixed-integer-float", "boolean", "empty"})
+
+
+def _json_scalar(value: Any) -> Any:
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return str(pd.Timedelta(value))
+    return value
+
+
+def _clean_column(series: pd.Series) -> pd.Series:
+    missing = series.isna()
+    if is_datetime64_any_dtype(series):
+        values = series.map(lambda value: value.isoformat(), na_action="ignore")
+    elif is_timedelta64_dtype(series):
+        values = series.astype(str)
+    elif series.dtype == object or is_string_dtype(series):
+        # pandas 3 reads text columns with the ``str`` dtype rather than ``object``.
+        missing |= series.isin(("NaN", "NaT"))
+        if infer_dtype(series, skipna=True) in _PLAIN_INFERRED_DTYPES:
+            values = series
+        else:
+            values = series.map(_json_scalar)
+    else:
+        values = series
+    return values.astype(object).where(~missing, MISSING_VALUE)
+
+
+def clean_dataframe_records(df: pd.DataFrame) -> list[dict[str, Any]]:
+    """Records of ``df`` that serialize to JSON: missing values become "nan", dates ISO strings and
+    timedeltas their string form."""
+    cleaned = df.astype(object)
+    for position in range(df.shape[1]):
+        cleaned.isetitem(position, _clean_column(df.iloc[:, position]))
+    return cleaned.to_dict("records")
+
+
+def iter_csv_row_batches(
+    file_path: str, delimiter: str, encoding: str, batch_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    with open(file_path, encoding=encoding, errors="replace", newline="") as file:
+        reader = csv.DictReader(file, delimiter=delimiter)
+        while batch := list(itertools.islice(reader, batch_size)):
+            yield batch
+
+
+def _excel_columns(header: Sequence[Any]) -> list[str]:
+    """Column names the way pandas.read_excel names them: blanks and duplicates are made unique."""
+    columns: list[str] = []
+    seen: dict[str, int] = {}
+    for position, cell in enumerate(header):
+        name = str(cell) if cell != "" else f"Unnamed: {position}"
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        else:
+            seen[name] = 0
+        columns.append(name)
+    return columns
+
+
+def _excel_cell(value: Any) -> Any:
+    # pandas.read_excel reads date-only cells as timestamps at midnight.
+    if isinstance(value, date) and not isinstance(value, datetime):
+        return datetime(value.year, value.month, value.day)
+    return value
+
+
+def _excel_data_rows(workbook: Any) -> Iterator[list[Any]]:
+    return (row for row in workbook.get_sheet_by_index(0).iter_rows() if any(cell != "" for cell in row))
+
+
+def _excel_float_columns(rows: Iterable[list[Any]], width: int) -> set[int]:
+    """Positions of the columns pandas.read_excel parses as float64.
+
+    Calamine hands back every number as a float and read_excel turns whole ones into ints, so a
+    numbers-only column stays int unless a cell is blank or fractional somewhere in the sheet. That
+    is only known once the whole sheet has been seen, so the sheet is scanned for it up front.
+    """
+    numeric = [True] * width
+    has_number = [False] * width
+    floating = [False] * width
+    for row in rows:
+        for position in range(width):
+            cell = row[position] if position < len(row) else ""
+            if cell == "":
+                floating[position] = True
+            elif isinstance(cell, bool) or not isinstance(cell, (int, float)):
+                numeric[position] = False
+            else:
+                has_number[position] = True
+                if isinstance(cell, float) and not cell.is_integer():
+                    floating[position] = True
+    return {position for position in range(width) if numeric[position] and has_number[position] and floating[position]}
+
+
+def _excel_batch_records(rows: list[list[Any]], columns: list[str], float_columns: set[int]) -> list[dict[str, Any]]:
+    for row in rows:
+        for position, cell in enumerate(row):
+            if isinstance(cell, float) and cell.is_integer() and position not in float_columns:
+                row[position] = int(cell)
+    df = pd.DataFrame(rows, columns=columns)
+    df = df.mask(df.eq("")).infer_objects()
+    for position in range(df.shape[1]):
+        series = df.iloc[:, position]
+        if series.dtype == object and infer_dtype(series, skipna=True) not in _PLAIN_INFERRED_DTYPES:
+            df.isetitem(position, series.map(_excel_cell, na_action="ignore"))
+    return clean_dataframe_records(df)
+
+
+def iter_excel_row_batches(file_path: str, batch_size: int) -> Iterator[list[dict[str, Any]]]:
+    """Rows of the first sheet, headed by its first row. Blank rows are skipped.
+
+    The sheet is read twice: once for the columns' number types, once for the rows themselves.
+    """
+    from python_calamine import CalamineWorkbook
+
+    workbook = CalamineWorkbook.from_path(file_path)
+    try:
+        rows = _excel_data_rows(workbook)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = _excel_columns(header)
+        width = len(columns)
+        float_columns = _excel_float_columns(rows, width)
+        rows = _excel_data_rows(workbook)
+        next(rows, None)
+        while batch := [list(row[:width]) for row in itertools.islice(rows, batch_size)]:
+            yield _excel_batch_records(batch, columns, float_columns)
+    finally:
+        workbook.close()
+
+
+class SpilledRows(Sequence[dict[str, Any]]):
+    """Parsed rows kept in a JSON Lines file, read back one row at a time.
+
+    Read-only, so copying it (the workflow context deep-copies block outputs) shares the file.
+    """
+
+    def __init__(self, path: str, offsets: array) -> None:
+        self.path = path
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, index: int) -> dict[str, Any]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[dict[str, Any]]: ...
+
+    def __getitem__(self, index: int | slice) -> dict[str, Any] | list[dict[str, Any]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        offset = self._offsets[index]
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            return json.loads(file.readline())
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        with open(self.path, "rb") as file:
+            for line in file:
+                yield json.loads(line)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> SpilledRows:
+        return self
+
+    def __repr__(self) -> str:
+        return f"SpilledRows(row_count={len(self)})"
+
+    def head(self, count: int = SPILLED_ROWS_PREVIEW_SIZE) -> list[dict[str, Any]]:
+        return list(itertools.islice(self, count))
+
+    def json_prefix(self, max_chars: int) -> str:
+        """The start of the rows' compact JSON array, at least ``max_chars`` long unless it is shorter."""
+        parts: list[str] = []
+        length = 0
+        for line in self._iter_lines():
+            if length >= max_chars:
+                break
+            parts.append(line)
+            length += len(line) + 1
+        return "[" + ",".join(parts) + "]"
+
+    def summary(self) -> dict[str, Any]:
+        """What is persisted as the block output in place of every row."""
+        return {"row_count": len(self), "preview": self.head(), "spilled": True}
+
+    def _iter_lines(self) -> Iterator[str]:
+        with open(self.path, encoding="utf-8") as file:
+            for line in file:
+                yield line.rstrip("\n")
+
+
+def _spill(rows: Iterable[dict[str, Any]], batches: Iterator[list[dict[str, Any]]], spill_dir: str) -> SpilledRows:
+    offsets = array("q")
+    fd, path = tempfile.mkstemp(dir=spill_dir, prefix="file_parser_rows_", suffix=".jsonl")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            for row in itertools.chain(rows, itertools.chain.from_iterable(batches)):
+                offsets.append(file.tell())
+                file.write(json.dumps(row, separators=(",", ":"), default=str).encode("utf-8"))
+                file.write(b"\n")
+    except BaseException:
+        os.unlink(path)
+        raise
+    return SpilledRows(path, offsets)
+
+
+def collect_rows(
+    batches: Iterator[list[dict[str, Any]]], spill_threshold: int, spill_dir: str
+) -> list[dict[str, Any]] | SpilledRows:
+    """All rows as a list, or as ``SpilledRows`` once there are more than ``spill_threshold``."""
+    rows: list[dict[str, Any]] = []
+    for batch in batches:
+        rows.extend(batch)
+        if len(rows) > spill_threshold:
+            return _spill(rows, batches, spill_dir)
+    return rows
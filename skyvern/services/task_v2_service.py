@@ -89,6 +89,7 @@ from skyvern.schemas.workflows import (
 )
 from skyvern.services import planner_levers
 from skyvern.services.webhook_delivery import deliver_webhook_with_retries, describe_delivery_error
+from skyvern.services.webhook_outbox import enqueue_run_webhook
 from skyvern.utils.prompt_engine import load_prompt_with_elements
 from skyvern.utils.strings import generate_random_string
 from skyvern.utils.url_validators import validate_fetch_url
@@ -2794,6 +2795,16 @@ async def send_task_v2_webhook(task_v2: TaskV2, *, success_marker: str = "") ->
             payload_length=len(payload),
             header_keys=sorted(headers.keys()),
         )
+        if await enqueue_run_webhook(
+            organization_id=organization_id,
+            run_id=task_v2.observer_cruise_id,
+            run_type=RunType.task_v2,
+            url=task_v2.webhook_callback_url,
+            payload=payload,
+            headers=headers,
+            success_marker=success_marker,
+        ):
+            return
         try:
             resp = await deliver_webhook_with_retries(
                 url=task_v2.webhook_callback_url,
@@ -58,7 +58,16 @@ def describe_delivery_error(exc: Exception) -> str:
     return f"{type(exc).__name__}: {text}" if text else type(exc).__name__
 
 
-def _parse_retry_after(value: str | None) -> float | None:
+def ensure_deliverable_url(url: str) -> None:
+    parsed_url = urlparse(url)
+    if parsed_url.scheme not in ("http", "https") or not parsed_url.netloc:
+        # Reject scheme-less/host-less targets before the outbound call so the
+        # failure is classified as invalid input rather than a raw
+        # httpx.UnsupportedProtocol from the transport.
+        raise InvalidUrl(url)
+
+
+def parse_retry_after(value: str | None) -> float | None:
     if value is None:
         return None
     stripped = value.strip()
@@ -80,7 +89,7 @@ def _parse_retry_after(value: str | None) -> float | None:
 
 
 def _compute_backoff_delay(attempt: int, base_delay_seconds: float, response: httpx.Response | None) -> float:
-    hinted = _parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+    hinted = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
     if hinted is not None:
         return min(hinted, WEBHOOK_DELIVERY_MAX_RETRY_AFTER_SECONDS)
     return base_delay_seconds * (2**attempt) + random.uniform(0, base_delay_seconds)
@@ -96,12 +105,7 @@ async def deliver_webhook_with_retries(
     max_attempts: int = WEBHOOK_DELIVERY_MAX_ATTEMPTS,
     base_delay_seconds: float = WEBHOOK_DELIVERY_RETRY_BASE_DELAY_SECONDS,
 ) -> httpx.Response:
-    parsed_url = urlparse(url)
-    if parsed_url.scheme not in ("http", "https") or not parsed_url.netloc:
-        # Reject scheme-less/host-less targets before the outbound call so the
-        # failure is classified as invalid input rather than a raw
-        # httpx.UnsupportedProtocol from the transport.
-        raise InvalidUrl(url)
+    ensure_deliverable_url(url)
 
     last_response: httpx.Response | None = None
     last_exc: Exception | None = None
@@ -0,0 +1,389 @@
+"""Durable, batched delivery of run-completion webhooks.
+
+With WEBHOOK_OUTBOX_ENABLED, finalizing a task, task v2 or workflow run only inserts the signed
+webhook into the ``webhook_outbox`` table (``enqueue_run_webhook``), and a worker in the API process
+delivers it. Compared with inline ``deliver_webhook_with_retries`` (a few attempts within seconds,
+awaited by the run itself):
+
+- a restart loses nothing: pending rows survive it, and a claim held by a dead worker expires;
+- retries back off exponentially over hours and honour Retry-After;
+- a webhook that cannot be delivered ends up ``dead`` in the table instead of being dropped;
+- one worker has up to WEBHOOK_OUTBOX_CONCURRENCY requests in flight, over keep-alive connections
+  kept per destination origin.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlparse
+
+import httpx
+import structlog
+from opentelemetry import metrics
+
+from skyvern.config import settings
+from skyvern.exceptions import InvalidUrl
+from skyvern.forge import app
+from skyvern.forge.sdk.schemas.webhook_outbox import WebhookOutboxEntry
+from skyvern.schemas.run_enums import RunType
+from skyvern.services.webhook_delivery import (
+    describe_delivery_error,
+    ensure_deliverable_url,
+    is_retryable_status,
+    parse_retry_after,
+)
+
+LOG = structlog.get_logger(__name__)
+
+WEBHOOK_OUTBOX_REQUEST_TIMEOUT_SECONDS = 30.0
+# Idle destination clients beyond this many are closed after each batch, least recently used first.
+_MAX_DESTINATION_CLIENTS = 256
+_MAX_ERROR_LENGTH = 2000
+
+_meter = metrics.get_meter("skyvern.webhook_outbox")
+_request_seconds = _meter.create_histogram(
+    "skyvern.webhook_outbox.request_seconds",
+    unit="s",
+    description="Webhook outbox: duration of one delivery attempt",
+)
+_delivery_latency_seconds = _meter.create_histogram(
+    "skyvern.webhook_outbox.delivery_latency_seconds",
+    unit="s",
+    description="Webhook outbox: enqueue -> successful delivery, across all attempts",
+)
+_outcomes = _meter.create_counter(
+    "skyvern.webhook_outbox.outcomes",
+    unit="{attempt}",
+    description="Webhook outbox delivery attempts by outcome (delivered, retried, dead)",
+)
+
+
+@dataclass
+class WebhookOutboxStats:
+    """In-process counters for this worker's delivery attempts."""
+
+    delivered: int = 0
+    retried: int = 0
+    dead_lettered: int = 0
+
+
+async def enqueue_run_webhook(
+    *,
+    organization_id: str,
+    run_id: str,
+    run_type: RunType,
+    url: str,
+    payload: str,
+    headers: dict[str, str],
+    success_marker: str | None = None,
+) -> bool:
+    """Hand a signed run webhook to the outbox. Returns False when the caller should deliver it inline.
+
+    That is the case when the outbox is disabled, and also when the insert fails: a webhook the
+    database would not take is better delivered late in the run than lost.
+    """
+    if not settings.WEBHOOK_OUTBOX_ENABLED:
+        return False
+    try:
+        entry = await app.DATABASE.webhook_outbox.enqueue_webhook(
+            organization_id=organization_id,
+            run_id=run_id,
+            run_type=run_type,
+            url=url,
+            payload=payload,
+            headers=headers,
+            success_marker=success_marker,
+        )
+    except Exception:
+        LOG.warning(
+            "Failed to enqueue webhook to the outbox; delivering inline",
+            run_id=run_id,
+            organization_id=organization_id,
+            exc_info=True,
+        )
+        return False
+    LOG.info(
+        "Enqueued webhook for outbox delivery",
+        webhook_outbox_id=entry.webhook_outbox_id,
+        run_id=run_id,
+        run_type=run_type,
+        organization_id=organization_id,
+    )
+    return True
+
+
+def compute_outbox_retry_delay(attempts: int, response: httpx.Response | None) -> float:
+    """Seconds to wait after the ``attempts``-th failed attempt (1-based)."""
+    max_delay = settings.WEBHOOK_OUTBOX_RETRY_MAX_DELAY_SECONDS
+    hinted = parse_retry_after(response.headers.get("Retry-After")) if response is not None else None
+    if hinted is not None:
+        return min(hinted, max_delay)
+    base_delay = settings.WEBHOOK_OUTBOX_RETRY_BASE_DELAY_SECONDS
+    exponent = min(max(attempts - 1, 0), 32)
+    return min(base_delay * (2**exponent) + random.uniform(0, base_delay), max_delay)
+
+
+def _destination_key(url: str) -> str:
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}".lower()
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class WebhookOutboxWorker:
+    def __init__(self, *, poll_interval_seconds: float, batch_size: int, concurrency: int) -> None:
+        self.poll_interval_seconds = poll_interval_seconds
+        self.batch_size = max(1, batch_size)
+        self.stats = WebhookOutboxStats()
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._clients: OrderedDict[str, httpx.AsyncClient] = OrderedDict()
+
+    async def run_forever(self) -> None:
+        LOG.info(
+            "Webhook outbox worker started",
+            poll_interval_seconds=self.poll_interval_seconds,
+            batch_size=self.batch_size,
+        )
+        while True:
+            try:
+                claimed = await self.deliver_due_webhooks()
+                # A full batch means more may already be due; only idle when caught up.
+                if claimed < self.batch_size:
+                    await asyncio.sleep(self.poll_interval_seconds)
+            except asyncio.CancelledError:
+                LOG.info("Webhook outbox worker cancelled")
+                break
+            except Exception:
+                LOG.exception("Error in webhook outbox worker")
+                await asyncio.sleep(self.poll_interval_seconds)
+
+    async def deliver_due_webhooks(self) -> int:
+        """Claim one batch of due webhooks and deliver it concurrently. Returns the number claimed."""
+        entries = await app.DATABASE.webhook_outbox.claim_due_webhooks(
+            limit=self.batch_size,
+            lease_seconds=settings.WEBHOOK_OUTBOX_LEASE_SECONDS,
+        )
+        if not entries:
+            return 0
+        await asyncio.gather(*(self._deliver_with_slot(entry) for entry in entries))
+        await self._close_idle_clients(keep=_MAX_DESTINATION_CLIENTS)
+        return len(entries)
+
+    async def shutdown(self) -> None:
+        await self._close_idle_clients(keep=0)
+
+    async def _deliver_with_slot(self, entry: WebhookOutboxEntry) -> None:
+        async with self._semaphore:
+            try:
+                await self.deliver(entry)
+            except Exception:
+                # The lease lapses and the entry is retried; never let one webhook sink the batch.
+                LOG.exception(
+                    "Unexpected error delivering outbox webhook",
+                    webhook_outbox_id=entry.webhook_outbox_id,
+                    run_id=entry.run_id,
+                )
+
+    def _client_for(self, url: str) -> httpx.AsyncClient:
+        key = _destination_key(url)
+        client = self._clients.get(key)
+        if client is None:
+            per_destination = settings.WEBHOOK_OUTBOX_MAX_CONNECTIONS_PER_DESTINATION
+            client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=per_destination,
+                    max_keepalive_connections=per_destination,
+                    keepalive_expiry=settings.HTTP_CLIENT_KEEPALIVE_SECONDS,
+                )
+            )
+            self._clients[key] = client
+        self._clients.move_to_end(key)
+        return client
+
+    async def _close_idle_clients(self, keep: int) -> None:
+        while len(self._clients) > keep:
+            _, client = self._clients.popitem(last=False)
+            await client.aclose()
+
+    async def deliver(self, entry: WebhookOutboxEntry) -> None:
+        """Make one attempt at ``entry`` and record it as delivered, rescheduled or dead."""
+        response: httpx.Response | None = None
+        error: str | None = None
+        retryable = True
+        started = time.monotonic()
+        try:
+            ensure_deliverable_url(entry.url)
+            response = await app.AGENT_FUNCTION.deliver_webhook(
+                url=entry.url,
+                payload=entry.payload,
+                headers=entry.headers,
+                timeout_seconds=WEBHOOK_OUTBOX_REQUEST_TIMEOUT_SECONDS,
+                organization_id=entry.organization_id,
+                run_id=entry.run_id,
+                client=self._client_for(entry.url),
+            )
+        except httpx.HTTPStatusError as exc:
+            # NAT egress proxy client calls resp.raise_for_status(), so a proxy-side
+            # status surfaces here rather than as a returned Response.
+            response = exc.response
+        except InvalidUrl as exc:
+            error = describe_delivery_error(exc)
+            retryable = False
+        except Exception as exc:
+            error = describe_delivery_error(exc)
+        request_seconds = time.monotonic() - started
+        _request_seconds.record(request_seconds)
+
+        status_code = response.status_code if response is not None else None
+        if response is not None:
+            if 200 <= response.status_code < 300:
+                await self._mark_delivered(entry, response.status_code, request_seconds)
+                return
+            error = response.text[:_MAX_ERROR_LENGTH]
+            retryable = is_retryable_status(response.status_code)
+
+        now = datetime.now(timezone.utc)
+        if retryable and entry.attempts < settings.WEBHOOK_OUTBOX_MAX_ATTEMPTS:
+            next_attempt_at = now + timedelta(seconds=compute_outbox_retry_delay(entry.attempts, response))
+            expires_at = _as_utc(entry.created_at) + timedelta(hours=settings.WEBHOOK_OUTBOX_MAX_AGE_HOURS)
+            if next_attempt_at < expires_at:
+                await app.DATABASE.webhook_outbox.reschedule_webhook(
+                    entry.webhook_outbox_id,
+                    next_attempt_at=next_attempt_at,
+                    status_code=status_code,
+                    error=error,
+                )
+                self.stats.retried += 1
+                _outcomes.add(1, {"outcome": "retried"})
+                LOG.info(
+                    "Webhook outbox delivery failed; retry scheduled",
+                    webhook_outbox_id=entry.webhook_outbox_id,
+                    run_id=entry.run_id,
+                    organization_id=entry.organization_id,
+                    attempt=entry.attempts,
+                    status_code=status_code,
+                    error=error,
+                    next_attempt_at=next_attempt_at.isoformat(),
+                    retry_after_present=response is not None and "Retry-After" in response.headers,
+                    request_seconds=request_seconds,
+                )
+                return
+
+        await app.DATABASE.webhook_outbox.mark_webhook_dead(
+            entry.webhook_outbox_id, status_code=status_code, error=error
+        )
+        self.stats.dead_lettered += 1
+        _outcomes.add(1, {"outcome": "dead"})
+        LOG.warning(
+            "Webhook outbox delivery dead-lettered",
+            webhook_outbox_id=entry.webhook_outbox_id,
+            run_id=entry.run_id,
+            organization_id=entry.organization_id,
+            attempts=entry.attempts,
+            retryable=retryable,
+            status_code=status_code,
+            error=error,
+        )
+        if status_code is not None:
+            failure_reason = f"Webhook failed with status code {status_code}, error message: {error}"
+        else:
+            failure_reason = f"Webhook delivery failed before receiving a response: {error}"
+        await _record_run_webhook_outcome(entry, failure_reason)
+
+    async def _mark_delivered(self, entry: WebhookOutboxEntry, status_code: int, request_seconds: float) -> None:
+        await app.DATABASE.webhook_outbox.mark_webhook_delivered(entry.webhook_outbox_id, status_code=status_code)
+        delivery_latency_seconds = (datetime.now(timezone.utc) - _as_utc(entry.created_at)).total_seconds()
+        _delivery_latency_seconds.record(delivery_latency_seconds)
+        self.stats.delivered += 1
+        _outcomes.add(1, {"outcome": "delivered"})
+        LOG.info(
+            "Webhook outbox delivery succeeded",
+            webhook_outbox_id=entry.webhook_outbox_id,
+            run_id=entry.run_id,
+            organization_id=entry.organization_id,
+            attempts=entry.attempts,
+            status_code=status_code,
+            request_seconds=request_seconds,
+            delivery_latency_seconds=delivery_latency_seconds,
+        )
+        await _record_run_webhook_outcome(entry, entry.success_marker or "")
+
+
+async def _record_run_webhook_outcome(entry: WebhookOutboxEntry, webhook_failure_reason: str) -> None:
+    try:
+        if entry.run_type == RunType.task_v1:
+            await app.DATABASE.tasks.update_task(
+                task_id=entry.run_id,
+                organization_id=entry.organization_id,
+                webhook_failure_reason=webhook_failure_reason,
+            )
+        elif entry.run_type == RunType.task_v2:
+            await app.DATABASE.observer.update_task_v2(
+                task_v2_id=entry.run_id,
+                organization_id=entry.organization_id,
+                webhook_failure_reason=webhook_failure_reason,
+            )
+        elif entry.run_type == RunType.workflow_run:
+            await app.DATABASE.workflow_runs.update_workflow_run(
+                workflow_run_id=entry.run_id,
+                webhook_failure_reason=webhook_failure_reason,
+            )
+    except Exception:
+        LOG.warning(
+            "Failed to record outbox webhook outcome on the run",
+            webhook_outbox_id=entry.webhook_outbox_id,
+            run_id=entry.run_id,
+            run_type=entry.run_type,
+            exc_info=True,
+        )
+
+
+_webhook_outbox_worker: WebhookOutboxWorker | None = None
+_webhook_outbox_task: asyncio.Task[None] | None = None
+
+
+def start_webhook_outbox_worker() -> asyncio.Task[None] | None:
+    global _webhook_outbox_worker, _webhook_outbox_task
+
+    if not settings.WEBHOOK_OUTBOX_ENABLED:
+        LOG.debug("Webhook outbox is disabled")
+        return None
+
+    if _webhook_outbox_task is not None and not _webhook_outbox_task.done():
+        LOG.warning("Webhook outbox worker is already running")
+        return _webhook_outbox_task
+
+    _webhook_outbox_worker = WebhookOutboxWorker(
+        poll_interval_seconds=settings.WEBHOOK_OUTBOX_POLL_INTERVAL_SECONDS,
+        batch_size=settings.WEBHOOK_OUTBOX_BATCH_SIZE,
+        concurrency=settings.WEBHOOK_OUTBOX_CONCURRENCY,
+    )
+    _webhook_outbox_task = asyncio.create_task(_webhook_outbox_worker.run_forever())
+    return _webhook_outbox_task
+
+
+async def stop_webhook_outbox_worker() -> None:
+    global _webhook_outbox_worker, _webhook_outbox_task
+
+    if _webhook_outbox_task is not None and not _webhook_outbox_task.done():
+        _webhook_outbox_task.cancel()
+        try:
+            await _webhook_outbox_task
+        except asyncio.CancelledError:
+            pass
+
+    if _webhook_outbox_worker is not None:
+        await _webhook_outbox_worker.shutdown()
+        LOG.info("Webhook outbox worker stopped", **vars(_webhook_outbox_worker.stats))
+
+    _webhook_outbox_worker = None
+    _webhook_outbox_task = None
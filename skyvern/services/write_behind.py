@@ -0,0 +1,239 @@
+"""Write-behind buffering of the agent loop's action inserts and step usage updates.
+
+With DATABASE_WRITE_BEHIND_ENABLED, while ``ForgeAgent.agent_step`` runs a step, two kinds of write
+that used to take a pooled connection each, on the path to the next LLM call, are held in the run's
+``RunWriteBuffer`` (kept on the SkyvernContext) instead:
+
+- the INSERT of every executed action. Its ``action_id`` is generated when it is buffered, so
+  callers can reference the action right away;
+- the incremental cost/token UPDATE of the step after every LLM call, summed per step.
+
+The buffer is written at the run's consistency points: ``ForgeAgent.update_step`` (step status
+changes, step end, cancellation), ``ForgeAgent.update_task`` (task status changes), the step
+archive flush that links action screenshots, and the end of ``agent_step``. A flush is one
+transaction for all buffered actions plus one UPDATE per step with usage; at a step update the
+step's usage rides along in that UPDATE. Flushes are serialized and insert actions in the order
+they were buffered, with ``created_at`` stamped at buffering time, so history reads order them
+exactly as direct writes would. A failed flush keeps its writes for the next one.
+
+Writes for a step that is not inside ``agent_step`` go straight to the database as before.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, fields
+from datetime import datetime
+from typing import Any
+
+import structlog
+from opentelemetry import metrics
+
+from skyvern.config import settings
+from skyvern.forge import app
+from skyvern.forge.sdk.core import skyvern_context
+from skyvern.forge.sdk.db.datetime_utils import naive_utc_now
+from skyvern.forge.sdk.db.id import generate_action_id
+from skyvern.forge.sdk.models import Step
+from skyvern.webeye.actions.actions import Action
+
+LOG = structlog.get_logger(__name__)
+
+_meter = metrics.get_meter("skyvern.write_behind")
+_flush_seconds = _meter.create_histogram(
+    "skyvern.write_behind.flush_seconds",
+    unit="s",
+    description="Write-behind buffer: duration of one flush, by consistency point",
+)
+_flush_writes = _meter.create_histogram(
+    "skyvern.write_behind.flush_writes",
+    unit="{write}",
+    description="Write-behind buffer: buffered writes committed by one flush",
+)
+_buffered_writes = _meter.create_counter(
+    "skyvern.write_behind.buffered_writes",
+    unit="{write}",
+    description="Writes taken off the agent loop's critical path by the write-behind buffer, by kind",
+)
+
+
+@dataclass
+class _StepUsage:
+    task_id: str
+    organization_id: str | None
+    incremental_cost: float | None = None
+    incremental_input_tokens: int | None = None
+    incremental_output_tokens: int | None = None
+    incremental_reasoning_tokens: int | None = None
+    incremental_cached_tokens: int | None = None
+    last_llm_model: str | None = None
+
+    def add(self, **usage: Any) -> None:
+        for key, value in usage.items():
+            if value is None:
+                continue
+            if key == "last_llm_model":
+                self.last_llm_model = value
+            else:
+                current = getattr(self, key)
+                setattr(self, key, value if current is None else current + value)
+
+    def as_update(self) -> dict[str, Any]:
+        """The ``update_step`` keyword arguments that apply this usage."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in ("task_id", "organization_id") and getattr(self, f.name) is not None
+        }
+
+
+class RunWriteBuffer:
+    """Buffered action inserts and step usage updates of one run, written at consistency points."""
+
+    def __init__(self) -> None:
+        self._active_step_ids: set[str] = set()
+        self._actions: list[tuple[Action, datetime]] = []
+        self._step_usage: dict[str, _StepUsage] = {}
+        # Serializes flushes: a flush that returns has committed every write buffered before it.
+        self._flush_lock = asyncio.Lock()
+
+    def begin_step(self, step_id: str) -> None:
+        self._active_step_ids.add(step_id)
+
+    async def end_step(self, step_id: str) -> None:
+        self._active_step_ids.discard(step_id)
+        try:
+            await asyncio.shield(self.flush("step_end"))
+        except Exception:
+            LOG.warning("Failed to flush write-behind buffer at step end", step_id=step_id, exc_info=True)
+
+    def is_buffering(self, step_id: str | None) -> bool:
+        return step_id is not None and step_id in self._active_step_ids
+
+    def add_action(self, action: Action) -> Action:
+        if action.action_id is None:
+            action.action_id = generate_action_id()
+        self._actions.append((action, naive_utc_now()))
+        _buffered_writes.add(1, {"kind": "action"})
+        return action
+
+    def add_step_usage(self, step_id: str, task_id: str, organization_id: str | None, **usage: Any) -> None:
+        self.restore_step_usage(step_id, task_id, organization_id, usage)
+        _buffered_writes.add(1, {"kind": "step_usage"})
+
+    def take_step_usage(self, step_id: str) -> dict[str, Any]:
+        """Remove and return a step's buffered usage as ``update_step`` keyword arguments."""
+        step_usage = self._step_usage.pop(step_id, None)
+        return step_usage.as_update() if step_usage else {}
+
+    def restore_step_usage(
+        self, step_id: str, task_id: str, organization_id: str | None, usage: dict[str, Any]
+    ) -> None:
+        """Merge usage back in, e.g. what ``take_step_usage`` returned to an update that then failed."""
+        step_usage = self._step_usage.get(step_id)
+        if step_usage is None:
+            step_usage = self._step_usage[step_id] = _StepUsage(task_id=task_id, organization_id=organization_id)
+        step_usage.add(**usage)
+
+    async def flush(self, reason: str) -> int:
+        """Write everything buffered so far and return how many buffered writes were committed."""
+        async with self._flush_lock:
+            if not self._actions and not self._step_usage:
+                return 0
+            actions, self._actions = self._actions, []
+            step_usage, self._step_usage = self._step_usage, {}
+            started = time.perf_counter()
+            written = 0
+            try:
+                await app.DATABASE.workflow_params.create_actions(actions)
+                written += len(actions)
+                actions = []
+                while step_usage:
+                    step_id, usage = next(iter(step_usage.items()))
+                    await app.DATABASE.tasks.update_step(
+                        task_id=usage.task_id,
+                        step_id=step_id,
+                        organization_id=usage.organization_id,
+                        **usage.as_update(),
+                    )
+                    del step_usage[step_id]
+                    written += 1
+            except BaseException:
+                # Put back what was not written, ahead of anything buffered meanwhile.
+                self._actions[:0] = actions
+                for step_id, usage in step_usage.items():
+                    if buffered := self._step_usage.pop(step_id, None):
+                        usage.add(**buffered.as_update())
+                    self._step_usage[step_id] = usage
+                raise
+            finally:
+                _flush_seconds.record(time.perf_counter() - started, {"reason": reason})
+                _flush_writes.record(written, {"reason": reason})
+            LOG.debug("Flushed write-behind buffer", reason=reason, writes=written)
+            return written
+
+
+def begin_step_write_behind(step: Step) -> RunWriteBuffer | None:
+    """Start buffering ``step``'s writes in the current run's buffer, when write-behind is enabled."""
+    if not settings.DATABASE_WRITE_BEHIND_ENABLED:
+        return None
+    context = skyvern_context.current()
+    if context is None:
+        return None
+    if context.write_buffer is None:
+        context.write_buffer = RunWriteBuffer()
+    context.write_buffer.begin_step(step.step_id)
+    return context.write_buffer
+
+
+def current_write_buffer() -> RunWriteBuffer | None:
+    if not settings.DATABASE_WRITE_BEHIND_ENABLED:
+        return None
+    context = skyvern_context.current()
+    return context.write_buffer if context else None
+
+
+async def flush_write_buffer(reason: str) -> None:
+    if buffer := current_write_buffer():
+        await buffer.flush(reason)
+
+
+async def persist_action(action: Action) -> Action:
+    """Insert ``action``, or buffer the insert while its step runs; either way ``action_id`` is set."""
+    buffer = current_write_buffer()
+    if buffer is not None and buffer.is_buffering(action.step_id):
+        return buffer.add_action(action)
+    return await app.DATABASE.workflow_params.create_action(action=action)
+
+
+async def record_step_llm_usage(
+    step: Step,
+    *,
+    incremental_cost: float | None = None,
+    incremental_input_tokens: int | None = None,
+    incremental_output_tokens: int | None = None,
+    incremental_reasoning_tokens: int | None = None,
+    incremental_cached_tokens: int | None = None,
+    last_llm_model: str | None = None,
+) -> None:
+    """Add an LLM call's cost and token counts to ``step``, buffered while the step runs."""
+    usage: dict[str, Any] = {
+        "incremental_cost": incremental_cost,
+        "incremental_input_tokens": incremental_input_tokens,
+        "incremental_output_tokens": incremental_output_tokens,
+        "incremental_reasoning_tokens": incremental_reasoning_tokens,
+        "incremental_cached_tokens": incremental_cached_tokens,
+    }
+    if last_llm_model is not None:
+        usage["last_llm_model"] = last_llm_model
+    buffer = current_write_buffer()
+    if buffer is not None and buffer.is_buffering(step.step_id):
+        buffer.add_step_usage(step.step_id, step.task_id, step.organization_id, **usage)
+        return
+    await app.DATABASE.tasks.update_step(
+        task_id=step.task_id,
+        step_id=step.step_id,
+        organization_id=step.organization_id,
+        **usage,
+    )
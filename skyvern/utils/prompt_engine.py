@@ -1,7 +1,10 @@
+import hashlib
 from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 import structlog
+from cachetools import TTLCache
 from pydantic import BaseModel
 
 from skyvern.constants import DEFAULT_MAX_TOKENS
@@ -73,6 +76,136 @@ CEILING_FALLBACK_KEYS_BY_TEMPLATE: dict[str, list[str]] = {
 }
 
 
+# Token counts of prompt sections keyed by content hash. A page's element tree variants recur across
+# the prompts built from one scrape and across steps on an unchanged page, as do extracted text and
+# action history, so most sections are only BPE-encoded once.
+_SECTION_TOKEN_COUNTS: TTLCache[str, int] = TTLCache(maxsize=512, ttl=60 * 60)
+
+
+def _count_section_tokens(text: str) -> int:
+    key = hashlib.sha256(text.encode("utf-8", "surrogatepass")).hexdigest()
+    token_count = _SECTION_TOKEN_COUNTS.get(key)
+    if token_count is None:
+        token_count = _SECTION_TOKEN_COUNTS[key] = count_tokens(text)
+    return token_count
+
+
+@dataclass
+class _PromptBudgetPlan:
+    elements: str
+    kwargs: dict[str, Any]
+    # The tree before it was trimmed, when the plan trimmed it.
+    trimmed_from: str | None = None
+
+
+def _plan_element_trim(elements: str, element_tokens: int, other_tokens: int, min_useful_element_tokens: int) -> str:
+    """Section-count counterpart of ``_trim_elements_to_fit``: trims without re-rendering the prompt."""
+    element_budget = PROMPT_HARD_CEILING_TOKENS - _CEILING_SAFETY_MARGIN_TOKENS - other_tokens
+    trimmed = elements
+    for _ in range(_MAX_ELEMENT_TRIM_ROUNDS):
+        if element_tokens == 0 or other_tokens + element_tokens <= PROMPT_HARD_CEILING_TOKENS:
+            break
+        if element_budget < min_useful_element_tokens:
+            break
+        keep_chars = int(element_budget * (len(trimmed) / element_tokens))
+        if keep_chars >= len(trimmed):
+            break
+        trimmed = _truncate_elements_at_tag_boundary(trimmed, keep_chars)
+        element_tokens = _count_section_tokens(trimmed)
+    return trimmed
+
+
+def _plan_prompt_budget(
+    element_tree_builder: ElementTreeBuilder,
+    prompt_engine: PromptEngine,
+    template_name: str,
+    *,
+    html_need_skyvern_attrs: bool,
+    kwargs: dict[str, Any],
+    elements: str,
+    token_count: int,
+) -> _PromptBudgetPlan:
+    """Pick the element tree variant, fallback-key drops and tree trim for an over-budget prompt.
+
+    Makes the same choices, in the same order, as rendering and re-encoding the whole prompt after
+    each step, but estimates every candidate as (tokens outside the tree) + (tokens of the tree),
+    both counted per section and memoized, so the caller renders and encodes the prompt once more.
+    """
+
+    def _other_tokens(working_kwargs: dict[str, Any]) -> int:
+        return _count_section_tokens(prompt_engine.load_prompt(template_name, elements="", **working_kwargs))
+
+    working_kwargs = dict(kwargs)
+    other_tokens = _other_tokens(working_kwargs)
+    element_tokens = max(token_count - other_tokens, 0)
+    if token_count > DEFAULT_MAX_TOKENS and element_tree_builder.support_economy_elements_tree():
+        # get rid of all the secondary elements like SVG, etc
+        # NOTE: economy fallback drops the lean recipe — context-overflow firefighting
+        # path; we accept the lean savings loss in exchange for fitting under the cap.
+        elements = _sanitize_elements_for_prompt(
+            element_tree_builder,
+            element_tree_builder.build_economy_elements_tree(html_need_skyvern_attrs=html_need_skyvern_attrs),
+        )
+        element_tokens = _count_section_tokens(elements)
+        economy_token_count = other_tokens + element_tokens
+        LOG.warning(
+            "Prompt is longer than the max tokens. Going to use the economy elements tree.",
+            template_name=template_name,
+            token_count=token_count,
+            economy_token_count=economy_token_count,
+            max_tokens=DEFAULT_MAX_TOKENS,
+        )
+        if economy_token_count > DEFAULT_MAX_TOKENS:
+            # !!! HACK alert
+            # dump the last 1/3 of the html context and keep the first 2/3 of the html context
+            elements = _sanitize_elements_for_prompt(
+                element_tree_builder,
+                element_tree_builder.build_economy_elements_tree(
+                    html_need_skyvern_attrs=html_need_skyvern_attrs,
+                    percent_to_keep=2 / 3,
+                ),
+            )
+            element_tokens = _count_section_tokens(elements)
+            LOG.warning(
+                "Prompt is still longer than the max tokens. Will only keep the first 2/3 of the html context.",
+                template_name=template_name,
+                token_count=token_count,
+                economy_token_count=economy_token_count,
+                token_count_after_dump=other_tokens + element_tokens,
+                max_tokens=DEFAULT_MAX_TOKENS,
+            )
+
+    plan = _PromptBudgetPlan(elements=elements, kwargs=working_kwargs)
+    if other_tokens + element_tokens <= PROMPT_HARD_CEILING_TOKENS:
+        return plan
+
+    # Same order as _enforce_prompt_ceiling_counted: trim the tree while it keeps a useful share of
+    # the page, then drop fallback keys, then trim the tree as far as it takes.
+    trimmed = _plan_element_trim(elements, element_tokens, other_tokens, _MIN_USEFUL_ELEMENT_TOKENS)
+    if trimmed != elements:
+        element_tokens = _count_section_tokens(trimmed)
+    for drop_key in CEILING_FALLBACK_KEYS_BY_TEMPLATE.get(template_name, []):
+        if other_tokens + element_tokens <= PROMPT_HARD_CEILING_TOKENS:
+            break
+        if working_kwargs.get(drop_key) is None:
+            continue
+        LOG.warning(
+            "Prompt exceeds hard ceiling; dropping fallback key",
+            template_name=template_name,
+            drop_key=drop_key,
+            final_token_count=other_tokens + element_tokens,
+            hard_ceiling=PROMPT_HARD_CEILING_TOKENS,
+        )
+        working_kwargs[drop_key] = None
+        other_tokens = _other_tokens(working_kwargs)
+    if other_tokens + element_tokens > PROMPT_HARD_CEILING_TOKENS:
+        trimmed = _plan_element_trim(trimmed, element_tokens, other_tokens, 0)
+
+    if trimmed != elements:
+        plan.elements, plan.trimmed_from = trimmed, elements
+    return plan
+
+
 def load_prompt_with_elements_tracked(
     element_tree_builder: ElementTreeBuilder,
     prompt_engine: PromptEngine,
@@ -128,60 +261,50 @@ def load_prompt_with_elements_tracked(
         **kwargs,
     )
     token_count = count_tokens(prompt)
-    # Invariant: equals count_tokens(prompt) for the current prompt; re-set on every rebuild
-    # below so the ceiling helper and telemetry can reuse it without re-encoding an identical string.
-    current_prompt_token_count = token_count
-    if token_count > DEFAULT_MAX_TOKENS and element_tree_builder.support_economy_elements_tree():
-        # get rid of all the secondary elements like SVG, etc
-        # NOTE: economy fallback drops the lean recipe — context-overflow firefighting
-        # path; we accept the lean savings loss in exchange for fitting under the cap.
-        elements = _sanitize_elements_for_prompt(
+
+    def _mirror_trimmed_elements(trimmed: str) -> None:
+        if element_tree_builder.last_used_element_tree_html is not None:
+            element_tree_builder.last_used_element_tree_html = trimmed
+
+    final_kwargs: dict[str, Any] = dict(kwargs)
+    # Invariant: equals count_tokens(prompt) for the current prompt, so the ceiling helper and
+    # telemetry can reuse it without re-encoding an identical string.
+    final_token_count = token_count
+    if token_count > PROMPT_HARD_CEILING_TOKENS or (
+        token_count > DEFAULT_MAX_TOKENS and element_tree_builder.support_economy_elements_tree()
+    ):
+        plan = _plan_prompt_budget(
             element_tree_builder,
-            element_tree_builder.build_economy_elements_tree(html_need_skyvern_attrs=html_need_skyvern_attrs),
-        )
-        prompt = prompt_engine.load_prompt(template_name, elements=elements, **kwargs)
-        economy_token_count = count_tokens(prompt)
-        current_prompt_token_count = economy_token_count
-        LOG.warning(
-            "Prompt is longer than the max tokens. Going to use the economy elements tree.",
-            template_name=template_name,
+            prompt_engine,
+            template_name,
+            html_need_skyvern_attrs=html_need_skyvern_attrs,
+            kwargs=kwargs,
+            elements=elements,
             token_count=token_count,
-            economy_token_count=economy_token_count,
-            max_tokens=DEFAULT_MAX_TOKENS,
         )
-        if economy_token_count > DEFAULT_MAX_TOKENS:
-            # !!! HACK alert
-            # dump the last 1/3 of the html context and keep the first 2/3 of the html context
-            elements = _sanitize_elements_for_prompt(
-                element_tree_builder,
-                element_tree_builder.build_economy_elements_tree(
-                    html_need_skyvern_attrs=html_need_skyvern_attrs,
-                    percent_to_keep=2 / 3,
-                ),
-            )
-            prompt = prompt_engine.load_prompt(template_name, elements=elements, **kwargs)
-            token_count_after_dump = count_tokens(prompt)
-            current_prompt_token_count = token_count_after_dump
+        elements, final_kwargs = plan.elements, plan.kwargs
+        prompt = prompt_engine.load_prompt(template_name, elements=elements, **final_kwargs)
+        final_token_count = count_tokens(prompt)
+        if plan.trimmed_from is not None:
             LOG.warning(
-                "Prompt is still longer than the max tokens. Will only keep the first 2/3 of the html context.",
+                "Prompt exceeded hard ceiling; trimmed the element tree to fit",
                 template_name=template_name,
-                token_count=token_count,
-                economy_token_count=economy_token_count,
-                token_count_after_dump=token_count_after_dump,
-                max_tokens=DEFAULT_MAX_TOKENS,
+                elements_char_count_before=len(plan.trimmed_from),
+                elements_char_count_after=len(elements),
+                final_token_count=final_token_count,
+                hard_ceiling=PROMPT_HARD_CEILING_TOKENS,
             )
+            _mirror_trimmed_elements(elements)
 
-    def _mirror_trimmed_elements(trimmed: str) -> None:
-        if element_tree_builder.last_used_element_tree_html is not None:
-            element_tree_builder.last_used_element_tree_html = trimmed
-
+    # The plan works from section counts, so the final prompt can land a few tokens off its estimate;
+    # the exact enforcement below only does work when that tips it over the ceiling.
     final_prompt, final_kwargs, final_token_count = _enforce_prompt_ceiling_counted(
         prompt,
         prompt_engine=prompt_engine,
         template_name=template_name,
-        kwargs=kwargs,
+        kwargs=final_kwargs,
         elements=elements,
-        precomputed_token_count=current_prompt_token_count,
+        precomputed_token_count=final_token_count,
         on_elements_trimmed=_mirror_trimmed_elements,
     )
 
@@ -1,5 +1,6 @@
 import ipaddress
 import socket
+from collections.abc import Callable
 from http import HTTPStatus
 from typing import Annotated, Any
 from urllib.parse import quote, urljoin, urlparse, urlsplit, urlunsplit
@@ -369,7 +370,14 @@ def validate_webhook_url(url: str) -> str:
 WebhookUrl = Annotated[str, AfterValidator(validate_webhook_url)]
 
 
-def validate_fetch_url_with_resolved_ips(url: str) -> tuple[str, tuple[str, ...]]:
+def validate_fetch_url_with_resolved_ips(
+    url: str, cached_host_ips: Callable[[str], tuple[str, ...] | None] | None = None
+) -> tuple[str, tuple[str, ...]]:
+    """Validate ``url`` and return it with the safe IPs its host resolves to.
+
+    ``cached_host_ips`` may supply addresses this process already validated for the host, which
+    skips the DNS lookup; it must only ever return results of ``resolve_fetch_host_ips``.
+    """
     try:
         url = _prepend_scheme(url=url)
         v = AnyHttpUrl(url=url)
@@ -379,15 +387,18 @@ def validate_fetch_url_with_resolved_ips(url: str) -> tuple[str, tuple[str, ...]
 
     if not v.host:
         raise InvalidUrl(url=url)
-    return str(v), resolve_fetch_host_ips(v.host)
+    cached_ips = cached_host_ips(v.host) if cached_host_ips else None
+    return str(v), cached_ips or resolve_fetch_host_ips(v.host)
 
 
 def validate_fetch_url(url: str) -> str:
     return validate_fetch_url_with_resolved_ips(url)[0]
 
 
-def validate_redirect_url_with_resolved_ips(url: str, location: str) -> tuple[str, tuple[str, ...]]:
-    return validate_fetch_url_with_resolved_ips(urljoin(url, location))
+def validate_redirect_url_with_resolved_ips(
+    url: str, location: str, cached_host_ips: Callable[[str], tuple[str, ...] | None] | None = None
+) -> tuple[str, tuple[str, ...]]:
+    return validate_fetch_url_with_resolved_ips(urljoin(url, location), cached_host_ips)
 
 
 def validate_redirect_url(url: str, location: str) -> str:
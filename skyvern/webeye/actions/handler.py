@@ -85,7 +85,7 @@ from skyvern.exceptions import (
     SkyvernPageAnalysisTimeout,
     UnresolvableHost,
 )
-from skyvern.experimentation.wait_utils import get_or_create_wait_config, get_wait_time
+from skyvern.experimentation.wait_utils import get_or_create_wait_config, get_wait_time, settle_wait
 from skyvern.forge import app
 from skyvern.forge.prompts import prompt_engine
 from skyvern.forge.sdk.api.files import (
@@ -136,6 +136,7 @@ from skyvern.forge.sdk.settings_manager import SettingsManager
 from skyvern.forge.sdk.trace import apply_context_attrs, traced, traced_span
 from skyvern.services import service_utils
 from skyvern.services.action_service import get_action_history
+from skyvern.services.write_behind import persist_action
 from skyvern.utils.contained_effects import contained_effect
 from skyvern.utils.lean_html import apply_lean_to_tree
 from skyvern.utils.prompt_engine import (
@@ -3802,7 +3803,7 @@ class ActionHandler:
                         if not false_click_download_event.done():
                             false_click_download_event.cancel()
             action.finished_at = naive_utc_now()
-            persisted_action = await app.DATABASE.workflow_params.create_action(action=action)
+            persisted_action = await persist_action(action)
             action.action_id = persisted_action.action_id
             return results
 
@@ -4458,7 +4459,7 @@ class ActionHandler:
                     Exception(download_error["reasoning"]),
                     download_triggered=download_triggered,
                 )
-            persisted_action = await app.DATABASE.workflow_params.create_action(action=action)
+            persisted_action = await persist_action(action)
             action.action_id = persisted_action.action_id
 
     @staticmethod
@@ -5440,7 +5441,9 @@ async def handle_click_action(
     skyvern_element = await dom.get_skyvern_element_by_id(action.element_id)
 
     # Wait after getting element to allow any dynamic changes
-    await asyncio.sleep(get_wait_time(wait_config, "post_click_delay", default=0.3))
+    await settle_wait(
+        page, get_wait_time(wait_config, "post_click_delay", default=0.3), "post_click_delay", action.action_type
+    )
 
     # Level-triggered toggle intent (ClickContext.desired_state) is resolved here, with the live
     # element in hand and before any physical click: suppress a redundant click when the control
@@ -12914,8 +12917,9 @@ async def extract_information_for_navigation_goal(
         )
 
     # Cross-run (wpid-scoped) cache lookup (SKY-8873). Consulted after an
-    # in-run miss so the tight in-process dict stays the hot path. Returns
-    # None in OSS; the cloud override hits Redis and is gated behind the
+    # in-run miss so the tight in-process dict stays the hot path. OSS reads
+    # the optional SQLite tier (EXTRACTION_CACHE_SQLITE_PATH); the cloud
+    # override hits Redis and is gated behind the
     # EXTRACT_INFORMATION_CACHE_REDIS PostHog flag. All errors are swallowed
     # by the backend so a Redis hiccup just falls through to the LLM call.
     # Skipped on retry — the subsequent dual-write overwrites any stale
@@ -13071,7 +13075,7 @@ async def extract_information_for_navigation_goal(
         except Exception:
             LOG.warning("extract_information cache store failed; ignoring", exc_info=True)
         # Dual-write to the cross-run (Redis) tier. Ungated so the cache is
-        # warm before the read flag rolls out. OSS returns immediately; cloud
+        # warm before the read flag rolls out. OSS writes the optional SQLite tier; cloud
         # writes to Redis with a long TTL and swallows backend errors.
         try:
             await app.AGENT_FUNCTION.store_cross_run_extraction_cache(wpid_for_cache, cache_key, json_response)
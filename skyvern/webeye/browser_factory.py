@@ -180,6 +180,12 @@ def _partition_browser_headers(
     return sanitize_browser_headers(browser_internal_headers), sanitize_browser_headers(caller_headers)
 
 
+def browser_launch_headers(extra_http_headers: dict[str, str] | None) -> dict[str, str] | None:
+    """The part of ``extra_http_headers`` baked into the browser at launch; caller headers are
+    applied per run as origin-scoped route handlers instead."""
+    return _partition_browser_headers(extra_http_headers)[0]
+
+
 async def _apply_origin_scoped_headers(
     browser_context: BrowserContext,
     *,
@@ -743,9 +749,33 @@ class BrowserContextFactory:
     def register_type(cls, browser_type: str, creator: BrowserContextCreator) -> None:
         cls._creators[browser_type] = creator
 
+    @classmethod
+    async def launch_browser_context(
+        cls,
+        playwright: Playwright,
+        proxy_location: ProxyLocationInput = None,
+        extra_http_headers: dict[str, str] | None = None,
+    ) -> tuple[BrowserContext, BrowserArtifacts, BrowserCleanupFunc]:
+        """Launch a run-agnostic context with the configured creator and nothing else.
+
+        Used to fill the warm browser pool: the per-run setup (cookies, listeners, extensions,
+        caller-scoped headers) is applied by ``create_browser_context`` once a run claims it.
+        """
+        browser_type = settings.BROWSER_TYPE
+        creator = cls._creators.get(browser_type)
+        if not creator:
+            raise UnknownBrowserType(browser_type)
+        browser_internal_headers, _ = _partition_browser_headers(extra_http_headers)
+        return await creator(
+            playwright, proxy_location=proxy_location, extra_http_headers=browser_internal_headers or {}
+        )
+
     @classmethod
     async def create_browser_context(
-        cls, playwright: Playwright, **kwargs: Any
+        cls,
+        playwright: Playwright,
+        launched_browser: tuple[BrowserContext, BrowserArtifacts, BrowserCleanupFunc] | None = None,
+        **kwargs: Any,
     ) -> tuple[BrowserContext, BrowserArtifacts, BrowserCleanupFunc]:
         browser_type = settings.BROWSER_TYPE
         browser_context: BrowserContext | None = None
@@ -753,10 +783,15 @@ class BrowserContextFactory:
         browser_internal_headers, scoped_headers = _partition_browser_headers(kwargs.get("extra_http_headers"))
         creator_kwargs = {**kwargs, "extra_http_headers": browser_internal_headers}
         try:
-            creator = cls._creators.get(browser_type)
-            if not creator:
-                raise UnknownBrowserType(browser_type)
-            browser_context, browser_artifacts, cleanup_func = await creator(playwright, **creator_kwargs)
+            if launched_browser is not None:
+                # Already launched by the warm pool with matching launch settings; only the per-run
+                # setup below is left to do.
+                browser_context, browser_artifacts, cleanup_func = launched_browser
+            else:
+                creator = cls._creators.get(browser_type)
+                if not creator:
+                    raise UnknownBrowserType(browser_type)
+                browser_context, browser_artifacts, cleanup_func = await creator(playwright, **creator_kwargs)
             requested_profile_id = cast(str | None, kwargs.get("browser_profile_id"))
             if requested_profile_id and browser_artifacts.applied_browser_profile_id != requested_profile_id:
                 LOG.warning(
@@ -68,6 +68,15 @@ class BrowserManager(Protocol):
         still running here. An implementation that tracks none reports none and is never protected."""
         return set()
 
+    async def prewarm_browser_pool(self) -> None:
+        """Launch idle browsers ahead of the first run. An implementation without a warm pool has
+        nothing to prewarm."""
+        return None
+
+    async def close_browser_pool(self) -> None:
+        """Tear down the idle browsers launched ahead of any run."""
+        return None
+
     async def cleanup_for_script(
         self,
         script_id: str,
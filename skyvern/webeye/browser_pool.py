@@ -0,0 +1,291 @@
+"""Pre-warmed local browser contexts for task and workflow-run startup.
+
+A cold start launches the Playwright driver, writes a fresh user-data dir and calls
+``launch_persistent_context``, which is several seconds of every short run. With
+BROWSER_POOL_ENABLED on, ``RealBrowserManager`` hands a run an already-launched context whose
+launch settings match, and refills the pool for that launch key in the background.
+
+Pooled browsers are single-use: the run that claims one owns it and tears it down as usual, so
+recordings, HAR and session cookies stay per run and no page state crosses runs. Only run-agnostic
+launches are pooled; a saved browser profile or a remote ``browser_address`` always launches cold.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+
+import psutil
+import structlog
+from opentelemetry import trace as otel_trace
+from playwright.async_api import BrowserContext, Playwright
+from pydantic import BaseModel
+
+from skyvern.config import settings
+from skyvern.constants import BROWSER_CLOSE_TIMEOUT
+from skyvern.schemas.runs import ProxyLocationInput
+from skyvern.webeye.browser_artifacts import BrowserArtifacts
+from skyvern.webeye.browser_factory import BrowserCleanupFunc
+from skyvern.webeye.browser_health import BrowserHealth, BrowserOperation
+
+LOG = structlog.get_logger()
+
+POOLED_BROWSER_TYPES = frozenset({"chromium-headless", "chromium-headful"})
+
+# An idle about:blank page that cannot evaluate a constant in this long will not serve a run either.
+_PROBE_TIMEOUT_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class BrowserPoolKey:
+    """Everything fixed at launch time that a run can ask for; runs only share a key if a browser
+    launched for one is indistinguishable from a browser launched for the other."""
+
+    engine: str
+    browser_type: str
+    proxy_location: str | None
+    launch_headers: tuple[tuple[str, str], ...] = ()
+
+    @classmethod
+    def build(
+        cls,
+        *,
+        engine: str,
+        proxy_location: ProxyLocationInput,
+        launch_headers: dict[str, str] | None,
+    ) -> BrowserPoolKey:
+        if isinstance(proxy_location, BaseModel):
+            proxy_key: str | None = proxy_location.model_dump_json()
+        elif isinstance(proxy_location, dict):
+            proxy_key = json.dumps(proxy_location, sort_keys=True)
+        else:
+            proxy_key = None if proxy_location is None else str(proxy_location)
+        return cls(
+            engine=engine,
+            browser_type=settings.BROWSER_TYPE,
+            proxy_location=proxy_key,
+            launch_headers=tuple(sorted((launch_headers or {}).items())),
+        )
+
+
+@dataclass
+class PooledBrowser:
+    key: BrowserPoolKey
+    pw: Playwright
+    browser_context: BrowserContext
+    browser_artifacts: BrowserArtifacts
+    browser_cleanup: BrowserCleanupFunc
+    launch_ms: float
+    created_at: float = field(default_factory=time.monotonic)
+    baseline_rss_bytes: int | None = None
+    health: BrowserHealth = field(default_factory=BrowserHealth)
+
+
+BrowserLauncher = Callable[[], Awaitable[PooledBrowser]]
+
+
+@dataclass
+class BrowserPoolStats:
+    hits: int = 0
+    misses: int = 0
+    launches: int = 0
+    launch_failures: int = 0
+    recycled: int = 0
+
+
+def _browser_rss_bytes(user_data_dir: str | None) -> int | None:
+    """Resident memory of the Chromium launched on ``user_data_dir`` plus its renderer/GPU children."""
+    if not user_data_dir:
+        return None
+    marker = f"--user-data-dir={user_data_dir}"
+    for proc in psutil.process_iter(["cmdline"]):
+        try:
+            if marker not in (proc.info["cmdline"] or ()):
+                continue
+            return proc.memory_info().rss + sum(
+                child.memory_info().rss for child in proc.children(recursive=True) if child.is_running()
+            )
+        except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
+            continue
+    return None
+
+
+def record_browser_launch(*, pool_hit: bool | None, launch_ms: float) -> None:
+    span = otel_trace.get_current_span()
+    if pool_hit is not None:
+        span.set_attribute("browser_pool_hit", pool_hit)
+    span.set_attribute("browser_launch_ms", round(launch_ms, 1))
+
+
+class WarmBrowserPool:
+    def __init__(self) -> None:
+        self._idle: dict[BrowserPoolKey, deque[PooledBrowser]] = {}
+        # The most recent launcher per key, so a refill launches with the engine the last run used.
+        self._launchers: dict[BrowserPoolKey, BrowserLauncher] = {}
+        self._refills: dict[BrowserPoolKey, asyncio.Task[None]] = {}
+        # Retirements run off the checkout path; held strongly until they finish.
+        self._retiring: set[asyncio.Task[None]] = set()
+        self._closed = False
+        self.stats = BrowserPoolStats()
+
+    @staticmethod
+    def is_eligible(
+        *,
+        browser_address: str | None = None,
+        browser_profile_id: str | None = None,
+    ) -> bool:
+        return (
+            settings.BROWSER_POOL_ENABLED
+            and settings.BROWSER_POOL_MAX_SIZE > 0
+            and settings.BROWSER_TYPE in POOLED_BROWSER_TYPES
+            and not browser_address
+            and not browser_profile_id
+        )
+
+    @property
+    def idle_count(self) -> int:
+        return sum(len(entries) for entries in self._idle.values())
+
+    async def acquire(self, key: BrowserPoolKey, launcher: BrowserLauncher) -> PooledBrowser | None:
+        """Hand out a healthy idle browser for ``key``, or None when the caller must launch cold.
+
+        Either way the pool is topped back up for ``key`` in the background.
+        """
+        if self._closed:
+            return None
+        self._launchers[key] = launcher
+        self._expire_idle()
+        entry = await self._checkout(key)
+        if entry is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        LOG.info(
+            "Browser pool checkout",
+            pool_hit=entry is not None,
+            engine=key.engine,
+            idle_browsers=self.idle_count,
+            **({"pooled_launch_ms": round(entry.launch_ms, 1)} if entry else {}),
+        )
+        self._schedule_refill(key)
+        return entry
+
+    def prewarm(self, key: BrowserPoolKey, launcher: BrowserLauncher) -> None:
+        """Fill the pool for ``key`` in the background before any run has asked for it."""
+        if self._closed:
+            return
+        self._launchers.setdefault(key, launcher)
+        self._schedule_refill(key)
+
+    async def _checkout(self, key: BrowserPoolKey) -> PooledBrowser | None:
+        idle = self._idle.get(key)
+        while idle:
+            entry = idle.popleft()
+            reason = await self._recycle_reason(entry)
+            if reason is None:
+                return entry
+            self._recycle(entry, reason)
+        return None
+
+    def _expire_idle(self) -> None:
+        """Drop idle browsers of every key that outlived BROWSER_POOL_MAX_IDLE_SECONDS."""
+        deadline = time.monotonic() - settings.BROWSER_POOL_MAX_IDLE_SECONDS
+        for idle in self._idle.values():
+            while idle and idle[0].created_at < deadline:
+                self._recycle(idle.popleft(), "idle_timeout")
+
+    def _recycle(self, entry: PooledBrowser, reason: str) -> None:
+        LOG.info("Recycling pooled browser", reason=reason, engine=entry.key.engine)
+        self.stats.recycled += 1
+        task = asyncio.create_task(self._retire(entry))
+        self._retiring.add(task)
+        task.add_done_callback(self._retiring.discard)
+
+    async def _recycle_reason(self, entry: PooledBrowser) -> str | None:
+        if time.monotonic() - entry.created_at > settings.BROWSER_POOL_MAX_IDLE_SECONDS:
+            return "idle_timeout"
+        growth_limit_mb = settings.BROWSER_POOL_MAX_RSS_GROWTH_MB
+        if growth_limit_mb > 0 and entry.baseline_rss_bytes is not None:
+            rss = await asyncio.to_thread(_browser_rss_bytes, entry.browser_artifacts.browser_session_dir)
+            if rss is not None and rss - entry.baseline_rss_bytes > growth_limit_mb * 1024 * 1024:
+                return "memory_growth"
+        if not await self._probe(entry):
+            return "unhealthy"
+        return None
+
+    @staticmethod
+    async def _probe(entry: PooledBrowser) -> bool:
+        try:
+            pages = entry.browser_context.pages
+            if not pages:
+                return False
+            async with asyncio.timeout(_PROBE_TIMEOUT_SECONDS):
+                await pages[0].evaluate("1")
+        except TimeoutError:
+            entry.health.record_timeout(BrowserOperation.EVALUATE)
+            return False
+        except Exception:
+            return False
+        entry.health.record_success()
+        return not entry.health.is_degraded
+
+    def _schedule_refill(self, key: BrowserPoolKey) -> None:
+        if self._closed or key in self._refills:
+            return
+        task = asyncio.create_task(self._refill(key))
+        self._refills[key] = task
+        task.add_done_callback(lambda _: self._refills.pop(key, None))
+
+    async def _refill(self, key: BrowserPoolKey) -> None:
+        idle = self._idle.setdefault(key, deque())
+        while (
+            not self._closed
+            and len(idle) < settings.BROWSER_POOL_MIN_SIZE
+            and self.idle_count < settings.BROWSER_POOL_MAX_SIZE
+        ):
+            launcher = self._launchers[key]
+            try:
+                entry = await launcher()
+            except Exception:
+                # The next run for this key launches cold and schedules another attempt.
+                self.stats.launch_failures += 1
+                LOG.warning("Failed to launch a browser for the warm pool", engine=key.engine, exc_info=True)
+                return
+            self.stats.launches += 1
+            if settings.BROWSER_POOL_MAX_RSS_GROWTH_MB > 0:
+                entry.baseline_rss_bytes = await asyncio.to_thread(
+                    _browser_rss_bytes, entry.browser_artifacts.browser_session_dir
+                )
+            if self._closed:
+                await self._retire(entry)
+                return
+            idle.append(entry)
+            LOG.info("Warmed a pooled browser", engine=key.engine, launch_ms=round(entry.launch_ms, 1))
+
+    @staticmethod
+    async def _retire(entry: PooledBrowser) -> None:
+        with suppress(Exception):
+            async with asyncio.timeout(BROWSER_CLOSE_TIMEOUT):
+                await entry.browser_context.close()
+        if entry.browser_cleanup is not None:
+            with suppress(Exception):
+                async with asyncio.timeout(BROWSER_CLOSE_TIMEOUT):
+                    await entry.browser_cleanup()
+        with suppress(Exception):
+            async with asyncio.timeout(BROWSER_CLOSE_TIMEOUT):
+                await entry.pw.stop()
+
+    async def close(self) -> None:
+        self._closed = True
+        refills = list(self._refills.values())
+        for task in refills:
+            task.cancel()
+        await asyncio.gather(*refills, return_exceptions=True)
+        entries = [entry for idle in self._idle.values() for entry in idle]
+        self._idle.clear()
+        await asyncio.gather(*(self._retire(entry) for entry in entries), *self._retiring)
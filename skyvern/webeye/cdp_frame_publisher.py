@@ -14,8 +14,10 @@ from typing import TYPE_CHECKING
 
 import structlog
 
+from skyvern.config import settings
 from skyvern.forge import app
 from skyvern.forge.sdk.api.files import get_skyvern_temp_dir
+from skyvern.webeye.page_screencast import ScreencastSubscription, page_screencasts
 
 if TYPE_CHECKING:
     from playwright.async_api import CDPSession, Page
@@ -116,6 +118,8 @@ class CDPFramePublisher:
         self._task: asyncio.Task[None] | None = None
         self._stopped = asyncio.Event()
         self._cdp_session: CDPSession | None = None
+        # Used instead of _cdp_session with CDP_FRAME_PUBLISHER_FROM_SCREENCAST.
+        self._screencast_subscription: ScreencastSubscription | None = None
         self._attached_page: Page | None = None
         # Whether an unexpected (non-teardown) session-open failure has already warned in
         # the current unhealthy streak. Re-armed by a successful attach so each streak
@@ -249,6 +253,32 @@ class CDPFramePublisher:
         if page is None:
             return
 
+        if settings.CDP_FRAME_PUBLISHER_FROM_SCREENCAST:
+            encoded = await self._latest_screencast_frame(page)
+        else:
+            encoded = await self._capture_screenshot(page)
+        if not encoded:
+            return
+        try:
+            data = base64.b64decode(encoded, validate=False)
+        except (binascii.Error, ValueError):
+            return
+        if not data:
+            return
+
+        # Content-addressable dedupe hash (not a security boundary); SHA-256
+        # to satisfy security scanners that block SHA-1.
+        digest = hashlib.sha256(data).digest()
+        if digest == self._last_published_digest:
+            return
+
+        write_ok = await self._write_frame(data)
+        if write_ok:
+            # Dedupe only after both local write and upload succeed, so a
+            # transient upload failure retries instead of getting deduped away.
+            self._last_published_digest = digest
+
+    async def _capture_screenshot(self, page: Page) -> str:
         if page is not self._attached_page or self._cdp_session is None:
             await self._detach_cdp_session()
             try:
@@ -257,16 +287,8 @@ class CDPFramePublisher:
                 self._cdp_session = None
                 self._attached_page = None
                 self._log_cdp_open_failure(exc)
-                return
-            self._attached_page = page
-            self._warned_unexpected_cdp_open_failure = False
-            self._last_published_digest = None
-            LOG.info(
-                "CDP frame publisher attached to page",
-                stream_key=self._stream_key,
-                organization_id=self._organization_id,
-                page_url=getattr(page, "url", ""),
-            )
+                return ""
+            self._on_attached(page)
 
         try:
             result = await self._cdp_session.send(
@@ -287,29 +309,32 @@ class CDPFramePublisher:
                 exc_info=True,
             )
             await self._detach_cdp_session()
-            return
-
-        encoded = result.get("data", "") if isinstance(result, dict) else ""
-        if not encoded:
-            return
-        try:
-            data = base64.b64decode(encoded, validate=False)
-        except (binascii.Error, ValueError):
-            return
-        if not data:
-            return
+            return ""
+        return result.get("data", "") if isinstance(result, dict) else ""
 
-        # Content-addressable dedupe hash (not a security boundary); SHA-256
-        # to satisfy security scanners that block SHA-1.
-        digest = hashlib.sha256(data).digest()
-        if digest == self._last_published_digest:
-            return
+    async def _latest_screencast_frame(self, page: Page) -> str:
+        """The newest JPEG of the page's shared screencast, which also feeds any in-process viewers."""
+        if page is not self._attached_page or self._screencast_subscription is None:
+            await self._detach_cdp_session()
+            try:
+                self._screencast_subscription = await page_screencasts.subscribe(page, live=False, max_queued=1)
+            except Exception as exc:
+                self._log_cdp_open_failure(exc)
+                return ""
+            self._on_attached(page)
+        frame = self._screencast_subscription.latest
+        return frame.data if frame is not None else ""
 
-        write_ok = await self._write_frame(data)
-        if write_ok:
-            # Dedupe only after both local write and upload succeed, so a
-            # transient upload failure retries instead of getting deduped away.
-            self._last_published_digest = digest
+    def _on_attached(self, page: Page) -> None:
+        self._attached_page = page
+        self._warned_unexpected_cdp_open_failure = False
+        self._last_published_digest = None
+        LOG.info(
+            "CDP frame publisher attached to page",
+            stream_key=self._stream_key,
+            organization_id=self._organization_id,
+            page_url=getattr(page, "url", ""),
+        )
 
     async def _viewer_wants_frames(self) -> bool:
         try:
@@ -406,8 +431,12 @@ class CDPFramePublisher:
 
     async def _detach_cdp_session(self) -> None:
         session = self._cdp_session
+        subscription = self._screencast_subscription
         self._cdp_session = None
+        self._screencast_subscription = None
         self._attached_page = None
+        if subscription is not None:
+            await subscription.close()
         if session is None:
             return
         try:
@@ -0,0 +1,364 @@
+"""One CDP screencast per page, shared by every consumer of that page's frames.
+
+Each live-view websocket used to open its own CDP session and its own ``Page.startScreencast`` on
+the page it watched, so N viewers of one browser made Chrome encode every frame N times. Consumers
+now subscribe to the page here instead: the first subscriber opens the page's CDP session, starts
+a single JPEG screencast and primes it with one screenshot; later subscribers are handed the latest
+frame straight away. Every frame is acked once and fanned out to the subscriptions, each holding a
+small bounded queue that drops its oldest frame when the consumer falls behind, so one slow viewer
+never holds frames back from the others. The screencast stops when the last subscriber leaves.
+
+Quality and frame rate adapt to the live subscribers: when their queues keep dropping frames the
+screencast steps down to a lower JPEG quality and skips frames (``everyNthFrame``), and it steps
+back up once they keep pace. A page watched only by sampling consumers (``live=False``, e.g. the
+worker's frame publisher, which reads the latest frame once a second) runs at the cheapest level.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import structlog
+from opentelemetry import metrics
+
+if TYPE_CHECKING:
+    from playwright.async_api import CDPSession
+
+LOG = structlog.get_logger()
+
+SCREENCAST_MAX_WIDTH = 1280
+SCREENCAST_MAX_HEIGHT = 720
+# (JPEG quality, everyNthFrame), best first.
+SCREENCAST_LEVELS: tuple[tuple[int, int], ...] = ((60, 1), (45, 2), (30, 3))
+# Live subscribers' drops are judged over windows of this length, one level step per window at most.
+ADAPT_WINDOW_SECONDS = 5.0
+# Step down when more than this share of the frames handed to live subscribers evicted a stale one.
+DEGRADE_DROP_RATIO = 0.25
+
+_meter = metrics.get_meter("skyvern.live_view")
+_screencast_level_changes = _meter.create_counter(
+    "skyvern.live_view.screencast_level_changes",
+    unit="{change}",
+    description="Shared screencast quality/frame-rate level changes, by direction",
+)
+
+
+@dataclass(frozen=True)
+class ScreencastFrame:
+    data: str
+    """Base64-encoded JPEG."""
+    received_at: float
+    """``time.monotonic()`` when the frame reached this process."""
+    metadata: dict[str, Any] = field(default_factory=dict)
+    """CDP ``ScreencastFrameMetadata``; ``deviceWidth``/``deviceHeight`` give the viewport."""
+
+
+async def _ack_frame(session: CDPSession, session_id: int) -> None:
+    try:
+        await session.send("Page.screencastFrameAck", {"sessionId": session_id})
+    except Exception:
+        pass
+
+
+async def _discard_session(session: CDPSession) -> None:
+    try:
+        await session.send("Page.stopScreencast", {})
+    except Exception:
+        pass
+    try:
+        await session.detach()
+    except Exception:
+        pass
+
+
+def _viewport_metadata(page: object) -> dict[str, Any]:
+    viewport_size = getattr(page, "viewport_size", None)
+    if not isinstance(viewport_size, dict):
+        return {}
+    metadata: dict[str, Any] = {}
+    width = viewport_size.get("width")
+    height = viewport_size.get("height")
+    if isinstance(width, (int, float)) and width > 0:
+        metadata["deviceWidth"] = int(width)
+    if isinstance(height, (int, float)) and height > 0:
+        metadata["deviceHeight"] = int(height)
+    return metadata
+
+
+class ScreencastSubscription:
+    """One consumer's view of a page's screencast. ``close()`` it when done."""
+
+    def __init__(
+        self,
+        screencast: PageScreencast,
+        *,
+        live: bool,
+        max_queued: int,
+        on_evicted: Callable[[ScreencastFrame], None] | None,
+    ) -> None:
+        self._screencast = screencast
+        self.live = live
+        self._on_evicted = on_evicted
+        self._queue: asyncio.Queue[ScreencastFrame | None] = asyncio.Queue(maxsize=max(max_queued, 1))
+        self._latest: ScreencastFrame | None = None
+        self._active = False
+        self._closed = False
+
+    @property
+    def page(self) -> object:
+        return self._screencast.page
+
+    @property
+    def latest(self) -> ScreencastFrame | None:
+        """The newest frame handed to this subscription, whether or not it was consumed."""
+        return self._latest
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def get(self) -> ScreencastFrame | None:
+        """The next queued frame, or None once the subscription is closed."""
+        if self._closed and self._queue.empty():
+            return None
+        return await self._queue.get()
+
+    def _deliver(self, frame: ScreencastFrame) -> bool:
+        """Queue ``frame``; True when a stale frame had to be dropped to make room."""
+        if self._closed:
+            return False
+        self._latest = frame
+        evicted = False
+        if self._queue.full():
+            try:
+                stale = self._queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+            else:
+                evicted = True
+                if stale is not None and self._on_evicted is not None:
+                    self._on_evicted(stale)
+        self._queue.put_nowait(frame)
+        return evicted
+
+    async def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        # Wakes a consumer blocked in get().
+        self._queue.put_nowait(None)
+        await self._screencast._unsubscribe(self)
+
+
+class PageScreencast:
+    """The single screencast of one page and its subscriptions."""
+
+    def __init__(self, registry: PageScreencastRegistry, page: object) -> None:
+        self._registry = registry
+        self.page = page
+        self._session: CDPSession | None = None
+        self._subscriptions: list[ScreencastSubscription] = []
+        self._start_lock = asyncio.Lock()
+        self._closed = False
+        self._latest: ScreencastFrame | None = None
+        self._level = 0
+        self._window_started = time.monotonic()
+        self._window_frames = 0
+        self._window_drops = 0
+
+    @property
+    def level(self) -> int:
+        return self._level
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscriptions)
+
+    def _screencast_params(self) -> dict[str, Any]:
+        quality, every_nth_frame = SCREENCAST_LEVELS[self._level]
+        return {
+            "format": "jpeg",
+            "quality": quality,
+            "maxWidth": SCREENCAST_MAX_WIDTH,
+            "maxHeight": SCREENCAST_MAX_HEIGHT,
+            "everyNthFrame": every_nth_frame,
+        }
+
+    def _has_live_subscriber(self) -> bool:
+        return any(s.live and s._active for s in self._subscriptions)
+
+    async def _ensure_started(self) -> None:
+        async with self._start_lock:
+            if self._session is not None:
+                return
+            if not any(s.live for s in self._subscriptions):
+                self._level = len(SCREENCAST_LEVELS) - 1
+            session = await self.page.context.new_cdp_session(self.page)  # type: ignore[attr-defined]
+            session.on(
+                "Page.screencastFrame",
+                lambda params: self._on_frame(session, params, time.monotonic()),
+            )
+            try:
+                await session.send("Page.startScreencast", self._screencast_params())
+            except (asyncio.CancelledError, Exception):
+                await _discard_session(session)
+                raise
+            # Frames emitted before this point were acked but are not kept: the screenshot below is
+            # what every subscriber starts from.
+            self._session = session
+            await self._prime(session)
+            LOG.info(
+                "CDP screencast started",
+                url=getattr(self.page, "url", ""),
+                quality=SCREENCAST_LEVELS[self._level][0],
+            )
+
+    async def _prime(self, session: CDPSession) -> None:
+        """Capture the current frame, since the screencast only emits one when the page repaints."""
+        try:
+            result = await session.send(
+                "Page.captureScreenshot",
+                {
+                    "format": "jpeg",
+                    "quality": SCREENCAST_LEVELS[self._level][0],
+                    "captureBeyondViewport": False,
+                },
+            )
+        except Exception:
+            LOG.debug("Could not prime CDP screencast frame", url=getattr(self.page, "url", ""), exc_info=True)
+            return
+        data = result.get("data", "") if isinstance(result, dict) else ""
+        if data:
+            self._latest = ScreencastFrame(data, time.monotonic(), _viewport_metadata(self.page))
+
+    async def _activate(self, subscription: ScreencastSubscription) -> None:
+        if subscription.live and not self._has_live_subscriber() and self._level != 0:
+            # The page was only being sampled; a viewer gets the best level straight away.
+            await self._set_level(0)
+        subscription._active = True
+        if self._latest is not None:
+            subscription._deliver(self._latest)
+
+    def _on_frame(self, session: CDPSession, params: dict, received_at: float) -> None:
+        # Acked even when the frame is not used: Chrome withholds further frames until the last one is
+        # acked, so a frame landing while the screencast starts or stops would otherwise stall it.
+        asyncio.create_task(_ack_frame(session, params.get("sessionId", 0)))
+        if session is not self._session:
+            return
+        data = params.get("data", "")
+        if not data:
+            return
+        frame = ScreencastFrame(data, received_at, params.get("metadata") or {})
+        self._latest = frame
+        for subscription in list(self._subscriptions):
+            if not subscription._active:
+                continue
+            evicted = subscription._deliver(frame)
+            if subscription.live:
+                self._window_frames += 1
+                self._window_drops += int(evicted)
+        if received_at - self._window_started >= ADAPT_WINDOW_SECONDS:
+            self._adapt(received_at)
+
+    def _adapt(self, now: float) -> None:
+        frames, drops = self._window_frames, self._window_drops
+        self._window_started = now
+        self._window_frames = self._window_drops = 0
+        if not frames:
+            return
+        if drops / frames > DEGRADE_DROP_RATIO:
+            target = min(self._level + 1, len(SCREENCAST_LEVELS) - 1)
+        elif drops == 0:
+            target = max(self._level - 1, 0)
+        else:
+            return
+        if target != self._level:
+            asyncio.create_task(self._set_level(target))
+
+    async def _set_level(self, level: int) -> None:
+        if level == self._level or self._closed:
+            return
+        direction = "down" if level > self._level else "up"
+        self._level = level
+        self._window_started = time.monotonic()
+        self._window_frames = self._window_drops = 0
+        _screencast_level_changes.add(1, {"direction": direction})
+        session = self._session
+        if session is None:
+            return
+        try:
+            # Chrome applies new parameters to a running screencast in place.
+            await session.send("Page.startScreencast", self._screencast_params())
+        except Exception:
+            LOG.debug("Could not change CDP screencast level", level=level, exc_info=True)
+
+    async def _unsubscribe(self, subscription: ScreencastSubscription) -> None:
+        if subscription in self._subscriptions:
+            self._subscriptions.remove(subscription)
+        if not self._subscriptions:
+            await self._stop()
+        elif subscription.live and not self._has_live_subscriber():
+            await self._set_level(len(SCREENCAST_LEVELS) - 1)
+
+    async def _stop(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._registry._forget(self)
+        session = self._session
+        self._session = None
+        if session is not None:
+            await _discard_session(session)
+            LOG.info("CDP screencast stopped", url=getattr(self.page, "url", ""))
+
+
+class PageScreencastRegistry:
+    """The running screencasts of this process, one per page."""
+
+    def __init__(self) -> None:
+        # Keyed by identity: a screencast holds its page, so the id is not reused while it is here.
+        self._screencasts: dict[int, PageScreencast] = {}
+
+    def get(self, page: object) -> PageScreencast | None:
+        return self._screencasts.get(id(page))
+
+    async def subscribe(
+        self,
+        page: object,
+        *,
+        live: bool = True,
+        max_queued: int = 2,
+        on_evicted: Callable[[ScreencastFrame], None] | None = None,
+    ) -> ScreencastSubscription:
+        """Subscribe to ``page``'s screencast, starting it if this is its first subscriber.
+
+        The subscription's queue starts with the latest frame when there is one. Raises when the
+        page's CDP session cannot be opened or the screencast cannot be started.
+        """
+        screencast = self._screencasts.get(id(page))
+        if screencast is None:
+            screencast = self._screencasts[id(page)] = PageScreencast(self, page)
+        subscription = ScreencastSubscription(screencast, live=live, max_queued=max_queued, on_evicted=on_evicted)
+        # Registered before starting so a concurrent last unsubscribe cannot stop the screencast
+        # while this subscriber waits for it.
+        screencast._subscriptions.append(subscription)
+        try:
+            await screencast._ensure_started()
+        except BaseException:
+            await subscription.close()
+            raise
+        await screencast._activate(subscription)
+        return subscription
+
+    def _forget(self, screencast: PageScreencast) -> None:
+        if self._screencasts.get(id(screencast.page)) is screencast:
+            del self._screencasts[id(screencast.page)]
+
+
+page_screencasts = PageScreencastRegistry()
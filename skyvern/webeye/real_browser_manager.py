@@ -3,6 +3,8 @@ from __future__ import annotations
 import asyncio
 import functools
 import os
+import time
+import uuid
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass, replace
@@ -38,8 +40,15 @@ from skyvern.webeye.browser_engine import (
     BrowserEngineSelection,
     resolve_browser_engine,
 )
-from skyvern.webeye.browser_factory import BrowserContextFactory, rebind_download_dir
+from skyvern.webeye.browser_factory import BrowserContextFactory, browser_launch_headers, rebind_download_dir
 from skyvern.webeye.browser_manager import BrowserCleanupResult, BrowserManager
+from skyvern.webeye.browser_pool import (
+    BrowserLauncher,
+    BrowserPoolKey,
+    PooledBrowser,
+    WarmBrowserPool,
+    record_browser_launch,
+)
 from skyvern.webeye.browser_state import BrowserState
 from skyvern.webeye.cdp_frame_publisher import (
     CDPFramePublisher,
@@ -273,6 +282,7 @@ class RealBrowserManager(BrowserManager):
         # ``_start_frame_publisher`` so concurrent attaches for one stream key
         # cannot orphan a publisher loop.
         self._publisher_lock = asyncio.Lock()
+        self.browser_pool = WarmBrowserPool()
 
     @staticmethod
     def _matching_session_lease(
@@ -566,6 +576,7 @@ class RealBrowserManager(BrowserManager):
             ),
         )
         context = skyvern_context.current()
+        use_pool = WarmBrowserPool.is_eligible(browser_address=browser_address, browser_profile_id=browser_profile_id)
 
         async def _start(selection: BrowserEngineSelection) -> BrowserState:
             LOG.info(
@@ -575,14 +586,21 @@ class RealBrowserManager(BrowserManager):
                 browser_source=settings.BROWSER_TYPE,
                 **selection.attribution(),
             )
-            try:
-                pw = await selection.start_driver()
-            except Exception as start_error:
-                # Mark a fallback-eligible driver-start failure so the boundary can degrade once; a
-                # no-fallback selection (and CancelledError, a BaseException) propagates unchanged.
-                if selection.boot_fallback_selection is None:
-                    raise
-                raise BrowserEngineBootstrapError(f"{selection.name} driver failed to start") from start_error
+            launch_started = time.perf_counter()
+            pooled: PooledBrowser | None = None
+            if use_pool:
+                pooled = await self._acquire_pooled_browser(selection, proxy_location, extra_http_headers)
+            if pooled is not None:
+                pw = pooled.pw
+            else:
+                try:
+                    pw = await selection.start_driver()
+                except Exception as start_error:
+                    # Mark a fallback-eligible driver-start failure so the boundary can degrade once; a
+                    # no-fallback selection (and CancelledError, a BaseException) propagates unchanged.
+                    if selection.boot_fallback_selection is None:
+                        raise
+                    raise BrowserEngineBootstrapError(f"{selection.name} driver failed to start") from start_error
             try:
                 (
                     browser_context,
@@ -590,6 +608,9 @@ class RealBrowserManager(BrowserManager):
                     browser_cleanup,
                 ) = await BrowserContextFactory.create_browser_context(
                     pw,
+                    launched_browser=(
+                        (pooled.browser_context, pooled.browser_artifacts, pooled.browser_cleanup) if pooled else None
+                    ),
                     proxy_location=proxy_location,
                     url=url,
                     task_id=task_id,
@@ -604,6 +625,11 @@ class RealBrowserManager(BrowserManager):
                     browser_profile_id=browser_profile_id,
                     engine_selection=selection,
                 )
+                if pooled is not None and browser_context.pages:
+                    # The pooled launch bound downloads to a pool-owned dir; point them at this run's.
+                    await rebind_download_dir(
+                        None, resolve_run_download_id(skyvern_context.current()), page=browser_context.pages[0]
+                    )
             except BaseException:
                 # start() launched the local Node driver; stop it (time-bounded) so a failed context
                 # creation doesn't leak it, and never let a stop() error/timeout mask the original.
@@ -618,6 +644,10 @@ class RealBrowserManager(BrowserManager):
                         exc_info=True,
                     )
                 raise
+            record_browser_launch(
+                pool_hit=(pooled is not None) if use_pool else None,
+                launch_ms=(time.perf_counter() - launch_started) * 1000,
+            )
             return RealBrowserState(
                 pw=pw,
                 browser_context=browser_context,
@@ -652,6 +682,74 @@ class RealBrowserManager(BrowserManager):
             self._repin_engine_selection(run_key, replace(engine_selection, boot_fallback_selection=None))
         return state
 
+    async def prewarm_browser_pool(self) -> None:
+        """Start launching the pool's browsers at startup instead of on the first run's checkout.
+
+        Warms the launch keys of a run that sets neither proxy location nor extra headers: the run
+        API's residential default and the legacy task / workflow default of no proxy location.
+        """
+        if not WarmBrowserPool.is_eligible():
+            return
+        selection = await self.get_or_resolve_engine_selection(
+            run_key=None, context=BrowserEngineContext(browser_source=settings.BROWSER_TYPE)
+        )
+        for proxy_location in (ProxyLocation.RESIDENTIAL, None):
+            self.browser_pool.prewarm(*self._pooled_browser_launcher(selection, proxy_location, None))
+
+    async def close_browser_pool(self) -> None:
+        await self.browser_pool.close()
+
+    async def _acquire_pooled_browser(
+        self,
+        selection: BrowserEngineSelection,
+        proxy_location: ProxyLocationInput,
+        extra_http_headers: dict[str, str] | None,
+    ) -> PooledBrowser | None:
+        key, launcher = self._pooled_browser_launcher(selection, proxy_location, extra_http_headers)
+        return await self.browser_pool.acquire(key, launcher)
+
+    @staticmethod
+    def _pooled_browser_launcher(
+        selection: BrowserEngineSelection,
+        proxy_location: ProxyLocationInput,
+        extra_http_headers: dict[str, str] | None,
+    ) -> tuple[BrowserPoolKey, BrowserLauncher]:
+        key = BrowserPoolKey.build(
+            engine=selection.name,
+            proxy_location=proxy_location,
+            launch_headers=browser_launch_headers(extra_http_headers),
+        )
+
+        async def _launch() -> PooledBrowser:
+            started = time.perf_counter()
+            pw = await selection.start_driver()
+            try:
+                # A run-agnostic identity: the launch's download dir and HAR name must not borrow the
+                # run whose checkout triggered this refill (the task inherits its context).
+                pool_context = skyvern_context.SkyvernContext(run_id=f"browser_pool_{uuid.uuid4().hex}")
+                with skyvern_context.scoped(pool_context):
+                    launched = await BrowserContextFactory.launch_browser_context(
+                        pw, proxy_location=proxy_location, extra_http_headers=extra_http_headers
+                    )
+            except BaseException:
+                try:
+                    async with asyncio.timeout(BROWSER_CLOSE_TIMEOUT):
+                        await pw.stop()
+                except Exception:
+                    LOG.warning("Failed to stop Playwright driver after a pooled launch failure", exc_info=True)
+                raise
+            browser_context, browser_artifacts, browser_cleanup = launched
+            return PooledBrowser(
+                key=key,
+                pw=pw,
+                browser_context=browser_context,
+                browser_artifacts=browser_artifacts,
+                browser_cleanup=browser_cleanup,
+                launch_ms=(time.perf_counter() - started) * 1000,
+            )
+
+        return key, _launch
+
     def evict_page(self, page_id: str) -> None:
         self.pages.pop(page_id, None)
 
@@ -1250,6 +1348,7 @@ class RealBrowserManager(BrowserManager):
         self.pages = dict()
         for run_key in list(self._engine_owners):
             await self._drop_engine_owner(run_key)
+        await self.browser_pool.close()
         LOG.info("BrowserManger is closed")
 
     async def cleanup_for_task(
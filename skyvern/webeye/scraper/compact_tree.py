@@ -0,0 +1,104 @@
+"""Decoder for the compact element-tree wire format built by ``encodeCompactElementTree`` in
+domUtils.js.
+
+The nested ``[elements, element_tree]`` result of ``buildTreeFromBody`` carries every element dict
+in both structures and every key of every element, and the evaluate boundary serializes all of it
+value by value. The compact form is one JSON string: each element once, stored column by column
+(with low-cardinality strings interned), and the tree as parent indices. Decoding rebuilds the same
+structures, with each element dict shared between the flat list and the tree as Playwright's own
+deserializer shares them.
+
+The payload comes back from the page, so its shape is checked before anything is built from it:
+a malformed payload raises ``ValueError`` rather than producing a partial or cyclic tree.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+COMPACT_ELEMENT_TREE_VERSION = 1
+
+
+def _malformed(reason: str) -> ValueError:
+    return ValueError(f"Malformed compact element tree: {reason}")
+
+
+def _index_list(value: object, name: str, count: int) -> list[int]:
+    if not isinstance(value, list) or not all(type(item) is int for item in value):
+        raise _malformed(f"{name} is not a list of indices")
+    if any(item < -1 or item >= count for item in value):
+        raise _malformed(f"{name} has an index out of range")
+    return value
+
+
+def _column_map(data: dict, name: str) -> dict[str, Any]:
+    value = data.get(name, {})
+    if not isinstance(value, dict):
+        raise _malformed(f"{name} is not an object")
+    if "children" in value:
+        raise _malformed(f"{name} carries children")
+    return value
+
+
+def _dense_values(key: str, column: object, count: int) -> list[Any]:
+    if not isinstance(column, list) or len(column) != count:
+        raise _malformed(f"column {key!r} does not have one value per element")
+    return column
+
+
+def _interned_values(key: str, column: object, count: int) -> list[Any]:
+    if not isinstance(column, dict):
+        raise _malformed(f"interned column {key!r} is not an object")
+    strings = column.get("strings")
+    if not isinstance(strings, list):
+        raise _malformed(f"interned column {key!r} has no string table")
+    codes = _index_list(column.get("codes"), f"interned column {key!r}", len(strings))
+    if len(codes) != count or -1 in codes:
+        raise _malformed(f"interned column {key!r} does not have one code per element")
+    return [strings[code] for code in codes]
+
+
+def decode_compact_element_tree(payload: str | bytes) -> tuple[list[dict], list[dict]]:
+    """The ``(elements, element_tree)`` pair encoded in ``payload``."""
+    try:
+        data = json.loads(payload)
+    except (TypeError, ValueError) as e:
+        raise _malformed("not JSON") from e
+    if not isinstance(data, dict) or data.get("version") != COMPACT_ELEMENT_TREE_VERSION:
+        raise _malformed("unknown version")
+    count = data.get("count")
+    if type(count) is not int or count < 0:
+        raise _malformed("count is not a non-negative integer")
+    parents = _index_list(data.get("parents"), "parents", count)
+    if len(parents) != count:
+        raise _malformed("parents does not have one entry per element")
+    # The flat list is in walk order, so a parent always precedes its children; holding the
+    # payload to that also rules out cycles.
+    if any(parent >= index for index, parent in enumerate(parents)):
+        raise _malformed("an element's parent does not precede it")
+    roots = _index_list(data.get("roots"), "roots", count)
+    if -1 in roots:
+        raise _malformed("roots has an index out of range")
+
+    elements: list[dict] = [{} for _ in range(count)]
+    for key, column in _column_map(data, "columns").items():
+        for element, value in zip(elements, _dense_values(key, column, count)):
+            element[key] = value
+    for key, column in _column_map(data, "interned").items():
+        for element, value in zip(elements, _interned_values(key, column, count)):
+            element[key] = value
+    for key, entries in _column_map(data, "sparse").items():
+        if not isinstance(entries, dict):
+            raise _malformed(f"sparse column {key!r} is not an object")
+        for index, value in entries.items():
+            if not index.isdigit() or int(index) >= count:
+                raise _malformed(f"sparse column {key!r} has an index out of range")
+            elements[int(index)][key] = value
+
+    for element in elements:
+        element["children"] = []
+    for element, parent in zip(elements, parents):
+        if parent != -1:
+            elements[parent]["children"].append(element)
+    return elements, [elements[index] for index in roots]
@@ -93,6 +93,7 @@ class Rect {
 
 class DomUtils {
   static elementListCache = [];
+  static elementTreeCache = [];
   static visibleClientRectCache = new WeakMap();
   //
   // Bounds the rect by the current viewport dimensions. If the rect is offscreen or has a height or
@@ -360,8 +361,123 @@ class QuadTreeNode {
   }
 }
 
-// from playwright
+// Per-build memo for the element tree walk. The walk asks for the same element's computed style,
+// visibility and text several times (processElement, isInteractable, isHidden, buildElementObject)
+// and never yields to the page while it runs, so the answers cannot change between those reads.
+// Only active inside ScrapeMemo.run; outside it every helper reads the DOM directly.
+class ScrapeMemo {
+  static active = null;
+
+  constructor() {
+    this.styles = new WeakMap();
+    this.pseudoStyles = new Map();
+    this.visibility = new WeakMap();
+    this.texts = new WeakMap();
+    this.hits = 0;
+    this.misses = 0;
+  }
+
+  static run(fn) {
+    // A nested build (the exported builder called again by the page mid-walk) shares the outer memo.
+    if (ScrapeMemo.active) {
+      return fn(ScrapeMemo.active);
+    }
+    ScrapeMemo.active = new ScrapeMemo();
+    try {
+      return fn(ScrapeMemo.active);
+    } finally {
+      ScrapeMemo.active = null;
+    }
+  }
+
+  lookup(cache, key, compute) {
+    if (cache.has(key)) {
+      this.hits += 1;
+      return cache.get(key);
+    }
+    this.misses += 1;
+    const value = compute();
+    cache.set(key, value);
+    return value;
+  }
+
+  styleCache(pseudo) {
+    if (!pseudo) {
+      return this.styles;
+    }
+    let cache = this.pseudoStyles.get(pseudo);
+    if (!cache) {
+      cache = new WeakMap();
+      this.pseudoStyles.set(pseudo, cache);
+    }
+    return cache;
+  }
+}
+
+// Bounds one element tree walk by element count and wall time. Past either bound the walk stops
+// and returns the tree built so far, reporting which bound cut it short.
+class TreeBuildBudget {
+  // performance.now() is cheap but not free; the clock is read once per this many visited nodes.
+  static CLOCK_CHECK_INTERVAL = 64;
+
+  constructor(maxElementNumber = 0, timeBudgetMs = 0) {
+    this.maxElementNumber = maxElementNumber;
+    this.timeBudgetMs = timeBudgetMs;
+    this.startedAt = performance.now();
+    this.visited = 0;
+    this.truncatedBy = null;
+  }
+
+  // Called once per node before it is processed; true once the walk has to stop.
+  exhausted(elementCount) {
+    if (this.truncatedBy !== null) {
+      return true;
+    }
+    this.visited += 1;
+    if (this.maxElementNumber > 0 && elementCount >= this.maxElementNumber) {
+      this.truncatedBy = "element_limit";
+    } else if (
+      this.timeBudgetMs > 0 &&
+      this.visited % TreeBuildBudget.CLOCK_CHECK_INTERVAL === 0 &&
+      performance.now() - this.startedAt > this.timeBudgetMs
+    ) {
+      this.truncatedBy = "time_budget";
+    }
+    if (this.truncatedBy !== null) {
+      _jsConsoleWarn(
+        "Element tree building stopped early",
+        "reason=" + this.truncatedBy,
+        "elements=" + elementCount,
+      );
+      return true;
+    }
+    return false;
+  }
+
+  report(elementCount, memo) {
+    return {
+      elapsed_ms: Math.round(performance.now() - this.startedAt),
+      visited_nodes: this.visited,
+      element_count: elementCount,
+      truncated_by: this.truncatedBy,
+      memo_hits: memo ? memo.hits : 0,
+      memo_misses: memo ? memo.misses : 0,
+    };
+  }
+}
+
 function getElementComputedStyle(element, pseudo) {
+  const memo = ScrapeMemo.active;
+  if (memo) {
+    return memo.lookup(memo.styleCache(pseudo), element, () =>
+      readElementComputedStyle(element, pseudo),
+    );
+  }
+  return readElementComputedStyle(element, pseudo);
+}
+
+// from playwright
+function readElementComputedStyle(element, pseudo) {
   return element.ownerDocument && element.ownerDocument.defaultView
     ? element.ownerDocument.defaultView.getComputedStyle(element, pseudo)
     : undefined;
@@ -595,6 +711,16 @@ function isElementVisible(element, seen) {
   return true;
 }
 
+// isElementVisible, answered once per element during a tree walk: processElement and
+// isInteractable both ask, and getVisibleText asks about a parent once per text node.
+function isElementVisibleCached(element) {
+  const memo = ScrapeMemo.active;
+  if (!memo) {
+    return isElementVisible(element);
+  }
+  return memo.lookup(memo.visibility, element, () => isElementVisible(element));
+}
+
 // from playwright: https://github.com/microsoft/playwright/blob/1b65f26f0287c0352e76673bc5f85bc36c934b55/packages/playwright-core/src/server/injected/domUtils.ts#L121-L127
 function isVisibleTextNode(node) {
   // https://stackoverflow.com/questions/1461059/is-there-an-equivalent-to-getboundingclientrect-for-text-nodes
@@ -1249,7 +1375,7 @@ function isValidCSSSelector(selector) {
 }
 
 function isInteractable(element, hoverStylesMap) {
-  if (!isElementVisible(element)) {
+  if (!isElementVisibleCached(element)) {
     return false;
   }
 
@@ -1801,13 +1927,16 @@ function getVisibleText(element) {
   function collectVisibleText(node) {
     if (
       node.nodeType === Node.TEXT_NODE &&
-      isElementVisible(node.parentElement)
+      isElementVisibleCached(node.parentElement)
     ) {
       const trimmedText = node.data.trim();
       if (trimmedText.length > 0) {
         visibleText.push(trimmedText);
       }
-    } else if (node.nodeType === Node.ELEMENT_NODE && isElementVisible(node)) {
+    } else if (
+      node.nodeType === Node.ELEMENT_NODE &&
+      isElementVisibleCached(node)
+    ) {
       for (let child of node.childNodes) {
         collectVisibleText(child);
       }
@@ -1848,6 +1977,14 @@ function getElementText(element) {
   return visibleText.length > 0 ? visibleText.join(";") : "";
 }
 
+function getElementTextCached(element) {
+  const memo = ScrapeMemo.active;
+  if (!memo) {
+    return getElementText(element);
+  }
+  return memo.lookup(memo.texts, element, () => getElementText(element));
+}
+
 function getSelectOptions(element) {
   const options = Array.from(element.options);
   const selectOptions = [];
@@ -1896,6 +2033,17 @@ if (window.elementIdCounter === undefined) {
 // generate a unique id for the element
 // length is 4, the first character is from the frame index, the last 3 characters are from the counter,
 async function uniqueId() {
+  return formatUniqueId(await window.elementIdCounter.add());
+}
+
+// uniqueId for the synchronous tree walk. Both draw from the same counter; incrementing it here
+// cannot interleave with a pending add(), which increments and reads it in one synchronous step.
+function nextUniqueId() {
+  window.elementIdCounter.value += 1;
+  return formatUniqueId(window.elementIdCounter.value);
+}
+
+function formatUniqueId(count) {
   const characters =
     "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789";
   const base = characters.length;
@@ -1916,8 +2064,7 @@ async function uniqueId() {
     result += characters[c1];
   }
 
-  const countPart =
-    (await window.elementIdCounter.add()) % (base * base * base);
+  const countPart = count % (base * base * base);
   const c2 = Math.floor(countPart / (base * base));
   result += characters[c2];
   const c3 = Math.floor(countPart / base) % base;
@@ -2173,13 +2320,13 @@ function buildDestinationFacts(element, tagNameLower) {
   }
 }
 
-async function buildElementObject(
+function buildElementObject(
   frame,
   element,
   interactable,
   purgeable = false,
 ) {
-  var element_id = element.getAttribute("unique_id") ?? (await uniqueId());
+  var element_id = element.getAttribute("unique_id") ?? nextUniqueId();
   var elementTagNameLower = element.tagName.toLowerCase();
   element.setAttribute("unique_id", element_id);
 
@@ -2294,7 +2441,7 @@ async function buildElementObject(
     tagName: elementTagNameLower,
     attributes: attrs,
     beforePseudoText: getPseudoContent(element, "::before"),
-    text: getElementText(element),
+    text: getElementTextCached(element),
     afterPseudoText: getPseudoContent(element, "::after"),
     children: [],
     // if purgeable is True, which means this element is only used for building the tree relationship
@@ -2320,7 +2467,7 @@ async function buildElementObject(
     let shadowHostId = shadowHostEle.getAttribute("unique_id");
     // assign shadowHostId to the shadowHost element if it doesn't have unique_id
     if (!shadowHostId) {
-      shadowHostId = await uniqueId();
+      shadowHostId = nextUniqueId();
       shadowHostEle.setAttribute("unique_id", shadowHostId);
     }
     elementObj.shadowHost = shadowHostId;
@@ -2363,6 +2510,7 @@ async function buildTreeFromBody(
   frame_index = undefined,
   must_included_tags = [],
   captureDestinationFacts = false,
+  timeBudgetMs = 0,
 ) {
   if (
     window.GlobalSkyvernFrameIndex === undefined &&
@@ -2399,8 +2547,10 @@ async function buildTreeFromBody(
       undefined,
       maxElementNumber,
       must_included_tags,
+      timeBudgetMs,
     );
     DomUtils.elementListCache = elementsAndResultArray[0];
+    DomUtils.elementTreeCache = elementsAndResultArray[1];
     return elementsAndResultArray;
   } finally {
     if (ownsDestinationBudget) {
@@ -2410,6 +2560,100 @@ async function buildTreeFromBody(
   }
 }
 
+// buildTreeFromBody, returned as [compact tree JSON, walk stats]. See encodeCompactElementTree.
+async function buildCompactTreeFromBody(
+  frame = "main.frame",
+  frame_index = undefined,
+  must_included_tags = [],
+  captureDestinationFacts = false,
+  timeBudgetMs = 0,
+) {
+  const [elements, tree, stats] = await buildTreeFromBody(
+    frame,
+    frame_index,
+    must_included_tags,
+    captureDestinationFacts,
+    timeBudgetMs,
+  );
+  return [encodeCompactElementTree(elements, tree), stats];
+}
+
+// Compact wire format for a built element tree, decoded by skyvern/webeye/scraper/compact_tree.py.
+// The nested [elements, tree] result holds every element twice and spells out every key of every
+// element; this sends each element once, column by column, and the tree as parent indices:
+//   count    number of elements, in the flat list's order
+//   parents  index of each element's parent, or -1 (parents always precede their children)
+//   roots    indices of the tree's top-level elements; an element neither reachable from a root
+//            nor a root itself is in the flat list only
+//   columns  key -> one value per element, for keys every element has
+//   interned key -> {strings, codes}, the same for low-cardinality string keys such as tagName
+//   sparse   key -> {index: value}, for keys only some elements have
+// It is returned as one JSON string, so the page serializes it once and Python parses it once.
+function encodeCompactElementTree(elements, tree) {
+  const count = elements.length;
+  const indexOf = new Map();
+  elements.forEach((element, index) => indexOf.set(element, index));
+
+  const parents = new Array(count).fill(-1);
+  const entriesByKey = new Map();
+  elements.forEach((element, index) => {
+    for (const child of element.children ?? []) {
+      const childIndex = indexOf.get(child);
+      if (childIndex !== undefined) {
+        parents[childIndex] = index;
+      }
+    }
+    for (const key of Object.keys(element)) {
+      if (key === "children") continue;
+      let entries = entriesByKey.get(key);
+      if (!entries) {
+        entries = [];
+        entriesByKey.set(key, entries);
+      }
+      // Playwright hands an undefined property to Python as None; JSON would drop it.
+      entries.push([index, element[key] === undefined ? null : element[key]]);
+    }
+  });
+
+  const columns = {};
+  const interned = {};
+  const sparse = {};
+  for (const [key, entries] of entriesByKey) {
+    if (entries.length < count) {
+      sparse[key] = Object.fromEntries(entries);
+      continue;
+    }
+    const values = entries.map((entry) => entry[1]);
+    if (values.every((value) => typeof value === "string")) {
+      const strings = [...new Set(values)];
+      if (strings.length * 2 <= count) {
+        const codeOf = new Map(strings.map((value, code) => [value, code]));
+        interned[key] = { strings, codes: values.map((v) => codeOf.get(v)) };
+        continue;
+      }
+    }
+    columns[key] = values;
+  }
+
+  const roots = [];
+  for (const node of tree) {
+    const index = indexOf.get(node);
+    if (index !== undefined) {
+      roots.push(index);
+    }
+  }
+
+  return JSON.stringify({
+    version: 1,
+    count,
+    parents,
+    roots,
+    columns,
+    interned,
+    sparse,
+  });
+}
+
 async function buildElementTree(
   starter = document.documentElement,
   frame,
@@ -2417,6 +2661,7 @@ async function buildElementTree(
   hoverStylesMap = undefined,
   maxElementNumber = 0,
   must_included_tags = [],
+  timeBudgetMs = 0,
 ) {
   // Generate hover styles map at the start
   if (hoverStylesMap === undefined) {
@@ -2435,8 +2680,12 @@ async function buildElementTree(
 
   var elements = [];
   var resultArray = [];
+  const elementsById = new Map();
+  const budget = new TreeBuildBudget(maxElementNumber, timeBudgetMs);
 
-  async function processElement(
+  // Synchronous on purpose: an await per node was the walk's main overhead on large pages, and
+  // ScrapeMemo relies on the page not running between two nodes.
+  function processElement(
     element,
     parentId,
     parent_xpath,
@@ -2447,10 +2696,7 @@ async function buildElementTree(
       return;
     }
 
-    if (maxElementNumber > 0 && elements.length >= maxElementNumber) {
-      _jsConsoleWarn(
-        "Max element number reached, aborting the element tree building",
-      );
+    if (budget.exhausted(elements.length)) {
       return;
     }
 
@@ -2493,7 +2739,7 @@ async function buildElementTree(
     if (element.shadowRoot) {
       shadowDOMchildren = getChildElements(element.shadowRoot);
     }
-    const isVisible = isElementVisible(element);
+    const isVisible = isElementVisibleCached(element);
     if (isVisible && !isHidden(element) && !isScriptOrStyle(element)) {
       let interactable = isInteractable(element, hoverStylesMap);
       let elementObj = null;
@@ -2502,59 +2748,49 @@ async function buildElementTree(
         interactable = true;
       }
       if (interactable) {
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (
         tagName === "frameset" ||
         tagName === "iframe" ||
         tagName === "frame"
       ) {
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (element.shadowRoot) {
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (isTableRelatedElement(element)) {
         // build all table related elements into skyvern element
         // we need these elements to preserve the DOM structure
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (hasBeforeOrAfterPseudoContent(element)) {
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (tagName === "svg") {
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (
         (isParentSVG = element.closest("svg")) &&
         isParentSVG.getAttribute("unique_id")
       ) {
         // if element is the children of the <svg> with an unique_id
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (tagName === "div" && isDOMNodeRepresentDiv(element)) {
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (
         tagName === "embed" &&
         element.getAttribute("type")?.toLowerCase() === "application/pdf"
       ) {
-        elementObj = await buildElementObject(
-          frame,
-          element,
-          interactable,
-          true,
-        );
+        elementObj = buildElementObject(frame, element, interactable, true);
       } else if (
-        getElementText(element).length > 0 &&
-        getElementText(element).length <= 5000
+        getElementTextCached(element).length > 0 &&
+        getElementTextCached(element).length <= 5000
       ) {
         if (window.GlobalEnableAllTextualElements) {
           // force all textual elements to be interactable
           interactable = true;
         }
-        elementObj = await buildElementObject(frame, element, interactable);
+        elementObj = buildElementObject(frame, element, interactable);
       } else if (full_tree) {
         // when building full tree, we only get text from element itself
         // elements without text are purgeable
-        elementObj = await buildElementObject(
-          frame,
-          element,
-          interactable,
-          true,
-        );
+        elementObj = buildElementObject(frame, element, interactable, true);
         if (elementObj.text.length > 0) {
           elementObj.purgeable = false;
         }
@@ -2563,6 +2799,7 @@ async function buildElementTree(
       if (elementObj) {
         elementObj.xpath = current_xpath;
         elements.push(elementObj);
+        elementsById.set(elementObj.id, elementObj);
         // If the element is interactable but has no interactable parent,
         // then it starts a new tree, so add it to the result array
         // and set its id as the interactable parent id for the next elements
@@ -2570,9 +2807,7 @@ async function buildElementTree(
         if (parentId === null) {
           resultArray.push(elementObj);
         } else {
-          const parentElement = elements.find(
-            (element) => element.id === parentId,
-          );
+          const parentElement = elementsById.get(parentId);
           if (parentElement) {
             if (!parentElement.children) {
               _jsConsoleWarn(
@@ -2615,7 +2850,7 @@ async function buildElementTree(
         current_node_index = current_node_index + 1;
       }
       xpathMap.set(tagName, current_node_index);
-      await processElement(
+      processElement(
         childElement,
         parentId,
         current_xpath,
@@ -2626,7 +2861,7 @@ async function buildElementTree(
     // FIXME: xpath won't work when the element is in shadow DOM
     for (let i = 0; i < shadowDOMchildren.length; i++) {
       const childElement = shadowDOMchildren[i];
-      await processElement(childElement, parentId, null, 0);
+      processElement(childElement, parentId, null, 0);
     }
     return;
   }
@@ -2686,7 +2921,10 @@ async function buildElementTree(
   }
 
   // setup before parsing the dom
-  await processElement(starter, null, current_xpath, 1);
+  const stats = ScrapeMemo.run((memo) => {
+    processElement(starter, null, current_xpath, 1);
+    return budget.report(elements.length, memo);
+  });
 
   for (var element of elements) {
     if (
@@ -2708,7 +2946,7 @@ async function buildElementTree(
     trimDuplicatedText(root);
   });
 
-  return [elements, resultArray];
+  return [elements, resultArray, stats];
 }
 
 // DEPRECATED: visual bounding box overlay is no longer rendered during scraping.
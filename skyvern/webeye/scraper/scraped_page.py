@@ -40,6 +40,36 @@ class ScrapeFrameDecision:
 
 ScrapeExcludeFunc = Callable[[Page, Frame], Awaitable[ScrapeFrameDecision]]
 
+
+@dataclass(frozen=True)
+class ElementTreeDelta:
+    """Element-level difference between two consecutive scrapes of the same page.
+
+    Computed from ``id_to_element_hash``. An element hash covers the element's whole subtree, so an
+    ancestor of any added, removed or changed element is itself reported as changed.
+    """
+
+    added_ids: frozenset[str] = frozenset()
+    removed_ids: frozenset[str] = frozenset()
+    changed_ids: frozenset[str] = frozenset()
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added_ids or self.removed_ids or self.changed_ids)
+
+    @classmethod
+    def between(cls, previous: dict[str, str], current: dict[str, str]) -> "ElementTreeDelta":
+        return cls(
+            added_ids=frozenset(current.keys() - previous.keys()),
+            removed_ids=frozenset(previous.keys() - current.keys()),
+            changed_ids=frozenset(
+                element_id
+                for element_id, element_hash in current.items()
+                if element_id in previous and previous[element_id] != element_hash
+            ),
+        )
+
+
 ELEMENT_NODE_ATTRIBUTES = {
     "id",
 }
@@ -217,6 +247,9 @@ class ScrapedPage(BaseModel, ElementTreeBuilder):
     html: str = ""
     extracted_text: str | None = None
     window_dimension: dict[str, int] | None = None
+    # Only populated by incremental scrapes (ENABLE_INCREMENTAL_SCRAPE) that have a previous scrape
+    # of the same page URL to diff against.
+    element_tree_delta: ElementTreeDelta | None = None
     _browser_state: "BrowserState" = PrivateAttr()
     _clean_up_func: CleanupElementTreeFunc = PrivateAttr()
     _scrape_exclude: ScrapeExcludeFunc | None = PrivateAttr(default=None)
@@ -498,6 +531,7 @@ class ScrapedPage(BaseModel, ElementTreeBuilder):
         self.html = refreshed_page.html
         self.extracted_text = refreshed_page.extracted_text
         self.url = refreshed_page.url
+        self.element_tree_delta = refreshed_page.element_tree_delta
         # Defensive: callers today rebuild before reading, but future direct
         # reads of this field post-refresh would otherwise see stale HTML.
         self.last_used_element_tree_html = None
@@ -1,8 +1,10 @@
 import asyncio
 import copy
 import json
+import time
+import weakref
 from collections import defaultdict
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import structlog
 from opentelemetry import trace as otel_trace
@@ -39,6 +41,7 @@ from skyvern.webeye.browser_state import BrowserState
 from skyvern.webeye.scraper.scraped_page import (
     CleanupElementTreeFunc,
     ElementTreeBuilder,
+    ElementTreeDelta,
     ElementTreeFormat,
     ScrapedPage,
     ScrapeExcludeFunc,
@@ -190,8 +193,10 @@ def clean_element_before_hashing(element: dict) -> dict:
 
 _ELEMENT_TREE_IMMUTABLE_LEAF = (str, bytes, bool, int, float, type(None))
 
+_T = TypeVar("_T")
 
-def _deepcopy_element_tree(element_tree: list[dict]) -> list[dict]:
+
+def _deepcopy_element_tree(element_tree: _T) -> _T:
     """Deep copy the scraped element tree without ``copy.deepcopy``'s generic overhead.
 
     The tree is normally pure JSON-like data (only dict/list mutable containers with immutable
@@ -227,12 +232,58 @@ def _deepcopy_element_tree(element_tree: list[dict]) -> list[dict]:
     return copy_value(element_tree)
 
 
-def hash_element(element: dict) -> str:
-    hash_ready_element = clean_element_before_hashing(element)
-    # Sort the keys to ensure consistent ordering
-    element_string = json.dumps(hash_ready_element, sort_keys=True)
+_HASH_EXCLUDED_KEYS = frozenset({"id", "rect", "frame_index"})
 
-    return calculate_sha256(element_string)
+
+def _canonical_subtree_json(
+    element: dict,
+    digests: dict[int, str] | None,
+    *,
+    hash_ready: bool = False,
+) -> str:
+    """Serialize ``element`` exactly as ``json.dumps(element, sort_keys=True)`` would, digesting every node.
+
+    Each child is serialized once and spliced into its parent, so digesting every subtree of the tree
+    costs one encode per node instead of one per (node, ancestor) pair. ``digests`` is keyed by
+    ``id(node)`` and only valid while the tree is alive and unmodified.
+
+    With ``hash_ready`` every node is serialized as ``clean_element_before_hashing`` would leave it,
+    so the digest of a node equals ``hash_element(node)``.
+    """
+    parts = []
+    for key in sorted(element):
+        if hash_ready and key in _HASH_EXCLUDED_KEYS:
+            continue
+        value = element[key]
+        if key == "children" and isinstance(value, list):
+            encoded = (
+                "["
+                + ", ".join(
+                    _canonical_subtree_json(child, digests, hash_ready=hash_ready)
+                    if isinstance(child, dict)
+                    else json.dumps(child, sort_keys=True)
+                    for child in value
+                )
+                + "]"
+            )
+        elif hash_ready and key == "attributes":
+            encoded = json.dumps(
+                {attr_key: attr_value for attr_key, attr_value in value.items() if attr_key != SKYVERN_ID_ATTR},
+                sort_keys=True,
+            )
+        else:
+            encoded = json.dumps(value, sort_keys=True)
+        parts.append(f"{json.dumps(key)}: {encoded}")
+    serialized = "{" + ", ".join(parts) + "}"
+    if digests is not None:
+        digests[id(element)] = calculate_sha256(serialized)
+    return serialized
+
+
+def hash_element(element: dict) -> str:
+    # Same bytes as json.dumps(clean_element_before_hashing(element), sort_keys=True): element hashes are
+    # persisted by cached actions, so the serialization must never drift.
+    return calculate_sha256(_canonical_subtree_json(element, None, hash_ready=True))
 
 
 def build_element_dict(
@@ -244,19 +295,145 @@ def build_element_dict(
     id_to_element_hash: dict[str, str] = {}
     hash_to_element_ids: dict[str, list[str]] = {}
 
+    # An element's hash covers its whole subtree, and the flat list holds ancestors and descendants
+    # alike. Hashing bottom-up records every descendant's hash on the way, so elements the flat list
+    # shares with an already-hashed subtree are looked up instead of re-serialized.
+    element_hashes: dict[int, str] = {}
     for element in elements:
         element_id: str = element.get("id", "")
         # get_interactable_element_tree marks each interactable element with a SKYVERN_ID_ATTR attribute
         id_to_css_dict[element_id] = f"[{SKYVERN_ID_ATTR}='{element_id}']"
         id_to_element_dict[element_id] = element
         id_to_frame_dict[element_id] = element["frame"]
-        element_hash = hash_element(element)
+        element_hash = element_hashes.get(id(element))
+        if element_hash is None:
+            _canonical_subtree_json(element, element_hashes, hash_ready=True)
+            element_hash = element_hashes[id(element)]
         id_to_element_hash[element_id] = element_hash
-        hash_to_element_ids[element_hash] = hash_to_element_ids.get(element_hash, []) + [element_id]
+        hash_to_element_ids.setdefault(element_hash, []).append(element_id)
 
     return id_to_css_dict, id_to_element_dict, id_to_frame_dict, id_to_element_hash, hash_to_element_ids
 
 
+async def build_element_dict_off_loop(
+    elements: list[dict],
+) -> tuple[dict[str, str], dict[str, dict], dict[str, str], dict[str, str], dict[str, list[str]]]:
+    """``build_element_dict`` that moves very large pages to a worker thread.
+
+    Hashing is pure CPU, so a 20k-element grid would otherwise block every other run sharing the
+    event loop. The freshly scraped elements are not reachable by anything else while it runs.
+    """
+    threshold = settings.ELEMENT_HASHING_THREAD_THRESHOLD
+    if threshold > 0 and len(elements) >= threshold:
+        return await asyncio.to_thread(build_element_dict, elements)
+    return build_element_dict(elements)
+
+
+class _IncrementalScrapeState:
+    """What the previous scrape of a page leaves behind for the next one.
+
+    Trimming and HTML rendering are pure functions of a cleaned subtree, so their results are
+    memoized by the subtree's content digest: a subtree the action did not touch is copied out of
+    the memo instead of being deep-copied and trimmed node by node. The memo only holds the last
+    scrape's subtrees, and its entries are private copies that are never handed out directly.
+    """
+
+    def __init__(self, enriched_tree: bool) -> None:
+        self.enriched_tree = enriched_tree
+        self.url: str | None = None
+        self.id_to_element_hash: dict[str, str] | None = None
+        self.reused_subtrees = 0
+        self._trimmed_subtrees: dict[str, dict] = {}
+        self._root_html: dict[str, str] = {}
+        self._root_digests: list[str] = []
+
+    def trim_element_tree(self, element_tree: list[dict]) -> list[dict]:
+        digests: dict[int, str] = {}
+        try:
+            for element in element_tree:
+                _canonical_subtree_json(element, digests)
+        except (RecursionError, TypeError, ValueError):
+            # Not plain acyclic JSON (a page-controlled payload can make it so); trim it the regular way.
+            LOG.warning("Element tree cannot be digested, skipping incremental trim", exc_info=True)
+            self._trimmed_subtrees = {}
+            self._root_html = {}
+            self._root_digests = []
+            self.reused_subtrees = 0
+            return trim_element_tree(_deepcopy_element_tree(element_tree))
+
+        previous = self._trimmed_subtrees
+        reused = 0
+
+        def trim_subtree(element: dict) -> dict:
+            nonlocal reused
+            cached = previous.get(digests[id(element)])
+            if cached is not None:
+                reused += 1
+                return _deepcopy_element_tree(cached)
+            trimmed = _deepcopy_element_tree({key: value for key, value in element.items() if key != "children"})
+            if "children" in element:
+                trimmed["children"] = [trim_subtree(child) for child in element["children"]]
+            _trim_element_node(trimmed)
+            return trimmed
+
+        element_tree_trimmed = [trim_subtree(element) for element in element_tree]
+
+        # trimming never drops a non-empty children list, so the trimmed tree mirrors the cleaned one
+        snapshot: dict[str, dict] = {}
+
+        def record(element: dict, private: dict) -> None:
+            snapshot.setdefault(digests[id(element)], private)
+            for child, private_child in zip(element.get("children") or [], private.get("children") or []):
+                record(child, private_child)
+
+        for element, private in zip(element_tree, _deepcopy_element_tree(element_tree_trimmed)):
+            record(element, private)
+
+        root_digests = [digests[id(element)] for element in element_tree]
+        self._root_html = {digest: html for digest, html in self._root_html.items() if digest in root_digests}
+        self._root_digests = root_digests
+        self._trimmed_subtrees = snapshot
+        self.reused_subtrees = reused
+        return element_tree_trimmed
+
+    def build_html_tree(self, element_tree_trimmed: list[dict]) -> str:
+        """HTML of the tree last returned by ``trim_element_tree``, without skyvern attributes."""
+        if len(element_tree_trimmed) != len(self._root_digests):
+            return "".join(json_to_html(element, need_skyvern_attrs=False) for element in element_tree_trimmed)
+        parts = []
+        for digest, element in zip(self._root_digests, element_tree_trimmed):
+            html = self._root_html.get(digest)
+            if html is None:
+                html = json_to_html(element, need_skyvern_attrs=False)
+                self._root_html[digest] = html
+            parts.append(html)
+        return "".join(parts)
+
+    def diff(self, url: str, id_to_element_hash: dict[str, str]) -> ElementTreeDelta | None:
+        """Delta against the previous scrape of the same URL; None when there is nothing to diff against."""
+        delta = None
+        if self.url == url and self.id_to_element_hash is not None:
+            delta = ElementTreeDelta.between(self.id_to_element_hash, id_to_element_hash)
+        self.url = url
+        self.id_to_element_hash = id_to_element_hash
+        return delta
+
+
+_INCREMENTAL_SCRAPE_STATES: weakref.WeakKeyDictionary[Page, _IncrementalScrapeState] = weakref.WeakKeyDictionary()
+
+
+def _get_incremental_scrape_state(page: Page) -> _IncrementalScrapeState | None:
+    if not settings.ENABLE_INCREMENTAL_SCRAPE:
+        return None
+    # the trimmed form depends on which attributes are reserved, so a flip drops the memo
+    enriched_tree = _reserved_attributes_for_context() is ENRICHED_RESERVED_ATTRIBUTES
+    state = _INCREMENTAL_SCRAPE_STATES.get(page)
+    if state is None or state.enriched_tree != enriched_tree:
+        state = _IncrementalScrapeState(enriched_tree=enriched_tree)
+        _INCREMENTAL_SCRAPE_STATES[page] = state
+    return state
+
+
 async def scrape_website(
     browser_state: BrowserState,
     url: str,
@@ -492,6 +669,101 @@ def _record_scrape_span_attrs(
         span.set_attribute("screenshots_consumed", ctx.scrape_screenshots_consumed)
 
 
+async def _get_page_html(
+    page: Page, url: str, engine_selection: "BrowserEngineSelection | None"
+) -> tuple[str, Resolution | None]:
+    html = ""
+    window_dimension: Resolution | None = None
+    try:
+        skyvern_frame = await SkyvernFrame.create_instance(frame=page, engine_selection=engine_selection)
+        html = await skyvern_frame.get_content()
+        if page.viewport_size:
+            window_dimension = Resolution(width=page.viewport_size["width"], height=page.viewport_size["height"])
+    except Exception:
+        LOG.error(
+            "Failed out to get HTML content",
+            url=url,
+            exc_info=True,
+        )
+    return html, window_dimension
+
+
+def _consume_abandoned_fetch_result(fetch: asyncio.Future) -> None:
+    if not fetch.cancelled():
+        fetch.exception()
+
+
+class _PageContentFetch:
+    """Visible text and HTML of the page, fetched inline or overlapped with the rest of the scrape.
+
+    Both are read-only and independent of the scroll position. Once started, their CDP round trips
+    run concurrently with each other and with the rest of the scrape until ``result`` is awaited.
+    Each fetch records how long it took on the scrape span.
+    """
+
+    def __init__(
+        self,
+        page: Page,
+        url: str,
+        scrape_exclude: ScrapeExcludeFunc | None,
+        engine_selection: "BrowserEngineSelection | None",
+    ) -> None:
+        self.page = page
+        self.url = url
+        self.scrape_exclude = scrape_exclude
+        self.engine_selection = engine_selection
+        self._span = otel_trace.get_current_span()
+        self._fetch: asyncio.Future[tuple[str, tuple[str, Resolution | None]]] | None = None
+
+    @property
+    def started(self) -> bool:
+        return self._fetch is not None
+
+    async def start(self) -> None:
+        if self._fetch is not None:
+            return
+        self._fetch = asyncio.gather(self._get_text(), self._get_html())
+        # the scrape can fail before awaiting it; don't log "Task exception was never retrieved"
+        self._fetch.add_done_callback(_consume_abandoned_fetch_result)
+        # let both fetches put their requests on the wire before the caller carries on
+        await asyncio.sleep(0)
+
+    def cancel(self) -> None:
+        if self._fetch is not None:
+            self._fetch.cancel()
+
+    async def result(self) -> tuple[str, str, Resolution | None]:
+        if self._fetch is None:
+            text_content = await self._get_text()
+            html, window_dimension = await self._get_html()
+        else:
+            text_content, (html, window_dimension) = await self._fetch
+        return text_content, html, window_dimension
+
+    async def _get_text(self) -> str:
+        started_at = time.perf_counter()
+        text = await get_frame_text(self.page.main_frame, self.scrape_exclude)
+        self._span.set_attribute("text_ms", int((time.perf_counter() - started_at) * 1000))
+        return text
+
+    async def _get_html(self) -> tuple[str, Resolution | None]:
+        started_at = time.perf_counter()
+        result = await _get_page_html(self.page, self.url, self.engine_selection)
+        self._span.set_attribute("html_ms", int((time.perf_counter() - started_at) * 1000))
+        return result
+
+
+def _record_incremental_scrape_span_attrs(
+    state: _IncrementalScrapeState, element_tree_delta: ElementTreeDelta | None
+) -> None:
+    span = otel_trace.get_current_span()
+    span.set_attribute("incremental_reused_subtrees", state.reused_subtrees)
+    if element_tree_delta is not None:
+        span.set_attribute("delta_added_elements", len(element_tree_delta.added_ids))
+        span.set_attribute("delta_removed_elements", len(element_tree_delta.removed_ids))
+        span.set_attribute("delta_changed_elements", len(element_tree_delta.changed_ids))
+
+
 @traced(name="skyvern.agent.scrape")
 async def scrape_web_unsafe(
     browser_state: BrowserState,
@@ -568,109 +840,134 @@ async def scrape_web_unsafe(
             engine_selection=browser_state.engine_selection,
         )
 
-    element_tree = await cleanup_element_tree(page, url, _deepcopy_element_tree(element_tree))
-    element_tree_trimmed = trim_element_tree(_deepcopy_element_tree(element_tree))
-
-    screenshots = []
-    if take_screenshots:
-        element_tree_trimmed_html_str = "".join(
-            json_to_html(element, need_skyvern_attrs=False) for element in element_tree_trimmed
-        )
-        token_count = approx_count_tokens(element_tree_trimmed_html_str)
-        if token_count > DEFAULT_MAX_TOKENS:
-            max_screenshot_number = min(max_screenshot_number, 1)
-
-        # Shadow-detect an open transient popup only on the agent-step scrape (opt-in via
-        # allow_transient_ui_suppression); goal-verification / extraction / error-detection scrapes
-        # keep legacy scrolling. Only the treatment arm suppresses the scroll so the popup survives
-        # into the just-built tree's next action, and only up to a bounded number of consecutive
-        # captures so a stale expanded trigger cannot pin the run at one viewport.
-        popup_trigger: dict | None = None
-        transient_ui_ctx = skyvern_context.current()
-        arm = transient_ui_capture_arm(transient_ui_ctx)
-        suppress_scroll = False
-        suppression_capped = False
-        if allow_transient_ui_suppression and scroll and arm != "off":
-            popup_trigger = await skyvern_frame.get_open_aria_popup_trigger()
-            decision = decide_transient_ui_suppression(transient_ui_ctx, arm, detected=popup_trigger is not None)
-            suppress_scroll = decision.suppress
-            suppression_capped = decision.capped
-        effective_scroll = scroll and not suppress_scroll
-
-        # get current x, y position of the page
-        x: int | None = None
-        y: int | None = None
-        try:
-            x, y = await skyvern_frame.get_scroll_x_y()
-            LOG.debug("Current x, y position of the page before scraping", x=x, y=y)
-        except Exception:
-            LOG.warning("Failed to get current x, y position of the page", exc_info=True)
-
-        _tracer = otel_trace.get_tracer("skyvern")
-        with traced_span(_tracer, "skyvern.browser.scrape_screenshot") as _ss_span:
-            apply_context_attrs(_ss_span)
-            # Hardcoded since this is an inline span, not a @traced method.
-            # Update if scrape_web_unsafe is renamed.
-            _ss_span.set_attribute("code.function", "scrape_web_unsafe.screenshot")
-            _ss_span.set_attribute("code.namespace", __name__)
-            _ss_span.set_attribute("max_screenshot_number", max_screenshot_number)
-            _ss_span.set_attribute("draw_boxes", draw_boxes)
-            _ss_span.set_attribute("scroll", scroll)
-            _ss_span.set_attribute("effective_scroll", effective_scroll)
-            if arm != "off":
-                _ss_span.set_attribute("transient_ui_arm", arm)
-            if popup_trigger is not None:
-                _ss_span.set_attribute("transient_ui_detected", True)
-                emit_transient_ui_popup_telemetry(_ss_span, popup_trigger)
-                if suppress_scroll:
-                    _ss_span.set_attribute("transient_ui_scroll_suppressed", True)
-                if suppression_capped:
-                    _ss_span.set_attribute("transient_ui_suppression_capped", True)
-            _scrape_ctx = skyvern_context.current()
-            if _scrape_ctx:
-                if _scrape_ctx.scrape_trigger:
-                    _ss_span.set_attribute("scrape_trigger", _scrape_ctx.scrape_trigger)
-                if _scrape_ctx.scrape_screenshots_consumed is not None:
-                    _ss_span.set_attribute("screenshots_consumed", _scrape_ctx.scrape_screenshots_consumed)
-            screenshots = await SkyvernFrame.take_split_screenshots(
-                page=page,
-                url=url,
-                draw_boxes=draw_boxes,
-                max_number=max_screenshot_number,
-                scroll=effective_scroll,
-                engine_selection=browser_state.engine_selection,
-            )
-            _ss_span.set_attribute("screenshot_count", len(screenshots))
-            _ss_span.set_attribute("screenshot_bytes", sum(len(s) for s in screenshots))
-
-        # scroll back to the original x, y position of the page
-        if x is not None and y is not None:
-            await skyvern_frame.safe_scroll_to_x_y(x, y)
-            LOG.debug("Scrolled back to the original x, y position of the page after scraping", x=x, y=y)
-
-    id_to_css_dict, id_to_element_dict, id_to_frame_dict, id_to_element_hash, hash_to_element_ids = build_element_dict(
-        elements
-    )
-
-    # if there are no elements, fail the scraping unless support_empty_page is True
-    if not elements and not support_empty_page:
-        raise NoElementFound()
-
-    text_content = await get_frame_text(page.main_frame, scrape_exclude)
-
-    html = ""
-    window_dimension = None
+    # Pipelined mode fetches text and HTML while the rest of the scrape runs. It has to wait for the
+    # element tree (which stamps the skyvern ids the HTML carries) and, when screenshots scroll the
+    # page, for the screenshots too: scrolling can lazy-load content the text and HTML must include.
+    pipelined = settings.ENABLE_PIPELINED_SCRAPE
+    page_content = _PageContentFetch(page, url, scrape_exclude, browser_state.engine_selection)
+    # a fetch still pending when the scrape fails (an empty page, a screenshot error, a
+    # cancellation) must not keep running against the page with nobody awaiting it
     try:
-        skyvern_frame = await SkyvernFrame.create_instance(frame=page, engine_selection=browser_state.engine_selection)
-        html = await skyvern_frame.get_content()
-        if page.viewport_size:
-            window_dimension = Resolution(width=page.viewport_size["width"], height=page.viewport_size["height"])
-    except Exception:
-        LOG.error(
-            "Failed out to get HTML content",
-            url=url,
-            exc_info=True,
-        )
+        if pipelined and not (take_screenshots and scroll):
+            await page_content.start()
+
+        element_tree = await cleanup_element_tree(page, url, _deepcopy_element_tree(element_tree))
+        incremental_state = _get_incremental_scrape_state(page)
+        if incremental_state is not None:
+            element_tree_trimmed = incremental_state.trim_element_tree(element_tree)
+        else:
+            element_tree_trimmed = trim_element_tree(_deepcopy_element_tree(element_tree))
+
+        screenshots = []
+        if take_screenshots:
+            if incremental_state is not None:
+                element_tree_trimmed_html_str = incremental_state.build_html_tree(element_tree_trimmed)
+            else:
+                element_tree_trimmed_html_str = "".join(
+                    json_to_html(element, need_skyvern_attrs=False) for element in element_tree_trimmed
+                )
+            token_count = approx_count_tokens(element_tree_trimmed_html_str)
+            if token_count > DEFAULT_MAX_TOKENS:
+                max_screenshot_number = min(max_screenshot_number, 1)
+
+            # Shadow-detect an open transient popup only on the agent-step scrape (opt-in via
+            # allow_transient_ui_suppression); goal-verification / extraction / error-detection scrapes
+            # keep legacy scrolling. Only the treatment arm suppresses the scroll so the popup survives
+            # into the just-built tree's next action, and only up to a bounded number of consecutive
+            # captures so a stale expanded trigger cannot pin the run at one viewport.
+            popup_trigger: dict | None = None
+            transient_ui_ctx = skyvern_context.current()
+            arm = transient_ui_capture_arm(transient_ui_ctx)
+            suppress_scroll = False
+            suppression_capped = False
+            if allow_transient_ui_suppression and scroll and arm != "off":
+                popup_trigger = await skyvern_frame.get_open_aria_popup_trigger()
+                decision = decide_transient_ui_suppression(transient_ui_ctx, arm, detected=popup_trigger is not None)
+                suppress_scroll = decision.suppress
+                suppression_capped = decision.capped
+            effective_scroll = scroll and not suppress_scroll
+
+            # get current x, y position of the page
+            x: int | None = None
+            y: int | None = None
+            try:
+                x, y = await skyvern_frame.get_scroll_x_y()
+                LOG.debug("Current x, y position of the page before scraping", x=x, y=y)
+            except Exception:
+                LOG.warning("Failed to get current x, y position of the page", exc_info=True)
+
+            _tracer = otel_trace.get_tracer("skyvern")
+            with traced_span(_tracer, "skyvern.browser.scrape_screenshot") as _ss_span:
+                _screenshot_started_at = time.perf_counter()
+                apply_context_attrs(_ss_span)
+                # Hardcoded since this is an inline span, not a @traced method.
+                # Update if scrape_web_unsafe is renamed.
+                _ss_span.set_attribute("code.function", "scrape_web_unsafe.screenshot")
+                _ss_span.set_attribute("code.namespace", __name__)
+                _ss_span.set_attribute("max_screenshot_number", max_screenshot_number)
+                _ss_span.set_attribute("draw_boxes", draw_boxes)
+                _ss_span.set_attribute("scroll", scroll)
+                _ss_span.set_attribute("effective_scroll", effective_scroll)
+                if arm != "off":
+                    _ss_span.set_attribute("transient_ui_arm", arm)
+                if popup_trigger is not None:
+                    _ss_span.set_attribute("transient_ui_detected", True)
+                    emit_transient_ui_popup_telemetry(_ss_span, popup_trigger)
+                    if suppress_scroll:
+                        _ss_span.set_attribute("transient_ui_scroll_suppressed", True)
+                    if suppression_capped:
+                        _ss_span.set_attribute("transient_ui_suppression_capped", True)
+                _scrape_ctx = skyvern_context.current()
+                if _scrape_ctx:
+                    if _scrape_ctx.scrape_trigger:
+                        _ss_span.set_attribute("scrape_trigger", _scrape_ctx.scrape_trigger)
+                    if _scrape_ctx.scrape_screenshots_consumed is not None:
+                        _ss_span.set_attribute("screenshots_consumed", _scrape_ctx.scrape_screenshots_consumed)
+                screenshots = await SkyvernFrame.take_split_screenshots(
+                    page=page,
+                    url=url,
+                    draw_boxes=draw_boxes,
+                    max_number=max_screenshot_number,
+                    scroll=effective_scroll,
+                    engine_selection=browser_state.engine_selection,
+                )
+                _ss_span.set_attribute("screenshot_count", len(screenshots))
+                _ss_span.set_attribute("screenshot_bytes", sum(len(s) for s in screenshots))
+                _ss_span.set_attribute("screenshot_ms", int((time.perf_counter() - _screenshot_started_at) * 1000))
+                _ss_span.set_attribute("pipelined", pipelined)
+                _ss_span.set_attribute("overlapped_page_content", page_content.started)
+
+            # the screenshots are the ordering barrier: nothing below scrolls except restoring the position
+            if pipelined:
+                await page_content.start()
+
+            # scroll back to the original x, y position of the page
+            if x is not None and y is not None:
+                await skyvern_frame.safe_scroll_to_x_y(x, y)
+                LOG.debug("Scrolled back to the original x, y position of the page after scraping", x=x, y=y)
+        elif pipelined:
+            await page_content.start()
+
+        (
+            id_to_css_dict,
+            id_to_element_dict,
+            id_to_frame_dict,
+            id_to_element_hash,
+            hash_to_element_ids,
+        ) = await build_element_dict_off_loop(elements)
+
+        # if there are no elements, fail the scraping unless support_empty_page is True
+        if not elements and not support_empty_page:
+            raise NoElementFound()
+
+        element_tree_delta: ElementTreeDelta | None = None
+        if incremental_state is not None:
+            element_tree_delta = incremental_state.diff(url, id_to_element_hash)
+            _record_incremental_scrape_span_attrs(incremental_state, element_tree_delta)
+
+        text_content, html, window_dimension = await page_content.result()
+    finally:
+        page_content.cancel()
 
     _record_scrape_span_attrs(
         elements=elements,
@@ -704,6 +1001,7 @@ async def scrape_web_unsafe(
         html=html,
         extracted_text=text_content,
         window_dimension=window_dimension,
+        element_tree_delta=element_tree_delta,
         _browser_state=browser_state,
         _clean_up_func=cleanup_element_tree,
         _scrape_exclude=scrape_exclude,
@@ -940,7 +1238,7 @@ class IncrementalScrapePage(ElementTreeBuilder):
             )
 
         # we listen the incremental elements seperated by frames, so all elements will be in the same SkyvernFrame
-        self.id_to_css_dict, self.id_to_element_dict, _, _, _ = build_element_dict(incremental_elements)
+        self.id_to_css_dict, self.id_to_element_dict, _, _, _ = await build_element_dict_off_loop(incremental_elements)
 
         self.elements = incremental_elements
 
@@ -1101,61 +1399,61 @@ def _should_keep_unique_id(element: dict) -> bool:
     return element.get("interactable", False)
 
 
-def trim_element(element: dict) -> dict:
-    queue = [element]
-    while queue:
-        queue_ele = queue.pop(0)
-        if "frame" in queue_ele:
-            del queue_ele["frame"]
+def _trim_element_node(queue_ele: dict) -> None:
+    """Trim a single node in place. Children are left for the caller to visit."""
+    if "frame" in queue_ele:
+        del queue_ele["frame"]
 
-        if "frame_index" in queue_ele:
-            del queue_ele["frame_index"]
+    if "frame_index" in queue_ele:
+        del queue_ele["frame_index"]
 
-        if "id" in queue_ele and not _should_keep_unique_id(queue_ele):
-            del queue_ele["id"]
+    if "id" in queue_ele and not _should_keep_unique_id(queue_ele):
+        del queue_ele["id"]
 
-        if "attributes" in queue_ele:
-            new_attributes = _trimmed_base64_data(queue_ele["attributes"])
-            if new_attributes:
-                queue_ele["attributes"] = new_attributes
-            else:
-                del queue_ele["attributes"]
+    if "attributes" in queue_ele:
+        new_attributes = _trimmed_base64_data(queue_ele["attributes"])
+        if new_attributes:
+            queue_ele["attributes"] = new_attributes
+        else:
+            del queue_ele["attributes"]
 
-        if "attributes" in queue_ele and not queue_ele.get("keepAllAttr", False):
-            has_pseudo = bool(queue_ele.get("beforePseudoText") or queue_ele.get("afterPseudoText"))
-            is_icon_only = (
-                queue_ele.get("interactable", False) and not str(queue_ele.get("text", "")).strip() and has_pseudo
-            )
-            new_attributes = _trimmed_attributes(queue_ele["attributes"], keep_class=is_icon_only)
-            if new_attributes:
-                queue_ele["attributes"] = new_attributes
-            else:
-                del queue_ele["attributes"]
-        # remove the tag, don't need it in the HTML tree
-        if "keepAllAttr" in queue_ele:
-            del queue_ele["keepAllAttr"]
-
-        if "children" in queue_ele:
-            queue.extend(queue_ele["children"])
-            if not queue_ele["children"]:
-                del queue_ele["children"]
-        if "text" in queue_ele:
-            element_text = str(queue_ele["text"]).strip()
-            if not element_text:
-                del queue_ele["text"]
-
-        if (
-            "attributes" in queue_ele
-            and "name" in queue_ele["attributes"]
-            and len(queue_ele["attributes"]["name"]) > 500
-        ):
-            queue_ele["attributes"]["name"] = queue_ele["attributes"]["name"][:500]
+    if "attributes" in queue_ele and not queue_ele.get("keepAllAttr", False):
+        has_pseudo = bool(queue_ele.get("beforePseudoText") or queue_ele.get("afterPseudoText"))
+        is_icon_only = (
+            queue_ele.get("interactable", False) and not str(queue_ele.get("text", "")).strip() and has_pseudo
+        )
+        new_attributes = _trimmed_attributes(queue_ele["attributes"], keep_class=is_icon_only)
+        if new_attributes:
+            queue_ele["attributes"] = new_attributes
+        else:
+            del queue_ele["attributes"]
+    # remove the tag, don't need it in the HTML tree
+    if "keepAllAttr" in queue_ele:
+        del queue_ele["keepAllAttr"]
+
+    if "children" in queue_ele and not queue_ele["children"]:
+        del queue_ele["children"]
+    if "text" in queue_ele:
+        element_text = str(queue_ele["text"]).strip()
+        if not element_text:
+            del queue_ele["text"]
+
+    if "attributes" in queue_ele and "name" in queue_ele["attributes"] and len(queue_ele["attributes"]["name"]) > 500:
+        queue_ele["attributes"]["name"] = queue_ele["attributes"]["name"][:500]
 
-        if "beforePseudoText" in queue_ele and not queue_ele.get("beforePseudoText"):
-            del queue_ele["beforePseudoText"]
+    if "beforePseudoText" in queue_ele and not queue_ele.get("beforePseudoText"):
+        del queue_ele["beforePseudoText"]
 
-        if "afterPseudoText" in queue_ele and not queue_ele.get("afterPseudoText"):
-            del queue_ele["afterPseudoText"]
+    if "afterPseudoText" in queue_ele and not queue_ele.get("afterPseudoText"):
+        del queue_ele["afterPseudoText"]
+
+
+def trim_element(element: dict) -> dict:
+    queue = [element]
+    while queue:
+        queue_ele = queue.pop(0)
+        queue.extend(queue_ele.get("children") or [])
+        _trim_element_node(queue_ele)
 
     return element
 
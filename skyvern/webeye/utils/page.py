@@ -7,6 +7,7 @@ import json
 import re
 import time
 import urllib.parse
+from collections import OrderedDict, deque
 from collections.abc import Awaitable, Callable
 from enum import StrEnum
 from io import BytesIO
@@ -30,6 +31,7 @@ from skyvern.webeye.browser_errors import BrowserTargetClosedError
 from skyvern.webeye.browser_health import BrowserOperation
 from skyvern.webeye.browser_object_predicates import is_page_like
 from skyvern.webeye.main_world_eval import evaluate_in_main_world, get_main_world_prefix
+from skyvern.webeye.scraper.compact_tree import decode_compact_element_tree
 
 if TYPE_CHECKING:
     from skyvern.webeye.browser_state import BrowserState
@@ -1105,6 +1107,100 @@ def pop_destination_facts(nodes: object) -> dict[str, dict]:
     return facts
 
 
+_TREE_BUILD_STAT_KEYS = ("elapsed_ms", "visited_nodes", "element_count", "memo_hits", "memo_misses")
+
+
+def _record_tree_build_stats(stats: object, frame_name: str | None) -> None:
+    """Put buildTreeFromBody's walk stats on the current span, and log a walk cut short by its
+    element or time budget. The stats come back from the page, so anything not of the expected
+    shape is ignored."""
+    if not isinstance(stats, dict):
+        return
+    span = otel_trace.get_current_span()
+    for key in _TREE_BUILD_STAT_KEYS:
+        value = stats.get(key)
+        if isinstance(value, int) and not isinstance(value, bool):
+            span.set_attribute(f"tree_build.{key}", value)
+    truncated_by = stats.get("truncated_by")
+    if truncated_by not in ("element_limit", "time_budget"):
+        return
+    span.set_attribute("tree_build.truncated_by", truncated_by)
+    LOG.warning(
+        "Element tree was truncated by the in-page build budget",
+        frame=frame_name,
+        truncated_by=truncated_by,
+        elapsed_ms=stats.get("elapsed_ms"),
+        element_count=stats.get("element_count"),
+    )
+
+
+class PageReadyTimeouts:
+    """Per-host readiness timeouts learned from how long each wait_for_page_ready signal took.
+
+    A signal's learned timeout is HEADROOM times the slowest of its recent settle times on that
+    host, never below FLOOR_MS and never above the timeout the caller asked for. A signal that
+    times out records the full timeout it was given, so a cap that turns out too tight roughly
+    doubles on the next wait instead of starving the page. Nothing is capped until MIN_SAMPLES
+    waits have been seen, and only the MAX_HOSTS most recently seen hosts are kept.
+    """
+
+    MIN_SAMPLES = 5
+    WINDOW = 20
+    HEADROOM = 2.0
+    FLOOR_MS = 500.0
+    MAX_HOSTS = 1024
+
+    def __init__(self) -> None:
+        self._samples: OrderedDict[tuple[str, str], deque[float]] = OrderedDict()
+
+    def timeout_ms(self, host: str, signal: str, default_ms: float) -> float:
+        samples = self._samples.get((host, signal))
+        if samples is None or len(samples) < self.MIN_SAMPLES:
+            return default_ms
+        return min(default_ms, max(self.FLOOR_MS, max(samples) * self.HEADROOM))
+
+    def record(self, host: str, signal: str, elapsed_ms: float) -> None:
+        key = (host, signal)
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.WINDOW)
+        self._samples.move_to_end(key)
+        samples.append(elapsed_ms)
+        # Three signals per host.
+        while len(self._samples) > self.MAX_HOSTS * 3:
+            self._samples.popitem(last=False)
+
+    def clear(self) -> None:
+        self._samples.clear()
+
+
+PAGE_READY_TIMEOUTS = PageReadyTimeouts()
+
+
+def _page_ready_host(frame: Page | Frame) -> str | None:
+    url = getattr(frame, "url", None)
+    if not isinstance(url, str):
+        return None
+    return urllib.parse.urlparse(url).hostname or None
+
+
+def _record_page_ready_signal(
+    span: Any, host: str | None, signal: str, result: str, started_at: float, timeout_ms: float
+) -> None:
+    """Close out one wait_for_page_ready signal: its result and elapsed time on its span, and its
+    settle time toward the host's learned timeout. Errors say nothing about how long the page
+    takes, so they are not learned from."""
+    elapsed_ms = (time.perf_counter() - started_at) * 1000
+    span.set_attribute("result", result)
+    span.set_attribute("elapsed_ms", round(elapsed_ms, 1))
+    if host is None:
+        return
+    if result == "success":
+        PAGE_READY_TIMEOUTS.record(host, signal, elapsed_ms)
+    elif result == "timeout":
+        PAGE_READY_TIMEOUTS.record(host, signal, timeout_ms)
+
+
 class SkyvernFrame:
     engine_selection: BrowserEngineSelection | None = None
 
@@ -1907,18 +2003,86 @@ class SkyvernFrame:
         # unconditional: it is protection against a hostile wrapper injecting the key, not capture
         # cost.
         capture_destination_facts = policy_observation_enabled()
-        js_script = "async ([frame_name, frame_index, must_included_tags, capture_destination_facts]) => await buildTreeFromBody(frame_name, frame_index, must_included_tags, capture_destination_facts)"
-        elements, element_tree = await self.evaluate(
+        settings = SettingsManager.get_settings()
+        build_budget_ms = settings.BROWSER_SCRAPING_TREE_BUILD_BUDGET_MS
+        wire_format = settings.BROWSER_SCRAPING_ELEMENT_TREE_WIRE_FORMAT
+        if wire_format == "nested":
+            js_script = "async ([frame_name, frame_index, must_included_tags, capture_destination_facts, build_budget_ms]) => await buildTreeFromBody(frame_name, frame_index, must_included_tags, capture_destination_facts, build_budget_ms)"
+        else:
+            js_script = "async ([frame_name, frame_index, must_included_tags, capture_destination_facts, build_budget_ms]) => await buildCompactTreeFromBody(frame_name, frame_index, must_included_tags, capture_destination_facts, build_budget_ms)"
+        result = await self.evaluate(
             frame=self.frame,
             engine_selection=self.engine_selection,
             expression=js_script,
             timeout_ms=timeout_ms,
-            arg=[frame_name, frame_index, must_included_tags, capture_destination_facts],
+            arg=[frame_name, frame_index, must_included_tags, capture_destination_facts, build_budget_ms],
         )
+        if wire_format == "nested":
+            elements, element_tree, *build_stats = result
+        else:
+            compact_payload, *build_stats = result
+            decode_started_at = time.perf_counter()
+            elements, element_tree = decode_compact_element_tree(compact_payload)
+            if wire_format == "compare":
+                await self._compare_element_tree_wire_formats(
+                    frame_name,
+                    compact_payload,
+                    elements,
+                    element_tree,
+                    decode_ms=(time.perf_counter() - decode_started_at) * 1000,
+                    timeout_ms=timeout_ms,
+                )
+        if build_stats:
+            _record_tree_build_stats(build_stats[0], frame_name)
         destinations = pop_destination_facts(elements)
         destinations.update(pop_destination_facts(element_tree))
         return elements, element_tree, destinations
 
+    async def _compare_element_tree_wire_formats(
+        self,
+        frame_name: str | None,
+        compact_payload: str,
+        elements: list[dict],
+        element_tree: list[dict],
+        decode_ms: float,
+        timeout_ms: float,
+    ) -> None:
+        """Re-send the tree just built in both wire formats and log their size and transfer time.
+
+        Both reads come from the page's cache of that build, so they time serialization and
+        transfer only, and the decoded compact tree is checked against the nested one.
+        """
+        try:
+            started_at = time.perf_counter()
+            nested = await self.evaluate(
+                frame=self.frame,
+                engine_selection=self.engine_selection,
+                expression="() => [DomUtils.elementListCache, DomUtils.elementTreeCache]",
+                timeout_ms=timeout_ms,
+            )
+            nested_ms = (time.perf_counter() - started_at) * 1000
+            started_at = time.perf_counter()
+            await self.evaluate(
+                frame=self.frame,
+                engine_selection=self.engine_selection,
+                expression="() => encodeCompactElementTree(DomUtils.elementListCache, DomUtils.elementTreeCache)",
+                timeout_ms=timeout_ms,
+            )
+            compact_ms = (time.perf_counter() - started_at) * 1000
+            LOG.info(
+                "Element tree wire format comparison",
+                frame=frame_name,
+                element_count=len(elements),
+                nested_bytes=len(json.dumps(nested, separators=(",", ":"), default=str)),
+                compact_bytes=len(compact_payload),
+                nested_transfer_ms=round(nested_ms, 1),
+                compact_transfer_ms=round(compact_ms, 1),
+                compact_decode_ms=round(decode_ms, 1),
+                decoded_matches_nested=[elements, element_tree] == nested,
+            )
+        except Exception:
+            LOG.warning("Element tree wire format comparison failed", frame=frame_name, exc_info=True)
+
     @traced(name="skyvern.browser.incremental_element_tree")
     async def get_incremental_element_tree(
         self,
@@ -1948,7 +2112,7 @@ class SkyvernFrame:
     ) -> tuple[list[dict], list[dict]]:
         await self._set_enriched_element_tree_flag()
         js_script = "async ([starter, frame, full_tree]) => await buildElementTree(starter, frame, full_tree)"
-        elements, element_tree = await self.evaluate(
+        elements, element_tree, *_ = await self.evaluate(
             frame=self.frame,
             engine_selection=self.engine_selection,
             expression=js_script,
@@ -2009,25 +2173,61 @@ class SkyvernFrame:
     ) -> None:
         """
         Wait for page to be ready for interaction by checking multiple signals:
-        1. Loading indicators gone (spinners, skeletons, progress bars) - highest timeout first
+        1. Loading indicators gone (spinners, skeletons, progress bars)
         2. Network idle (no pending requests for 500ms)
         3. DOM stability (no significant mutations for dom_stable_ms)
 
-        Checks are ordered by timeout (highest first) so the longest timeout
-        acts as the primary upper bound when checks complete early.
+        The signals are awaited concurrently, so the longest timeout is the upper bound rather
+        than the sum of all three. The page is ready once every signal has settled, and the DOM
+        stability check is confirmed again after the other two settle, within its own timeout.
+
+        With BROWSER_PAGE_READY_LEARNED_TIMEOUTS on, each timeout is further capped by how long
+        that signal has recently taken on the page's host.
 
         This is designed for cached action execution to ensure the page is ready
         before attempting to interact with elements.
         """
         _tracer = otel_trace.get_tracer("skyvern")
+        host = None
+        if SettingsManager.get_settings().BROWSER_PAGE_READY_LEARNED_TIMEOUTS:
+            host = _page_ready_host(self.frame)
+        if host is not None:
+            loading_indicator_timeout_ms = PAGE_READY_TIMEOUTS.timeout_ms(
+                host, "loading_indicators", loading_indicator_timeout_ms
+            )
+            network_idle_timeout_ms = PAGE_READY_TIMEOUTS.timeout_ms(host, "network_idle", network_idle_timeout_ms)
+            dom_stability_timeout_ms = PAGE_READY_TIMEOUTS.timeout_ms(host, "dom_stability", dom_stability_timeout_ms)
 
-        # 1. Wait for loading indicators to disappear (longest timeout first)
+        loading_indicator_task = asyncio.create_task(
+            self._page_ready_loading_indicators(_tracer, host, loading_indicator_timeout_ms)
+        )
+        network_idle_task = asyncio.create_task(self._page_ready_network_idle(_tracer, host, network_idle_timeout_ms))
+        dom_stability_task = asyncio.create_task(
+            self._page_ready_dom_stability(
+                _tracer,
+                host,
+                dom_stable_ms,
+                dom_stability_timeout_ms,
+                others=(loading_indicator_task, network_idle_task),
+            )
+        )
+        tasks = (loading_indicator_task, network_idle_task, dom_stability_task)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Each signal swallows its own failures, so only cancellation gets here early; don't
+            # leave the other signals polling the page.
+            for task in tasks:
+                task.cancel()
+
+    async def _page_ready_loading_indicators(self, _tracer: Any, host: str | None, timeout_ms: float) -> None:
         loading_indicator_result = "success"
+        started_at = time.perf_counter()
         with traced_span(_tracer, "skyvern.browser.page_ready.loading_indicators") as _li_span:
             apply_context_attrs(_li_span)
-            _li_span.set_attribute("timeout_ms", loading_indicator_timeout_ms)
+            _li_span.set_attribute("timeout_ms", timeout_ms)
             try:
-                await self._wait_for_loading_indicators_gone(timeout_ms=loading_indicator_timeout_ms)
+                await self._wait_for_loading_indicators_gone(timeout_ms=timeout_ms)
             except Exception as exc:
                 if _is_readiness_timeout(exc, self.engine_selection):
                     loading_indicator_result = "timeout"
@@ -2038,15 +2238,19 @@ class SkyvernFrame:
                     loading_indicator_result = "error"
                     LOG.warning("Failed to check loading indicators, proceeding", exc_info=True)
             finally:
-                _li_span.set_attribute("result", loading_indicator_result)
+                _record_page_ready_signal(
+                    _li_span, host, "loading_indicators", loading_indicator_result, started_at, timeout_ms
+                )
 
-        # 2. Wait for network idle (with short timeout - some pages never go idle)
+    async def _page_ready_network_idle(self, _tracer: Any, host: str | None, timeout_ms: float) -> None:
+        # Some pages never go idle, hence the short timeout.
         network_idle_result = "success"
+        started_at = time.perf_counter()
         with traced_span(_tracer, "skyvern.browser.page_ready.network_idle") as _ni_span:
             apply_context_attrs(_ni_span)
-            _ni_span.set_attribute("timeout_ms", network_idle_timeout_ms)
+            _ni_span.set_attribute("timeout_ms", timeout_ms)
             try:
-                await self.frame.wait_for_load_state("networkidle", timeout=network_idle_timeout_ms)
+                await self.frame.wait_for_load_state("networkidle", timeout=timeout_ms)
             except Exception as exc:
                 if _is_readiness_timeout(exc, self.engine_selection):
                     network_idle_result = "timeout"
@@ -2055,16 +2259,36 @@ class SkyvernFrame:
                     network_idle_result = "error"
                     LOG.warning("Failed to check network idle, proceeding", exc_info=True)
             finally:
-                _ni_span.set_attribute("result", network_idle_result)
+                _record_page_ready_signal(_ni_span, host, "network_idle", network_idle_result, started_at, timeout_ms)
 
-        # 3. Wait for DOM to stabilize
+    async def _page_ready_dom_stability(
+        self,
+        _tracer: Any,
+        host: str | None,
+        stable_ms: float,
+        timeout_ms: float,
+        others: tuple[asyncio.Task, ...],
+    ) -> None:
         dom_stability_result = "success"
+        started_at = time.perf_counter()
+        deadline = started_at + timeout_ms / 1000
         with traced_span(_tracer, "skyvern.browser.page_ready.dom_stability") as _ds_span:
             apply_context_attrs(_ds_span)
-            _ds_span.set_attribute("timeout_ms", dom_stability_timeout_ms)
-            _ds_span.set_attribute("stable_ms", dom_stable_ms)
+            _ds_span.set_attribute("timeout_ms", timeout_ms)
+            _ds_span.set_attribute("stable_ms", stable_ms)
             try:
-                await self._wait_for_dom_stable(stable_ms=dom_stable_ms, timeout_ms=dom_stability_timeout_ms)
+                while True:
+                    remaining_ms = max((deadline - time.perf_counter()) * 1000, 0)
+                    await self._wait_for_dom_stable(stable_ms=stable_ms, timeout_ms=remaining_ms)
+                    pending = [task for task in others if not task.done()]
+                    if not pending:
+                        break
+                    # Stable while the other signals were still settling: the page may yet change
+                    # when they do, so confirm again once they have. If they outlast this check's
+                    # own timeout, the last stable reading stands.
+                    await asyncio.wait(pending, timeout=max(deadline - time.perf_counter(), 0))
+                    if any(not task.done() for task in pending) or time.perf_counter() >= deadline:
+                        break
             except Exception as exc:
                 if _is_readiness_timeout(exc, self.engine_selection):
                     dom_stability_result = "timeout"
@@ -2073,7 +2297,7 @@ class SkyvernFrame:
                     dom_stability_result = "error"
                     LOG.warning("Failed to check DOM stability, proceeding", exc_info=True)
             finally:
-                _ds_span.set_attribute("result", dom_stability_result)
+                _record_page_ready_signal(_ds_span, host, "dom_stability", dom_stability_result, started_at, timeout_ms)
 
     async def _wait_for_loading_indicators_gone(self, timeout_ms: float = 5000) -> None:
         """
@@ -2206,3 +2430,67 @@ class SkyvernFrame:
             expression=dom_stability_js,
             timeout_ms=timeout_ms,
         )
+
+    async def wait_for_action_settle(self, max_ms: float, quiet_ms: float = 150) -> bool:
+        """
+        Wait for the page to go quiet after an action: no DOM mutations and no network request
+        completing for quiet_ms, with the document fully loaded. Returns False if it has not
+        settled by max_ms.
+
+        The observers are torn down in the page either way, so a page that never settles does
+        not keep them running. This evaluates without ``evaluate``'s navigation recovery, which
+        would wait out the navigation and retry well past max_ms: a navigation that tears down the
+        document raises from here, and the caller falls back to its fixed wait.
+        """
+        action_settle_js = """
+        ([quietMs, maxMs]) => new Promise((resolve) => {
+            const startedAt = performance.now();
+            let lastActivity = startedAt;
+            const touch = () => {
+                lastActivity = performance.now();
+            };
+
+            const mutationObserver = new MutationObserver(touch);
+            mutationObserver.observe(document.documentElement, {
+                childList: true,
+                subtree: true,
+                attributes: true,
+                characterData: true,
+            });
+            // Resource entries are reported as requests complete, so a request started by the
+            // action keeps pushing the quiet window out once it lands.
+            let resourceObserver = null;
+            try {
+                resourceObserver = new PerformanceObserver(touch);
+                resourceObserver.observe({ type: 'resource' });
+            } catch (e) {
+                resourceObserver = null;
+            }
+
+            const finish = (settled) => {
+                mutationObserver.disconnect();
+                if (resourceObserver) resourceObserver.disconnect();
+                resolve(settled);
+            };
+            const interval = Math.min(50, quietMs);
+            const check = () => {
+                const now = performance.now();
+                if (document.readyState === 'complete' && now - lastActivity >= quietMs) {
+                    finish(true);
+                } else if (now - startedAt >= maxMs) {
+                    finish(false);
+                } else {
+                    setTimeout(check, interval);
+                }
+            };
+            setTimeout(check, interval);
+        })
+        """
+
+        try:
+            # The page resolves on its own at max_ms; the timeout only stops a slow round trip
+            # from running past it.
+            async with asyncio.timeout(max_ms / 1000):
+                return bool(await _dispatch_evaluate(self.frame, action_settle_js, [quiet_ms, max_ms]))
+        except TimeoutError:
+            return False
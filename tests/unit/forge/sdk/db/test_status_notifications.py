@@ -0,0 +1,191 @@
+"""Status change notifications: waking waiters on commit instead of on their next poll."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skyvern.config import settings
+from skyvern.forge.sdk.db import status_notifications as notifications_module
+from skyvern.forge.sdk.db.polls import await_browser_session
+from skyvern.forge.sdk.db.status_notifications import (
+    StatusEntity,
+    StatusNotificationHub,
+    commit_with_status_notification,
+    status_notifications,
+)
+from skyvern.forge.sdk.schemas.tasks import TaskStatus
+from skyvern.forge.sdk.workflow.models.workflow import WorkflowRunStatus
+
+
+async def _task_id(agent_db) -> tuple[str, str]:
+    organization = await agent_db.organizations.create_organization(
+        organization_name="Notifications org", organization_id="o_status_notifications"
+    )
+    task = await agent_db.tasks.create_task(
+        url="https://example.com",
+        title="Notify",
+        navigation_goal=None,
+        data_extraction_goal=None,
+        navigation_payload=None,
+        organization_id=organization.organization_id,
+    )
+    return task.task_id, organization.organization_id
+
+
+@pytest.mark.asyncio
+async def test_a_status_update_wakes_only_that_entitys_waiters(agent_db) -> None:
+    task_id, organization_id = await _task_id(agent_db)
+
+    with (
+        status_notifications.subscribe(StatusEntity.task, task_id) as subscription,
+        status_notifications.subscribe(StatusEntity.task, "tsk_other") as other,
+    ):
+        waiter = asyncio.create_task(subscription.wait(60))
+        await asyncio.sleep(0)
+        await agent_db.tasks.update_task(task_id, status=TaskStatus.running, organization_id=organization_id)
+
+        assert await asyncio.wait_for(waiter, timeout=5) is True
+        assert await other.wait(0.01) is False
+
+    # Updates that leave the status alone do not wake anyone.
+    with status_notifications.subscribe(StatusEntity.task, task_id) as subscription:
+        await agent_db.tasks.update_task(task_id, failure_reason="still running", organization_id=organization_id)
+        assert await subscription.wait(0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_finalizing_a_workflow_run_wakes_its_and_its_tasks_waiters(agent_db) -> None:
+    organization = await agent_db.organizations.create_organization(
+        organization_name="Notifications org", organization_id="o_status_notifications_wr"
+    )
+    workflow = await agent_db.workflows.create_workflow(
+        title="Notify",
+        workflow_definition={"parameters": [], "blocks": []},
+        organization_id=organization.organization_id,
+    )
+    workflow_run = await agent_db.workflow_runs.create_workflow_run(
+        workflow_permanent_id=workflow.workflow_permanent_id,
+        workflow_id=workflow.workflow_id,
+        organization_id=organization.organization_id,
+    )
+    workflow_run_id = workflow_run.workflow_run_id
+    task = await agent_db.tasks.create_task(
+        url="https://example.com",
+        title="Notify",
+        navigation_goal=None,
+        data_extraction_goal=None,
+        navigation_payload=None,
+        organization_id=organization.organization_id,
+        workflow_run_id=workflow_run_id,
+    )
+
+    with (
+        status_notifications.subscribe(StatusEntity.workflow_run, workflow_run_id) as run_subscription,
+        status_notifications.subscribe(StatusEntity.task, task.task_id) as task_subscription,
+    ):
+        finalized = await agent_db.workflow_runs.update_workflow_run_if_not_final(
+            workflow_run_id, WorkflowRunStatus.canceled
+        )
+        cascaded = await agent_db.tasks.bulk_update_tasks_by_workflow_run_ids(
+            [workflow_run_id], TaskStatus.canceled, only_if_status_in=[TaskStatus.created]
+        )
+
+        assert finalized is not None and cascaded == 1
+        assert await run_subscription.wait(0.01) is True
+        assert await task_subscription.wait(0.01) is True
+
+    # A run that is already final is left alone, and nobody is woken for it.
+    with status_notifications.subscribe(StatusEntity.workflow_run, workflow_run_id) as run_subscription:
+        assert (
+            await agent_db.workflow_runs.update_workflow_run_if_not_final(workflow_run_id, WorkflowRunStatus.failed)
+            is None
+        )
+        assert await run_subscription.wait(0.01) is False
+
+
+@pytest.mark.asyncio
+async def test_await_browser_session_returns_when_the_browser_becomes_ready(agent_db) -> None:
+    organization = await agent_db.organizations.create_organization(
+        organization_name="Notifications org", organization_id="o_status_notifications_pbs"
+    )
+    browser_session = await agent_db.browser_sessions.create_persistent_browser_session(
+        organization_id=organization.organization_id
+    )
+    session_id = browser_session.persistent_browser_session_id
+
+    waiter = asyncio.create_task(
+        # A poll interval this long would fail the wait_for below if readiness were only polled for.
+        await_browser_session(agent_db, session_id, organization.organization_id, timeout=60, poll_interval=60)
+    )
+    await asyncio.sleep(0.05)
+    assert not waiter.done()
+    await agent_db.browser_sessions.set_persistent_browser_session_browser_address(
+        session_id,
+        browser_address="wss://browser.example.com",
+        ip_address=None,
+        ecs_task_arn=None,
+        organization_id=organization.organization_id,
+        upstream_cdp_url="ws://10.0.0.1:9222/devtools/browser/1",
+    )
+
+    ready_session = await asyncio.wait_for(waiter, timeout=5)
+    assert ready_session is not None and ready_session.is_browser_ready
+
+
+@pytest.mark.asyncio
+async def test_postgres_commits_send_notify_in_the_same_transaction() -> None:
+    session = MagicMock()
+    session.get_bind.return_value.dialect.name = "postgresql"
+    calls: list[str] = []
+    session.execute = AsyncMock(side_effect=lambda statement: calls.append("notify"))
+    session.commit = AsyncMock(side_effect=lambda: calls.append("commit"))
+    entity_ids = [f"wr_{i}" for i in range(150)]
+
+    with patch.object(settings, "RUN_STATUS_LISTEN_NOTIFY_ENABLED", True):
+        await commit_with_status_notification(session, StatusEntity.workflow_run, entity_ids)
+
+    # Large bulk updates are split to stay under Postgres' NOTIFY payload limit.
+    assert calls == ["notify", "notify", "commit"]
+    payloads = [
+        json.loads(param)
+        for call in session.execute.await_args_list
+        for param in call.args[0].compile().params.values()
+        if param != notifications_module.STATUS_NOTIFICATION_CHANNEL
+    ]
+    assert [len(payload["ids"]) for payload in payloads] == [100, 50]
+    assert {payload["entity"] for payload in payloads} == {"workflow_run"}
+
+
+@pytest.mark.asyncio
+async def test_remote_notifications_wake_waiters_and_listening_relaxes_the_fallback_poll() -> None:
+    hub = StatusNotificationHub()
+    with (
+        patch.object(notifications_module, "status_notifications", hub),
+        patch.object(settings, "RUN_STATUS_FALLBACK_POLL_SECONDS", 30.0),
+    ):
+        with hub.subscribe(StatusEntity.browser_session, "pbs_1") as subscription:
+            assert hub.poll_interval(2) == 2
+            hub.set_listening(True)
+            # Changes may have been missed before the listener connected, so every waiter re-checks.
+            assert await subscription.wait(0.01) is True
+            assert hub.poll_interval(2) == 30.0
+            assert subscription.should_refresh(2) is True
+            assert subscription.should_refresh(2) is False
+
+            notifications_module._dispatch_remote_notification(
+                json.dumps({"origin": "another-process", "entity": "browser_session", "ids": ["pbs_1"]})
+            )
+            assert await subscription.wait(0.01) is True
+
+            # This process's own notifications were already delivered locally; junk is dropped.
+            notifications_module._dispatch_remote_notification(
+                json.dumps({"origin": notifications_module._ORIGIN, "entity": "browser_session", "ids": ["pbs_1"]})
+            )
+            notifications_module._dispatch_remote_notification("not json")
+            assert await subscription.wait(0.01, deadline=0) is False
+
+        assert hub._subscriptions == {}
@@ -66,3 +66,37 @@ async def test_internal_synthetic_sdk_task_round_trips_through_repository(agent_
     persisted = await agent_db.tasks.get_task(task.task_id, organization.organization_id)
     assert persisted is not None
     assert persisted.task_type == TaskType.synthetic_sdk_action
+
+
+@pytest.mark.asyncio
+async def test_get_tasks_cursor_pages_continue_past_the_previous_page(agent_db) -> None:
+    organization = await agent_db.organizations.create_organization(
+        organization_name="Test organization",
+        organization_id="o_test_task_keyset",
+    )
+    for index in range(5):
+        await agent_db.tasks.create_task(
+            url="https://example.com",
+            title=f"Task {index}",
+            navigation_goal=None,
+            data_extraction_goal=None,
+            navigation_payload=None,
+            organization_id=organization.organization_id,
+        )
+    offset_order = [
+        task.task_id
+        for task in await agent_db.tasks.get_tasks(page_size=5, organization_id=organization.organization_id)
+    ]
+
+    seen: list[str] = []
+    cursor_value = cursor_task_id = None
+    while page := await agent_db.tasks.get_tasks(
+        page_size=2,
+        organization_id=organization.organization_id,
+        cursor_value=cursor_value,
+        cursor_task_id=cursor_task_id,
+    ):
+        seen.extend(task.task_id for task in page)
+        cursor_value, cursor_task_id = page[-1].created_at, page[-1].task_id
+
+    assert seen == offset_order
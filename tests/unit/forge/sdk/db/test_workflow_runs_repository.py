@@ -17,7 +17,9 @@ from sqlalchemy.ext.asyncio import AsyncEngine
 from skyvern.forge.sdk.db.agent_db import AgentDB, _build_engine
 from skyvern.forge.sdk.db.models import (
     Base,
+    OrganizationModel,
     PersistentBrowserSessionModel,
+    TaskModel,
     TaskRunModel,
     WorkflowModel,
     WorkflowRunModel,
@@ -25,7 +27,7 @@ from skyvern.forge.sdk.db.models import (
 from skyvern.forge.sdk.db.repositories.workflow_runs import WorkflowRunsRepository
 from skyvern.forge.sdk.schemas.persistent_browser_sessions import FORCED_WORKFLOW_SESSION_RUNNABLE_TYPE
 from skyvern.forge.sdk.workflow.models.parameter import WorkflowParameter, WorkflowParameterType
-from skyvern.forge.sdk.workflow.models.workflow import WorkflowRunStatus
+from skyvern.forge.sdk.workflow.models.workflow import WorkflowRun, WorkflowRunStatus
 from skyvern.schemas.run_enums import RunType
 from skyvern.schemas.runs import MAX_SEARCH_FETCH_LIMIT
 
@@ -1017,6 +1019,84 @@ async def test_get_all_runs_excludes_copilot_session_workflow_runs() -> None:
     _assert_not_filtering_copilot_authored_workflows(where_clause)
 
 
+@pytest.mark.asyncio
+async def test_get_all_runs_before_pages_merged_runs_without_gaps_or_duplicates(sqlite_db: AgentDB) -> None:
+    base = datetime(2026, 7, 20, 12, 0, tzinfo=timezone.utc)
+    tied_at = datetime(2026, 7, 20, 12, 5, tzinfo=timezone.utc)
+    async with sqlite_db.Session() as session:
+        session.add(OrganizationModel(organization_id="org_test", organization_name="History Org"))
+        session.add(
+            WorkflowModel(
+                workflow_id="wf_test", workflow_permanent_id="wpid_test", title="History", workflow_definition={}
+            )
+        )
+        session.add_all(
+            [
+                _workflow_run_model(
+                    workflow_run_id=f"wr_{minute}",
+                    queued_at=base.replace(minute=minute),
+                    status=WorkflowRunStatus.completed.value,
+                )
+                for minute in (1, 3, 7)
+            ]
+        )
+        session.add_all(
+            [
+                TaskModel(
+                    task_id=f"tsk_{minute}",
+                    organization_id="org_test",
+                    url="https://example.com",
+                    status="completed",
+                    created_at=at,
+                )
+                for minute, at in (
+                    (2, base.replace(minute=2)),
+                    (4, base.replace(minute=4)),
+                    (6, base.replace(minute=6)),
+                )
+            ]
+        )
+        # Same created_at in both tables: the run id breaks the tie, so neither is skipped or repeated.
+        session.add(_workflow_run_model(workflow_run_id="wr_tied", queued_at=tied_at, status="completed"))
+        session.add(
+            TaskModel(
+                task_id="tsk_tied",
+                organization_id="org_test",
+                url="https://example.com",
+                status="completed",
+                created_at=tied_at,
+            )
+        )
+        await session.flush()
+        # Not part of the org's history.
+        session.add(TaskModel(task_id="tsk_in_workflow", organization_id="org_test", workflow_run_id="wr_1"))
+        session.add(_workflow_run_model(workflow_run_id="wr_other_org", queued_at=base, organization_id="org_other"))
+        await session.commit()
+
+    pages: list[list[str]] = []
+    created_before = run_id_before = None
+    while True:
+        page = await sqlite_db.workflow_runs.get_all_runs_before(
+            organization_id="org_test", page_size=3, created_before=created_before, run_id_before=run_id_before
+        )
+        if not page:
+            break
+        pages.append([run.workflow_run_id if isinstance(run, WorkflowRun) else run.task_id for run in page])
+        created_before = page[-1].created_at
+        run_id_before = pages[-1][-1]
+
+    assert pages == [
+        ["wr_7", "tsk_6", "wr_tied"],
+        ["tsk_tied", "tsk_4", "wr_3"],
+        ["tsk_2", "wr_1"],
+    ]
+    assert page == []
+    offset_pages = [await sqlite_db.workflow_runs.get_all_runs("org_test", page=n, page_size=3) for n in (1, 2, 3)]
+    assert [len(p) for p in offset_pages] == [3, 3, 2]
+    first_page = await sqlite_db.workflow_runs.get_all_runs_before(organization_id="org_test", page_size=3)
+    assert isinstance(first_page[0], WorkflowRun) and first_page[0].workflow_title == "History"
+
+
 @pytest.mark.asyncio
 async def test_workflow_run_history_queries_exclude_copilot_session_runs() -> None:
     captured_queries: list[Any] = []
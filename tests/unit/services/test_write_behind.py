@@ -0,0 +1,152 @@
+"""Write-behind buffering of the agent loop's action inserts and step usage updates."""
+
+from __future__ import annotations
+
+from typing import AsyncGenerator
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from skyvern.config import settings
+from skyvern.forge.sdk.core import skyvern_context
+from skyvern.forge.sdk.core.skyvern_context import SkyvernContext
+from skyvern.forge.sdk.db.agent_db import AgentDB
+from skyvern.forge.sdk.db.models import Base
+from skyvern.forge.sdk.models import Step
+from skyvern.services import write_behind as write_behind_module
+from skyvern.services.write_behind import (
+    begin_step_write_behind,
+    flush_write_buffer,
+    persist_action,
+    record_step_llm_usage,
+)
+from skyvern.webeye.actions.actions import ActionType, ClickAction
+
+
+@pytest_asyncio.fixture
+async def agent_db(monkeypatch: pytest.MonkeyPatch) -> AsyncGenerator[AgentDB]:
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    db = AgentDB(database_string="sqlite+aiosqlite:///:memory:", debug_enabled=True, db_engine=engine)
+    monkeypatch.setattr(write_behind_module.app, "DATABASE", db, raising=False)
+    try:
+        yield db
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture(autouse=True)
+def _run_context():
+    with patch.object(settings, "DATABASE_WRITE_BEHIND_ENABLED", True), skyvern_context.scoped(SkyvernContext()):
+        yield
+
+
+async def _step(agent_db: AgentDB) -> Step:
+    organization = await agent_db.organizations.create_organization(
+        organization_name="Write-behind org", organization_id="o_write_behind"
+    )
+    task = await agent_db.tasks.create_task(
+        url="https://example.com",
+        title="Write-behind",
+        navigation_goal=None,
+        data_extraction_goal=None,
+        navigation_payload=None,
+        organization_id=organization.organization_id,
+    )
+    return await agent_db.tasks.create_step(
+        task.task_id, order=0, retry_index=0, organization_id=organization.organization_id
+    )
+
+
+def _click(step: Step, action_order: int) -> ClickAction:
+    return ClickAction(
+        element_id=f"e{action_order}",
+        organization_id=step.organization_id,
+        task_id=step.task_id,
+        step_id=step.step_id,
+        step_order=step.order,
+        action_order=action_order,
+    )
+
+
+@pytest.mark.asyncio
+async def test_buffered_step_writes_land_in_one_flush_in_order(agent_db: AgentDB) -> None:
+    step = await _step(agent_db)
+    create_actions = AsyncMock(wraps=agent_db.workflow_params.create_actions)
+    create_action = AsyncMock(wraps=agent_db.workflow_params.create_action)
+    buffer = begin_step_write_behind(step)
+    assert buffer is not None
+
+    with (
+        patch.object(agent_db.workflow_params, "create_actions", create_actions),
+        patch.object(agent_db.workflow_params, "create_action", create_action),
+    ):
+        actions = [await persist_action(_click(step, order)) for order in range(3)]
+        await record_step_llm_usage(step, incremental_cost=0.25, incremental_input_tokens=100)
+        await record_step_llm_usage(step, incremental_cost=0.5, incremental_output_tokens=7, last_llm_model="gpt-x")
+
+        # Ids are usable before anything is written.
+        assert all(action.action_id for action in actions)
+        assert await agent_db.tasks.get_task_actions(step.task_id, step.organization_id) == []
+
+        await buffer.end_step(step.step_id)
+
+    create_action.assert_not_awaited()
+    create_actions.assert_awaited_once()
+    persisted = await agent_db.tasks.get_task_actions(step.task_id, step.organization_id)
+    assert [action.action_id for action in persisted] == [action.action_id for action in actions]
+    assert {action.action_type for action in persisted} == {ActionType.CLICK}
+    stored_step = await agent_db.tasks.get_step(step.step_id, step.organization_id)
+    assert stored_step is not None
+    assert (stored_step.step_cost, stored_step.input_token_count, stored_step.output_token_count) == (0.75, 100, 7)
+    assert stored_step.last_llm_model == "gpt-x"
+
+
+@pytest.mark.asyncio
+async def test_step_usage_is_summed_per_step_until_taken(agent_db: AgentDB) -> None:
+    step = await _step(agent_db)
+    buffer = begin_step_write_behind(step)
+    assert buffer is not None
+    await record_step_llm_usage(step, incremental_cost=1.0, incremental_input_tokens=10)
+    await record_step_llm_usage(step, incremental_cost=2.0, incremental_input_tokens=5)
+
+    assert buffer.take_step_usage(step.step_id) == {"incremental_cost": 3.0, "incremental_input_tokens": 15}
+    assert buffer.take_step_usage(step.step_id) == {}
+
+
+@pytest.mark.asyncio
+async def test_a_failed_flush_keeps_its_writes_for_the_next_one(agent_db: AgentDB) -> None:
+    step = await _step(agent_db)
+    begin_step_write_behind(step)
+    action = await persist_action(_click(step, 0))
+    await record_step_llm_usage(step, incremental_cost=1.0)
+
+    with patch.object(agent_db.tasks, "update_step", AsyncMock(side_effect=RuntimeError("db down"))):
+        with pytest.raises(RuntimeError):
+            await flush_write_buffer("task_update")
+    # The actions committed before the failure are not written twice.
+    await record_step_llm_usage(step, incremental_cost=0.5)
+    await flush_write_buffer("task_update")
+
+    persisted = await agent_db.tasks.get_task_actions(step.task_id, step.organization_id)
+    assert [persisted_action.action_id for persisted_action in persisted] == [action.action_id]
+    stored_step = await agent_db.tasks.get_step(step.step_id, step.organization_id)
+    assert stored_step is not None and stored_step.step_cost == 1.5
+
+
+@pytest.mark.asyncio
+async def test_writes_outside_a_buffered_step_go_straight_to_the_database(agent_db: AgentDB) -> None:
+    step = await _step(agent_db)
+
+    with patch.object(settings, "DATABASE_WRITE_BEHIND_ENABLED", False):
+        assert begin_step_write_behind(step) is None
+    action = await persist_action(_click(step, 0))
+    await record_step_llm_usage(step, incremental_cost=0.25)
+
+    persisted = await agent_db.tasks.get_task_actions(step.task_id, step.organization_id)
+    assert [persisted_action.action_id for persisted_action in persisted] == [action.action_id]
+    stored_step = await agent_db.tasks.get_step(step.step_id, step.organization_id)
+    assert stored_step is not None and stored_step.step_cost == 0.25
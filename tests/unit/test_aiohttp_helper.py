@@ -1,14 +1,28 @@
 import os
 import socket
 import tempfile
+import time
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from cachetools import TTLCache
 
+from skyvern.config import settings
 from skyvern.exceptions import BlockedHost, HttpException
-from skyvern.forge.sdk.core.aiohttp_helper import SSRFGuardedResolver, aiohttp_delete, aiohttp_request
+from skyvern.forge.sdk.core.aiohttp_helper import (
+    CachingSSRFGuardedResolver,
+    PooledHttpClient,
+    SSRFGuardedResolver,
+    aiohttp_delete,
+    aiohttp_request,
+    validate_and_pin_fetch_url,
+)
 from skyvern.utils.url_validators import MAX_SAFE_REDIRECTS, validate_fetch_url
 
 
@@ -1410,3 +1424,132 @@ async def test_aiohttp_request_data_list_with_form_content_type_uses_data() -> N
     assert captured_request_kwargs["data"] == [{"item": 1}, {"item": 2}]
     assert "json" not in captured_request_kwargs
     assert captured_request_kwargs["headers"]["Content-Type"] == "application/x-www-form-urlencoded"
+
+
+@pytest_asyncio.fixture
+async def pooled_client() -> Any:
+    client = PooledHttpClient()
+    with (
+        patch.object(settings, "HTTP_CLIENT_POOL_ENABLED", True),
+        patch.object(settings, "ALLOWED_HOSTS", ["127.0.0.1"]),
+        patch("skyvern.forge.sdk.core.aiohttp_helper.pooled_http_client", return_value=client),
+    ):
+        yield client
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_pooled_aiohttp_request_reuses_connections_without_sharing_cookies(
+    pooled_client: PooledHttpClient,
+) -> None:
+    seen_cookies: list[str | None] = []
+
+    async def handler(request: web.Request) -> web.Response:
+        seen_cookies.append(request.headers.get("Cookie"))
+        response = web.json_response({"ok": True})
+        response.set_cookie("session", "from-first-caller")
+        return response
+
+    app = web.Application()
+    app.router.add_get("/api", handler)
+    async with TestServer(app, host="127.0.0.1") as server:
+        url = f"http://127.0.0.1:{server.port}/api"
+        first = await aiohttp_request(method="GET", url=url)
+        second = await aiohttp_request(method="GET", url=url, cookies={"caller": "two"})
+
+    assert first[:1] == second[:1] == (200,)
+    assert seen_cookies == [None, "caller=two"]
+    assert (pooled_client.stats.connections_created, pooled_client.stats.connections_reused) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_pooled_aiohttp_request_keeps_proxied_requests_off_the_shared_session(
+    pooled_client: PooledHttpClient,
+) -> None:
+    mock_response = AsyncMock()
+    mock_response.status = 200
+    mock_response.headers = {"Content-Type": "application/json"}
+    mock_response.json = AsyncMock(return_value={"success": True})
+    mock_response.__aenter__ = AsyncMock(return_value=mock_response)
+    mock_response.__aexit__ = AsyncMock(return_value=None)
+
+    mock_session = MagicMock()
+    mock_session.__aenter__ = AsyncMock(return_value=mock_session)
+    mock_session.__aexit__ = AsyncMock(return_value=None)
+    mock_session.request = MagicMock(return_value=mock_response)
+
+    with patch("skyvern.forge.sdk.core.aiohttp_helper.aiohttp.ClientSession", return_value=mock_session):
+        await aiohttp_request(method="GET", url="https://example.com/api", proxy="http://127.0.0.1:8080")
+
+    assert pooled_client.stats.requests == 0
+    mock_session.request.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_caching_resolver_reuses_validated_ips_until_ttl(monkeypatch: pytest.MonkeyPatch) -> None:
+    resolver = CachingSSRFGuardedResolver(ttl_seconds=60)
+    resolver.pin_url_ips("https://api.example.test/v1", ("93.184.216.34",))
+
+    def unexpected_dns(host: str, port: int | None, *args: object, **kwargs: object) -> list[object]:
+        raise AssertionError("cached host should not be re-resolved")
+
+    monkeypatch.setattr("skyvern.utils.url_validators.socket.getaddrinfo", unexpected_dns)
+    assert await validate_and_pin_fetch_url("https://API.example.test/v2", resolver) == "https://api.example.test/v2"
+    assert resolver.cache_hits == 1
+    with pytest.raises(ValueError):
+        resolver.trust_proxy_url("http://127.0.0.1:8080")
+
+    with patch("cachetools.TTLCache.timer", return_value=time.monotonic() + 120):
+        assert resolver.cached_host_ips("api.example.test") is None
+
+
+@pytest.mark.asyncio
+async def test_caching_resolver_revalidates_a_busy_host_once_the_ttl_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    resolutions: list[str] = []
+
+    def counting_dns(host: str, port: int | None, *args: object, **kwargs: object) -> list[object]:
+        resolutions.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 0, "", ("93.184.216.34", port or 0))]
+
+    monkeypatch.setattr("skyvern.utils.url_validators.socket.getaddrinfo", counting_dns)
+    resolver = CachingSSRFGuardedResolver(ttl_seconds=1)
+    now = [0.0]
+    resolver._validated_host_ips = TTLCache(maxsize=16, ttl=1, timer=lambda: now[0])
+
+    # A fetch every 0.4s: re-pinning each cache hit must not keep pushing the expiry out, so the
+    # host is resolved again at 1.2s and 2.4s.
+    for fetch in range(7):
+        now[0] = fetch * 0.4
+        await validate_and_pin_fetch_url("https://api.example.test/v1", resolver)
+
+    assert len(resolutions) == 3
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_request_redirect_chain_shares_one_timeout_budget(pooled_client: PooledHttpClient) -> None:
+    now = [100.0]
+    hop_timeouts: list[float] = []
+
+    def slow_redirect(*args: Any, **kwargs: Any) -> AsyncMock:
+        hop_timeouts.append(kwargs["timeout"].total)
+        now[0] += 4
+        response = AsyncMock()
+        response.status = 302
+        response.headers = {"Location": f"https://example.com/hop{len(hop_timeouts)}"}
+        response.__aenter__ = AsyncMock(return_value=response)
+        response.__aexit__ = AsyncMock(return_value=None)
+        return response
+
+    mock_session = MagicMock()
+    mock_session.request = MagicMock(side_effect=slow_redirect)
+    pooled_client.session = MagicMock(return_value=mock_session)  # type: ignore[method-assign]
+    pooled_client._resolver = CachingSSRFGuardedResolver(ttl_seconds=60)
+
+    with (
+        patch("skyvern.forge.sdk.core.aiohttp_helper.time", SimpleNamespace(monotonic=lambda: now[0])),
+        pytest.raises(TimeoutError),
+    ):
+        await aiohttp_request(method="GET", url="https://example.com/start", timeout=10)
+
+    # Each hop only gets what the earlier ones left, and no hop starts once the budget is spent.
+    assert hop_timeouts == [10, 6, 2]
@@ -0,0 +1,105 @@
+"""Tests for incremental browser profile/session persistence."""
+
+from __future__ import annotations
+
+import os
+import shutil
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from skyvern.forge.sdk.artifact.storage import profile_sync
+from skyvern.forge.sdk.artifact.storage.profile_sync import (
+    PROFILE_MANIFEST_FILENAME,
+    sync_profile_directory,
+    zip_profile_directory,
+)
+
+
+@pytest.fixture
+def profile(tmp_path: Path) -> Path:
+    src = tmp_path / "src"
+    (src / "Default" / "Cache" / "Cache_Data").mkdir(parents=True)
+    (src / "Default" / "Local Storage").mkdir(parents=True)
+    (src / "Default" / "Cookies").write_text("cookies-v1")
+    (src / "Default" / "Preferences").write_text("{}")
+    (src / "Default" / "Local Storage" / "leveldb").write_text("ls")
+    (src / "Default" / "Cache" / "Cache_Data" / "f_000001").write_bytes(b"x" * 1024)
+    (src / "GrShaderCache").mkdir()
+    (src / "GrShaderCache" / "data_0").write_bytes(b"shader")
+    return src
+
+
+def test_second_store_copies_only_changed_files(profile: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    dst = tmp_path / "dst"
+    first = sync_profile_directory(profile, dst, prune=True)
+    assert first.copied == 3
+    assert not (dst / "Default" / "Cache").exists()
+    assert not (dst / "GrShaderCache").exists()
+    assert (dst / PROFILE_MANIFEST_FILENAME).exists()
+
+    (profile / "Default" / "Cookies").write_text("cookies-v2")
+    copied: list[str] = []
+    real_copy2 = shutil.copy2
+    monkeypatch.setattr(shutil, "copy2", lambda s, d: copied.append(Path(s).name) or real_copy2(s, d))
+
+    second = sync_profile_directory(profile, dst, prune=True)
+
+    assert copied == ["Cookies"]
+    assert (second.copied, second.unchanged) == (1, 2)
+    assert (dst / "Default" / "Cookies").read_text() == "cookies-v2"
+
+
+def test_rewrite_with_identical_content_is_not_copied(
+    profile: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    dst = tmp_path / "dst"
+    sync_profile_directory(profile, dst, prune=True)
+    preferences = profile / "Default" / "Preferences"
+    stat = preferences.stat()
+    os.utime(preferences, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    result = sync_profile_directory(profile, dst, prune=True)
+    assert (result.copied, result.unchanged) == (0, 3)
+
+    # The stored copy's mtime was realigned, so the next store skips it without hashing.
+    hashed: list[Path] = []
+    real_sha256 = profile_sync._sha256
+    monkeypatch.setattr(profile_sync, "_sha256", lambda path: hashed.append(path) or real_sha256(path))
+    sync_profile_directory(profile, dst, prune=True)
+    assert hashed == []
+
+
+def test_prune_removes_files_gone_from_the_source(profile: Path, tmp_path: Path) -> None:
+    dst = tmp_path / "dst"
+    sync_profile_directory(profile, dst, prune=True)
+    shutil.rmtree(profile / "Default" / "Local Storage")
+
+    overlay = sync_profile_directory(profile, tmp_path / "overlay", prune=False)
+    result = sync_profile_directory(profile, dst, prune=True)
+
+    assert overlay.removed == 0
+    assert result.removed == 1
+    assert not (dst / "Default" / "Local Storage").exists()
+    assert (dst / "Default" / "Cookies").exists()
+
+
+def test_tampered_stored_copy_is_recopied(profile: Path, tmp_path: Path) -> None:
+    dst = tmp_path / "dst"
+    sync_profile_directory(profile, dst, prune=True)
+    (dst / "Default" / "Cookies").write_text("corrupt")
+
+    result = sync_profile_directory(profile, dst, prune=True)
+
+    assert result.copied == 1
+    assert (dst / "Default" / "Cookies").read_text() == "cookies-v1"
+
+
+def test_zip_excludes_caches_and_manifest(profile: Path, tmp_path: Path) -> None:
+    (profile / PROFILE_MANIFEST_FILENAME).write_text("{}")
+    zip_path = zip_profile_directory(str(profile), str(tmp_path / "profile.zip"))
+
+    with zipfile.ZipFile(zip_path) as zf:
+        names = sorted(zf.namelist())
+    assert names == ["Default/Cookies", "Default/Local Storage/leveldb", "Default/Preferences"]
@@ -0,0 +1,134 @@
+"""The compact element-tree wire format: encoded by domUtils.js, decoded by compact_tree.py."""
+
+from __future__ import annotations
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from skyvern.webeye.scraper.compact_tree import decode_compact_element_tree
+from skyvern.webeye.utils.page import SkyvernFrame
+
+_REPO_ROOT = Path(__file__).parent.parent.parent
+_DOMUTILS = _REPO_ROOT / "skyvern" / "webeye" / "scraper" / "domUtils.js"
+_NODE = shutil.which("node")
+
+# Builds a small tree the way buildElementTree does -- the flat list and the tree share element
+# objects, a pruned <label> stays in the flat list only, and only some elements carry options or a
+# shadowHost -- then prints the compact encoding next to the nested result.
+_ENCODE_SCRIPT = """
+const fs = require("fs");
+const src = fs.readFileSync(process.argv[1], "utf8");
+const start = src.indexOf("function encodeCompactElementTree(");
+let depth = 0, end = -1;
+for (let i = src.indexOf("{", start); i < src.length; i++) {
+  if (src[i] === "{") depth++;
+  else if (src[i] === "}" && --depth === 0) { end = i + 1; break; }
+}
+const encode = new Function(`${src.substring(start, end)}\\nreturn encodeCompactElementTree;`)();
+
+const node = (id, tagName, extra = {}) => ({
+  id, frame: "main.frame", frame_index: 0, interactable: tagName !== "div", tagName,
+  attributes: { class: "c-" + id }, beforePseudoText: null, text: id + " text", children: [],
+  xpath: "/" + tagName, ...extra,
+});
+const select = node("AAAc", "select", { options: [{ optionIndex: 0, text: "One", value: "1" }] });
+const button = node("AAAd", "button", { shadowHost: "AAAb" });
+const host = node("AAAb", "div");
+host.children.push(select, button);
+const root = node("AAAa", "div");
+root.children.push(host);
+const label = node("AAAe", "label");
+const labelled = node("AAAf", "span");
+label.children.push(labelled);
+const second = node("AAAg", "a", { frame_index: undefined });
+const elements = [root, host, select, button, label, labelled, second];
+const tree = [root, second];
+// The nested result as Playwright's evaluate delivers it, where an undefined property arrives as None.
+const nested = JSON.stringify([elements, tree], (key, value) => (value === undefined ? null : value));
+console.log(JSON.stringify({ compact: encode(elements, tree), nested: JSON.parse(nested) }));
+"""
+
+
+@pytest.mark.skipif(_NODE is None, reason="node not on PATH")
+def test_decoding_the_page_encoding_rebuilds_the_nested_result() -> None:
+    result = subprocess.run(
+        [_NODE, "-e", _ENCODE_SCRIPT, str(_DOMUTILS)],
+        capture_output=True,
+        text=True,
+        timeout=30,
+        check=True,
+    )
+    encoded = json.loads(result.stdout)
+    compact = json.loads(encoded["compact"])
+    # Seven elements share one frame name but carry six different tags: only the frame is interned.
+    assert compact["interned"]["frame"] == {"strings": ["main.frame"], "codes": [0] * 7}
+    assert compact["columns"]["tagName"] == ["div", "div", "select", "button", "label", "span", "a"]
+    assert set(compact["sparse"]) == {"options", "shadowHost"}
+    assert len(encoded["compact"]) < len(json.dumps(encoded["nested"]))
+
+    elements, element_tree = decode_compact_element_tree(encoded["compact"])
+
+    assert [elements, element_tree] == encoded["nested"]
+    # As over Playwright's evaluate: the tree and the flat list hold the same dicts.
+    assert element_tree[0]["children"][0] is elements[1]
+    assert elements[4]["children"] == [elements[5]]
+    assert all(element is not elements[4] for element in element_tree)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "not json",
+        json.dumps({"version": 2, "count": 0, "parents": [], "roots": []}),
+        json.dumps({"version": 1, "count": 2, "parents": [1, -1], "roots": [1]}),
+        json.dumps({"version": 1, "count": 1, "parents": [-1], "roots": [3]}),
+        json.dumps({"version": 1, "count": 1, "parents": [-1], "roots": [0], "columns": {"id": []}}),
+        json.dumps({"version": 1, "count": 1, "parents": [-1], "roots": [0], "columns": {"children": [[]]}}),
+        json.dumps({"version": 1, "count": 1, "parents": [-1], "roots": [0], "sparse": {"id": {"7": "x"}}}),
+        json.dumps(
+            {
+                "version": 1,
+                "count": 1,
+                "parents": [-1],
+                "roots": [0],
+                "interned": {"tagName": {"strings": ["a"], "codes": [4]}},
+            }
+        ),
+    ],
+)
+def test_a_malformed_payload_is_rejected(payload: str) -> None:
+    with pytest.raises(ValueError, match="Malformed compact element tree"):
+        decode_compact_element_tree(payload)
+
+
+@pytest.mark.asyncio
+async def test_compact_mode_builds_with_the_compact_entry_point(monkeypatch: pytest.MonkeyPatch) -> None:
+    from skyvern.config import settings
+
+    monkeypatch.setattr(settings, "BROWSER_SCRAPING_ELEMENT_TREE_WIRE_FORMAT", "compact")
+    payload = json.dumps(
+        {
+            "version": 1,
+            "count": 2,
+            "parents": [-1, 0],
+            "roots": [0],
+            "columns": {"id": ["AAAa", "AAAb"], "frame": ["main.frame", "main.frame"]},
+            "sparse": {"destination": {"1": {"kind": "anchor", "url": "https://example.com/"}}},
+        }
+    )
+    frame = SkyvernFrame(MagicMock())
+    frame._set_enriched_element_tree_flag = AsyncMock()  # type: ignore[method-assign]
+    frame.evaluate = AsyncMock(return_value=[payload, {"elapsed_ms": 3}])  # type: ignore[method-assign]
+
+    elements, element_tree, destinations = await frame.build_tree_from_body(frame_name="main.frame", frame_index=0)
+
+    assert "buildCompactTreeFromBody(" in frame.evaluate.await_args.kwargs["expression"]
+    assert element_tree == [elements[0]] and elements[0]["children"] == [elements[1]]
+    # Destination facts are stripped at the boundary in either format.
+    assert destinations == {"AAAb": {"kind": "anchor", "url": "https://example.com/"}}
+    assert "destination" not in elements[1]
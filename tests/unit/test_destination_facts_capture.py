@@ -212,6 +212,7 @@ class TestEntryPointsStrip:
                     f"{producer}(" in rendered
                     for producer in (
                         "buildTreeFromBody",
+                        "buildCompactTreeFromBody",
                         "getIncrementElements",
                         "buildElementTree",
                         "buildElementObject",
@@ -253,7 +254,7 @@ class TestCaptureIsFlagGated:
         frame.evaluate = fake_evaluate  # type: ignore[method-assign]
         await frame.build_tree_from_body(frame_name="main.frame", frame_index=0)
         arg = captured["arg"]
-        assert isinstance(arg, list) and len(arg) == 4, "the capture flag no longer reaches JS"
+        assert isinstance(arg, list) and len(arg) == 5, "the capture flag no longer reaches JS"
         return arg[3]
 
     @pytest.mark.asyncio
@@ -4,7 +4,8 @@ Element-tree scraper regression tests.
 Aggregates the behavioral Node.js suites that exercise domUtils.js against a mock DOM:
 the two crash paths (undefined `className` in isHoverPointerElement, and the
 isElementVisible recursion cycle on a display:contents element holding a
-checkbox/radio/option), plus the datepicker, aria-popup, and Kendo picker seams.
+checkbox/radio/option), plus the datepicker, aria-popup, and Kendo picker seams, and the
+tree walk's per-build memo and budget.
 """
 
 import shutil
@@ -72,6 +73,17 @@ class TestDomScrapeCrashGuards:
         )
         assert result.returncode == 0, f"Failed:\n{result.stdout}\n{result.stderr}"
 
+    def test_tree_build_memo_behavioral(self):
+        script = Path(__file__).parent / "test_domutils_tree_build_memo.js"
+        assert script.exists(), f"Missing {script}"
+        result = subprocess.run(
+            [_NODE, str(script)],
+            capture_output=True,
+            text=True,
+            timeout=30,
+        )
+        assert result.returncode == 0, f"Failed:\n{result.stdout}\n{result.stderr}"
+
     def test_injection_scope_isolation(self, tmp_path):
         from skyvern.webeye.utils.page import load_js_script
 
@@ -0,0 +1,242 @@
+/**
+ * Behavioral tests for the element tree walk's per-build memo and budget in domUtils.js.
+ *
+ * buildElementTree walks synchronously inside ScrapeMemo.run, so the same element's computed
+ * style, visibility and text are read from the page once per build; TreeBuildBudget stops the
+ * walk at its element or time bound and the walk reports which one it hit.
+ * Exit 0 = pass, exit 1 = failures on stderr.
+ */
+
+const assert = require("node:assert");
+const fs = require("fs");
+const path = require("path");
+
+const src = fs.readFileSync(
+  path.join(__dirname, "../../skyvern/webeye/scraper/domUtils.js"),
+  "utf8",
+);
+
+function extractFrom(start, label) {
+  if (start === -1) throw new Error(`${label} not found in domUtils.js`);
+  const bodyStart = src.indexOf("{", start);
+  let depth = 0;
+  for (let i = bodyStart; i < src.length; i++) {
+    if (src[i] === "{") depth++;
+    else if (src[i] === "}") {
+      depth--;
+      if (depth === 0) return src.substring(start, i + 1);
+    }
+  }
+  throw new Error(`${label} is unbalanced`);
+}
+
+const extract = (name) => extractFrom(src.indexOf(`function ${name}(`), name);
+const extractClass = (name) =>
+  extractFrom(src.indexOf(`class ${name} {`), name);
+
+function el(tagName, children = [], extra = {}) {
+  return {
+    tagName,
+    children,
+    childElementCount: children.length,
+    shadowRoot: null,
+    hasAttribute: () => false,
+    getAttribute: () => null,
+    ...extra,
+  };
+}
+
+// The walk with the real memo, budget and id helpers; the page-facing predicates are stubs that
+// route through the memoized helpers the way isInteractable and buildElementObject do.
+function makeWalk({
+  clock = () => 0,
+  interactable = () => true,
+} = {}) {
+  const reads = { style: 0, visible: 0, text: 0 };
+  const view = {
+    getComputedStyle: () => {
+      reads.style += 1;
+      return { display: "block", cursor: "auto" };
+    },
+  };
+  const window = { elementIdCounter: { value: 0 } };
+  const factory = new Function(
+    "window",
+    "document",
+    "performance",
+    "reads",
+    "view",
+    "interactable",
+    `const _jsConsoleLog = () => {};
+     const _jsConsoleWarn = () => {};
+     ${extractClass("ScrapeMemo")}
+     ${extractClass("TreeBuildBudget")}
+     ${extract("getElementComputedStyle")}
+     function readElementComputedStyle(element, pseudo) {
+       return view.getComputedStyle(element, pseudo);
+     }
+     function isElementVisible(element) {
+       reads.visible += 1;
+       return true;
+     }
+     ${extract("isElementVisibleCached")}
+     function getElementText(element) {
+       reads.text += 1;
+       return element.text || "";
+     }
+     ${extract("getElementTextCached")}
+     ${extract("formatUniqueId")}
+     ${extract("nextUniqueId")}
+     async function getHoverStylesMap() { return new Map(); }
+     function getChildElements(element) { return element.children; }
+     function isHidden(element) { return getElementComputedStyle(element).display === "none"; }
+     function isScriptOrStyle() { return false; }
+     function isInteractable(element) {
+       getElementComputedStyle(element);
+       return isElementVisibleCached(element) && interactable(element);
+     }
+     function isTableRelatedElement() { return false; }
+     function hasBeforeOrAfterPseudoContent() { return false; }
+     function isDOMNodeRepresentDiv() { return false; }
+     function buildElementObject(frame, element, interactable) {
+       return {
+         id: nextUniqueId(),
+         tagName: element.tagName,
+         interactable,
+         attributes: {},
+         text: getElementTextCached(element),
+         children: [],
+       };
+     }
+     async ${extract("buildElementTree")}
+     return { buildElementTree, ScrapeMemo };`,
+  );
+  const walk = factory(
+    window,
+    { documentElement: null, querySelector: () => null },
+    { now: clock },
+    reads,
+    view,
+    interactable,
+  );
+  return { ...walk, reads };
+}
+
+const tests = [];
+function test(name, fn) {
+  tests.push([name, fn]);
+}
+
+test("each element's style, visibility and text are read once per walk", async () => {
+  const leaves = [el("a", [], { text: "one" }), el("a", [], { text: "two" })];
+  const root = el("div", [el("ul", leaves)]);
+  const walk = makeWalk();
+
+  const [elements, tree, stats] = await walk.buildElementTree(root, "main.frame");
+
+  assert.strictEqual(elements.length, 4);
+  assert.deepStrictEqual(walk.reads, { style: 4, visible: 4, text: 4 });
+  assert.ok(stats.memo_hits >= 8, `no memo hits: ${stats.memo_hits}`);
+  assert.strictEqual(stats.truncated_by, null);
+  assert.strictEqual(stats.visited_nodes, 4);
+  // The tree is linked through the id map, one level per DOM level.
+  assert.strictEqual(tree.length, 1);
+  assert.deepStrictEqual(
+    tree[0].children[0].children.map((child) => child.text),
+    ["one", "two"],
+  );
+  assert.strictEqual(walk.ScrapeMemo.active, null, "memo outlived the walk");
+});
+
+test("a second walk starts from a fresh memo", async () => {
+  const root = el("div", [el("a")]);
+  const walk = makeWalk();
+  await walk.buildElementTree(root, "main.frame");
+  await walk.buildElementTree(root, "main.frame");
+  assert.strictEqual(walk.reads.style, 4);
+});
+
+test("the element limit stops the walk and is reported", async () => {
+  const root = el("div", Array.from({ length: 5 }, () => el("a")));
+  const walk = makeWalk();
+
+  const [elements, , stats] = await walk.buildElementTree(
+    root,
+    "main.frame",
+    false,
+    undefined,
+    3,
+  );
+
+  assert.strictEqual(elements.length, 3);
+  assert.strictEqual(stats.truncated_by, "element_limit");
+  assert.strictEqual(stats.element_count, 3);
+});
+
+test("the time budget stops the walk and is reported", async () => {
+  let now = 0;
+  const root = el("div", Array.from({ length: 500 }, () => el("a")));
+  const walk = makeWalk({
+    clock: () => now,
+    interactable: () => {
+      now += 1;
+      return true;
+    },
+  });
+
+  const [elements, , stats] = await walk.buildElementTree(
+    root,
+    "main.frame",
+    false,
+    undefined,
+    0,
+    [],
+    100,
+  );
+
+  assert.strictEqual(stats.truncated_by, "time_budget");
+  assert.ok(
+    elements.length > 100 && elements.length < 500,
+    `got ${elements.length}`,
+  );
+  assert.strictEqual(stats.elapsed_ms, now);
+});
+
+test("uniqueId and nextUniqueId draw distinct ids from one counter", async () => {
+  const window = { GlobalSkyvernFrameIndex: 0, elementIdCounter: null };
+  const ids = new Function(
+    "window",
+    `${extractClass("SafeCounter")}
+     window.elementIdCounter = new SafeCounter();
+     async ${extract("uniqueId")}
+     ${extract("nextUniqueId")}
+     ${extract("formatUniqueId")}
+     return { uniqueId, nextUniqueId };`,
+  )(window);
+
+  const pending = ids.uniqueId();
+  const sync = ids.nextUniqueId();
+  const drawn = [
+    sync,
+    await pending,
+    ids.nextUniqueId(),
+    await ids.uniqueId(),
+  ];
+
+  assert.strictEqual(new Set(drawn).size, 4, `duplicate ids: ${drawn}`);
+  assert.strictEqual(window.elementIdCounter.value, 4);
+});
+
+(async () => {
+  let failures = 0;
+  for (const [name, fn] of tests) {
+    try {
+      await fn();
+      console.log(`ok - ${name}`);
+    } catch (err) {
+      failures += 1;
+      console.error(`FAIL - ${name}: ${err.stack}`);
+    }
+  }
+  process.exit(failures ? 1 : 0);
+})();
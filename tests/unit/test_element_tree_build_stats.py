@@ -0,0 +1,76 @@
+"""buildTreeFromBody's walk stats reaching Python: the budget goes to JS, the stats come back."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from skyvern.webeye.utils import page as page_module
+from skyvern.webeye.utils.page import SkyvernFrame
+
+
+def _frame(payload: object, captured: dict) -> SkyvernFrame:
+    frame = SkyvernFrame(MagicMock())
+    frame._set_enriched_element_tree_flag = AsyncMock()  # type: ignore[method-assign]
+
+    async def fake_evaluate(**kwargs: object) -> object:
+        captured.update(kwargs)
+        return payload
+
+    frame.evaluate = fake_evaluate  # type: ignore[method-assign]
+    return frame
+
+
+@pytest.mark.asyncio
+async def test_truncated_walk_is_recorded_and_logged(monkeypatch: pytest.MonkeyPatch) -> None:
+    from skyvern.config import settings
+
+    monkeypatch.setattr(settings, "BROWSER_SCRAPING_TREE_BUILD_BUDGET_MS", 20000)
+    span = MagicMock()
+    monkeypatch.setattr(page_module, "otel_trace", SimpleNamespace(get_current_span=lambda: span))
+    log = MagicMock()
+    monkeypatch.setattr(page_module, "LOG", log)
+    stats = {
+        "elapsed_ms": 20011,
+        "visited_nodes": 9000,
+        "element_count": 4200,
+        "truncated_by": "time_budget",
+        "memo_hits": 31000,
+        "memo_misses": 12000,
+    }
+    captured: dict = {}
+    frame = _frame([[{"id": "A1"}], [], stats], captured)
+
+    elements, element_tree, destinations = await frame.build_tree_from_body(frame_name="main.frame", frame_index=0)
+
+    assert captured["arg"][4] == 20000
+    assert elements == [{"id": "A1"}] and element_tree == [] and destinations == {}
+    span.set_attribute.assert_any_call("tree_build.elapsed_ms", 20011)
+    span.set_attribute.assert_any_call("tree_build.memo_hits", 31000)
+    span.set_attribute.assert_any_call("tree_build.truncated_by", "time_budget")
+    log.warning.assert_called_once()
+    assert log.warning.call_args.kwargs["truncated_by"] == "time_budget"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [
+        [[], []],
+        [[], [], "not stats"],
+        [[], [], {"elapsed_ms": "12", "truncated_by": "<script>", "memo_hits": True}],
+    ],
+)
+async def test_missing_or_malformed_stats_are_ignored(monkeypatch: pytest.MonkeyPatch, payload: list) -> None:
+    span = MagicMock()
+    monkeypatch.setattr(page_module, "otel_trace", SimpleNamespace(get_current_span=lambda: span))
+    log = MagicMock()
+    monkeypatch.setattr(page_module, "LOG", log)
+
+    elements, element_tree, _ = await _frame(payload, {}).build_tree_from_body(frame_name="main.frame", frame_index=0)
+
+    assert elements == [] and element_tree == []
+    span.set_attribute.assert_not_called()
+    log.warning.assert_not_called()
@@ -0,0 +1,140 @@
+"""Unit tests for the SQLite-backed cross-run extraction cache tier."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from skyvern.config import settings
+from skyvern.forge import agent_functions
+from skyvern.forge.agent_functions import AgentFunction
+from skyvern.forge.sdk.cache import extraction_cache, extraction_cache_sqlite
+from skyvern.forge.sdk.cache.extraction_cache_sqlite import SqliteExtractionCache
+
+
+def _cache(tmp_path: Path, **overrides: float) -> SqliteExtractionCache:
+    kwargs: dict[str, float] = {"max_bytes": 10_000, "max_entry_bytes": 1_000, "ttl_seconds": 3600}
+    kwargs.update(overrides)
+    return SqliteExtractionCache(str(tmp_path / "cache" / "extraction.sqlite3"), **kwargs)  # type: ignore[arg-type]
+
+
+def test_round_trip_and_scope(tmp_path: Path) -> None:
+    cache = _cache(tmp_path)
+    assert cache.store_sync("wpid_1", "key", {"docs": ["a", "b"]})
+
+    result = cache.lookup_sync("wpid_1", "key")
+    assert result.hit
+    assert result.value == {"docs": ["a", "b"]}
+    assert result.scope == extraction_cache.SCOPE_WPID
+    assert result.age_seconds is not None
+
+    miss = cache.lookup_sync("wpid_2", "key")
+    assert not miss.hit
+    assert miss.fallback_reason == extraction_cache.FALLBACK_KEY_NOT_FOUND
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 1
+
+
+def test_shared_across_connections(tmp_path: Path) -> None:
+    writer = _cache(tmp_path)
+    reader = _cache(tmp_path)
+    writer.store_sync("wpid_1", "key", "value")
+    assert reader.lookup_sync("wpid_1", "key").value == "value"
+
+
+def test_expired_entry_is_deleted_and_reported(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = _cache(tmp_path, ttl_seconds=10)
+    now = 1_000_000.0
+    monkeypatch.setattr(extraction_cache_sqlite.time, "time", lambda: now)
+    cache.store_sync("wpid_1", "key", [1, 2, 3])
+
+    now += 11
+    result = cache.lookup_sync("wpid_1", "key")
+    assert not result.hit
+    assert result.fallback_reason == extraction_cache.FALLBACK_TTL_EXPIRED
+    assert cache.stats.expired == 1
+    assert cache.lookup_sync("wpid_1", "key").fallback_reason == extraction_cache.FALLBACK_KEY_NOT_FOUND
+
+
+def test_oversized_entry_is_not_stored(tmp_path: Path) -> None:
+    cache = _cache(tmp_path, max_entry_bytes=50)
+    assert not cache.store_sync("wpid_1", "key", "x" * 100)
+    assert cache.stats.rejected_oversize == 1
+    assert not cache.lookup_sync("wpid_1", "key").hit
+
+
+def test_lru_eviction_respects_byte_budget(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # each value serializes to 102 bytes ("x" * 100 plus quotes); the budget holds two
+    cache = _cache(tmp_path, max_bytes=250)
+    now = 1_000_000.0
+    monkeypatch.setattr(extraction_cache_sqlite.time, "time", lambda: now)
+    cache.store_sync("wpid_1", "a", "a" * 100)
+    now += 1
+    cache.store_sync("wpid_1", "b", "b" * 100)
+    now += 1
+    # touching "a" makes "b" the least recently used entry
+    assert cache.lookup_sync("wpid_1", "a").hit
+    now += 1
+    cache.store_sync("wpid_1", "c", "c" * 100)
+
+    assert cache.stats.evictions == 1
+    assert cache.lookup_sync("wpid_1", "a").hit
+    assert not cache.lookup_sync("wpid_1", "b").hit
+    assert cache.lookup_sync("wpid_1", "c").hit
+
+
+def test_corrupt_file_degrades_to_lookup_error(tmp_path: Path) -> None:
+    path = tmp_path / "corrupt.sqlite3"
+    path.write_bytes(b"definitely not a sqlite database" * 100)
+    cache = SqliteExtractionCache(str(path), max_bytes=10_000, max_entry_bytes=1_000, ttl_seconds=60)
+
+    assert cache.lookup_sync("wpid_1", "key").fallback_reason == extraction_cache.FALLBACK_LOOKUP_ERROR
+    assert not cache.store_sync("wpid_1", "key", "value")
+    assert cache.stats.errors == 2
+
+
+@pytest.mark.asyncio
+async def test_agent_function_hooks_use_sqlite_tier(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    agent_function = AgentFunction()
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_SQLITE_PATH", None)
+    monkeypatch.setattr(extraction_cache_sqlite, "_local_cache", None)
+    await agent_function.store_cross_run_extraction_cache("wpid_1", "key", {"a": 1})
+    assert await agent_function.lookup_cross_run_extraction_cache("wpid_1", "key") is None
+
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_SQLITE_PATH", str(tmp_path / "hooks.sqlite3"))
+    await agent_function.store_cross_run_extraction_cache("wpid_1", "key", {"a": 1})
+    assert await agent_function.lookup_cross_run_extraction_cache("wpid_1", "key") == {"a": 1}
+    # no workflow_permanent_id means the cross-run tier does not apply
+    await agent_function.store_cross_run_extraction_cache(None, "key", {"a": 1})
+    assert await agent_function.lookup_cross_run_extraction_cache(None, "key") is None
+
+    with sqlite3.connect(tmp_path / "hooks.sqlite3") as conn:
+        assert conn.execute("SELECT COUNT(*) FROM extraction_cache").fetchone() == (1,)
+    extraction_cache_sqlite._local_cache.close()  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_agent_function_lookup_logs_the_tiers_miss_reason(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = MagicMock()
+    monkeypatch.setattr(agent_functions, "LOG", log)
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_SQLITE_PATH", str(tmp_path / "hooks.sqlite3"))
+    monkeypatch.setattr(settings, "EXTRACTION_CACHE_SQLITE_TTL_SECONDS", 60)
+    monkeypatch.setattr(extraction_cache_sqlite, "_local_cache", None)
+    now = 1_000.0
+    monkeypatch.setattr(extraction_cache_sqlite.time, "time", lambda: now)
+    agent_function = AgentFunction()
+    await agent_function.store_cross_run_extraction_cache("wpid_1", "key", {"a": 1})
+    now += 61
+
+    assert await agent_function.lookup_cross_run_extraction_cache("wpid_1", "key") is None
+    assert await agent_function.lookup_cross_run_extraction_cache("wpid_1", "other") is None
+
+    reasons = [call.kwargs["fallback_reason"] for call in log.info.call_args_list]
+    assert reasons == [extraction_cache.FALLBACK_TTL_EXPIRED, extraction_cache.FALLBACK_KEY_NOT_FOUND]
+    assert log.info.call_args.kwargs["cache_scope"] == extraction_cache.SCOPE_WPID
+    extraction_cache_sqlite._local_cache.close()  # type: ignore[union-attr]
@@ -0,0 +1,86 @@
+"""Tests for the screenshot downscale/re-encode stage in front of llm_messages_builder."""
+
+import io
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from skyvern.config import settings
+from skyvern.forge.sdk.api.llm import screenshot_encoding
+from skyvern.forge.sdk.api.llm.screenshot_encoding import encode_screenshot_for_llm
+from skyvern.forge.sdk.api.llm.utils import llm_messages_builder
+
+
+def _png(width: int, height: int) -> bytes:
+    buf = io.BytesIO()
+    # noise keeps the PNG from compressing better than the lossy re-encode
+    image = Image.effect_noise((width, height), 64).convert("RGB")
+    image.save(buf, format="PNG")
+    return buf.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    screenshot_encoding._encoded_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_disabled_passes_original_png_through() -> None:
+    screenshot = _png(64, 64)
+    with patch.object(settings, "LLM_SCREENSHOT_ENCODING_ENABLED", False):
+        encoded = await encode_screenshot_for_llm(screenshot)
+    assert encoded.data is screenshot
+    assert encoded.media_type == "image/png"
+
+
+@pytest.mark.asyncio
+async def test_enabled_downscales_and_reencodes() -> None:
+    screenshot = _png(2560, 1440)
+    with (
+        patch.object(settings, "LLM_SCREENSHOT_ENCODING_ENABLED", True),
+        patch.object(settings, "LLM_SCREENSHOT_MAX_DIMENSION", 1280),
+        patch.object(settings, "LLM_SCREENSHOT_FORMAT", "jpeg"),
+    ):
+        encoded = await encode_screenshot_for_llm(screenshot)
+
+    assert encoded.media_type == "image/jpeg"
+    assert len(encoded.data) < len(screenshot)
+    with Image.open(io.BytesIO(encoded.data)) as image:
+        assert image.size == (1280, 720)
+
+
+@pytest.mark.asyncio
+async def test_encoded_result_is_cached_per_screenshot() -> None:
+    screenshot = _png(2000, 1000)
+    with (
+        patch.object(settings, "LLM_SCREENSHOT_ENCODING_ENABLED", True),
+        patch.object(screenshot_encoding, "_encode", wraps=screenshot_encoding._encode) as encode,
+    ):
+        first = await encode_screenshot_for_llm(screenshot)
+        second = await encode_screenshot_for_llm(screenshot)
+
+    assert first is second
+    assert encode.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_undecodable_bytes_fall_back_to_original() -> None:
+    with patch.object(settings, "LLM_SCREENSHOT_ENCODING_ENABLED", True):
+        encoded = await encode_screenshot_for_llm(b"not an image")
+    assert encoded.data == b"not an image"
+    assert encoded.media_type == "image/png"
+
+
+@pytest.mark.asyncio
+async def test_messages_carry_the_encoded_media_type() -> None:
+    screenshot = _png(2560, 1440)
+    with (
+        patch.object(settings, "LLM_SCREENSHOT_ENCODING_ENABLED", True),
+        patch.object(settings, "LLM_SCREENSHOT_FORMAT", "webp"),
+    ):
+        openai_messages = await llm_messages_builder("prompt", [screenshot])
+        anthropic_messages = await llm_messages_builder("prompt", [screenshot], message_pattern="anthropic")
+
+    assert openai_messages[0]["content"][1]["image_url"]["url"].startswith("data:image/webp;base64,")
+    assert anthropic_messages[0]["content"][1]["source"]["media_type"] == "image/webp"
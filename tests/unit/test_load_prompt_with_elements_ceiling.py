@@ -551,3 +551,83 @@ def test_two_thirds_economy_fallback_count_matches_final_prompt(monkeypatch: pyt
         assert ctx.last_prompt_breakdown["total_tokens_local"] == count_tokens(rendered)
     finally:
         skyvern_context._context.reset(token)
+
+
+@pytest.fixture
+def fresh_section_counts(monkeypatch: pytest.MonkeyPatch) -> None:
+    from cachetools import TTLCache
+
+    from skyvern.utils import prompt_engine
+
+    monkeypatch.setattr(prompt_engine, "_SECTION_TOKEN_COUNTS", TTLCache(maxsize=512, ttl=60))
+
+
+def test_oversized_tree_is_planned_down_and_rendered_once_more(
+    monkeypatch: pytest.MonkeyPatch, fresh_section_counts: None
+) -> None:
+    """Fallback drops and the tree trim are planned from section counts; the prompt is rendered with a
+    tree only twice, instead of once more per drop and per trim round."""
+    from skyvern.forge.prompts import prompt_engine as engine_module
+    from skyvern.utils import prompt_engine
+    from skyvern.utils.prompt_engine import load_prompt_with_elements_tracked
+    from skyvern.utils.token_counter import count_tokens
+
+    monkeypatch.setattr(prompt_engine, "PROMPT_HARD_CEILING_TOKENS", 1_500)
+    monkeypatch.setattr(prompt_engine, "_CEILING_SAFETY_MARGIN_TOKENS", 100)
+    monkeypatch.setattr(prompt_engine, "_MIN_USEFUL_ELEMENT_TOKENS", 500)
+
+    html = "".join(f'<div id="{i}">item {i}</div>' for i in range(400))
+    builder = _make_element_tree_builder()
+    builder.build_element_tree.return_value = html
+    builder.support_lean_elements_tree.return_value = False
+    builder.last_used_element_tree_html = html
+    engine = MagicMock(wraps=engine_module)
+
+    rendered, post_kwargs = load_prompt_with_elements_tracked(
+        element_tree_builder=builder,
+        prompt_engine=engine,
+        template_name="extract-information",
+        data_extraction_goal="Extract documents",
+        extracted_information_schema=None,
+        current_url="https://example.test",
+        extracted_text="PAGE_TEXT " * 400,
+        error_code_mapping_str=None,
+        navigation_payload=None,
+        local_datetime="2026-04-14T12:00:00",
+        previous_extracted_information=None,
+    )
+
+    assert count_tokens(rendered) <= 1_500
+    assert '<div id="0">' in rendered and '<div id="399">' not in rendered
+    assert builder.last_used_element_tree_html in rendered
+    assert post_kwargs["extracted_text"] is None
+    tree_renders = [call for call in engine.load_prompt.call_args_list if call.kwargs.get("elements")]
+    assert len(tree_renders) == 2
+
+
+def test_economy_tree_counts_are_memoized_across_prompts(
+    monkeypatch: pytest.MonkeyPatch, fresh_section_counts: None
+) -> None:
+    from skyvern.utils import prompt_engine
+    from skyvern.utils.prompt_engine import load_prompt_with_elements_tracked
+    from skyvern.utils.token_counter import count_tokens as real_count_tokens
+
+    monkeypatch.setattr(prompt_engine, "DEFAULT_MAX_TOKENS", 20)
+    economy_html = "ECONOMY " + ("word " * 10)
+    builder = _economy_builder("P0 " + ("word " * 200), economy_html)
+    engine = MagicMock()
+    engine.load_prompt = MagicMock(side_effect=lambda template_name, elements="", **k: f"PFX {elements} SFX")
+    counted: list[str] = []
+    monkeypatch.setattr(prompt_engine, "count_tokens", lambda text: counted.append(text) or real_count_tokens(text))
+
+    for _ in range(2):
+        rendered, _ = load_prompt_with_elements_tracked(
+            element_tree_builder=builder,
+            prompt_engine=engine,
+            template_name="check-user-goal",
+        )
+        assert "ECONOMY" in rendered
+
+    # Each prompt encodes the first render and the final one; the economy tree is counted once in all.
+    assert counted.count(economy_html) == 1
+    assert counted.count(rendered) == 2
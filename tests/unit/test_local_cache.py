@@ -0,0 +1,111 @@
+"""Unit tests for the in-process LocalCache engine and its lock."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from skyvern.forge.sdk.cache import local
+from skyvern.forge.sdk.cache.local import LocalCache, LockError
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    now = [1_000.0]
+    monkeypatch.setattr(local.time, "monotonic", lambda: now[0])
+    return now
+
+
+@pytest.mark.asyncio
+async def test_set_honours_per_key_ttl(clock: list[float]) -> None:
+    cache = LocalCache()
+    await cache.set("short", "a", ex=10)
+    await cache.set("medium", "b", ex=timedelta(minutes=1))
+    await cache.set("forever", "c", ex=None)
+
+    clock[0] += 11
+    assert await cache.get("short") is None
+    assert await cache.get("medium") == "b"
+    clock[0] += 60
+    assert await cache.get("medium") is None
+    assert await cache.get("forever") == "c"
+    assert cache.stats.expirations == 2
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used_by_bytes() -> None:
+    value_size = local._estimate_size("x" * 1000)
+    cache = LocalCache(max_bytes=value_size * 2 + value_size // 2)
+    await cache.set("a", "a" * 1000)
+    await cache.set("b", "b" * 1000)
+    assert await cache.get("a") is not None  # "b" is now least recently used
+    await cache.set("c", "c" * 1000)
+
+    assert await cache.mget(["a", "b", "c"]) == ["a" * 1000, None, "c" * 1000]
+    assert cache.stats.evictions == 1
+    assert cache.current_bytes == value_size * 2
+
+
+@pytest.mark.asyncio
+async def test_item_cap_and_oversized_values() -> None:
+    cache = LocalCache(max_items=2, max_bytes=10_000)
+    await cache.mset({"a": 1, "b": 2, "c": 3})
+    assert len(cache) == 2
+    assert await cache.get("a") is None
+
+    await cache.set("b", "x" * 20_000)
+    # an oversized write is dropped and replaces the old value rather than leaving it stale
+    assert await cache.get("b") is None
+    assert cache.stats.rejected_oversize == 1
+
+
+@pytest.mark.asyncio
+async def test_nested_values_are_weighed() -> None:
+    cache = LocalCache()
+    await cache.set("small", {"k": "v"})
+    small = cache.current_bytes
+    await cache.set("large", {"k": ["v" * 10_000, {"nested": "w" * 10_000}]})
+    assert cache.current_bytes - small > 20_000
+
+
+@pytest.mark.asyncio
+async def test_lock_serializes_holders() -> None:
+    cache = LocalCache()
+    order: list[str] = []
+
+    async def worker(name: str) -> None:
+        async with cache.get_lock("shared"):
+            order.append(f"{name}:enter")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}:exit")
+
+    await asyncio.gather(worker("one"), worker("two"))
+    assert order in (
+        ["one:enter", "one:exit", "two:enter", "two:exit"],
+        ["two:enter", "two:exit", "one:enter", "one:exit"],
+    )
+    assert cache._locks == {}
+
+
+@pytest.mark.asyncio
+async def test_lock_blocking_timeout_raises_lock_error() -> None:
+    cache = LocalCache()
+    async with cache.get_lock("shared"):
+        with pytest.raises(LockError):
+            async with cache.get_lock("shared", blocking_timeout=0):
+                pass
+        async with cache.get_lock("other", blocking_timeout=0):
+            pass
+
+
+@pytest.mark.asyncio
+async def test_lock_expires_after_timeout() -> None:
+    cache = LocalCache()
+    holder = cache.get_lock("shared", timeout=0.05)  # type: ignore[arg-type]
+    await holder.__aenter__()
+    # the stale holder loses the lock once its timeout passes
+    async with cache.get_lock("shared", blocking_timeout=1):
+        pass
+    await holder.__aexit__(None, None, None)
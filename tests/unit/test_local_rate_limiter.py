@@ -0,0 +1,98 @@
+"""Unit tests for the SQLite-backed local rate limiter."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from skyvern.config import settings
+from skyvern.exceptions import ConcurrencyLimitExceeded, RateLimitExceeded
+from skyvern.forge.sdk.core import local_rate_limiter
+from skyvern.forge.sdk.core.local_rate_limiter import LocalRateLimiter
+
+
+@pytest.fixture
+def limiter_path(tmp_path: Path) -> str:
+    return str(tmp_path / "limits" / "rate_limiter.sqlite3")
+
+
+@pytest.fixture(autouse=True)
+def _limits():
+    with (
+        patch.object(settings, "SUBMIT_RUN_RATE_LIMIT_PER_MINUTE", 60),
+        patch.object(settings, "SUBMIT_RUN_RATE_LIMIT_BURST", 2),
+        patch.object(settings, "SDK_ACTION_CONCURRENCY_LIMIT", 1),
+        patch.object(settings, "RATE_LIMIT_ORGANIZATION_OVERRIDES", {"o_big": {"submit_run_burst": 5}}),
+    ):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_submit_bucket_is_shared_across_processes_and_refills(
+    limiter_path: str, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    now = 1_000_000.0
+    monkeypatch.setattr(local_rate_limiter.time, "time", lambda: now)
+    worker_a = LocalRateLimiter(limiter_path)
+    worker_b = LocalRateLimiter(limiter_path)
+
+    await worker_a.rate_limit_submit_run("o_1")
+    await worker_b.rate_limit_submit_run("o_1")
+    with pytest.raises(RateLimitExceeded):
+        await worker_a.rate_limit_submit_run("o_1")
+    await worker_a.rate_limit_submit_run("o_2")  # other organizations have their own bucket
+
+    now += 1  # 60/minute refills one token per second
+    await worker_b.rate_limit_submit_run("o_1")
+    assert worker_a.stats.submit_runs_rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_per_organization_override(limiter_path: str) -> None:
+    limiter = LocalRateLimiter(limiter_path)
+    for _ in range(5):
+        await limiter.rate_limit_submit_run("o_big")
+    with pytest.raises(RateLimitExceeded):
+        await limiter.rate_limit_submit_run("o_big")
+
+
+@pytest.mark.asyncio
+async def test_sdk_action_slot_rejects_over_cap_and_releases(limiter_path: str) -> None:
+    worker_a = LocalRateLimiter(limiter_path)
+    worker_b = LocalRateLimiter(limiter_path)
+
+    async with worker_a.limit_sdk_action_concurrency("o_1"):
+        with pytest.raises(ConcurrencyLimitExceeded) as rejected:
+            async with worker_b.limit_sdk_action_concurrency("o_1"):
+                pass
+        async with worker_b.limit_sdk_action_concurrency("o_2"):
+            pass
+
+    assert rejected.value.status_code == 429
+    async with worker_b.limit_sdk_action_concurrency("o_1"):
+        pass
+    assert (worker_b.stats.sdk_action_slots_acquired, worker_b.stats.sdk_action_slots_rejected) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_slot_of_a_dead_worker_is_reclaimed(limiter_path: str) -> None:
+    limiter = LocalRateLimiter(limiter_path)
+    with patch.object(local_rate_limiter.os, "getpid", return_value=2**22 + 1):
+        assert limiter.acquire_sdk_action_slot_sync("o_1", limit=1) is not None
+
+    async with limiter.limit_sdk_action_concurrency("o_1"):
+        pass
+    assert limiter.stats.stale_slots_reclaimed == 1
+
+
+@pytest.mark.asyncio
+async def test_unusable_limiter_file_fails_open(tmp_path: Path) -> None:
+    (tmp_path / "not_a_db").write_text("garbage" * 100)
+    limiter = LocalRateLimiter(str(tmp_path / "not_a_db"))
+
+    await limiter.rate_limit_submit_run("o_1")
+    async with limiter.limit_sdk_action_concurrency("o_1"):
+        pass
+    assert limiter.stats.errors >= 2
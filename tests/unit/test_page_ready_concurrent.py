@@ -0,0 +1,162 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+
+from skyvern.webeye.utils.page import PAGE_READY_TIMEOUTS, PageReadyTimeouts, SkyvernFrame
+
+
+def _frame(url: str = "https://shop.example.com/cart") -> SkyvernFrame:
+    frame = AsyncMock()
+    frame.url = url
+    skyvern_frame = SkyvernFrame(frame=frame)
+    skyvern_frame._wait_for_loading_indicators_gone = AsyncMock()
+    skyvern_frame._wait_for_dom_stable = AsyncMock()
+    return skyvern_frame
+
+
+@pytest.fixture
+def learned_timeouts(monkeypatch: pytest.MonkeyPatch):
+    from skyvern.config import settings
+
+    monkeypatch.setattr(settings, "BROWSER_PAGE_READY_LEARNED_TIMEOUTS", True)
+    PAGE_READY_TIMEOUTS.clear()
+    yield PAGE_READY_TIMEOUTS
+    PAGE_READY_TIMEOUTS.clear()
+
+
+@pytest.mark.asyncio
+async def test_signals_are_awaited_concurrently(span_exporter: InMemorySpanExporter) -> None:
+    skyvern_frame = _frame()
+    started: list[str] = []
+    all_started = asyncio.Event()
+
+    def signal(name: str):
+        async def wait(*args: object, **kwargs: object) -> None:
+            started.append(name)
+            if len(started) == 3:
+                all_started.set()
+            # Only returns once the other two signals are waiting too.
+            await asyncio.wait_for(all_started.wait(), timeout=1)
+
+        return wait
+
+    skyvern_frame._wait_for_loading_indicators_gone = AsyncMock(side_effect=signal("loading_indicators"))
+    skyvern_frame.frame.wait_for_load_state = AsyncMock(side_effect=signal("network_idle"))
+    skyvern_frame._wait_for_dom_stable = AsyncMock(side_effect=signal("dom_stability"))
+
+    await skyvern_frame.wait_for_page_ready()
+
+    assert sorted(started) == ["dom_stability", "loading_indicators", "network_idle"]
+    spans = {span.name: dict(span.attributes or {}) for span in span_exporter.get_finished_spans()}
+    for name in ("loading_indicators", "network_idle", "dom_stability"):
+        attrs = spans[f"skyvern.browser.page_ready.{name}"]
+        assert attrs["result"] == "success"
+        assert attrs["elapsed_ms"] >= 0
+
+
+@pytest.mark.asyncio
+async def test_dom_stability_is_confirmed_again_after_the_other_signals_settle() -> None:
+    skyvern_frame = _frame()
+
+    async def slow_network_idle(*args: object, **kwargs: object) -> None:
+        await asyncio.sleep(0.05)
+
+    skyvern_frame.frame.wait_for_load_state = AsyncMock(side_effect=slow_network_idle)
+
+    await skyvern_frame.wait_for_page_ready()
+
+    assert skyvern_frame._wait_for_dom_stable.await_count == 2
+    # The confirmation only gets what is left of the DOM check's own timeout.
+    assert skyvern_frame._wait_for_dom_stable.await_args_list[1].kwargs["timeout_ms"] < 3000
+
+
+@pytest.mark.asyncio
+async def test_dom_stability_does_not_outwait_its_own_timeout(span_exporter: InMemorySpanExporter) -> None:
+    skyvern_frame = _frame()
+
+    async def slow_network_idle(*args: object, **kwargs: object) -> None:
+        await asyncio.sleep(0.2)
+
+    skyvern_frame.frame.wait_for_load_state = AsyncMock(side_effect=slow_network_idle)
+
+    await skyvern_frame.wait_for_page_ready(dom_stability_timeout_ms=20)
+
+    skyvern_frame._wait_for_dom_stable.assert_awaited_once()
+    span = next(s for s in span_exporter.get_finished_spans() if s.name == "skyvern.browser.page_ready.dom_stability")
+    assert dict(span.attributes or {})["result"] == "success"
+
+
+@pytest.mark.asyncio
+async def test_cancellation_stops_the_other_signals() -> None:
+    skyvern_frame = _frame()
+    cancelled = asyncio.Event()
+
+    async def hang(*args: object, **kwargs: object) -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    skyvern_frame._wait_for_loading_indicators_gone = AsyncMock(side_effect=hang)
+    skyvern_frame.frame.wait_for_load_state = AsyncMock(side_effect=asyncio.CancelledError())
+
+    with pytest.raises(asyncio.CancelledError):
+        await skyvern_frame.wait_for_page_ready()
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+
+
+def test_learned_timeout_needs_enough_samples_and_stays_within_bounds() -> None:
+    timeouts = PageReadyTimeouts()
+    for _ in range(PageReadyTimeouts.MIN_SAMPLES - 1):
+        timeouts.record("a.example", "network_idle", 400)
+    assert timeouts.timeout_ms("a.example", "network_idle", 3000) == 3000
+
+    timeouts.record("a.example", "network_idle", 600)
+    assert timeouts.timeout_ms("a.example", "network_idle", 3000) == 1200
+    # Never above what the caller asked for, never below the floor, and per host and signal.
+    assert timeouts.timeout_ms("a.example", "network_idle", 1000) == 1000
+    assert timeouts.timeout_ms("b.example", "network_idle", 3000) == 3000
+    assert timeouts.timeout_ms("a.example", "dom_stability", 3000) == 3000
+    for _ in range(PageReadyTimeouts.WINDOW):
+        timeouts.record("a.example", "network_idle", 10)
+    assert timeouts.timeout_ms("a.example", "network_idle", 3000) == PageReadyTimeouts.FLOOR_MS
+
+
+def test_least_recently_seen_hosts_are_evicted(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(PageReadyTimeouts, "MAX_HOSTS", 1)
+    timeouts = PageReadyTimeouts()
+    for signal in ("loading_indicators", "network_idle", "dom_stability"):
+        for _ in range(PageReadyTimeouts.MIN_SAMPLES):
+            timeouts.record("old.example", signal, 100)
+    timeouts.record("new.example", "network_idle", 100)
+
+    assert timeouts.timeout_ms("old.example", "loading_indicators", 3000) == 3000
+    assert timeouts.timeout_ms("old.example", "dom_stability", 3000) == PageReadyTimeouts.FLOOR_MS
+
+
+@pytest.mark.asyncio
+async def test_learned_timeouts_cap_the_next_wait_and_a_timeout_loosens_them(learned_timeouts) -> None:
+    for _ in range(PageReadyTimeouts.MIN_SAMPLES):
+        learned_timeouts.record("shop.example.com", "network_idle", 400)
+    skyvern_frame = _frame()
+    skyvern_frame.frame.wait_for_load_state = AsyncMock(side_effect=TimeoutError("Timeout 800.0ms exceeded."))
+
+    await skyvern_frame.wait_for_page_ready()
+
+    skyvern_frame.frame.wait_for_load_state.assert_awaited_once_with("networkidle", timeout=800)
+    assert learned_timeouts.timeout_ms("shop.example.com", "network_idle", 3000) == 1600
+    # The other signals settled and were learned from, but are not capped yet.
+    assert learned_timeouts.timeout_ms("shop.example.com", "dom_stability", 3000) == 3000
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_learned_when_disabled() -> None:
+    PAGE_READY_TIMEOUTS.clear()
+
+    await _frame().wait_for_page_ready()
+
+    assert PAGE_READY_TIMEOUTS._samples == {}
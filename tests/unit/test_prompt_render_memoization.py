@@ -0,0 +1,56 @@
+"""Tests for PromptEngine.load_prompt_memoized and template precompilation."""
+
+from pathlib import Path
+
+import pytest
+
+from skyvern.forge.sdk.prompting import PromptEngine
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> PromptEngine:
+    model_dir = tmp_path / "skyvern"
+    model_dir.mkdir()
+    (model_dir / "static.j2").write_text(
+        "Goal: {{ navigation_goal }}{% if verification_code_check %} (otp){% endif %}\n{% include 'skyvern/footer.j2' %}"
+    )
+    (model_dir / "footer.j2").write_text("Criterion: {{ complete_criterion }}")
+    (model_dir / "dynamic-include.j2").write_text("{% include section %}")
+    return PromptEngine("skyvern", prompts_dir=tmp_path)
+
+
+def test_unreferenced_kwargs_do_not_defeat_the_cache(engine: PromptEngine) -> None:
+    first = engine.load_prompt_memoized(
+        "static", navigation_goal="buy", complete_criterion="done", elements="<tree v1>", action_history="[]"
+    )
+    second = engine.load_prompt_memoized(
+        "static", navigation_goal="buy", complete_criterion="done", elements="<tree v2>", action_history="[a]"
+    )
+
+    assert first == second == "Goal: buy\nCriterion: done"
+    assert (engine.render_stats.hits, engine.render_stats.misses) == (1, 1)
+
+
+def test_referenced_kwargs_including_included_templates_are_keyed(engine: PromptEngine) -> None:
+    base = engine.load_prompt_memoized("static", navigation_goal="buy", complete_criterion="done")
+    otp = engine.load_prompt_memoized(
+        "static", navigation_goal="buy", complete_criterion="done", verification_code_check=True
+    )
+    changed_footer = engine.load_prompt_memoized("static", navigation_goal="buy", complete_criterion="other")
+
+    assert otp == "Goal: buy (otp)\nCriterion: done"
+    assert changed_footer == "Goal: buy\nCriterion: other"
+    assert base != otp
+    assert engine.render_stats.misses == 3
+
+
+def test_dynamic_includes_are_never_memoized(engine: PromptEngine) -> None:
+    engine.load_prompt_memoized("dynamic-include", section="skyvern/footer.j2", complete_criterion="a")
+    rendered = engine.load_prompt_memoized("dynamic-include", section="skyvern/footer.j2", complete_criterion="b")
+
+    assert rendered == "Criterion: b"
+    assert engine.render_stats.hits == 0
+
+
+def test_precompile_loads_every_model_template(engine: PromptEngine) -> None:
+    assert engine.precompile() == 3
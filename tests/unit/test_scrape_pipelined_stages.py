@@ -0,0 +1,164 @@
+"""Pipelined scrape (ENABLE_PIPELINED_SCRAPE): text and HTML fetch overlap the rest of the scrape.
+
+The fetch may only start once the element tree exists (it stamps the skyvern ids the HTML carries)
+and, when the screenshots scroll the page, only after the screenshots: scrolling can lazy-load
+content the text and HTML must include.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skyvern.config import settings
+from skyvern.exceptions import NoElementFound
+from skyvern.forge.sdk.core import skyvern_context
+from skyvern.forge.sdk.core.skyvern_context import SkyvernContext
+from skyvern.webeye.scraper import scraper
+
+
+@contextlib.asynccontextmanager
+async def _stubbed_scrape(events: list[str], *, elements: list[dict] | None = None):
+    page = MagicMock()
+    page.url = "https://example.com"
+    page.main_frame.url = "https://example.com"
+    page.main_frame.child_frames = []
+    page.viewport_size = {"width": 1280, "height": 800}
+    browser_state = MagicMock()
+    browser_state.must_get_working_page = AsyncMock(return_value=page)
+
+    async def get_content() -> str:
+        events.append("html")
+        return "<html></html>"
+
+    async def get_frame_text(*_args: object) -> str:
+        events.append("text:start")
+        await asyncio.sleep(0)
+        events.append("text:end")
+        return "text"
+
+    async def take_split_screenshots(**_kwargs: object) -> list[bytes]:
+        events.append("screenshots:start")
+        await asyncio.sleep(0)
+        events.append("screenshots:end")
+        return [b"img"]
+
+    frame_mock = MagicMock()
+    frame_mock.get_scroll_x_y = AsyncMock(return_value=(0, 0))
+    frame_mock.safe_scroll_to_x_y = AsyncMock()
+    frame_mock.get_content = get_content
+
+    element = {"id": "btn", "tagName": "button"}
+    if elements is None:
+        elements = [element]
+
+    def build_element_dict(_elements: list[dict]) -> tuple:
+        events.append("hash")
+        return {}, {}, {}, {}, {}
+
+    skyvern_context.set(SkyvernContext(workflow_run_id="wr_test"))
+    try:
+        with contextlib.ExitStack() as stack:
+            skyvern_frame_cls = stack.enter_context(patch.object(scraper, "SkyvernFrame"))
+            skyvern_frame_cls.create_instance = AsyncMock(return_value=frame_mock)
+            skyvern_frame_cls.take_split_screenshots = take_split_screenshots
+            stack.enter_context(patch.object(scraper, "_wait_for_scrape_ready", new=AsyncMock()))
+            stack.enter_context(patch.object(scraper, "empty_page_retry_wait", new=AsyncMock()))
+            stack.enter_context(
+                patch.object(
+                    scraper,
+                    "get_interactable_element_tree",
+                    new=AsyncMock(return_value=(elements, list(elements), {})),
+                )
+            )
+            stack.enter_context(patch.object(scraper, "trim_element_tree", new=MagicMock(return_value=[])))
+            stack.enter_context(patch.object(scraper, "build_element_dict", new=build_element_dict))
+            stack.enter_context(patch.object(scraper, "get_frame_text", new=get_frame_text))
+            stack.enter_context(patch.object(scraper, "advance_observation_epoch", new=MagicMock()))
+            stack.enter_context(patch.object(scraper, "_record_scrape_span_attrs", new=MagicMock()))
+            yield browser_state
+    finally:
+        skyvern_context.reset()
+
+
+async def _scrape(browser_state: MagicMock, *, scroll: bool) -> scraper.ScrapedPage:
+    return await scraper.scrape_web_unsafe(
+        browser_state=browser_state,
+        url="https://example.com",
+        cleanup_element_tree=AsyncMock(side_effect=lambda _page, _url, tree: tree),
+        scroll=scroll,
+    )
+
+
+@pytest.mark.asyncio
+async def test_sequential_by_default(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ENABLE_PIPELINED_SCRAPE", False)
+    events: list[str] = []
+    async with _stubbed_scrape(events) as browser_state:
+        scraped_page = await _scrape(browser_state, scroll=False)
+
+    assert events == ["screenshots:start", "screenshots:end", "hash", "text:start", "text:end", "html"]
+    assert scraped_page.extracted_text == "text"
+    assert scraped_page.html == "<html></html>"
+
+
+@pytest.mark.asyncio
+async def test_scrolling_screenshots_are_an_ordering_barrier(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ENABLE_PIPELINED_SCRAPE", True)
+    events: list[str] = []
+    async with _stubbed_scrape(events) as browser_state:
+        scraped_page = await _scrape(browser_state, scroll=True)
+
+    assert events.index("text:start") > events.index("screenshots:end")
+    assert events.index("html") > events.index("screenshots:end")
+    # text and html overlap each other and the hashing
+    assert events.index("html") < events.index("text:end")
+    assert events.index("text:start") < events.index("hash")
+    assert scraped_page.extracted_text == "text"
+    assert scraped_page.html == "<html></html>"
+
+
+@pytest.mark.asyncio
+async def test_non_scrolling_screenshots_overlap_the_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ENABLE_PIPELINED_SCRAPE", True)
+    events: list[str] = []
+    async with _stubbed_scrape(events) as browser_state:
+        scraped_page = await _scrape(browser_state, scroll=False)
+
+    assert events.index("text:start") < events.index("screenshots:end")
+    assert scraped_page.extracted_text == "text"
+    assert scraped_page.window_dimension == {"width": 1280, "height": 800}
+
+
+@pytest.mark.asyncio
+async def test_empty_page_cancels_the_pending_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ENABLE_PIPELINED_SCRAPE", True)
+    events: list[str] = []
+    async with _stubbed_scrape(events, elements=[]) as browser_state:
+        with pytest.raises(NoElementFound):
+            await _scrape(browser_state, scroll=True)
+        # let the cancellation reach the fetches and the done callback run before the loop closes
+        await asyncio.sleep(0.01)
+
+    assert "text:end" not in events
+
+
+@pytest.mark.asyncio
+async def test_any_scrape_failure_cancels_the_pending_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "ENABLE_PIPELINED_SCRAPE", True)
+    events: list[str] = []
+
+    async def failing_screenshots(**_kwargs: object) -> list[bytes]:
+        raise RuntimeError("screenshot failed")
+
+    async with _stubbed_scrape(events) as browser_state:
+        scraper.SkyvernFrame.take_split_screenshots = failing_screenshots
+        with pytest.raises(RuntimeError, match="screenshot failed"):
+            await _scrape(browser_state, scroll=False)
+        await asyncio.sleep(0.01)
+
+    assert "text:start" in events
+    assert "text:end" not in events
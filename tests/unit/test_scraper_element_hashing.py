@@ -0,0 +1,94 @@
+"""Single-pass element hashing in ``build_element_dict``.
+
+Element hashes are persisted by cached actions (``skyvern_element_hash``), so the bottom-up
+serializer must keep producing exactly ``sha256(json.dumps(clean_element_before_hashing(e),
+sort_keys=True))`` for every element, whether or not the flat list shares dicts with the tree.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+
+import pytest
+
+from skyvern.config import settings
+from skyvern.constants import SKYVERN_ID_ATTR
+from skyvern.forge.sdk.api.crypto import calculate_sha256
+from skyvern.webeye.scraper import scraper
+from skyvern.webeye.scraper.scraper import build_element_dict, build_element_dict_off_loop, clean_element_before_hashing
+
+
+def _reference_hash(element: dict) -> str:
+    return calculate_sha256(json.dumps(clean_element_before_hashing(element), sort_keys=True))
+
+
+def _node(element_id: str, tag: str, children: list[dict], **extra: object) -> dict:
+    return {
+        "id": element_id,
+        "frame": "main.frame",
+        "frame_index": 0,
+        "rect": {"x": 1.5, "y": 2, "width": 3, "height": 4},
+        "tagName": tag,
+        "attributes": {SKYVERN_ID_ATTR: element_id, "type": "text", "aria-label": 'Ünïcode "quoted"'},
+        "interactable": True,
+        "children": children,
+        **extra,
+    }
+
+
+def _flat_and_tree() -> tuple[list[dict], list[dict]]:
+    leaf_a = _node("c", "input", [], text="same")
+    leaf_b = _node("d", "input", [], text="same")
+    middle = _node("b", "div", [leaf_a, leaf_b], context=None)
+    root = _node("a", "form", [middle, _node("e", "span", [], value=3.25)])
+    tree = [root]
+    # pre-order, sharing dict objects with the tree as Playwright's evaluate does
+    flat = [root, middle, leaf_a, leaf_b, root["children"][1]]
+    return flat, tree
+
+
+def test_hashes_match_reference_serialization() -> None:
+    flat, _ = _flat_and_tree()
+    _, _, _, id_to_hash, _ = build_element_dict(flat)
+
+    assert id_to_hash == {element["id"]: _reference_hash(element) for element in flat}
+    assert {element["id"]: scraper.hash_element(element) for element in flat} == id_to_hash
+
+
+def test_hashes_match_when_flat_list_copies_the_tree() -> None:
+    flat, _ = _flat_and_tree()
+    # a raw-CDP returnByValue round-trip copies the shared dicts
+    copied = [copy.deepcopy(element) for element in flat]
+
+    assert build_element_dict(copied)[3] == build_element_dict(flat)[3]
+
+
+def test_identical_subtrees_share_a_hash() -> None:
+    flat, _ = _flat_and_tree()
+    _, _, id_to_frame, id_to_hash, hash_to_ids = build_element_dict(flat)
+
+    assert id_to_hash["c"] == id_to_hash["d"]
+    assert hash_to_ids[id_to_hash["c"]] == ["c", "d"]
+    assert id_to_frame == {element["id"]: "main.frame" for element in flat}
+
+
+@pytest.mark.asyncio
+async def test_large_pages_are_hashed_off_the_event_loop(monkeypatch: pytest.MonkeyPatch) -> None:
+    flat, _ = _flat_and_tree()
+    calls: list[object] = []
+
+    async def fake_to_thread(func, *args):
+        calls.append(func)
+        return func(*args)
+
+    monkeypatch.setattr(scraper.asyncio, "to_thread", fake_to_thread)
+
+    monkeypatch.setattr(settings, "ELEMENT_HASHING_THREAD_THRESHOLD", len(flat) + 1)
+    inline = await build_element_dict_off_loop(flat)
+    assert calls == []
+
+    monkeypatch.setattr(settings, "ELEMENT_HASHING_THREAD_THRESHOLD", len(flat))
+    threaded = await build_element_dict_off_loop(flat)
+    assert calls == [build_element_dict]
+    assert threaded == inline
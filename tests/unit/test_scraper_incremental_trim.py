@@ -0,0 +1,145 @@
+"""Incremental scrape: memoized trimming and the element-level delta between scrapes.
+
+``_IncrementalScrapeState.trim_element_tree`` must produce exactly what the regular
+``trim_element_tree(_deepcopy_element_tree(...))`` path produces, while copying unchanged
+subtrees out of the previous scrape's memo instead of re-trimming them.
+"""
+
+from __future__ import annotations
+
+import copy
+import json
+
+import pytest
+
+from skyvern.forge.sdk.core import skyvern_context
+from skyvern.forge.sdk.core.skyvern_context import SkyvernContext
+from skyvern.webeye.scraper.scraped_page import ElementTreeDelta
+from skyvern.webeye.scraper.scraper import (
+    _canonical_subtree_json,
+    _deepcopy_element_tree,
+    _IncrementalScrapeState,
+    json_to_html,
+    trim_element_tree,
+)
+
+
+@pytest.fixture(autouse=True)
+def _scoped_context():
+    """`json_to_html` calls `skyvern_context.ensure_context()`, so we need one."""
+    with skyvern_context.scoped(SkyvernContext(organization_id="o_test")):
+        yield
+
+
+def _leaf(element_id: str, text: str) -> dict:
+    return {
+        "id": element_id,
+        "tagName": "input",
+        "frame": "main.frame",
+        "frame_index": 0,
+        "attributes": {"type": "text", "class": "x", "src": "data:image/png;base64,AAAA"},
+        "interactable": True,
+        "text": text,
+        "children": [],
+    }
+
+
+def _sample_tree(second_text: str = "second") -> list[dict]:
+    return [
+        {
+            "id": "0",
+            "tagName": "form",
+            "frame": "main.frame",
+            "frame_index": 0,
+            "attributes": {"name": "signup"},
+            "interactable": False,
+            "text": " ",
+            "children": [
+                {
+                    "id": "1",
+                    "tagName": "div",
+                    "interactable": False,
+                    "children": [_leaf("2", "first")],
+                },
+                {
+                    "id": "3",
+                    "tagName": "div",
+                    "interactable": False,
+                    "children": [_leaf("4", second_text)],
+                },
+            ],
+        },
+        _leaf("5", "footer"),
+    ]
+
+
+def test_canonical_subtree_json_matches_json_dumps() -> None:
+    tree = _sample_tree()
+    digests: dict[int, str] = {}
+    for element in tree:
+        assert _canonical_subtree_json(element, digests) == json.dumps(element, sort_keys=True)
+    # one digest per node: form, two divs, three leaves
+    assert len(digests) == 6
+
+
+def test_incremental_trim_matches_regular_trim() -> None:
+    state = _IncrementalScrapeState(enriched_tree=False)
+    tree = _sample_tree()
+    expected = trim_element_tree(_deepcopy_element_tree(tree))
+
+    assert state.trim_element_tree(tree) == expected
+    assert state.reused_subtrees == 0
+    # the cleaned tree handed in is never mutated
+    assert tree == _sample_tree()
+
+
+def test_incremental_trim_reuses_unchanged_subtrees() -> None:
+    state = _IncrementalScrapeState(enriched_tree=False)
+    state.trim_element_tree(_sample_tree())
+
+    changed = _sample_tree(second_text="edited")
+    trimmed = state.trim_element_tree(changed)
+
+    assert trimmed == trim_element_tree(_deepcopy_element_tree(changed))
+    # the untouched div subtree and the footer come from the memo; the form and the edited branch do not
+    assert state.reused_subtrees == 2
+
+
+def test_incremental_trim_hands_out_copies() -> None:
+    state = _IncrementalScrapeState(enriched_tree=False)
+    first = state.trim_element_tree(_sample_tree())
+    first[1]["text"] = "MUTATED"
+
+    second = state.trim_element_tree(_sample_tree())
+    assert second[1]["text"] == "footer"
+    assert second[1] is not first[1]
+
+
+def test_build_html_tree_matches_regular_rendering() -> None:
+    state = _IncrementalScrapeState(enriched_tree=False)
+    trimmed = state.trim_element_tree(_sample_tree())
+    expected = "".join(json_to_html(copy.deepcopy(element), need_skyvern_attrs=False) for element in trimmed)
+
+    assert state.build_html_tree(trimmed) == expected
+    # second render of the same roots is served from the cache
+    assert state.build_html_tree(state.trim_element_tree(_sample_tree())) == expected
+
+
+def test_diff_only_against_the_same_url() -> None:
+    state = _IncrementalScrapeState(enriched_tree=False)
+    assert state.diff("https://example.com/a", {"1": "h1", "2": "h2"}) is None
+
+    delta = state.diff("https://example.com/a", {"1": "h1", "2": "h2-new", "3": "h3"})
+    assert delta == ElementTreeDelta(
+        added_ids=frozenset({"3"}),
+        removed_ids=frozenset(),
+        changed_ids=frozenset({"2"}),
+    )
+    assert not delta.is_empty
+
+    assert state.diff("https://example.com/b", {"1": "h1"}) is None
+
+
+def test_element_tree_delta_between_identical_scrapes_is_empty() -> None:
+    hashes = {"1": "h1", "2": "h2"}
+    assert ElementTreeDelta.between(hashes, dict(hashes)).is_empty
@@ -0,0 +1,171 @@
+"""Content-addressed screenshot storage: identical screenshots share one stored object."""
+
+import asyncio
+import hashlib
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from skyvern.config import settings
+from skyvern.forge.sdk.artifact.manager import ArtifactManager
+from skyvern.forge.sdk.artifact.models import ArtifactType
+from skyvern.forge.sdk.artifact.storage import local as local_storage
+from skyvern.forge.sdk.artifact.storage.local import LocalStorage
+from tests.unit.forge.sdk.artifact.storage.test_helpers import TEST_ORGANIZATION_ID, create_fake_step
+
+TEST_STEP_ID = "step_content_dedup_001"
+_PNG = b"\x89PNG identical viewport"
+
+
+def test_local_storage_builds_org_scoped_digest_uri(tmp_path) -> None:
+    storage = LocalStorage(artifact_path=str(tmp_path))
+    digest = hashlib.sha256(_PNG).hexdigest()
+
+    uri = storage.build_content_addressed_uri(
+        organization_id=TEST_ORGANIZATION_ID, digest=digest, artifact_type=ArtifactType.SCREENSHOT_ACTION
+    )
+
+    assert uri == f"file://{tmp_path}/{TEST_ORGANIZATION_ID}/content/{digest[:2]}/{digest}.png"
+
+
+def _content_artifact(storage: LocalStorage) -> MagicMock:
+    artifact = MagicMock()
+    artifact.uri = storage.build_content_addressed_uri(
+        organization_id=TEST_ORGANIZATION_ID,
+        digest=hashlib.sha256(_PNG).hexdigest(),
+        artifact_type=ArtifactType.SCREENSHOT_ACTION,
+    )
+    return artifact
+
+
+@pytest.mark.asyncio
+async def test_local_content_blob_is_written_once_and_atomically(tmp_path) -> None:
+    storage = LocalStorage(artifact_path=str(tmp_path))
+    artifact = _content_artifact(storage)
+
+    assert await storage.store_content_addressed_artifact(artifact, _PNG) is True
+    assert await storage.store_content_addressed_artifact(artifact, b"other") is False
+
+    blob_dir = tmp_path / TEST_ORGANIZATION_ID / "content" / hashlib.sha256(_PNG).hexdigest()[:2]
+    assert [path.read_bytes() for path in blob_dir.iterdir()] == [_PNG]
+
+
+@pytest.mark.asyncio
+async def test_failed_local_content_write_raises_and_leaves_no_blob(tmp_path) -> None:
+    storage = LocalStorage(artifact_path=str(tmp_path))
+    artifact = _content_artifact(storage)
+
+    with patch("skyvern.forge.sdk.artifact.storage.local.os.replace", side_effect=OSError("disk full")):
+        with pytest.raises(OSError, match="disk full"):
+            await storage.store_content_addressed_artifact(artifact, _PNG)
+
+    blob_dir = tmp_path / TEST_ORGANIZATION_ID / "content" / hashlib.sha256(_PNG).hexdigest()[:2]
+    assert list(blob_dir.iterdir()) == []
+    # Nothing counts as present, so the next writer stores the blob.
+    assert await storage.store_content_addressed_artifact(artifact, _PNG) is True
+
+
+def _make_app_mocks(tmp_path) -> tuple[LocalStorage, MagicMock]:
+    storage = LocalStorage(artifact_path=str(tmp_path))
+    mock_database = MagicMock()
+    mock_database.artifacts = MagicMock()
+    mock_database.artifacts.bulk_create_artifacts = AsyncMock()
+    return storage, mock_database
+
+
+@pytest.mark.asyncio
+async def test_identical_screenshots_across_steps_are_stored_once(tmp_path) -> None:
+    storage, mock_database = _make_app_mocks(tmp_path)
+    manager = ArtifactManager()
+
+    with (
+        patch.object(settings, "ARTIFACT_CONTENT_HMAC_KEYRING", None),
+        patch.object(settings, "ARTIFACT_SCREENSHOT_DEDUP", True),
+        patch(
+            "skyvern.forge.sdk.artifact.storage.local._write_file_atomically",
+            wraps=local_storage._write_file_atomically,
+        ) as write_blob,
+        patch("skyvern.forge.sdk.artifact.manager.app") as mock_app,
+    ):
+        mock_app.STORAGE = storage
+        mock_app.DATABASE = mock_database
+        for step_id in (TEST_STEP_ID, f"{TEST_STEP_ID}_next"):
+            step = create_fake_step(step_id)
+            manager.accumulate_screenshot_to_step_archive(
+                step=step, screenshots=[_PNG, _PNG], artifact_type=ArtifactType.SCREENSHOT_ACTION
+            )
+            await manager.flush_step_archive(step.step_id)
+
+    assert write_blob.call_count == 1
+    models = [m for call in mock_database.artifacts.bulk_create_artifacts.await_args_list for m in call.args[0]]
+    digest = hashlib.sha256(_PNG).hexdigest()
+    assert len(models) == 4
+    assert {m.uri for m in models} == {f"file://{tmp_path}/{TEST_ORGANIZATION_ID}/content/{digest[:2]}/{digest}.png"}
+    assert {m.checksum for m in models} == {digest}
+    # retrieval resolves through the shared uri
+    assert await storage.retrieve_artifact(MagicMock(uri=models[-1].uri)) == _PNG
+
+
+@pytest.mark.asyncio
+async def test_existing_blob_from_another_process_is_not_reuploaded(tmp_path) -> None:
+    storage, mock_database = _make_app_mocks(tmp_path)
+    digest = hashlib.sha256(_PNG).hexdigest()
+    blob = tmp_path / TEST_ORGANIZATION_ID / "content" / digest[:2] / f"{digest}.png"
+    blob.parent.mkdir(parents=True)
+    blob.write_bytes(_PNG)
+    step = create_fake_step(TEST_STEP_ID)
+    manager = ArtifactManager()
+    manager.accumulate_screenshot_to_step_archive(
+        step=step, screenshots=[_PNG], artifact_type=ArtifactType.SCREENSHOT_LLM
+    )
+
+    with (
+        patch.object(settings, "ARTIFACT_CONTENT_HMAC_KEYRING", None),
+        patch.object(settings, "ARTIFACT_SCREENSHOT_DEDUP", True),
+        patch("skyvern.forge.sdk.artifact.storage.local._write_file_atomically") as write_blob,
+        patch("skyvern.forge.sdk.artifact.manager.app") as mock_app,
+    ):
+        mock_app.STORAGE = storage
+        mock_app.DATABASE = mock_database
+        await manager.flush_step_archive(step.step_id)
+
+    write_blob.assert_not_called()
+    mock_database.artifacts.bulk_create_artifacts.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_upload_is_retried_by_the_next_writer() -> None:
+    manager = ArtifactManager()
+    artifact = MagicMock(uri="file:///shared.png")
+
+    with patch("skyvern.forge.sdk.artifact.manager.app") as mock_app:
+        mock_app.STORAGE = MagicMock()
+        mock_app.STORAGE.store_content_addressed_artifact = AsyncMock(side_effect=[RuntimeError("boom"), True])
+        with pytest.raises(RuntimeError, match="boom"):
+            await manager._store_content_addressed(artifact, _PNG)
+        await asyncio.gather(
+            manager._store_content_addressed(artifact, _PNG), manager._store_content_addressed(artifact, _PNG)
+        )
+
+    assert mock_app.STORAGE.store_content_addressed_artifact.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_non_screenshots_keep_per_artifact_uris(tmp_path) -> None:
+    storage, mock_database = _make_app_mocks(tmp_path)
+    step = create_fake_step(TEST_STEP_ID)
+    manager = ArtifactManager()
+    manager.accumulate_action_html_to_archive(step=step, html_action=b"<html/>")
+
+    with (
+        patch.object(settings, "ARTIFACT_CONTENT_HMAC_KEYRING", None),
+        patch.object(settings, "ARTIFACT_SCREENSHOT_DEDUP", True),
+        patch("skyvern.forge.sdk.artifact.manager.app") as mock_app,
+    ):
+        mock_app.STORAGE = storage
+        mock_app.DATABASE = mock_database
+        await manager.flush_step_archive(step.step_id)
+
+    (model,) = mock_database.artifacts.bulk_create_artifacts.await_args.args[0]
+    assert "/content/" not in model.uri
+    assert model.checksum is None
@@ -0,0 +1,161 @@
+"""settle_wait: fixed post-action waits become upper bounds once the page goes quiet."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Frame
+
+from skyvern.experimentation import wait_utils
+from skyvern.experimentation.wait_utils import settle_wait
+from skyvern.webeye.utils.page import SkyvernFrame
+
+
+@pytest.fixture
+def settle_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    from skyvern.config import settings
+
+    monkeypatch.setattr(settings, "BROWSER_ACTION_SETTLE_DETECTION", True)
+
+
+@pytest.fixture
+def log(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    log = MagicMock()
+    monkeypatch.setattr(wait_utils, "LOG", log)
+    return log
+
+
+@pytest.fixture
+def sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    sleep = AsyncMock()
+    monkeypatch.setattr(wait_utils.asyncio, "sleep", sleep)
+    return sleep
+
+
+@pytest.mark.asyncio
+async def test_disabled_sleeps_the_fixed_wait(monkeypatch: pytest.MonkeyPatch, sleep: AsyncMock) -> None:
+    settle = AsyncMock()
+    monkeypatch.setattr(SkyvernFrame, "wait_for_action_settle", settle)
+
+    await settle_wait(MagicMock(), 0.3, "post_click_delay", "click")
+
+    sleep.assert_awaited_once_with(0.3)
+    settle.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("settle_enabled")
+async def test_no_page_or_no_wait_never_observes_the_page(monkeypatch: pytest.MonkeyPatch, sleep: AsyncMock) -> None:
+    settle = AsyncMock()
+    monkeypatch.setattr(SkyvernFrame, "wait_for_action_settle", settle)
+
+    await settle_wait(None, 0.5, "inter_action_delay")
+    await settle_wait(MagicMock(), 0.0, "inter_action_delay")
+
+    assert [call.args for call in sleep.await_args_list] == [(0.5,), (0.0,)]
+    settle.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("settle_enabled")
+async def test_returns_once_the_page_settles_and_logs_the_time_saved(
+    monkeypatch: pytest.MonkeyPatch, sleep: AsyncMock, log: MagicMock
+) -> None:
+    settle = AsyncMock(return_value=True)
+    monkeypatch.setattr(SkyvernFrame, "wait_for_action_settle", settle)
+
+    await settle_wait(MagicMock(), 3.0, "inter_action_delay", "input_text")
+
+    assert settle.await_args.kwargs == {"max_ms": 3000.0}
+    sleep.assert_not_awaited()
+    fields = log.info.call_args.kwargs
+    assert fields["outcome"] == "settled"
+    assert fields["wait_type"] == "inter_action_delay" and fields["action_type"] == "input_text"
+    assert fields["upper_bound_ms"] == 3000
+    assert fields["saved_ms"] == 3000 - fields["waited_ms"] > 2000
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("settle_enabled")
+async def test_a_page_that_never_settles_waits_the_upper_bound(
+    monkeypatch: pytest.MonkeyPatch, sleep: AsyncMock, log: MagicMock
+) -> None:
+    monkeypatch.setattr(SkyvernFrame, "wait_for_action_settle", AsyncMock(return_value=False))
+
+    await settle_wait(MagicMock(), 0.3, "post_click_delay", "click")
+
+    sleep.assert_not_awaited()
+    assert log.info.call_args.kwargs["outcome"] == "upper_bound"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("settle_enabled")
+async def test_an_unobservable_page_sleeps_the_rest_of_the_fixed_wait(
+    monkeypatch: pytest.MonkeyPatch, sleep: AsyncMock, log: MagicMock
+) -> None:
+    monkeypatch.setattr(
+        SkyvernFrame,
+        "wait_for_action_settle",
+        AsyncMock(side_effect=RuntimeError("Execution context was destroyed, most likely because of a navigation")),
+    )
+
+    await settle_wait(MagicMock(), 0.5, "inter_action_delay", "click")
+
+    remaining = sleep.await_args.args[0]
+    assert 0.4 < remaining <= 0.5
+    assert log.info.call_args.kwargs["outcome"] == "unobservable"
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("settle_enabled")
+async def test_cancellation_is_not_swallowed(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(SkyvernFrame, "wait_for_action_settle", AsyncMock(side_effect=asyncio.CancelledError()))
+
+    with pytest.raises(asyncio.CancelledError):
+        await settle_wait(MagicMock(), 0.5, "inter_action_delay")
+
+
+def _frame(evaluate: AsyncMock) -> MagicMock:
+    frame = MagicMock(spec=Frame)
+    frame.evaluate = evaluate
+    frame.wait_for_load_state = AsyncMock()
+    return frame
+
+
+@pytest.mark.asyncio
+async def test_wait_for_action_settle_bounds_the_in_page_wait() -> None:
+    frame = _frame(AsyncMock(return_value=True))
+
+    assert await SkyvernFrame(frame=frame).wait_for_action_settle(max_ms=300) is True
+    assert frame.evaluate.await_args.kwargs["arg"] == [150, 300]
+
+    async def never_resolves(*args: object, **kwargs: object) -> bool:
+        await asyncio.sleep(10)
+        return True
+
+    frame = _frame(AsyncMock(side_effect=never_resolves))
+    started_at = time.monotonic()
+    assert await SkyvernFrame(frame=frame).wait_for_action_settle(max_ms=50) is False
+    assert time.monotonic() - started_at < 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("settle_enabled")
+async def test_a_navigation_falls_back_to_the_fixed_wait_without_recovering(log: MagicMock) -> None:
+    frame = _frame(
+        AsyncMock(side_effect=PlaywrightError("Execution context was destroyed, most likely because of a navigation"))
+    )
+
+    started_at = time.monotonic()
+    await settle_wait(frame, 0.2, "post_click_delay", "click")
+    elapsed = time.monotonic() - started_at
+
+    # SkyvernFrame.evaluate would wait for the navigation to settle and retry instead.
+    frame.evaluate.assert_awaited_once()
+    frame.wait_for_load_state.assert_not_awaited()
+    fields = log.info.call_args.kwargs
+    assert fields["outcome"] == "unobservable"
+    assert 0.2 <= elapsed < 1
+    assert fields["waited_ms"] >= 200
@@ -534,6 +534,7 @@ def _make_app_mocks() -> tuple[MagicMock, MagicMock]:
     mock_database.artifacts = MagicMock()
     mock_database.artifacts.bulk_create_artifacts = AsyncMock()
     mock_database.artifacts.update_action_screenshot_artifact_id = AsyncMock()
+    mock_database.artifacts.update_action_screenshot_artifact_ids = AsyncMock()
     return mock_storage, mock_database
 
 
@@ -673,6 +674,41 @@ class TestFlushStepArchive:
             screenshot_artifact_id="art_1",
         )
 
+    @pytest.mark.asyncio
+    async def test_write_behind_links_screenshots_in_one_batch_even_if_the_flush_fails(self) -> None:
+        """With write-behind on, buffered actions are flushed first and the links go out in one call."""
+        mock_storage, mock_database = _make_app_mocks()
+        manager = ArtifactManager()
+        step = create_fake_step(TEST_STEP_ID)
+
+        manager.accumulate_screenshot_to_step_archive(
+            step=step,
+            screenshots=[b"\x89PNGdata", b"\x89PNGmore"],
+            artifact_type=ArtifactType.SCREENSHOT_ACTION,
+        )
+        manager.queue_action_screenshot_update(
+            step=step, organization_id="org_1", action_id="action_1", artifact_id="art_1"
+        )
+        manager.queue_action_screenshot_update(
+            step=step, organization_id="org_1", action_id="action_2", artifact_id="art_2"
+        )
+        flush = AsyncMock(side_effect=RuntimeError("db down"))
+
+        with (
+            patch("skyvern.forge.sdk.artifact.manager.app") as mock_app,
+            patch("skyvern.forge.sdk.artifact.manager.flush_write_buffer", flush),
+            patch.object(settings, "DATABASE_WRITE_BEHIND_ENABLED", True),
+        ):
+            mock_app.STORAGE = mock_storage
+            mock_app.DATABASE = mock_database
+            await manager.flush_step_archive(step.step_id)
+
+        flush.assert_awaited_once_with("step_archive")
+        mock_database.artifacts.update_action_screenshot_artifact_ids.assert_awaited_once_with(
+            [("org_1", "action_1", "art_1"), ("org_1", "action_2", "art_2")]
+        )
+        mock_database.artifacts.update_action_screenshot_artifact_id.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_wait_for_upload_aiotasks_finds_no_step_archives_after_per_step_flush(self) -> None:
         """After per-step flushes, wait_for_upload_aiotasks should have nothing left to flush."""
@@ -706,6 +742,99 @@ class TestFlushStepArchive:
         mock_database.artifacts.bulk_create_artifacts.assert_not_awaited()
 
 
+class TestArchiveUploadPipeline:
+    """Large archives are spooled to disk off the event loop; unbundled PUTs run concurrently."""
+
+    @pytest.mark.asyncio
+    async def test_large_archive_is_uploaded_from_a_temp_file(self, tmp_path) -> None:
+        mock_storage, mock_database = _make_app_mocks()
+        uploaded: dict[str, bytes] = {}
+
+        async def _store_from_path(artifact, path: str) -> None:
+            with open(path, "rb") as f:
+                uploaded["zip"] = f.read()
+            uploaded["path"] = path.encode()
+
+        mock_storage.store_artifact_from_path = AsyncMock(side_effect=_store_from_path)
+        manager = ArtifactManager()
+        step = create_fake_step(TEST_STEP_ID)
+        screenshots = [b"\x89PNG" + bytes([i]) * 600 for i in range(3)]
+        manager.accumulate_screenshot_to_step_archive(
+            step=step, screenshots=screenshots, artifact_type=ArtifactType.SCREENSHOT_ACTION
+        )
+
+        with (
+            patch.object(settings, "ARTIFACT_CONTENT_HMAC_KEYRING", _DUMMY_KEYRING_JSON),
+            patch.object(settings, "ARTIFACT_ARCHIVE_SPOOL_THRESHOLD_BYTES", 1024),
+            patch.object(settings, "TEMP_PATH", str(tmp_path)),
+            patch("skyvern.forge.sdk.artifact.manager.app") as mock_app,
+        ):
+            mock_app.STORAGE = mock_storage
+            mock_app.DATABASE = mock_database
+            await manager.flush_step_archive(step.step_id)
+
+        mock_storage.store_artifact.assert_not_awaited()
+        with zipfile.ZipFile(io.BytesIO(uploaded["zip"])) as zf:
+            assert [zf.read(f"screenshot_action_{i}.png") for i in range(3)] == screenshots
+        # the spool file is removed once the upload finishes
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_unbundled_puts_run_concurrently_within_the_bound(self) -> None:
+        mock_storage, mock_database = _make_app_mocks()
+        in_flight = 0
+        peak = 0
+
+        async def _store(artifact, data: bytes) -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        mock_storage.store_artifact = AsyncMock(side_effect=_store)
+        manager = ArtifactManager()
+        step = create_fake_step(TEST_STEP_ID)
+        manager.accumulate_screenshot_to_step_archive(
+            step=step, screenshots=[b"png"] * 6, artifact_type=ArtifactType.SCREENSHOT_ACTION
+        )
+
+        with (
+            patch.object(settings, "ARTIFACT_CONTENT_HMAC_KEYRING", None),
+            patch.object(settings, "ARTIFACT_UNBUNDLED_UPLOAD_CONCURRENCY", 3),
+            patch("skyvern.forge.sdk.artifact.manager.app") as mock_app,
+        ):
+            mock_app.STORAGE = mock_storage
+            mock_app.DATABASE = mock_database
+            await manager.flush_step_archive(step.step_id)
+
+        assert mock_storage.store_artifact.await_count == 6
+        assert peak == 3
+        models = mock_database.artifacts.bulk_create_artifacts.await_args.args[0]
+        assert [m.bundle_key for m in models] == [None] * 6
+
+    @pytest.mark.asyncio
+    async def test_unbundled_put_failure_writes_no_rows(self) -> None:
+        mock_storage, mock_database = _make_app_mocks()
+        mock_storage.store_artifact = AsyncMock(side_effect=[None, RuntimeError("boom"), None])
+        manager = ArtifactManager()
+        step = create_fake_step(TEST_STEP_ID)
+        manager.accumulate_screenshot_to_step_archive(
+            step=step, screenshots=[b"a", b"b", b"c"], artifact_type=ArtifactType.SCREENSHOT_ACTION
+        )
+
+        with (
+            patch.object(settings, "ARTIFACT_CONTENT_HMAC_KEYRING", None),
+            patch("skyvern.forge.sdk.artifact.manager.app") as mock_app,
+        ):
+            mock_app.STORAGE = mock_storage
+            mock_app.DATABASE = mock_database
+            with pytest.raises(RuntimeError, match="boom"):
+                await manager.flush_step_archive(step.step_id)
+
+        mock_database.artifacts.bulk_create_artifacts.assert_not_awaited()
+
+
 class TestWaitForUploadAiotasksCleanup:
     """wait_for_upload_aiotasks must release its upload_aiotasks_map entry on every exit path.
 
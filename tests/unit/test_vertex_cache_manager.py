@@ -0,0 +1,159 @@
+"""Tests for the asyncio-native VertexCacheManager against an in-process HTTP stand-in."""
+
+import asyncio
+import json
+from datetime import UTC, datetime, timedelta
+
+import httpx
+import pytest
+
+from skyvern.forge.sdk.api.llm import vertex_cache_manager
+from skyvern.forge.sdk.api.llm.vertex_cache_manager import VertexCacheManager
+
+CACHE_KEY = "extract-action-std-VERTEX_GEMINI_2.5_FLASH"
+
+
+class FakeCredentials:
+    """Stands in for google.auth credentials; each refresh mints a new token."""
+
+    def __init__(self, expires_in: timedelta = timedelta(hours=1)) -> None:
+        self.token: str | None = None
+        self.expiry: datetime | None = None
+        self.refresh_count = 0
+        self._expires_in = expires_in
+
+    @property
+    def valid(self) -> bool:
+        return self.token is not None
+
+    def refresh(self, request: object) -> None:
+        self.refresh_count += 1
+        self.token = f"token-{self.refresh_count}"
+        # google-auth keeps expiry as naive UTC
+        self.expiry = (datetime.now(UTC) + self._expires_in).replace(tzinfo=None)
+
+
+class VertexStandIn:
+    def __init__(self, ttl: timedelta = timedelta(hours=1), delay: float = 0.0) -> None:
+        self.requests: list[httpx.Request] = []
+        self.ttl = ttl
+        self.delay = delay
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if request.method == "DELETE":
+            return httpx.Response(200, json={})
+        body = json.loads(request.content)
+        expire_time = (datetime.now(UTC) + self.ttl).isoformat().replace("+00:00", "Z")
+        return httpx.Response(
+            200,
+            json={
+                "name": f"projects/p/locations/global/cachedContents/{len(self.requests)}",
+                "model": body["model"],
+                "expireTime": expire_time,
+            },
+        )
+
+
+def _make_manager(stand_in: VertexStandIn, credentials: FakeCredentials) -> VertexCacheManager:
+    manager = VertexCacheManager(project_id="p", base_url="http://vertex.test", credentials=credentials)
+    manager._client = httpx.AsyncClient(base_url=manager.base_url, transport=httpx.MockTransport(stand_in))
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_create_posts_payload_with_bearer_token() -> None:
+    stand_in = VertexStandIn()
+    manager = _make_manager(stand_in, FakeCredentials())
+
+    cache_data = await manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key=CACHE_KEY)
+
+    (request,) = stand_in.requests
+    assert request.url.path == "/v1/projects/p/locations/global/cachedContents"
+    assert request.headers["Authorization"] == "Bearer token-1"
+    assert json.loads(request.content)["contents"][0]["parts"][0]["text"] == "static"
+    assert cache_data["name"].endswith("/1")
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_creates_for_the_same_key_share_one_request() -> None:
+    stand_in = VertexStandIn(delay=0.02)
+    manager = _make_manager(stand_in, FakeCredentials())
+
+    results = await asyncio.gather(
+        *(
+            manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key=CACHE_KEY)
+            for _ in range(5)
+        )
+    )
+
+    assert len(stand_in.requests) == 1
+    assert {r["name"] for r in results} == {results[0]["name"]}
+    # later calls are served from the registry
+    await manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key=CACHE_KEY)
+    assert len(stand_in.requests) == 1
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_token_is_reused_until_it_nears_expiry() -> None:
+    stand_in = VertexStandIn(ttl=timedelta(seconds=1))
+    credentials = FakeCredentials()
+    manager = _make_manager(stand_in, credentials)
+
+    for i in range(3):
+        await manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key=f"{CACHE_KEY}{i}")
+    assert credentials.refresh_count == 1
+
+    credentials.expiry = (datetime.now(UTC) + timedelta(minutes=1)).replace(tzinfo=None)
+    await manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key="another")
+    assert credentials.refresh_count == 2
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_expiring_cache_is_recreated_and_expired_entries_purged() -> None:
+    stand_in = VertexStandIn(ttl=timedelta(seconds=30))
+    manager = _make_manager(stand_in, FakeCredentials())
+
+    first = await manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key=CACHE_KEY)
+    # under the reuse margin, so a fresh cache is created instead of handing out one about to lapse
+    second = await manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key=CACHE_KEY)
+    assert first["name"] != second["name"]
+
+    manager._cache_registry[CACHE_KEY]["expireTime"] = "2000-01-01T00:00:00Z"
+    manager.purge_expired()
+    assert CACHE_KEY not in manager._cache_registry
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_registry_entry() -> None:
+    stand_in = VertexStandIn()
+    manager = _make_manager(stand_in, FakeCredentials())
+    cache_data = await manager.create_cache(model_name="gemini-2.5-flash", static_content="static", cache_key=CACHE_KEY)
+
+    assert await manager.delete_cache(CACHE_KEY) is True
+
+    assert stand_in.requests[-1].method == "DELETE"
+    assert stand_in.requests[-1].url.path == f"/v1/{cache_data['name']}"
+    assert CACHE_KEY not in manager._cache_registry
+    assert await manager.delete_cache(CACHE_KEY) is False
+    await manager.aclose()
+
+
+@pytest.mark.asyncio
+async def test_close_cache_manager_closes_the_global_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    await vertex_cache_manager.close_cache_manager()
+
+    manager = _make_manager(VertexStandIn(), FakeCredentials())
+    client = manager._client
+    monkeypatch.setattr(vertex_cache_manager, "_global_cache_manager", manager)
+
+    await vertex_cache_manager.close_cache_manager()
+
+    assert client is not None and client.is_closed
+    assert manager._client is None
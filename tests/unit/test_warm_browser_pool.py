@@ -0,0 +1,205 @@
+"""Tests for the warm browser pool and its use in RealBrowserManager._create_browser_state."""
+
+import asyncio
+import time
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import pytest
+
+from skyvern.config import settings
+from skyvern.schemas.runs import ProxyLocation
+from skyvern.webeye import browser_pool, real_browser_manager
+from skyvern.webeye.browser_artifacts import BrowserArtifacts
+from skyvern.webeye.browser_factory import BrowserContextFactory
+from skyvern.webeye.browser_pool import BrowserPoolKey, PooledBrowser, WarmBrowserPool
+from skyvern.webeye.real_browser_manager import RealBrowserManager
+
+KEY = BrowserPoolKey(engine="playwright", browser_type="chromium-headless", proxy_location=None)
+
+
+def _pooled_browser(key: BrowserPoolKey = KEY, evaluate: AsyncMock | None = None) -> PooledBrowser:
+    page = MagicMock()
+    page.evaluate = evaluate or AsyncMock(return_value=1)
+    browser_context = MagicMock()
+    browser_context.pages = [page]
+    browser_context.close = AsyncMock()
+    return PooledBrowser(
+        key=key,
+        pw=MagicMock(stop=AsyncMock()),
+        browser_context=browser_context,
+        browser_artifacts=BrowserArtifacts(browser_session_dir="/tmp/skyvern_browser_pool_test"),
+        browser_cleanup=None,
+        launch_ms=2500.0,
+    )
+
+
+@pytest.fixture(autouse=True)
+def _pool_settings():
+    with (
+        patch.object(settings, "BROWSER_POOL_ENABLED", True),
+        patch.object(settings, "BROWSER_POOL_MIN_SIZE", 1),
+        patch.object(settings, "BROWSER_POOL_MAX_SIZE", 4),
+        patch.object(settings, "BROWSER_TYPE", "chromium-headless"),
+    ):
+        yield
+
+
+async def _drain_refills(pool: WarmBrowserPool) -> None:
+    await asyncio.gather(*pool._refills.values())
+
+
+def test_key_separates_launch_settings() -> None:
+    base = BrowserPoolKey.build(engine="playwright", proxy_location=None, launch_headers=None)
+
+    assert base == BrowserPoolKey.build(engine="playwright", proxy_location=None, launch_headers={})
+    assert base != BrowserPoolKey.build(
+        engine="playwright", proxy_location=ProxyLocation.RESIDENTIAL, launch_headers=None
+    )
+    assert base != BrowserPoolKey.build(engine="playwright", proxy_location=None, launch_headers={"x-session": "1"})
+
+
+def test_profiles_and_remote_browsers_are_never_pooled() -> None:
+    assert WarmBrowserPool.is_eligible()
+    assert not WarmBrowserPool.is_eligible(browser_profile_id="bp_1")
+    assert not WarmBrowserPool.is_eligible(browser_address="ws://remote:9222")
+    with patch.object(settings, "BROWSER_TYPE", "cdp-connect"):
+        assert not WarmBrowserPool.is_eligible()
+
+
+@pytest.mark.asyncio
+async def test_miss_refills_and_next_checkout_hits() -> None:
+    pool = WarmBrowserPool()
+    warmed = _pooled_browser()
+    launcher = AsyncMock(return_value=warmed)
+
+    assert await pool.acquire(KEY, launcher) is None
+    await _drain_refills(pool)
+    assert await pool.acquire(KEY, launcher) is warmed
+
+    assert (pool.stats.hits, pool.stats.misses) == (1, 1)
+    await _drain_refills(pool)
+    assert launcher.await_count == 2  # topped back up after the hit
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_unhealthy_idle_browser_is_recycled() -> None:
+    pool = WarmBrowserPool()
+    broken = _pooled_browser(evaluate=AsyncMock(side_effect=RuntimeError("Target closed")))
+    pool._idle[KEY] = deque([broken])
+
+    assert await pool.acquire(KEY, AsyncMock(side_effect=RuntimeError("no launch"))) is None
+    await pool.close()
+
+    broken.browser_context.close.assert_awaited_once()
+    broken.pw.stop.assert_awaited_once()
+    assert pool.stats.recycled == 1
+
+
+@pytest.mark.asyncio
+async def test_idle_timeout_and_memory_growth_recycle() -> None:
+    pool = WarmBrowserPool()
+    stale = _pooled_browser()
+    stale.created_at = time.monotonic() - 3600
+    bloated = _pooled_browser()
+    bloated.baseline_rss_bytes = 100 * 1024 * 1024
+    pool._idle[KEY] = deque([stale, bloated])
+
+    with (
+        patch.object(settings, "BROWSER_POOL_MAX_RSS_GROWTH_MB", 256),
+        patch.object(browser_pool, "_browser_rss_bytes", return_value=900 * 1024 * 1024),
+    ):
+        assert await pool.acquire(KEY, AsyncMock(side_effect=RuntimeError("no launch"))) is None
+    await pool.close()
+
+    assert pool.stats.recycled == 2
+    stale.browser_context.close.assert_awaited_once()
+    bloated.browser_context.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_create_browser_state_claims_the_warmed_browser() -> None:
+    manager = RealBrowserManager()
+    cold_pw = MagicMock(stop=AsyncMock())
+    warm_pw = MagicMock(stop=AsyncMock())
+    selection = SimpleNamespace(
+        name="playwright",
+        start_driver=AsyncMock(side_effect=[cold_pw, warm_pw, MagicMock(stop=AsyncMock())]),
+        boot_fallback_selection=None,
+        attribution=lambda: {},
+    )
+    warmed_context = MagicMock(pages=[MagicMock(evaluate=AsyncMock(return_value=1))])
+    warmed_artifacts = BrowserArtifacts()
+
+    async def create_browser_context(pw, launched_browser=None, **kwargs):
+        if launched_browser is not None:
+            return launched_browser
+        return MagicMock(pages=[]), BrowserArtifacts(), None
+
+    with (
+        patch.object(manager, "get_or_resolve_engine_selection", AsyncMock(return_value=selection)),
+        patch.object(BrowserContextFactory, "create_browser_context", side_effect=create_browser_context),
+        patch.object(
+            BrowserContextFactory,
+            "launch_browser_context",
+            AsyncMock(return_value=(warmed_context, warmed_artifacts, None)),
+        ) as launch_browser_context,
+        patch.object(real_browser_manager, "rebind_download_dir", AsyncMock()) as rebind_download_dir,
+        patch.object(real_browser_manager, "RealBrowserState", side_effect=lambda **kwargs: kwargs),
+    ):
+        cold = await manager._create_browser_state(task_id="tsk_1")
+        await _drain_refills(manager.browser_pool)
+        warm = await manager._create_browser_state(task_id="tsk_2")
+        await _drain_refills(manager.browser_pool)
+
+    assert cold["pw"] is cold_pw
+    assert warm["pw"] is warm_pw
+    assert warm["browser_context"] is warmed_context
+    assert warm["browser_artifacts"] is warmed_artifacts
+    assert launch_browser_context.await_args_list[0] == call(warm_pw, proxy_location=None, extra_http_headers=None)
+    rebind_download_dir.assert_awaited_once()
+    assert manager.browser_pool.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_prewarm_fills_the_default_launch_keys_before_any_run() -> None:
+    manager = RealBrowserManager()
+    selection = SimpleNamespace(
+        name="playwright", start_driver=AsyncMock(side_effect=lambda: MagicMock(stop=AsyncMock()))
+    )
+
+    with (
+        patch.object(manager, "get_or_resolve_engine_selection", AsyncMock(return_value=selection)),
+        patch.object(
+            BrowserContextFactory,
+            "launch_browser_context",
+            AsyncMock(
+                side_effect=lambda *args, **kwargs: (_pooled_browser().browser_context, BrowserArtifacts(), None)
+            ),
+        ) as launch_browser_context,
+    ):
+        await manager.prewarm_browser_pool()
+        await _drain_refills(manager.browser_pool)
+
+    assert manager.browser_pool.idle_count == 2
+    assert {c.kwargs["proxy_location"] for c in launch_browser_context.await_args_list} == {
+        ProxyLocation.RESIDENTIAL,
+        None,
+    }
+    await manager.close_browser_pool()
+    assert manager.browser_pool.idle_count == 0
+
+
+@pytest.mark.asyncio
+async def test_prewarm_is_a_no_op_when_the_pool_is_disabled() -> None:
+    manager = RealBrowserManager()
+    with (
+        patch.object(settings, "BROWSER_POOL_ENABLED", False),
+        patch.object(manager, "get_or_resolve_engine_selection", AsyncMock()) as resolve,
+    ):
+        await manager.prewarm_browser_pool()
+
+    resolve.assert_not_awaited()
+    assert manager.browser_pool._refills == {}
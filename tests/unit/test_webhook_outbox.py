@@ -0,0 +1,222 @@
+"""Durable webhook outbox: claiming, retry scheduling, dead-lettering and enqueue-on-finalize."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+import pytest_asyncio
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from skyvern.config import settings
+from skyvern.forge.sdk.db.models import Base, WebhookOutboxModel
+from skyvern.forge.sdk.db.repositories.webhook_outbox import WebhookOutboxRepository
+from skyvern.forge.sdk.schemas.webhook_outbox import WebhookOutboxStatus
+from skyvern.forge.sdk.workflow import service as service_module
+from skyvern.forge.sdk.workflow.service import WorkflowService
+from skyvern.schemas.run_enums import RunType
+from skyvern.services import webhook_outbox as outbox_module
+from skyvern.services.webhook_delivery import PreparedWorkflowWebhook
+from skyvern.services.webhook_outbox import WebhookOutboxWorker, compute_outbox_retry_delay, enqueue_run_webhook
+
+
+@pytest.fixture(autouse=True)
+def _outbox_settings():
+    with (
+        patch.object(settings, "WEBHOOK_OUTBOX_ENABLED", True),
+        patch.object(settings, "WEBHOOK_OUTBOX_MAX_ATTEMPTS", 2),
+        patch.object(settings, "WEBHOOK_OUTBOX_RETRY_BASE_DELAY_SECONDS", 30.0),
+        patch.object(settings, "WEBHOOK_OUTBOX_RETRY_MAX_DELAY_SECONDS", 3600.0),
+    ):
+        yield
+
+
+@pytest_asyncio.fixture
+async def outbox(monkeypatch: pytest.MonkeyPatch):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(
+            lambda sync_conn: Base.metadata.create_all(sync_conn, tables=[WebhookOutboxModel.__table__])
+        )
+    session_factory = async_sessionmaker(engine, expire_on_commit=False)
+    repo = WebhookOutboxRepository(session_factory)
+    monkeypatch.setattr(outbox_module.app.DATABASE, "webhook_outbox", repo, raising=False)
+    try:
+        yield repo, session_factory
+    finally:
+        await engine.dispose()
+
+
+@pytest.fixture
+def update_run(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    update = AsyncMock()
+    monkeypatch.setattr(outbox_module.app.DATABASE.workflow_runs, "update_workflow_run", update)
+    return update
+
+
+def _deliver(monkeypatch: pytest.MonkeyPatch, *outcomes: httpx.Response | Exception) -> AsyncMock:
+    deliver = AsyncMock(side_effect=list(outcomes))
+    monkeypatch.setattr(outbox_module.app.AGENT_FUNCTION, "deliver_webhook", deliver)
+    return deliver
+
+
+async def _enqueue() -> None:
+    assert await enqueue_run_webhook(
+        organization_id="o_1",
+        run_id="wr_1",
+        run_type=RunType.workflow_run,
+        url="https://hooks.example.com/skyvern",
+        payload='{"signed":true}',
+        headers={"x-skyvern-signature": "sig"},
+    )
+
+
+async def _row(session_factory) -> WebhookOutboxModel:
+    async with session_factory() as session:
+        return (await session.execute(WebhookOutboxModel.__table__.select())).one()
+
+
+async def _make_due(repo: WebhookOutboxRepository, session_factory) -> None:
+    row = await _row(session_factory)
+    await repo.reschedule_webhook(
+        row.webhook_outbox_id,
+        next_attempt_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+        status_code=row.last_status_code,
+        error=row.last_error,
+    )
+
+
+def _worker() -> WebhookOutboxWorker:
+    return WebhookOutboxWorker(poll_interval_seconds=1, batch_size=10, concurrency=4)
+
+
+@pytest.mark.asyncio
+async def test_claim_leases_each_webhook_to_one_worker_and_counts_the_attempt(outbox) -> None:
+    repo, _ = outbox
+    await _enqueue()
+
+    first = await repo.claim_due_webhooks(limit=10, lease_seconds=0)
+    # A lease that has lapsed (a worker died mid-delivery) makes the webhook claimable again.
+    second = await repo.claim_due_webhooks(limit=10, lease_seconds=60)
+
+    assert [entry.attempts for entry in first + second] == [1, 2]
+    assert await repo.claim_due_webhooks(limit=10, lease_seconds=60) == []
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_honoured_and_the_destination_client_is_reused(
+    outbox, update_run: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo, session_factory = outbox
+    deliver = _deliver(
+        monkeypatch,
+        httpx.Response(503, headers={"Retry-After": "120"}, content=b"busy"),
+        httpx.Response(200, content=b"ok"),
+    )
+    await _enqueue()
+    worker = _worker()
+
+    assert await worker.deliver_due_webhooks() == 1
+    row = await _row(session_factory)
+    assert (row.status, row.last_status_code, row.locked_until) == (WebhookOutboxStatus.pending, 503, None)
+    assert 110 < (row.next_attempt_at - datetime.utcnow()).total_seconds() <= 120
+    assert await worker.deliver_due_webhooks() == 0  # not due yet
+
+    await _make_due(repo, session_factory)
+    assert await worker.deliver_due_webhooks() == 1
+
+    row = await _row(session_factory)
+    assert (row.status, row.attempts, row.last_status_code) == (WebhookOutboxStatus.delivered, 2, 200)
+    update_run.assert_awaited_once_with(workflow_run_id="wr_1", webhook_failure_reason="")
+    first_client, second_client = (call.kwargs["client"] for call in deliver.await_args_list)
+    assert first_client is second_client
+    assert worker.stats.delivered == worker.stats.retried == 1
+    await worker.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_response_is_dead_lettered_immediately(
+    outbox, update_run: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _, session_factory = outbox
+    _deliver(monkeypatch, httpx.Response(400, content=b"bad payload"))
+    await _enqueue()
+
+    await _worker().deliver_due_webhooks()
+
+    row = await _row(session_factory)
+    assert (row.status, row.attempts) == (WebhookOutboxStatus.dead, 1)
+    update_run.assert_awaited_once_with(
+        workflow_run_id="wr_1",
+        webhook_failure_reason="Webhook failed with status code 400, error message: bad payload",
+    )
+
+
+@pytest.mark.asyncio
+async def test_exhausted_attempts_are_dead_lettered(
+    outbox, update_run: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    repo, session_factory = outbox
+    _deliver(monkeypatch, httpx.ConnectError("refused"), httpx.ConnectError("refused"))
+    await _enqueue()
+    worker = _worker()
+
+    await worker.deliver_due_webhooks()
+    assert (await _row(session_factory)).status == WebhookOutboxStatus.pending
+    await _make_due(repo, session_factory)
+    await worker.deliver_due_webhooks()
+
+    row = await _row(session_factory)
+    assert (row.status, row.last_error) == (WebhookOutboxStatus.dead, "ConnectError: refused")
+    update_run.assert_awaited_once_with(
+        workflow_run_id="wr_1",
+        webhook_failure_reason="Webhook delivery failed before receiving a response: ConnectError: refused",
+    )
+    assert worker.stats.dead_lettered == 1
+
+
+def test_backoff_grows_exponentially_and_caps_retry_after() -> None:
+    assert 30 <= compute_outbox_retry_delay(1, None) <= 60
+    assert 240 <= compute_outbox_retry_delay(4, None) <= 270
+    assert compute_outbox_retry_delay(20, None) == 3600
+    assert compute_outbox_retry_delay(1, httpx.Response(429, headers={"Retry-After": "86400"})) == 3600
+
+
+@pytest.mark.asyncio
+async def test_workflow_finalization_enqueues_instead_of_delivering(outbox, monkeypatch: pytest.MonkeyPatch) -> None:
+    _, session_factory = outbox
+    deliver_inline = AsyncMock()
+    monkeypatch.setattr(service_module, "deliver_webhook_with_retries", deliver_inline)
+
+    await WorkflowService().deliver_prepared_workflow_webhook(
+        PreparedWorkflowWebhook(
+            workflow_id="w_1",
+            workflow_run_id="wr_1",
+            organization_id="o_1",
+            webhook_callback_url="https://hooks.example.com/skyvern",
+            signed_payload='{"signed":true}',
+            headers={"x-skyvern-signature": "sig"},
+        )
+    )
+
+    deliver_inline.assert_not_awaited()
+    row = await _row(session_factory)
+    assert (row.run_id, row.run_type, row.status) == ("wr_1", "workflow_run", WebhookOutboxStatus.pending)
+
+
+@pytest.mark.asyncio
+async def test_enqueue_declines_when_disabled_or_the_insert_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    failing_enqueue = AsyncMock(side_effect=RuntimeError("db down"))
+    monkeypatch.setattr(outbox_module.app.DATABASE, "webhook_outbox", AsyncMock(), raising=False)
+    monkeypatch.setattr(outbox_module.app.DATABASE.webhook_outbox, "enqueue_webhook", failing_enqueue)
+
+    assert not await enqueue_run_webhook(
+        organization_id="o_1", run_id="tsk_1", run_type=RunType.task_v1, url="https://x", payload="{}", headers={}
+    )
+    with patch.object(settings, "WEBHOOK_OUTBOX_ENABLED", False):
+        assert not await enqueue_run_webhook(
+            organization_id="o_1", run_id="tsk_1", run_type=RunType.task_v1, url="https://x", payload="{}", headers={}
+        )
+    failing_enqueue.assert_awaited_once()
@@ -602,6 +602,34 @@ async def test_capture_uses_png_format(streaming_temp_dir: Path, fake_storage: A
     assert written.startswith(b"\x89PNG")
 
 
+@pytest.mark.asyncio
+async def test_publishes_from_the_shared_screencast_when_enabled(
+    streaming_temp_dir: Path, fake_storage: AsyncMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(publisher_module.settings, "CDP_FRAME_PUBLISHER_FROM_SCREENCAST", True)
+    session = _make_cdp_session([b"\xff\xd8primed-jpeg"])
+    page = _make_page_with_session(session)
+    pub = CDPFramePublisher(
+        browser_state=_make_browser_state(page),
+        stream_key=STREAM_KEY,
+        organization_id=ORG_ID,
+    )
+
+    await _drive_publish_once(pub)
+    assert _stream_path(streaming_temp_dir).read_bytes() == b"\xff\xd8primed-jpeg"
+
+    event, on_frame = session.on.call_args.args
+    assert event == "Page.screencastFrame"
+    on_frame({"data": base64.b64encode(b"\xff\xd8next-jpeg").decode("ascii"), "sessionId": 1, "metadata": {}})
+    await _drive_publish_once(pub)
+
+    assert _stream_path(streaming_temp_dir).read_bytes() == b"\xff\xd8next-jpeg"
+    # Only the screencast's priming screenshot; later frames come from the stream itself.
+    assert len(session._screenshot_calls) == 1
+    await pub.stop()
+    session.detach.assert_awaited_once()
+
+
 def test_write_frame_atomically_writes_bytes_via_tempfile(tmp_path: Path) -> None:
     """The sync helper used by ``_write_frame`` writes via tempfile+replace and
     leaves no ``.tmp`` siblings behind on success."""
@@ -0,0 +1,155 @@
+"""One shared CDP screencast per page, fanned out to every subscriber."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from skyvern.webeye import page_screencast as page_screencast_module
+from skyvern.webeye.page_screencast import PageScreencastRegistry
+
+
+class _FakeCdpSession:
+    def __init__(self) -> None:
+        self.handlers: dict[str, object] = {}
+        self.sent: list[tuple[str, dict]] = []
+        self.detached = False
+
+    def on(self, event: str, handler: object) -> None:
+        self.handlers[event] = handler
+
+    async def send(self, method: str, params: dict | None = None) -> dict:
+        self.sent.append((method, params or {}))
+        if method == "Page.captureScreenshot":
+            return {"data": "primed"}
+        return {}
+
+    async def detach(self) -> None:
+        self.detached = True
+
+    def emit(self, data: str, session_id: int = 1) -> None:
+        self.handlers["Page.screencastFrame"]({"data": data, "sessionId": session_id, "metadata": {}})  # type: ignore[operator]
+
+    def params_sent(self, method: str) -> list[dict]:
+        return [params for sent_method, params in self.sent if sent_method == method]
+
+
+def _page(session: _FakeCdpSession) -> SimpleNamespace:
+    return SimpleNamespace(
+        context=SimpleNamespace(new_cdp_session=AsyncMock(return_value=session)),
+        url="https://example.test/",
+        viewport_size={"width": 800, "height": 600},
+    )
+
+
+@pytest.mark.asyncio
+async def test_viewers_of_one_page_share_a_single_screencast() -> None:
+    registry = PageScreencastRegistry()
+    session = _FakeCdpSession()
+    page = _page(session)
+
+    first = await registry.subscribe(page)
+    second = await registry.subscribe(page)
+    session.emit("frame-1", session_id=5)
+
+    page.context.new_cdp_session.assert_awaited_once_with(page)
+    assert len(session.params_sent("Page.startScreencast")) == 1
+    # The second viewer starts from the cached frame instead of another screenshot.
+    assert len(session.params_sent("Page.captureScreenshot")) == 1
+    for subscription in (first, second):
+        primed = await subscription.get()
+        assert primed is not None and primed.data == "primed"
+        assert primed.metadata == {"deviceWidth": 800, "deviceHeight": 600}
+        frame = await subscription.get()
+        assert frame is not None and frame.data == "frame-1"
+    await asyncio.sleep(0)
+    assert session.params_sent("Page.screencastFrameAck") == [{"sessionId": 5}]
+
+    await first.close()
+    assert not session.detached
+    await second.close()
+    assert session.detached
+    assert registry.get(page) is None
+    assert await second.get() is None
+
+
+@pytest.mark.asyncio
+async def test_a_slow_viewer_drops_its_stale_frames_without_holding_back_others() -> None:
+    registry = PageScreencastRegistry()
+    session = _FakeCdpSession()
+    evicted: list[str] = []
+    slow = await registry.subscribe(_page(session), on_evicted=lambda frame: evicted.append(frame.data))
+    fast = await registry.subscribe(slow.page)
+    assert (await fast.get()).data == "primed"  # type: ignore[union-attr]
+
+    received: list[str] = []
+    for data in ("frame-1", "frame-2", "frame-3"):
+        session.emit(data)
+        frame = await fast.get()
+        assert frame is not None
+        received.append(frame.data)
+
+    assert received == ["frame-1", "frame-2", "frame-3"]
+    assert evicted == ["primed", "frame-1"]
+    assert [(await slow.get()).data, (await slow.get()).data] == ["frame-2", "frame-3"]  # type: ignore[union-attr]
+    await slow.close()
+    await fast.close()
+
+
+@pytest.mark.asyncio
+async def test_quality_and_frame_rate_follow_whether_viewers_keep_up(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(page_screencast_module, "ADAPT_WINDOW_SECONDS", 0.0)
+    registry = PageScreencastRegistry()
+    session = _FakeCdpSession()
+    viewer = await registry.subscribe(_page(session), max_queued=1)
+
+    # Every frame evicts the one before it: the viewer is behind.
+    session.emit("frame-1")
+    await asyncio.sleep(0)
+    assert registry.get(viewer.page).level == 1  # type: ignore[union-attr]
+    assert session.params_sent("Page.startScreencast")[-1] == {
+        "format": "jpeg",
+        "quality": 45,
+        "maxWidth": 1280,
+        "maxHeight": 720,
+        "everyNthFrame": 2,
+    }
+
+    # Caught up: the next window without drops steps back up.
+    await viewer.get()
+    session.emit("frame-2")
+    await asyncio.sleep(0)
+    assert registry.get(viewer.page).level == 0  # type: ignore[union-attr]
+    assert session.params_sent("Page.startScreencast")[-1]["quality"] == 60
+    await viewer.close()
+
+
+@pytest.mark.asyncio
+async def test_a_page_only_sampled_runs_at_the_cheapest_level_until_a_viewer_joins() -> None:
+    registry = PageScreencastRegistry()
+    session = _FakeCdpSession()
+    sampler = await registry.subscribe(_page(session), live=False, max_queued=1)
+    assert session.params_sent("Page.startScreencast")[0]["everyNthFrame"] == 3
+    assert sampler.latest is not None and sampler.latest.data == "primed"
+
+    viewer = await registry.subscribe(sampler.page)
+    assert session.params_sent("Page.startScreencast")[-1]["quality"] == 60
+
+    await viewer.close()
+    assert session.params_sent("Page.startScreencast")[-1]["everyNthFrame"] == 3
+    await sampler.close()
+    assert session.detached
+
+
+@pytest.mark.asyncio
+async def test_a_screencast_that_cannot_start_is_not_left_behind() -> None:
+    registry = PageScreencastRegistry()
+    page = SimpleNamespace(context=SimpleNamespace(new_cdp_session=AsyncMock(side_effect=RuntimeError("closed"))))
+
+    with pytest.raises(RuntimeError):
+        await registry.subscribe(page)
+
+    assert registry.get(page) is None